@@ -1,50 +1,100 @@
 """Error handlers for scale"""
 from logging import Handler
 
+import os
 import socket
+import threading
+from Queue import Empty, Full, Queue
+
+
+# The maximum number of log entries that are inserted into the database at once
+BATCH_SIZE = 500
+
+# The number of seconds that the flusher waits for new log entries before it checks again
+FLUSH_INTERVAL = 1.0
+
+# The maximum number of log entries waiting to be inserted, additional log records are dropped
+MAX_QUEUE_SIZE = 10000
+
+# The maximum number of seconds to wait for queued log entries to be inserted when the handler is closed
+STOP_TIMEOUT = 10.0
 
 
 class DatabaseLogHandler(Handler):
     """This class inherits from the logging.Handler class to provide
-       support for logging messages to a database table.
+       support for logging messages to a database table. Log records are
+       formatted on the calling thread and placed in a bounded queue, and a
+       background thread inserts them into the database in batches, so that
+       logging never waits on the database. When the queue is full, records
+       are dropped and counted, and the count is written as its own entry.
     """
 
     # name of the model to log messages
     model = None
 
-    def __init__(self, model=""):
+    def __init__(self, model="", batch_size=BATCH_SIZE, max_queue_size=MAX_QUEUE_SIZE):
         super(DatabaseLogHandler, self).__init__()
         self.model = model
+        self.batch_size = batch_size
+        self.max_queue_size = max_queue_size
+
+        self._dropped_count = 0
+        self._flusher = None
+        self._flusher_lock = threading.Lock()
+        self._hostname = socket.getfqdn()
+        self._model_class = None
+        self._pid = None
+        self._queue = Queue(maxsize=max_queue_size)
+
+    @property
+    def dropped_count(self):
+        """The number of log records dropped since the last batch was written
+
+        :returns: The number of dropped log records
+        :rtype: int
+        """
+
+        return self._dropped_count
+
+    def close(self):
+        """Stops the background thread after it inserts the queued log entries, then closes the handler
+        """
+
+        with self._flusher_lock:
+            flusher = self._flusher
+            self._flusher = None
+        if flusher and flusher.is_alive() and self._pid == os.getpid():
+            try:
+                self._queue.put(None, timeout=STOP_TIMEOUT)
+                flusher.join(STOP_TIMEOUT)
+            except Full:
+                pass
+        super(DatabaseLogHandler, self).close()
 
     def emit(self, record):
-        """Saves the record object to a database using the Django model class
+        """Queues the record object to be saved to the database using the Django model class
 
         :param record: Record object to save to the database
         :type record: LogRecord
         """
 
-        # get the model by name
-        try:
-            model = self.get_model(self.model)
-        except:
-            from error.models import LogEntry as model
+        # Records logged by the flusher itself (such as database errors) would feed back into the queue
+        if self._flusher is not None and threading.current_thread() is self._flusher:
+            return
 
-        hostname = socket.getfqdn()
-        levelname = record.levelname
+        self._ensure_flusher()
 
         # Note if an exception occurred, the formatter will append it to
         # the message, so need to split the formatted string to get just
         # the message.
         formatted_message = self.format(record).split('\nTraceback')[0]
-        log_entry = model(host=hostname, level=levelname,
-                          message=formatted_message)
-
-        # If there is exception information, add it to the 'LogEntry'
-        if not record.exc_text is None:
-            log_entry.stacktrace = record.exc_text
+        entry = (record.levelname, formatted_message, record.exc_text)
 
-        # save log entry to database table
-        log_entry.save()
+        try:
+            self._queue.put_nowait(entry)
+        except Full:
+            with self._flusher_lock:
+                self._dropped_count += 1
 
     def handleError(self, record):
         """Handles an exception that happened within the emit method
@@ -64,3 +114,89 @@ class DatabaseLogHandler(Handler):
         names = model_name.split('.')
         python_module = __import__('.'.join(names[:-1]), fromlist=names[-1:])
         return getattr(python_module, names[-1])
+
+    def _ensure_flusher(self):
+        """Starts the background thread if it is not running in this process. A forked child process gets its own
+        queue and thread, since the parent's thread does not exist in the child.
+        """
+
+        if self._pid == os.getpid() and self._flusher is not None:
+            return
+
+        with self._flusher_lock:
+            pid = os.getpid()
+            if self._pid != pid:
+                self._pid = pid
+                self._queue = Queue(maxsize=self.max_queue_size)
+                self._flusher = None
+            if self._flusher is None:
+                self._flusher = threading.Thread(target=self._run_flusher, name='DatabaseLogHandler')
+                self._flusher.daemon = True
+                self._flusher.start()
+
+    def _get_model_class(self):
+        """Returns the Django model class for the log entries, resolving it on first use
+
+        :returns: The model class
+        :rtype: class
+        """
+
+        if self._model_class is None:
+            # get the model by name
+            try:
+                self._model_class = self.get_model(self.model)
+            except:
+                from error.models import LogEntry
+                self._model_class = LogEntry
+        return self._model_class
+
+    def _run_flusher(self):
+        """The main loop of the background thread, which inserts the queued log entries until it receives a None
+        entry
+        """
+
+        running = True
+        while running:
+            try:
+                entries = [self._queue.get(timeout=FLUSH_INTERVAL)]
+            except Empty:
+                entries = []
+            while len(entries) < self.batch_size:
+                try:
+                    entries.append(self._queue.get_nowait())
+                except Empty:
+                    break
+            if None in entries:
+                running = False
+                entries = [entry for entry in entries if entry is not None]
+            if entries or self._dropped_count:
+                self._write_entries(entries)
+
+    def _write_entries(self, entries):
+        """Inserts the given log entries into the database in a single query, along with an entry for any log records
+        that were dropped. Entries that fail to be inserted are counted as dropped.
+
+        :param entries: The log entries as tuples of level, message, and stack trace
+        :type entries: [tuple]
+        """
+
+        with self._flusher_lock:
+            dropped_count = self._dropped_count
+            self._dropped_count = 0
+
+        try:
+            model = self._get_model_class()
+            log_entries = []
+            for levelname, message, stacktrace in entries:
+                log_entries.append(model(host=self._hostname, level=levelname, message=message, stacktrace=stacktrace))
+            if dropped_count:
+                message = 'Dropped %i log record(s) because the database log queue was full' % dropped_count
+                log_entries.append(model(host=self._hostname, level='WARNING', message=message))
+
+            # save log entries to database table
+            model.objects.bulk_create(log_entries, batch_size=self.batch_size)
+        except Exception:
+            from django.db import connection
+            connection.close()
+            with self._flusher_lock:
+                self._dropped_count += dropped_count + len(entries)
@@ -1,7 +1,11 @@
+import logging
+
 import django
 from django.test import TestCase
+from mock import patch
 
 from error.handlers import DatabaseLogHandler
+from error.models import LogEntry
 
 
 class TestGetDatabaseModel(TestCase):
@@ -14,3 +18,30 @@ class TestGetDatabaseModel(TestCase):
         model = self.obj_under_test.get_model('error.models.LogEntry')
         if model is None:
             self.fail("Failed to get the model")
+
+
+class TestDatabaseLogHandler(TestCase):
+
+    def setUp(self):
+        django.setup()
+
+    def _create_record(self, message):
+        return logging.LogRecord('test', logging.ERROR, __file__, 1, message, None, None)
+
+    @patch('error.handlers.DatabaseLogHandler._ensure_flusher')
+    def test_batch_and_overflow(self, mock_ensure_flusher):
+        """Tests that queued records are inserted in one batch and that records over the queue limit are counted"""
+
+        handler = DatabaseLogHandler('error.models.LogEntry', max_queue_size=2)
+        handler.emit(self._create_record('Message 1'))
+        handler.emit(self._create_record('Message 2'))
+        handler.emit(self._create_record('Message 3'))
+        self.assertEqual(handler.dropped_count, 1)
+
+        entries = [handler._queue.get_nowait(), handler._queue.get_nowait()]
+        handler._write_entries(entries)
+
+        self.assertEqual(handler.dropped_count, 0)
+        messages = set(LogEntry.objects.values_list('message', flat=True))
+        self.assertSetEqual(messages, {'Message 1', 'Message 2',
+                                       'Dropped 1 log record(s) because the database log queue was full'})
@@ -8,6 +8,8 @@ import os
 import django.utils.timezone as timezone
 import django.contrib.postgres.fields
 from django.db import models, transaction
+from django.db.models import Count, Max, Sum
+from django.db.models.functions import TruncHour
 from django.utils.timezone import now
 
 from ingest.scan.configuration.scan_configuration import ScanConfiguration
@@ -242,8 +244,6 @@ class IngestManager(models.Manager):
 
         # Fetch a list of ingests
         ingests = Ingest.objects.filter(status='INGESTED')
-        ingests = ingests.select_related('strike')
-        ingests = ingests.defer('strike__configuration')
 
         # Apply time range filtering
         if started:
@@ -257,13 +257,8 @@ class IngestManager(models.Manager):
             else:
                 ingests = ingests.filter(data_started__lte=ended)
 
-        # Apply sorting
-        if use_ingest_time:
-            ingests = ingests.order_by('ingest_ended')
-        else:
-            ingests = ingests.order_by('data_started')
-
-        groups = self._group_by_time(ingests, use_ingest_time)
+        date_field = 'ingest_ended' if use_ingest_time else 'data_started'
+        groups = self._group_by_time(ingests, date_field)
         return [self._fill_status(status, time_slots, started, ended) for status, time_slots in groups.iteritems()]
 
     @transaction.atomic
@@ -320,13 +315,14 @@ class IngestManager(models.Manager):
 
             logger.debug('Successfully created ingest task for %s', ingest.file_name)
 
-    def _group_by_time(self, ingests, use_ingest_time):
-        """Groups the given ingests by hourly time slots.
+    def _group_by_time(self, ingests, date_field):
+        """Groups the given ingests by hourly time slots. The counts for each time slot are calculated by the database
+        so that the ingest models do not need to be loaded.
 
         :param ingests: Query ingests updated after this amount of time.
-        :type ingests: list[:class:`ingest.models.Ingest`]
-        :param use_ingest_time: Whether or not to group the status values by ingest time (False) or data time (True).
-        :type use_ingest_time: bool
+        :type ingests: :class:`django.db.models.query.QuerySet`
+        :param date_field: The name of the date field to group the ingests by (ingest time or data time).
+        :type date_field: string
         :returns: A mapping of ingest status models to hourly groups of counts.
         :rtype: dict[:class:`ingest.models.IngestStatus`, dict[datetime.datetime, :class:`ingest.models.IngestCounts`]]
         """
@@ -335,56 +331,35 @@ class IngestManager(models.Manager):
         strike_map = {}
         slot_map = {}
         for strike in Strike.objects.all():
-            strike_map[strike] = IngestStatus(strike)
-            slot_map[strike] = {}
+            strike_map[strike.id] = IngestStatus(strike)
+            slot_map[strike.id] = {}
 
-        # Build a mapping of ingest status to time slots
-        for ingest in ingests:
+        # Count the ingests for each strike process and hourly time slot, ingests without a date are not counted
+        ingests = ingests.filter(**{'%s__isnull' % date_field: False})
+        ingests = ingests.annotate(time_slot=TruncHour(date_field, tzinfo=timezone.utc))
+        ingests = ingests.values('strike_id', 'time_slot').order_by()
+        ingests = ingests.annotate(slot_files=Count('id'), slot_size=Sum('file_size'), slot_most_recent=Max(date_field))
 
-            # Initialize the mappings for the first strike
-            if ingest.strike not in strike_map:
-                logger.error('Missing strike process mapping: %s', ingest.strike_id)
+        # Build a mapping of ingest status to time slots
+        for slot in ingests:
+            strike_id = slot['strike_id']
+            if strike_id not in strike_map:
+                logger.error('Missing strike process mapping: %s', strike_id)
                 continue
 
-            # Check whether there is a valid date for the requested query
-            dated = ingest.ingest_ended if use_ingest_time else ingest.data_started
-            if dated:
-                ingest_status = strike_map[ingest.strike]
-                time_slots = slot_map[ingest.strike]
-                self._update_status(ingest_status, time_slots, ingest, dated)
-
-        return {strike_map[strike]: slot_map[strike] for strike in strike_map}
+            ingest_status = strike_map[strike_id]
+            time_slots = slot_map[strike_id]
+            time_slot = slot['time_slot']
+            size = slot['slot_size'] or 0
+            time_slots[time_slot] = IngestCounts(time_slot, slot['slot_files'], size)
 
-    def _update_status(self, ingest_status, time_slots, ingest, dated):
-        """Updates the given ingest status model based on attributes of an ingest model.
+            # Update the summary values for the ingest status
+            ingest_status.files += slot['slot_files']
+            ingest_status.size += size
+            if not ingest_status.most_recent or slot['slot_most_recent'] > ingest_status.most_recent:
+                ingest_status.most_recent = slot['slot_most_recent']
 
-        :param ingest_status: The ingest status to update.
-        :type ingest_status: :class:`ingest.models.IngestStatus`
-        :param time_slots: A mapping of hourly time slots to ingest status counts.
-        :type time_slots: dict[datetime.datetime, :class:`ingest.models.IngestCounts`]
-        :param ingest: The ingest model that should be counted.
-        :type ingest: :class:`ingest.models.Ingest`
-        :returns: The ingest status model after the counts are updated.
-        :rtype: :class:`ingest.models.IngestStatus`
-        """
-
-        # Calculate the hourly time slot the record falls within
-        time_slot = datetime.datetime(dated.year, dated.month, dated.day, dated.hour, tzinfo=timezone.utc)
-
-        # Update the values for the current time slot
-        if time_slot not in time_slots:
-            time_slots[time_slot] = IngestCounts(time_slot)
-        values = time_slots[time_slot]
-        values.files += 1
-        values.size += ingest.file_size
-
-        # Update the summary values for the ingest status
-        ingest_status.files += 1
-        ingest_status.size += ingest.file_size
-        if not ingest_status.most_recent or dated > ingest_status.most_recent:
-            ingest_status.most_recent = dated
-
-        return ingest_status
+        return {strike_map[strike_id]: slot_map[strike_id] for strike_id in strike_map}
 
     def _fill_status(self, ingest_status, time_slots, started=None, ended=None):
         """Fills all the values for the given ingest status using a specified time range and grouped values.
@@ -206,6 +206,25 @@ class TestIngestStatusView(TestCase):
         self.assertEqual(entry['size'], self.ingest3.file_size)
         self.assertEqual(len(entry['values']), 24)
 
+    def test_hourly_counts(self):
+        """Tests successfully calling the ingest status view with multiple ingests in the same hourly time slot."""
+        ingest_test_utils.create_ingest(file_name='test5.txt', status='INGESTED', strike=self.strike,
+                                        data_started=datetime.datetime(2015, 1, 1, 5, 10, tzinfo=utc))
+        ingest_test_utils.create_ingest(file_name='test6.txt', status='INGESTED', strike=self.strike,
+                                        data_started=datetime.datetime(2015, 1, 1, 5, 40, tzinfo=utc))
+
+        url = rest_util.get_url('/ingests/status/?started=2015-01-01T00:00:00Z&ended=2015-01-01T10:00:00Z')
+        response = self.client.generic('GET', url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.content)
+
+        result = json.loads(response.content)
+        entry = result['results'][0]
+        self.assertEqual(entry['files'], 3)
+        self.assertEqual(entry['most_recent'], '2015-01-01T05:40:00Z')
+        self.assertEqual(entry['values'][0]['files'], 1)
+        self.assertEqual(entry['values'][5]['files'], 2)
+        self.assertEqual(entry['values'][6]['files'], 0)
+
     def test_multiple_strikes(self):
         """Tests successfully calling the ingest status view with multiple strike process groupings."""
         ingest_test_utils.create_strike()
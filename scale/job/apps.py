@@ -12,12 +12,16 @@ class JobConfig(AppConfig):
     verbose_name = 'Job'
 
     def ready(self):
-        """Registers job errors"""
+        """Registers job errors and the history purge processor with the clock system"""
+        import job.clock as clock
         from error.exceptions import register_error
         from job.configuration.exceptions import MissingMount, MissingSetting
         from job.configuration.results.exceptions import InvalidResultsManifest, MissingRequiredOutput
+        from job.purge import PurgeHistoryProcessor
 
         register_error(InvalidResultsManifest(''))
         register_error(MissingMount(''))
         register_error(MissingRequiredOutput(''))
         register_error(MissingSetting(''))
+
+        clock.register_processor('scale-purge-history', PurgeHistoryProcessor)
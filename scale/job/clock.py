@@ -7,6 +7,7 @@ import math
 
 import django.utils.timezone as timezone
 from django.db import transaction
+from django.db.models import OuterRef, Subquery
 
 import util.parse as parse
 from trigger.models import TriggerEvent, TriggerRule
@@ -17,6 +18,9 @@ logger = logging.getLogger(__name__)
 # Mapping of clock event processor name to processor class definition
 _PROCESSORS = {}
 
+# Cache of parsed clock schedules, {Schedule string: duration}
+_SCHEDULES = {}
+
 
 class ClockEventError(Exception):
     """Error class used when a clock event processor encounters a problem."""
@@ -48,11 +52,12 @@ def perform_tick():
     configured type and the registered clock function is executed.
     """
 
-    # Check all the clock trigger rules
-    rules = TriggerRule.objects.filter(type='CLOCK', is_active=True)
+    # Check all the clock trigger rules, fetching the last event of every rule at once
+    rules = list(TriggerRule.objects.filter(type='CLOCK', is_active=True))
+    last_events = _get_last_events([rule.id for rule in rules])
     for rule in rules:
         try:
-            _check_rule(rule)
+            _check_rule(rule, last_events)
         except ClockEventError:
             logger.exception('Clock scheduler caught known rule error: %s', rule.id)
         except:
@@ -75,11 +80,14 @@ def register_processor(name, processor_class):
     _PROCESSORS[name].append(processor_class)
 
 
-def _check_rule(rule):
+def _check_rule(rule, last_events=None):
     """Checks the given rule for validation errors and then triggers an event for processing if the schedule requires.
 
     :param rule: The system name of the processor, which is used in trigger rule configurations.
     :type rule: :class:`trigger.models.TriggerRule`
+    :param last_events: The last event triggered for each rule, {Rule ID: event}. The last event for this rule is
+        queried if None.
+    :type last_events: dict
 
     :raises :class:`job.clock.ClockEventError`: If there is a configuration problem with the rule.
     """
@@ -96,17 +104,44 @@ def _check_rule(rule):
     if 'schedule' not in rule.configuration or not rule.configuration['schedule']:
         raise ClockEventError('Clock trigger rule missing "schedule" attribute: ' % rule.id)
     schedule = rule.configuration['schedule']
-    duration = parse.parse_duration(schedule)
+    if schedule not in _SCHEDULES:
+        _SCHEDULES[schedule] = parse.parse_duration(schedule)
+    duration = _SCHEDULES[schedule]
     if not duration:
         raise ClockEventError('Invalid format for clock trigger "schedule" attribute: %s -> %s' % (rule.id, schedule))
 
     # Trigger a new event when the schedule is surpassed
-    last_event = TriggerEvent.objects.filter(rule=rule).order_by('-occurred').first()
+    if last_events is None:
+        last_events = _get_last_events([rule.id])
+    last_event = last_events.get(rule.id)
     logger.debug('Checking rule schedule: %s -> %s since %s', rule.type, duration, last_event)
     if _check_schedule(duration, last_event):
         _trigger_event(rule, last_event)
 
 
+def _get_last_events(rule_ids):
+    """Returns the last event that was triggered for each of the given rules. The events are found with one query that
+    looks up the latest event of each rule through the index on rule and occurred, and one query that fetches them, so
+    the cost does not grow with the number of past events.
+
+    :param rule_ids: The IDs of the rules
+    :type rule_ids: [int]
+    :returns: The last event for each rule that has triggered an event, {Rule ID: event}
+    :rtype: dict
+    """
+
+    if not rule_ids:
+        return {}
+
+    latest_events = TriggerEvent.objects.filter(rule_id=OuterRef('pk')).order_by('-occurred').values('id')[:1]
+    rules = TriggerRule.objects.filter(id__in=rule_ids).annotate(last_event_id=Subquery(latest_events))
+    event_ids = {event_id: rule_id for rule_id, event_id in rules.values_list('id', 'last_event_id') if event_id}
+    if not event_ids:
+        return {}
+
+    return {event_ids[event.id]: event for event in TriggerEvent.objects.filter(id__in=event_ids.keys())}
+
+
 def _check_schedule(duration, last_event=None):
     """Checks the given rule schedule and previously triggered event to determine whether a new event should trigger.
 
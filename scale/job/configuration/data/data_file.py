@@ -70,3 +70,38 @@ class AbstractDataFileStore(object):
         """
 
         raise NotImplementedError()
+
+    def stage_files(self, data_files, input_file_ids, job_exe):
+        """Performs the first phase of a staged store by writing the given data files to their workspaces without saving
+        anything in the database, so that the (slow) file transfers can happen outside of a database transaction. The
+        returned staged files are then passed to commit_staged_files(). The default implementation transfers nothing and
+        leaves all of the work to store_files() during the commit.
+
+        :param data_files: Dict with workspace ID mapping to a list of tuples with absolute local file paths and media
+            type (media type is optionally None)
+        :type data_files: dict of int -> list of tuple(str, str)
+        :param input_file_ids: Set of input file IDs
+        :type input_file_ids: set of long
+        :param job_exe: The job execution model (with related job and job_type fields) that is storing the files
+        :type job_exe: :class:`job.models.JobExecution`
+        :returns: The staged files to commit
+        :rtype: object
+        """
+
+        return data_files
+
+    def commit_staged_files(self, staged_files, input_file_ids, job_exe):
+        """Performs the second phase of a staged store by saving the staged files in the database. This should be called
+        within a database transaction.
+
+        :param staged_files: The staged files returned by stage_files()
+        :type staged_files: object
+        :param input_file_ids: Set of input file IDs
+        :type input_file_ids: set of long
+        :param job_exe: The job execution model (with related job and job_type fields) that is storing the files
+        :type job_exe: :class:`job.models.JobExecution`
+        :returns: Dict with each local file path mapping to its new file ID
+        :rtype: dict of str -> long
+        """
+
+        return self.store_files(staged_files, input_file_ids, job_exe)
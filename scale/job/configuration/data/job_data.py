@@ -3,6 +3,7 @@ from __future__ import unicode_literals
 
 import logging
 import os
+from collections import namedtuple
 from numbers import Integral
 
 from job.configuration.data.data_file import DATA_FILE_PARSE_SAVER, DATA_FILE_STORE
@@ -19,6 +20,10 @@ logger = logging.getLogger(__name__)
 DEFAULT_VERSION = '1.0'
 
 
+# The output files that have been transferred into their workspaces, but not yet saved in the database
+StagedOutputFiles = namedtuple('StagedOutputFiles', ['data_files', 'params_by_file_path', 'staged_files'])
+
+
 class ValidationWarning(object):
     """Tracks job data configuration warnings during validation that may not prevent the job from working."""
 
@@ -154,6 +159,23 @@ class JobData(object):
         self.data_dict['input_data'].append(prop_input)
         self.data_inputs_by_name[input_name] = prop_input
 
+    def commit_output_data_files(self, staged, job_exe):
+        """Completes storing the given staged data output files by saving their models in the database. This should be
+        called within a database transaction.
+
+        :param staged: The staged output files returned by stage_output_data_files()
+        :type staged: :class:`job.configuration.data.job_data.StagedOutputFiles`
+        :param job_exe: The job execution model (with related job and job_type fields) that is storing the output data
+            files
+        :type job_exe: :class:`job.models.JobExecution`
+        :returns: The job results
+        :rtype: :class:`job.configuration.results.job_results.JobResults`
+        """
+
+        data_file_store = self._get_data_file_store()
+        stored_files = data_file_store.commit_staged_files(staged.staged_files, self.get_input_file_ids(), job_exe)
+        return self._create_output_results(staged.data_files, staged.params_by_file_path, stored_files)
+
     def get_all_properties(self):
         """Retrieves all properties from this job data and returns them in ascending order of their names
 
@@ -339,6 +361,27 @@ class JobData(object):
         # Download the job execution input files
         self.retrieve_input_data_files(data_files)
 
+    def stage_output_data_files(self, data_files, job_exe):
+        """Transfers the given data output files into their workspaces without saving any models in the database. The
+        returned staged files must be passed to commit_output_data_files() to complete storing the files. This allows
+        the (potentially slow) file transfers to be performed outside of a database transaction.
+
+        :param data_files: Dict with each file parameter name mapping to a tuple of absolute local file path and media
+            type (media type is optionally None) for a single file parameter and a list of tuples for a multiple file
+            parameter
+        :type data_files: {string: tuple(string, string)} or [tuple(string, string)]
+        :param job_exe: The job execution model (with related job and job_type fields) that is storing the output data
+            files
+        :type job_exe: :class:`job.models.JobExecution`
+        :returns: The staged output files
+        :rtype: :class:`job.configuration.data.job_data.StagedOutputFiles`
+        """
+
+        workspace_files, params_by_file_path = self._organize_output_data_files(data_files)
+        data_file_store = self._get_data_file_store()
+        staged_files = data_file_store.stage_files(workspace_files, self.get_input_file_ids(), job_exe)
+        return StagedOutputFiles(data_files, params_by_file_path, staged_files)
+
     def store_output_data_files(self, data_files, job_exe):
         """Stores the given data output files
 
@@ -353,71 +396,10 @@ class JobData(object):
         :rtype: :class:`job.configuration.results.job_results.JobResults`
         """
 
-        # Organize the data files
-        workspace_files = {}  # Workspace ID -> [(absolute local file path, media type)]
-        params_by_file_path = {}  # Absolute local file path -> output parameter name
-        for name in data_files:
-            file_output = self.data_outputs_by_name[name]
-            workspace_id = file_output['workspace_id']
-            if workspace_id in workspace_files:
-                workspace_file_list = workspace_files[workspace_id]
-            else:
-                workspace_file_list = []
-                workspace_files[workspace_id] = workspace_file_list
-            data_file_entry = data_files[name]
-            if isinstance(data_file_entry, list):
-                for file_tuple in data_file_entry:
-                    file_path = os.path.normpath(file_tuple[0])
-                    if not os.path.isfile(file_path):
-                        raise Exception('%s is not a valid file' % file_path)
-                    params_by_file_path[file_path] = name
-                    # Adjust file path to be relative to upload_dir
-                    if len(file_tuple) == 2:
-                        new_tuple = (file_path, file_tuple[1], name)
-                    else:
-                        new_tuple = (file_path, file_tuple[1], name, file_tuple[2])
-                    workspace_file_list.append(new_tuple)
-            else:
-                file_path = os.path.normpath(data_file_entry[0])
-                if not os.path.isfile(file_path):
-                    raise Exception('%s is not a valid file' % file_path)
-                params_by_file_path[file_path] = name
-                # Adjust file path to be relative to upload_dir
-                if len(data_file_entry) == 2:
-                    new_tuple = (file_path, data_file_entry[1], name)
-                else:
-                    new_tuple = (file_path, data_file_entry[1], name, data_file_entry[2])
-                workspace_file_list.append(new_tuple)
-
-        data_file_store = DATA_FILE_STORE['DATA_FILE_STORE']
-        if not data_file_store:
-            raise Exception('No data file store found')
+        workspace_files, params_by_file_path = self._organize_output_data_files(data_files)
+        data_file_store = self._get_data_file_store()
         stored_files = data_file_store.store_files(workspace_files, self.get_input_file_ids(), job_exe)
-
-        # Organize results
-        param_file_ids = {}  # Output parameter name -> file ID or [file IDs]
-        for file_path in stored_files:
-            file_id = stored_files[file_path]
-            name = params_by_file_path[file_path]
-            if isinstance(data_files[name], list):
-                if name in param_file_ids:
-                    file_id_list = param_file_ids[name]
-                else:
-                    file_id_list = []
-                    param_file_ids[name] = file_id_list
-                file_id_list.append(file_id)
-            else:
-                param_file_ids[name] = file_id
-
-        # Create job results
-        results = JobResults()
-        for name in param_file_ids:
-            param_entry = param_file_ids[name]
-            if isinstance(param_entry, list):
-                results.add_file_list_parameter(name, param_entry)
-            else:
-                results.add_file_parameter(name, param_entry)
-        return results
+        return self._create_output_results(data_files, params_by_file_path, stored_files)
 
     def validate_input_files(self, files):
         """Validates the given file parameters to make sure they are valid with respect to the job interface.
@@ -567,6 +549,106 @@ class JobData(object):
 
         return warnings
 
+    def _create_output_results(self, data_files, params_by_file_path, stored_files):
+        """Creates the job results for the given stored data output files
+
+        :param data_files: Dict with each file parameter name mapping to a tuple of absolute local file path and media
+            type for a single file parameter and a list of tuples for a multiple file parameter
+        :type data_files: {string: tuple(string, string)} or [tuple(string, string)]
+        :param params_by_file_path: Dict with each absolute local file path mapping to its output parameter name
+        :type params_by_file_path: {string: string}
+        :param stored_files: Dict with each absolute local file path mapping to the ID of its stored file
+        :type stored_files: {string: long}
+        :returns: The job results
+        :rtype: :class:`job.configuration.results.job_results.JobResults`
+        """
+
+        # Organize results
+        param_file_ids = {}  # Output parameter name -> file ID or [file IDs]
+        for file_path in stored_files:
+            file_id = stored_files[file_path]
+            name = params_by_file_path[file_path]
+            if isinstance(data_files[name], list):
+                if name in param_file_ids:
+                    file_id_list = param_file_ids[name]
+                else:
+                    file_id_list = []
+                    param_file_ids[name] = file_id_list
+                file_id_list.append(file_id)
+            else:
+                param_file_ids[name] = file_id
+
+        # Create job results
+        results = JobResults()
+        for name in param_file_ids:
+            param_entry = param_file_ids[name]
+            if isinstance(param_entry, list):
+                results.add_file_list_parameter(name, param_entry)
+            else:
+                results.add_file_parameter(name, param_entry)
+        return results
+
+    def _get_data_file_store(self):
+        """Returns the registered data file store
+
+        :returns: The data file store
+        :rtype: :class:`job.configuration.data.data_file.AbstractDataFileStore`
+        """
+
+        data_file_store = DATA_FILE_STORE['DATA_FILE_STORE']
+        if not data_file_store:
+            raise Exception('No data file store found')
+        return data_file_store
+
+    def _organize_output_data_files(self, data_files):
+        """Organizes the given data output files by workspace, checking that each file exists
+
+        :param data_files: Dict with each file parameter name mapping to a tuple of absolute local file path and media
+            type for a single file parameter and a list of tuples for a multiple file parameter
+        :type data_files: {string: tuple(string, string)} or [tuple(string, string)]
+        :returns: Dict with each workspace ID mapping to a list of file tuples, and dict with each absolute local file
+            path mapping to its output parameter name
+        :rtype: tuple({long: [tuple]}, {string: string})
+        """
+
+        # Organize the data files
+        workspace_files = {}  # Workspace ID -> [(absolute local file path, media type)]
+        params_by_file_path = {}  # Absolute local file path -> output parameter name
+        for name in data_files:
+            file_output = self.data_outputs_by_name[name]
+            workspace_id = file_output['workspace_id']
+            if workspace_id in workspace_files:
+                workspace_file_list = workspace_files[workspace_id]
+            else:
+                workspace_file_list = []
+                workspace_files[workspace_id] = workspace_file_list
+            data_file_entry = data_files[name]
+            if isinstance(data_file_entry, list):
+                for file_tuple in data_file_entry:
+                    file_path = os.path.normpath(file_tuple[0])
+                    if not os.path.isfile(file_path):
+                        raise Exception('%s is not a valid file' % file_path)
+                    params_by_file_path[file_path] = name
+                    # Adjust file path to be relative to upload_dir
+                    if len(file_tuple) == 2:
+                        new_tuple = (file_path, file_tuple[1], name)
+                    else:
+                        new_tuple = (file_path, file_tuple[1], name, file_tuple[2])
+                    workspace_file_list.append(new_tuple)
+            else:
+                file_path = os.path.normpath(data_file_entry[0])
+                if not os.path.isfile(file_path):
+                    raise Exception('%s is not a valid file' % file_path)
+                params_by_file_path[file_path] = name
+                # Adjust file path to be relative to upload_dir
+                if len(data_file_entry) == 2:
+                    new_tuple = (file_path, data_file_entry[1], name)
+                else:
+                    new_tuple = (file_path, data_file_entry[1], name, data_file_entry[2])
+                workspace_file_list.append(new_tuple)
+
+        return workspace_files, params_by_file_path
+
     def _delete_input(self, name):
         """Deletes the input with the given name
 
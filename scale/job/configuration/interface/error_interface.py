@@ -3,12 +3,12 @@ from __future__ import unicode_literals
 
 import logging
 
-from jsonschema import validate
 from jsonschema.exceptions import ValidationError
 
 from job.configuration.interface.exceptions import InvalidInterfaceDefinition
 
 from error.models import Error
+from util.validation import validate
 
 logger = logging.getLogger(__name__)
 
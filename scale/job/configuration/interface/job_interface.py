@@ -1,12 +1,12 @@
 """Defines the interface for executing a job"""
 from __future__ import unicode_literals
 
+import copy
 import json
 import logging
 import os
 import re
 
-from jsonschema import validate
 from jsonschema.exceptions import ValidationError
 
 from job.configuration.data.exceptions import InvalidData, InvalidConnection
@@ -18,6 +18,7 @@ from job.configuration.results.exceptions import InvalidResultsManifest
 from job.configuration.results.results_manifest.results_manifest import ResultsManifest
 from job.execution.container import SCALE_JOB_EXE_INPUT_PATH, SCALE_JOB_EXE_OUTPUT_PATH
 from scheduler.vault.manager import secrets_mgr
+from util.validation import validate
 
 logger = logging.getLogger(__name__)
 
@@ -298,6 +299,26 @@ class JobInterface(object):
 
         return converted
 
+    def commit_post_steps(self, job_exe, job_data, staged_post_steps):
+        """Performs the second half of the post steps: saves the parse results and the staged output files in the
+        database. This should be called within a database transaction.
+
+        :param job_exe: The job execution model with related job and job_type fields
+        :type job_exe: :class:`job.models.JobExecution`
+        :param job_data: The job data
+        :type job_data: :class:`job.configuration.data.job_data.JobData`
+        :param staged_post_steps: The value returned by stage_post_steps()
+        :type staged_post_steps: tuple
+        :return: A tuple of the job results and the results manifest generated by the job execution
+        :rtype: (:class:`job.configuration.results.job_results.JobResults`,
+            :class:`job.configuration.results.results_manifest.results_manifest.ResultsManifest`)
+        """
+
+        results_manifest, job_data_parse_results, staged_files = staged_post_steps
+
+        job_data.save_parse_results(job_data_parse_results)
+        return (job_data.commit_output_data_files(staged_files, job_exe), results_manifest)
+
     def fully_populate_command_argument(self, job_data, job_environment, job_exe_id):
         """Return a fully populated command arguments string. If pre-steps are necessary
         (see are_pre_steps_needed), they should be run before this.  populated with information
@@ -394,65 +415,7 @@ class JobInterface(object):
             :class:`job.configuration.results.results_manifest.results_manifest.ResultsManifest`)
         """
 
-        manifest_data = {}
-        path_to_manifest_file = os.path.join(SCALE_JOB_EXE_OUTPUT_PATH, 'results_manifest.json')
-        if os.path.exists(path_to_manifest_file):
-            logger.info('Opening results manifest...')
-            with open(path_to_manifest_file, 'r') as manifest_file:
-                manifest_data = json.loads(manifest_file.read())
-                logger.info('Results manifest:')
-                logger.info(manifest_data)
-        else:
-            logger.info('No results manifest found')
-
-        results_manifest = ResultsManifest(manifest_data)
-        stdout_files = self._get_artifacts_from_stdout(stdoutAndStderr)
-        results_manifest.add_files(stdout_files)
-
-        results_manifest.validate(self._output_file_manifest_dict)
-
-        files_to_store = {}
-        for manifest_file_entry in results_manifest.get_files():
-            param_name = manifest_file_entry['name']
-
-            media_type = None
-            output_data_item = self._get_output_data_item_by_name(param_name)
-            if output_data_item:
-                media_type = output_data_item.get('media_type')
-
-            msg = 'Output %s has invalid/missing file path "%s"'
-            if 'file' in manifest_file_entry:
-                file_entry = manifest_file_entry['file']
-                if not os.path.isfile(file_entry['path']):
-                    raise InvalidResultsManifest(msg % (param_name, file_entry['path']))
-                if 'geo_metadata' in file_entry:
-                    files_to_store[param_name] = (file_entry['path'], media_type, file_entry['geo_metadata'])
-                else:
-                    files_to_store[param_name] = (file_entry['path'], media_type)
-            elif 'files' in manifest_file_entry:
-                file_tuples = []
-                for file_entry in manifest_file_entry['files']:
-                    if not os.path.isfile(file_entry['path']):
-                        raise InvalidResultsManifest(msg % (param_name, file_entry['path']))
-                    if 'geo_metadata' in file_entry:
-                        file_tuples.append((file_entry['path'], media_type, file_entry['geo_metadata']))
-                    else:
-                        file_tuples.append((file_entry['path'], media_type))
-                files_to_store[param_name] = file_tuples
-
-        job_data_parse_results = {}  # parse results formatted for job_data
-        for parse_result in results_manifest.get_parse_results():
-            filename = parse_result['filename']
-            assert filename not in job_data_parse_results
-            geo_metadata = parse_result.get('geo_metadata', {})
-            geo_json = geo_metadata.get('geo_json', None)
-            data_started = geo_metadata.get('data_started', None)
-            data_ended = geo_metadata.get('data_ended', None)
-            data_types = parse_result.get('data_types', [])
-            new_workspace_path = parse_result.get('new_workspace_path', None)
-            if new_workspace_path:
-                new_workspace_path = os.path.join(new_workspace_path, filename)
-            job_data_parse_results[filename] = (geo_json, data_started, data_ended, data_types, new_workspace_path)
+        results_manifest, files_to_store, job_data_parse_results = self._read_results_manifest(stdoutAndStderr)
 
         job_data.save_parse_results(job_data_parse_results)
         return (job_data.store_output_data_files(files_to_store, job_exe), results_manifest)
@@ -527,7 +490,8 @@ class JobInterface(object):
         :rtype: dict
         """
 
-        env_vars = self.definition['env_vars']
+        # Replace values in a copy since interfaces are shared between all executions of a job type revision
+        env_vars = copy.deepcopy(self.definition['env_vars'])
         interface_settings = self.definition['settings']
 
         param_replacements = self._get_settings_values(interface_settings,
@@ -537,6 +501,27 @@ class JobInterface(object):
 
         return env_vars
 
+    def stage_post_steps(self, job_exe, job_data, stdoutAndStderr):
+        """Performs the first half of the post steps: reads the results manifest and transfers the output files into
+        their workspaces without making any changes to the database. This should be called outside of a database
+        transaction and the returned value must then be passed to commit_post_steps() within a transaction.
+
+        :param job_exe: The job execution model with related job and job_type fields
+        :type job_exe: :class:`job.models.JobExecution`
+        :param job_data: The job data
+        :type job_data: :class:`job.configuration.data.job_data.JobData`
+        :param stdoutAndStderr: the standard out from the job execution
+        :type stdoutAndStderr: str
+        :return: A tuple of the results manifest, the parse results, and the staged output files
+        :rtype: (:class:`job.configuration.results.results_manifest.results_manifest.ResultsManifest`, dict,
+            :class:`job.configuration.data.job_data.StagedOutputFiles`)
+        """
+
+        results_manifest, files_to_store, job_data_parse_results = self._read_results_manifest(stdoutAndStderr)
+
+        staged_files = job_data.stage_output_data_files(files_to_store, job_exe)
+        return (results_manifest, job_data_parse_results, staged_files)
+
     def validate_connection(self, job_conn):
         """Validates the given job connection to ensure that the connection will provide sufficient data to run a job
         with this interface
@@ -886,6 +871,78 @@ class JobInterface(object):
             if 'required' not in shared_resource:
                 shared_resource['required'] = True
 
+    def _read_results_manifest(self, stdoutAndStderr):
+        """Reads the results manifest file and the artifacts in the given standard out, validates them, and returns the
+        output files to store and the parse results
+
+        :param stdoutAndStderr: the standard out from the job execution
+        :type stdoutAndStderr: str
+        :return: A tuple of the results manifest, the output files to store, and the parse results
+        :rtype: (:class:`job.configuration.results.results_manifest.results_manifest.ResultsManifest`, dict, dict)
+        """
+
+        manifest_data = {}
+        path_to_manifest_file = os.path.join(SCALE_JOB_EXE_OUTPUT_PATH, 'results_manifest.json')
+        if os.path.exists(path_to_manifest_file):
+            logger.info('Opening results manifest...')
+            with open(path_to_manifest_file, 'r') as manifest_file:
+                manifest_data = json.loads(manifest_file.read())
+                logger.info('Results manifest:')
+                logger.info(manifest_data)
+        else:
+            logger.info('No results manifest found')
+
+        results_manifest = ResultsManifest(manifest_data)
+        stdout_files = self._get_artifacts_from_stdout(stdoutAndStderr)
+        results_manifest.add_files(stdout_files)
+
+        results_manifest.validate(self._output_file_manifest_dict)
+
+        files_to_store = {}
+        for manifest_file_entry in results_manifest.get_files():
+            param_name = manifest_file_entry['name']
+
+            media_type = None
+            output_data_item = self._get_output_data_item_by_name(param_name)
+            if output_data_item:
+                media_type = output_data_item.get('media_type')
+
+            msg = 'Output %s has invalid/missing file path "%s"'
+            if 'file' in manifest_file_entry:
+                file_entry = manifest_file_entry['file']
+                if not os.path.isfile(file_entry['path']):
+                    raise InvalidResultsManifest(msg % (param_name, file_entry['path']))
+                if 'geo_metadata' in file_entry:
+                    files_to_store[param_name] = (file_entry['path'], media_type, file_entry['geo_metadata'])
+                else:
+                    files_to_store[param_name] = (file_entry['path'], media_type)
+            elif 'files' in manifest_file_entry:
+                file_tuples = []
+                for file_entry in manifest_file_entry['files']:
+                    if not os.path.isfile(file_entry['path']):
+                        raise InvalidResultsManifest(msg % (param_name, file_entry['path']))
+                    if 'geo_metadata' in file_entry:
+                        file_tuples.append((file_entry['path'], media_type, file_entry['geo_metadata']))
+                    else:
+                        file_tuples.append((file_entry['path'], media_type))
+                files_to_store[param_name] = file_tuples
+
+        job_data_parse_results = {}  # parse results formatted for job_data
+        for parse_result in results_manifest.get_parse_results():
+            filename = parse_result['filename']
+            assert filename not in job_data_parse_results
+            geo_metadata = parse_result.get('geo_metadata', {})
+            geo_json = geo_metadata.get('geo_json', None)
+            data_started = geo_metadata.get('data_started', None)
+            data_ended = geo_metadata.get('data_ended', None)
+            data_types = parse_result.get('data_types', [])
+            new_workspace_path = parse_result.get('new_workspace_path', None)
+            if new_workspace_path:
+                new_workspace_path = os.path.join(new_workspace_path, filename)
+            job_data_parse_results[filename] = (geo_json, data_started, data_ended, data_types, new_workspace_path)
+
+        return results_manifest, files_to_store, job_data_parse_results
+
     @staticmethod
     def _replace_command_parameters(command_arguments, param_replacements):
         """find all occurrences of a parameter with a given name in the command_arguments string and
@@ -4,12 +4,12 @@ from __future__ import unicode_literals
 import logging
 import re
 
-from jsonschema import validate
 from jsonschema.exceptions import ValidationError
 
 from job.configuration.interface import job_interface_1_1 as previous_interface
 from job.configuration.interface.exceptions import InvalidInterfaceDefinition
 from job.configuration.exceptions import MissingSetting
+from util.validation import validate
 
 
 logger = logging.getLogger(__name__)
@@ -3,7 +3,6 @@ from __future__ import unicode_literals
 
 import logging
 
-from jsonschema import validate
 from jsonschema.exceptions import ValidationError
 
 from job.configuration.exceptions import InvalidExecutionConfiguration
@@ -11,6 +10,7 @@ from job.configuration.job_parameter import TaskSetting
 from job.configuration.json.execution import exe_config_1_0 as previous_version
 from job.configuration.volume import MODE_RO, MODE_RW
 from job.execution.container import get_mount_volume_name
+from util.validation import validate
 
 logger = logging.getLogger(__name__)
 
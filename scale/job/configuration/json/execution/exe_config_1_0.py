@@ -4,13 +4,13 @@ from __future__ import unicode_literals
 import logging
 
 from django.conf import settings
-from jsonschema import validate
 from jsonschema.exceptions import ValidationError
 
 from job.configuration.exceptions import InvalidExecutionConfiguration
 from job.configuration.job_parameter import DockerParam, TaskWorkspace
 from job.execution.container import get_workspace_volume_name
 from storage.container import get_workspace_volume_path
+from util.validation import validate
 
 
 logger = logging.getLogger(__name__)
@@ -161,6 +161,7 @@ class ExecutionConfiguration(object):
         if name in self._job_task_workspace_names:
             raise InvalidExecutionConfiguration('Duplicate workspace %s in job task' % name)
         self._configuration['job_task']['workspaces'].append({'name': name, 'mode': mode})
+        self._job_task_workspace_names.add(name)
 
     def add_post_task_workspace(self, name, mode):
         """Adds a needed workspace to this job's post task
@@ -177,6 +178,7 @@ class ExecutionConfiguration(object):
         if name in self._post_task_workspace_names:
             raise InvalidExecutionConfiguration('Duplicate workspace %s in post task' % name)
         self._configuration['post_task']['workspaces'].append({'name': name, 'mode': mode})
+        self._post_task_workspace_names.add(name)
 
     def add_pre_task_workspace(self, name, mode):
         """Adds a needed workspace to this job's pre task
@@ -193,6 +195,7 @@ class ExecutionConfiguration(object):
         if name in self._pre_task_workspace_names:
             raise InvalidExecutionConfiguration('Duplicate workspace %s in pre task' % name)
         self._configuration['pre_task']['workspaces'].append({'name': name, 'mode': mode})
+        self._pre_task_workspace_names.add(name)
 
     def configure_workspace_docker_params(self, job_exe, workspaces, docker_volumes):
         """Configures the Docker parameters needed for each workspace in the job execution tasks. The given job
@@ -336,6 +339,15 @@ class ExecutionConfiguration(object):
         workspaces = self._configuration['pre_task']['workspaces']
         return [TaskWorkspace(workspace_dict['name'], workspace_dict['mode']) for workspace_dict in workspaces]
 
+    def get_workspace_names(self):
+        """Returns the names of the workspaces needed by any of the tasks
+
+        :returns: The names of the workspaces needed by any of the tasks
+        :rtype: set
+        """
+
+        return self._pre_task_workspace_names | self._job_task_workspace_names | self._post_task_workspace_names
+
     def get_dict(self):
         """Returns the internal dictionary that represents this job configuration
 
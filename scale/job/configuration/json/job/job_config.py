@@ -4,12 +4,12 @@ from __future__ import unicode_literals
 import logging
 import os
 
-from jsonschema import validate
 from jsonschema.exceptions import ValidationError
 
 from job.configuration.exceptions import InvalidJobConfiguration
 from job.configuration.json.job import job_config_1_0 as previous_interface
 from job.configuration.volume import Volume
+from util.validation import validate
 
 logger = logging.getLogger(__name__)
 
@@ -4,10 +4,12 @@ from __future__ import unicode_literals
 import logging
 import threading
 
+from django.conf import settings
 from django.db import transaction
 from django.utils.timezone import now
 
 from error.models import Error
+from job.configuration.json.execution.exe_config import ExecutionConfiguration
 from job.execution.tasks.job_task import JobTask
 from job.execution.tasks.post_task import PostTask
 from job.execution.tasks.pre_task import PreTask
@@ -23,7 +25,7 @@ logger = logging.getLogger(__name__)
 class RunningJobExecution(object):
     """This class represents a currently running job execution. This class is thread-safe."""
 
-    def __init__(self, agent_id, job_exe):
+    def __init__(self, agent_id, job_exe, is_image_pulled=False):
         """Constructor
 
         :param agent_id: The ID of the agent on which the execution is running
@@ -31,6 +33,9 @@ class RunningJobExecution(object):
         :param job_exe: The job execution, which must be in RUNNING status and have its related node_id, job, job_type
             and job_type_rev models populated
         :type job_exe: :class:`job.models.JobExecution`
+        :param is_image_pulled: Whether the node recently pulled the job's Docker image, in which case the pull task is
+            skipped
+        :type is_image_pulled: bool
         """
 
         self._id = job_exe.id
@@ -38,10 +43,14 @@ class RunningJobExecution(object):
         self._job_type_id = job_exe.job.job_type_id
         self._priority = job_exe.job.priority
         self._node_id = job_exe.node_id
+        self._started = job_exe.started
+        self._disk_scheduled = (job_exe.disk_in_scheduled or 0.0) + (job_exe.disk_out_scheduled or 0.0)
         if hasattr(job_exe, 'docker_volumes'):
             self._docker_volumes = job_exe.docker_volumes
         else:
             self._docker_volumes = []
+        self._configuration = job_exe.configuration
+        self._workspace_names = None
 
         self._lock = threading.Lock()  # Protects the following fields
         self._all_tasks = []
@@ -53,7 +62,8 @@ class RunningJobExecution(object):
 
         # Create tasks
         if not job_exe.is_system:
-            self._all_tasks.append(PullTask(agent_id, job_exe))
+            if not is_image_pulled:
+                self._all_tasks.append(PullTask(agent_id, job_exe))
             self._all_tasks.append(PreTask(agent_id, job_exe))
         self._all_tasks.append(JobTask(agent_id, job_exe))
         if not job_exe.is_system:
@@ -71,6 +81,16 @@ class RunningJobExecution(object):
 
         return self._current_task
 
+    @property
+    def disk_scheduled(self):
+        """Returns the amount of disk space in MiB scheduled for this job execution's input and output
+
+        :returns: The amount of disk space scheduled
+        :rtype: float
+        """
+
+        return self._disk_scheduled
+
     @property
     def docker_volumes(self):
         """Returns the names of the Docker volumes used by this job execution
@@ -81,6 +101,16 @@ class RunningJobExecution(object):
 
         return self._docker_volumes
 
+    @property
+    def error(self):
+        """Returns this job execution's error, None if there is no error
+
+        :returns: The error, possibly None
+        :rtype: :class:`error.models.Error`
+        """
+
+        return self._error
+
     @property
     def error_category(self):
         """Returns the category of this job execution's error, None if there is no error
@@ -153,6 +183,16 @@ class RunningJobExecution(object):
 
         return self._node_id
 
+    @property
+    def started(self):
+        """When this job execution was scheduled to run, possibly None
+
+        :returns: When this job execution started, possibly None
+        :rtype: :class:`datetime.datetime`
+        """
+
+        return self._started
+
     @property
     def status(self):
         """Returns the status of this job execution
@@ -163,6 +203,20 @@ class RunningJobExecution(object):
 
         return self._status
 
+    @property
+    def workspace_names(self):
+        """Returns the names of the workspaces used by this job execution. The execution configuration is only parsed
+        the first time this is called.
+
+        :returns: The names of the workspaces used by this job execution
+        :rtype: set
+        """
+
+        with self._lock:
+            if self._workspace_names is None:
+                self._workspace_names = ExecutionConfiguration(self._configuration).get_workspace_names()
+            return self._workspace_names
+
     @retry_database_query
     def execution_canceled(self):
         """Cancels this job execution and returns the current task
@@ -194,8 +248,9 @@ class RunningJobExecution(object):
         """
 
         error = Error.objects.get_builtin_error('node-lost')
-        from queue.models import Queue
-        Queue.objects.handle_job_failure(self._id, when, self._all_tasks, error)
+        if not settings.JOB_LIFECYCLE_MESSAGES_ENABLED:
+            from queue.models import Queue
+            Queue.objects.handle_job_failure(self._id, when, self._all_tasks, error)
 
         with self._lock:
             self._current_task = None
@@ -217,8 +272,9 @@ class RunningJobExecution(object):
         else:
             error_name = 'launch-timeout'
         error = Error.objects.get_builtin_error(error_name)
-        from queue.models import Queue
-        Queue.objects.handle_job_failure(self._id, when, self._all_tasks, error)
+        if not settings.JOB_LIFECYCLE_MESSAGES_ENABLED:
+            from queue.models import Queue
+            Queue.objects.handle_job_failure(self._id, when, self._all_tasks, error)
 
         with self._lock:
             self._current_task = None
@@ -273,6 +329,66 @@ class RunningJobExecution(object):
             next_task = self._remaining_tasks[0]
             return next_task
 
+    def populate_job_exe_model(self, job_exe):
+        """Populates the given job execution model with the relevant information from all of this job execution's
+        tasks
+
+        :param job_exe: The job execution model
+        :type job_exe: :class:`job.models.JobExecution`
+        """
+
+        with self._lock:
+            for task in self._all_tasks:
+                task.populate_job_exe_model(job_exe)
+
+    def recover_tasks(self, task_updates, when):
+        """Recovers the state of this job execution's tasks from the status updates that were saved in the database
+        before the scheduler was restarted and returns the current task. Tasks that successfully finished are skipped and
+        the latest task that was launched becomes the current task so that it can be reconciled instead of launched
+        again. A terminal update of the current task is not applied so that reconciliation delivers it again and the
+        job execution is completed or failed through the normal task update handling.
+
+        :param task_updates: The saved status updates for this job execution's tasks, ordered by when they were saved
+        :type task_updates: [:class:`job.tasks.update.TaskStatusUpdate`]
+        :param when: The current time, used for tasks whose launch time is unknown
+        :type when: :class:`datetime.datetime`
+        :returns: The current task, possibly None
+        :rtype: :class:`job.tasks.base_task.Task`
+        """
+
+        with self._lock:
+            last_task = self._all_tasks[-1]
+            while self._remaining_tasks:
+                task = self._remaining_tasks[0]
+                lost_prefix = '%s_lost-' % task.id
+                updates = [update for update in task_updates
+                           if update.task_id == task.id or update.task_id.startswith(lost_prefix)]
+                if not updates:
+                    break  # Task was never launched
+
+                # Only the updates for the latest ID of the task matter, previous IDs were lost
+                task.recover_task_id(updates[-1].task_id)
+                updates = [update for update in updates if update.task_id == task.id]
+                latest_update = updates[-1]
+                if latest_update.status == TaskStatusUpdate.LOST:
+                    task.update_task_id_for_lost_task()  # Task will be launched again with a new ID
+                    break
+
+                task.launch(updates[0].timestamp or when)
+                for update in updates:
+                    if update.status not in TaskStatusUpdate.TERMINAL_STATUSES:
+                        task.update(update)
+                if latest_update.status == TaskStatusUpdate.FINISHED and task is not last_task:
+                    task.update(latest_update)
+                    task.complete(latest_update)
+                    self._remaining_tasks.pop(0)
+                    continue
+
+                self._current_task = self._remaining_tasks.pop(0)
+                break
+
+            return self._current_task
+
     def start_next_task(self):
         """Starts the next task in the job execution and returns it. Returns None if the next task is not ready or no
         tasks remain.
@@ -340,7 +456,7 @@ class RunningJobExecution(object):
                 job_exe = JobExecution.objects.get(id=self._id)
                 for task in remaining_tasks:
                     task.refresh_cached_values(job_exe)
-            if not remaining_tasks:
+            if not remaining_tasks and not settings.JOB_LIFECYCLE_MESSAGES_ENABLED:
                 from queue.models import Queue
                 Queue.objects.handle_job_completion(self._id, when, self._all_tasks)
 
@@ -363,8 +479,8 @@ class RunningJobExecution(object):
             return
 
         when = now()
-        with transaction.atomic():
-            error = current_task.determine_error(task_update)
+        error = current_task.determine_error(task_update)
+        if not settings.JOB_LIFECYCLE_MESSAGES_ENABLED:
             from queue.models import Queue
             Queue.objects.handle_job_failure(self._id, when, self._all_tasks, error)
 
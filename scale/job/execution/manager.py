@@ -4,12 +4,17 @@ from __future__ import unicode_literals
 import logging
 import threading
 
+from django.conf import settings
 from django.db import DatabaseError
 from django.utils.timezone import now
 
+from job.execution.container import get_job_exe_input_vol_name, get_job_exe_output_vol_name
+from job.execution.job_exe import RunningJobExecution
 from job.execution.metrics import TotalJobExeMetrics
 from job.execution.tasks.exe_task import JOB_TASK_ID_PREFIX
-from job.models import JobExecution
+from job.models import JobExecution, TaskUpdate
+from job.tasks.update import TaskStatusUpdate
+from util.retry import retry_database_query
 
 logger = logging.getLogger(__name__)
 
@@ -21,14 +26,43 @@ class JobExecutionManager(object):
         """Constructor
         """
 
+        self._finished_job_exes = []  # Finished job executions that need to be handled with messages
         self._running_job_exes = {}  # {ID: RunningJobExecution}
         self._lock = threading.Lock()
         self._metrics = TotalJobExeMetrics(now())
 
+    def cancel_job_exes(self, job_exe_ids):
+        """Handles the running job executions with the given IDs that have been canceled in the database. The current
+        task of each canceled job execution is returned so the tasks may be killed. IDs of job executions that are no
+        longer running are ignored.
+
+        :param job_exe_ids: The IDs of the canceled job executions
+        :type job_exe_ids: [int]
+        :returns: A list of the canceled tasks to kill
+        :rtype: [:class:`job.tasks.base_task.Task`]
+        """
+
+        canceled_tasks = []
+        with self._lock:
+            for job_exe_id in job_exe_ids:
+                if job_exe_id in self._running_job_exes:
+                    canceled_job_exe = self._running_job_exes[job_exe_id]
+                    try:
+                        task = canceled_job_exe.execution_canceled()
+                        if task:
+                            canceled_tasks.append(task)
+                    except DatabaseError:
+                        logger.exception('Error canceling job execution %i', job_exe_id)
+                    # We do not remove canceled job executions at this point. We wait for the status update of the
+                    # killed task to come back so that job execution cleanup occurs after the task is dead.
+
+        return canceled_tasks
+
     def clear(self):
         """Clears all data from the manager. This method is intended for testing only.
         """
 
+        self._finished_job_exes = []
         self._running_job_exes = {}
         self._metrics = TotalJobExeMetrics(now())
 
@@ -44,6 +78,21 @@ class JobExecutionManager(object):
         with self._lock:
             self._metrics.generate_status_json(nodes_list, when)
 
+    def get_messages(self):
+        """Returns the command messages for handling the job executions that have completed or failed since the last
+        time this method was called. Job executions of the same kind are combined into as few messages as possible.
+
+        :returns: The list of messages to send
+        :rtype: [:class:`messaging.messages.message.CommandMessage`]
+        """
+
+        with self._lock:
+            finished_job_exes = self._finished_job_exes
+            self._finished_job_exes = []
+
+        from queue.messages.job_exe_end import create_job_exe_end_messages
+        return create_job_exe_end_messages(finished_job_exes)
+
     def get_running_job_exe(self, job_exe_id):
         """Returns the running job execution with the given ID, or None if the job execution does not exist
 
@@ -58,6 +107,16 @@ class JobExecutionManager(object):
                 return self._running_job_exes[job_exe_id]
             return None
 
+    def get_running_job_exe_ids(self):
+        """Returns the IDs of all of the running job executions
+
+        :returns: The IDs of the running job executions
+        :rtype: [int]
+        """
+
+        with self._lock:
+            return list(self._running_job_exes.keys())
+
     def get_running_job_exes(self):
         """Returns all currently running job executions
 
@@ -145,6 +204,59 @@ class JobExecutionManager(object):
                         self._handle_finished_job_exe(job_exe)
         return lost_exes
 
+    @retry_database_query
+    def recover_running_job_exes(self, when):
+        """Recovers the job executions that are RUNNING in the database but unknown to this manager, which happens when
+        the scheduler is restarted or fails over while job executions are running. The state of each job execution's
+        tasks is rebuilt from its saved task updates so that the execution can continue instead of being failed. The
+        current tasks of the recovered job executions are returned so that they can be tracked and reconciled.
+
+        :param when: The current time
+        :type when: :class:`datetime.datetime`
+        :returns: The current tasks of the recovered job executions
+        :rtype: [:class:`job.tasks.base_task.Task`]
+        """
+
+        with self._lock:
+            known_job_exe_ids = set(self._running_job_exes.keys())
+
+        job_exe_qry = JobExecution.objects.get_running_job_exes().select_related('job__job_type', 'job__job_type_rev')
+        job_exe_models = [job_exe for job_exe in job_exe_qry.iterator() if job_exe.id not in known_job_exe_ids]
+        if not job_exe_models:
+            return []
+
+        # Retrieve the saved task updates for all of the job executions with a single query
+        task_updates = {}  # {Job Exe ID: [TaskStatusUpdate]}
+        task_update_qry = TaskUpdate.objects.filter(job_exe_id__in=[job_exe.id for job_exe in job_exe_models])
+        for task_update_model in task_update_qry.order_by('id').iterator():
+            # Agent IDs are not saved with task updates, tasks learn them again from their next status update
+            task_update = TaskStatusUpdate(task_update_model, '', {})
+            task_updates.setdefault(task_update_model.job_exe_id, []).append(task_update)
+
+        recovered_job_exes = []
+        for job_exe_model in job_exe_models:
+            try:
+                if not job_exe_model.is_system:
+                    job_exe_model.docker_volumes = [get_job_exe_input_vol_name(job_exe_model),
+                                                    get_job_exe_output_vol_name(job_exe_model)]
+                job_exe = RunningJobExecution('', job_exe_model)
+                job_exe.recover_tasks(task_updates.get(job_exe.id, []), when)
+            except Exception:
+                logger.exception('Unable to recover running job execution %i', job_exe_model.id)
+                continue
+            recovered_job_exes.append(job_exe)
+
+        with self._lock:
+            recovered_job_exes = [job_exe for job_exe in recovered_job_exes if job_exe.id not in self._running_job_exes]
+            for job_exe in recovered_job_exes:
+                self._running_job_exes[job_exe.id] = job_exe
+            self._metrics.add_running_job_exes(recovered_job_exes)
+
+        current_tasks = [job_exe.current_task for job_exe in recovered_job_exes if job_exe.current_task]
+        logger.info('Recovered %i running job execution(s) with %i launched task(s)', len(recovered_job_exes),
+                    len(current_tasks))
+        return current_tasks
+
     def schedule_job_exes(self, job_exes):
         """Adds newly scheduled running job executions to the manager
 
@@ -165,26 +277,9 @@ class JobExecutionManager(object):
         :rtype: [:class:`job.tasks.base_task.Task`]
         """
 
-        with self._lock:
-            job_exe_ids = list(self._running_job_exes.keys())
-
-        canceled_tasks = []
-        canceled_models = list(JobExecution.objects.filter(id__in=job_exe_ids, status='CANCELED').iterator())
-
-        with self._lock:
-            for job_exe_model in canceled_models:
-                if job_exe_model.id in self._running_job_exes:
-                    canceled_job_exe = self._running_job_exes[job_exe_model.id]
-                    try:
-                        task = canceled_job_exe.execution_canceled()
-                        if task:
-                            canceled_tasks.append(task)
-                    except DatabaseError:
-                        logger.exception('Error canceling job execution %i', job_exe_model.id)
-                    # We do not remove canceled job executions at this point. We wait for the status update of the
-                    # killed task to come back so that job execution cleanup occurs after the task is dead.
-
-        return canceled_tasks
+        job_exe_ids = self.get_running_job_exe_ids()
+        canceled_ids = JobExecution.objects.filter(id__in=job_exe_ids, status='CANCELED').values_list('id', flat=True)
+        return self.cancel_job_exes(list(canceled_ids))
 
     def _handle_finished_job_exe(self, job_exe):
         """Handles the finished job execution. Caller must have obtained the manager lock.
@@ -195,6 +290,8 @@ class JobExecutionManager(object):
 
         del self._running_job_exes[job_exe.id]
         self._metrics.job_exe_finished(job_exe)
+        if settings.JOB_LIFECYCLE_MESSAGES_ENABLED and job_exe.status in ['COMPLETED', 'FAILED']:
+            self._finished_job_exes.append(job_exe)
 
 
 job_exe_mgr = JobExecutionManager()
@@ -5,13 +5,16 @@ import datetime
 import logging
 from collections import namedtuple
 
-from job.execution.job_exe import RunningJobExecution
 from job.models import JobExecution
 from util.retry import retry_database_query
 
 logger = logging.getLogger(__name__)
 
 
+# Lightweight representation of a finished job execution that provides the fields needed by the metrics
+FinishedJobExe = namedtuple('FinishedJobExe', ['node_id', 'job_type_id', 'status', 'error_category', 'finished'])
+
+
 class JobExeMetrics(object):
     """This class holds metrics for a list of job executions"""
 
@@ -454,12 +457,13 @@ class TotalJobExeMetrics(object):
         """
 
         oldest_time = self._finished_metrics_over_time.time_blocks[0].start
+        # Only the few fields needed by the metrics are queried (with no model instances or related models) so that
+        # loading the history is fast even when many job executions have finished recently
         # TODO: this should be in the manager, but the JobExecution model is going to be completely re-worked anyway
-        job_exe_query = JobExecution.objects.select_related('error')
-        job_exe_query = job_exe_query.filter(status__in=['COMPLETED', 'FAILED'], ended__gte=oldest_time)
-        for job_exe_model in job_exe_query:
-            job_exe = RunningJobExecution('', job_exe_model)
-            job_exe._set_finished_status(job_exe_model.status, job_exe_model.ended, job_exe_model.error)
+        job_exe_query = JobExecution.objects.filter(status__in=['COMPLETED', 'FAILED'], ended__gte=oldest_time)
+        job_exe_query = job_exe_query.values_list('node_id', 'job__job_type_id', 'status', 'error__category', 'ended')
+        for row in job_exe_query.iterator():
+            job_exe = FinishedJobExe(*row)
             self._finished_metrics.add_job_execution(job_exe)
             self._finished_metrics_over_time.add_job_execution(job_exe)
 
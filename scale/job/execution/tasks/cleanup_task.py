@@ -39,15 +39,17 @@ class CleanupTask(Task):
         self._is_docker_privileged = False
         self._running_timeout_threshold = datetime.timedelta(minutes=10)
 
-        # Define basic command pieces
-        for_cmd = 'for %s in `%s`; do %s; done'
+        # Define basic command pieces, each list of containers/volumes is deleted with a single Docker command
+        bulk_cmd = '%s | xargs -r %s'
         all_containers_cmd = 'docker ps -a --format \'{{.Names}}\''
         nonrunning_filters = '-f status=created -f status=dead -f status=exited'
         all_nonrunning_containers_cmd = 'docker ps %s --format \'{{.Names}}\'' % nonrunning_filters
         all_volumes_cmd = 'docker volume ls -q'
         all_scale_dangling_volumes_cmd = 'docker volume ls -f dangling=true -q | grep scale_'
-        container_delete_cmd = 'docker rm $cont'
-        volume_delete_cmd = 'docker volume rm $vol'
+        container_delete_cmd = 'docker rm'
+        volume_delete_cmd = 'docker volume rm'
+        dangling_images_cmd = 'docker images -q -f dangling=true'
+        image_delete_cmd = 'docker rmi'
 
         # Create commands that list the containers/volumes to delete
         if self._is_initial_cleanup:
@@ -70,11 +72,14 @@ class CleanupTask(Task):
             container_list_cmd = '%s | grep -e %s' % (all_containers_cmd, ' -e '.join(containers))
             volume_list_cmd = '%s | grep -e %s' % (all_volumes_cmd, ' -e '.join(volumes))
 
-        delete_containers_cmd = for_cmd % ('cont', container_list_cmd, container_delete_cmd)
-        delete_volumes_cmd = for_cmd % ('vol', volume_list_cmd, volume_delete_cmd)
+        delete_containers_cmd = bulk_cmd % (container_list_cmd, container_delete_cmd)
+        delete_volumes_cmd = bulk_cmd % (volume_list_cmd, volume_delete_cmd)
+        # Images replaced by pulls are left dangling, they are deleted here instead of by the pulls so that the pulls of
+        # job executions stay fast
+        delete_images_cmd = bulk_cmd % (dangling_images_cmd, image_delete_cmd)
 
-        # Create overall command that deletes containers and volumes for the job executions
-        self._command = '%s; %s' % (delete_containers_cmd, delete_volumes_cmd)
+        # Create overall command that deletes containers and volumes for the job executions and any dangling images
+        self._command = '%s; %s; %s' % (delete_containers_cmd, delete_volumes_cmd, delete_images_cmd)
 
     @property
     def is_initial_cleanup(self):
@@ -97,6 +97,20 @@ class JobExecutionTask(Task):
 
         pass
 
+    def recover_task_id(self, task_id):
+        """Recovers this task's ID from the ID that the task had when the scheduler was last running. If the task had
+        been lost and given a new ID, the lost count is restored so that future lost task IDs remain unique.
+
+        :param task_id: The recovered task ID
+        :type task_id: string
+        """
+
+        lost_prefix = '%s_lost-' % self._base_task_id
+        with self._lock:
+            if task_id.startswith(lost_prefix):
+                self._lost_count = int(task_id[len(lost_prefix):])
+                self._task_id = task_id
+
     def refresh_cached_values(self, job_exe):
         """Refreshes the task's cached job execution values with the given model
 
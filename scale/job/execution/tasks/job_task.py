@@ -10,6 +10,9 @@ from node.resources.resource import Disk
 
 JOB_TYPE_TIMEOUT_ERRORS = {}  # {Job type name: error name}
 
+# The number of bytes in a MiB, resource usage statistics are reported in bytes
+BYTES_PER_MIB = 1024.0 * 1024.0
+
 
 class JobTask(JobExecutionTask):
     """Represents a job execution job task (runs the actual job/algorithm). This class is thread-safe.
@@ -50,6 +53,12 @@ class JobTask(JobExecutionTask):
         else:
             self.timeout_error_name = 'system-timeout' if self._is_system else 'timeout'
 
+        # Peak resource usage of the running task, sampled from the agent's resource usage statistics
+        self._cpus_used = None
+        self._mem_used = None
+        self._disk_used = None
+        self._last_cpu_sample = None  # (Timestamp in seconds, Total CPU time in seconds)
+
     def determine_error(self, task_update):
         """See :meth:`job.execution.tasks.exe_task.JobExecutionTask.determine_error`
         """
@@ -94,6 +103,12 @@ class JobTask(JobExecutionTask):
             if self._has_ended:
                 job_exe.job_completed = self._ended
                 job_exe.job_exit_code = self._exit_code
+            if self._cpus_used is not None:
+                job_exe.cpus_used = self._cpus_used
+            if self._mem_used is not None:
+                job_exe.mem_used = self._mem_used
+            if self._disk_used is not None:
+                job_exe.disk_used = self._disk_used
 
     def refresh_cached_values(self, job_exe):
         """Refreshes the task's cached job execution values with the given model
@@ -104,3 +119,32 @@ class JobTask(JobExecutionTask):
 
         with self._lock:
             self._command_arguments = job_exe.command_arguments
+
+    def update_resource_usage(self, statistics):
+        """Updates the peak resource usage of this task with the given sample of the resource usage statistics that the
+        agent reports for the task's container. CPU usage is the CPU time used between two samples divided by the time
+        between them, so the first sample only records the CPU time. Memory and disk usage are point-in-time values, so
+        the largest samples underestimate the true peaks.
+
+        :param statistics: The resource usage statistics of the task's container
+        :type statistics: dict
+        """
+
+        with self._lock:
+            if not self._has_started or self._has_ended:
+                return
+
+            if 'timestamp' in statistics and 'cpus_user_time_secs' in statistics:
+                cpu_time = statistics['cpus_user_time_secs'] + statistics.get('cpus_system_time_secs', 0.0)
+                if self._last_cpu_sample:
+                    elapsed = statistics['timestamp'] - self._last_cpu_sample[0]
+                    if elapsed > 0:
+                        cpus = (cpu_time - self._last_cpu_sample[1]) / elapsed
+                        self._cpus_used = max(self._cpus_used, cpus) if self._cpus_used is not None else cpus
+                self._last_cpu_sample = (statistics['timestamp'], cpu_time)
+            if 'mem_rss_bytes' in statistics:
+                mem = statistics['mem_rss_bytes'] / BYTES_PER_MIB
+                self._mem_used = max(self._mem_used, mem) if self._mem_used is not None else mem
+            if 'disk_used_bytes' in statistics:
+                disk = statistics['disk_used_bytes'] / BYTES_PER_MIB
+                self._disk_used = max(self._disk_used, disk) if self._disk_used is not None else disk
@@ -5,7 +5,7 @@ import datetime
 
 from error.models import Error
 from job.execution.tasks.exe_task import JobExecutionTask
-from job.tasks.pull_task import create_pull_command
+from job.tasks.pull_task import create_pull_command, is_image_pinned
 
 
 class PullTask(JobExecutionTask):
@@ -32,7 +32,20 @@ class PullTask(JobExecutionTask):
         self._staging_timeout_threshold = datetime.timedelta(minutes=2)
 
         self.timeout_error_name = 'pull-timeout'
-        self._command = create_pull_command(job_exe.get_docker_image())
+        # This task is skipped when the node recently pulled the image. Otherwise a tag may have been re-pushed since
+        # the image was last pulled, so only an image pinned to a digest is not pulled again when it is already there.
+        self._image_name = job_exe.get_docker_image()
+        self._command = create_pull_command(self._image_name, check_exists=is_image_pinned(self._image_name))
+
+    @property
+    def image_name(self):
+        """Returns the name of the Docker image that this task pulls
+
+        :returns: The Docker image name
+        :rtype: string
+        """
+
+        return self._image_name
 
     def determine_error(self, task_update):
         """See :meth:`job.execution.tasks.exe_task.JobExecutionTask.determine_error`
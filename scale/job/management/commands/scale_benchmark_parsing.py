@@ -0,0 +1,83 @@
+"""Defines the command line method for benchmarking the parsing of job interfaces and recipe definitions"""
+from __future__ import unicode_literals
+
+import copy
+import logging
+import timeit
+
+import jsonschema
+from django.core.management.base import BaseCommand
+
+from job.configuration.interface.job_interface import JobInterface, JOB_INTERFACE_SCHEMA
+from job.models import JobTypeRevision, job_interface_cache
+from recipe.configuration.definition.recipe_definition import RecipeDefinition, RECIPE_DEFINITION_SCHEMA
+from recipe.models import RecipeTypeRevision, recipe_definition_cache
+from util.validation import validate
+
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """Command that benchmarks parsing the job interfaces and recipe definitions of every revision in the database,
+    comparing uncompiled and pre-compiled schema validation and uncached and cached parsing
+    """
+
+    help = 'Benchmarks parsing the job interfaces and recipe definitions of every revision in the database'
+
+    def add_arguments(self, parser):
+        parser.add_argument('-n', '--number', action='store', type=int, default=100,
+                            help='The number of times each revision is parsed')
+
+    def handle(self, *args, **options):
+        """See :meth:`django.core.management.base.BaseCommand.handle`.
+
+        This method runs the benchmark and prints the results.
+        """
+
+        number = options.get('number')
+
+        job_type_revs = list(JobTypeRevision.objects.all().order_by('id'))
+        recipe_type_revs = list(RecipeTypeRevision.objects.all().order_by('id'))
+        logger.info('Benchmarking %i job type revision(s) and %i recipe type revision(s) %i time(s) each',
+                    len(job_type_revs), len(recipe_type_revs), number)
+
+        interfaces = [copy.deepcopy(rev.interface) for rev in job_type_revs]
+        definitions = [copy.deepcopy(rev.definition) for rev in recipe_type_revs]
+        for interface in interfaces:
+            JobInterface(interface)  # Populates defaults so that each interface validates against the latest schema
+
+        self._report('Job interface validation (uncompiled)', number,
+                     lambda: [jsonschema.validate(i, JOB_INTERFACE_SCHEMA) for i in interfaces])
+        self._report('Job interface validation (compiled)', number,
+                     lambda: [validate(i, JOB_INTERFACE_SCHEMA) for i in interfaces])
+        self._report('Job interface parsing (uncached)', number,
+                     lambda: [JobInterface(copy.deepcopy(rev.interface)) for rev in job_type_revs])
+        job_interface_cache.clear()
+        self._report('Job interface parsing (cached)', number,
+                     lambda: [rev.get_job_interface() for rev in job_type_revs])
+
+        self._report('Recipe definition validation (uncompiled)', number,
+                     lambda: [jsonschema.validate(d, RECIPE_DEFINITION_SCHEMA) for d in definitions])
+        self._report('Recipe definition validation (compiled)', number,
+                     lambda: [validate(d, RECIPE_DEFINITION_SCHEMA) for d in definitions])
+        self._report('Recipe definition parsing (uncached)', number,
+                     lambda: [RecipeDefinition(copy.deepcopy(rev.definition)) for rev in recipe_type_revs])
+        recipe_definition_cache.clear()
+        self._report('Recipe definition parsing (cached)', number,
+                     lambda: [rev.get_recipe_definition() for rev in recipe_type_revs])
+
+    def _report(self, name, number, func):
+        """Times the given function and prints the result
+
+        :param name: The name of the benchmark
+        :type name: string
+        :param number: The number of times to call the function
+        :type number: int
+        :param func: The function to time
+        :type func: function
+        """
+
+        seconds = timeit.timeit(func, number=number)
+        self.stdout.write('%-45s %10.3f ms total %10.3f ms per pass' % (name, seconds * 1000.0,
+                                                                        seconds * 1000.0 / number))
@@ -18,6 +18,9 @@ logger = logging.getLogger(__name__)
 
 GENERAL_FAIL_EXIT_CODE = 1
 
+# The keyword that starts the log lines that declare output artifacts
+ARTIFACT_KEYWORD = 'ARTIFACT'
+
 
 class Command(BaseCommand):
     """Command that performs the post-job steps for a job execution
@@ -71,7 +74,9 @@ class Command(BaseCommand):
 
     @retry_database_query
     def _perform_post_steps(self, job_exe):
-        """Populates the full set of command arguments for the job execution
+        """Stores the output files of the job execution and saves its results. The output files are transferred into
+        their workspaces before the database transaction is started, so the transaction is only held open while the
+        models are saved.
 
         :param job_exe: The job execution
         :type job_exe: :class:`job.models.JobExecution`
@@ -81,12 +86,15 @@ class Command(BaseCommand):
         job_data = job_exe.job.get_job_data()
         stdout_and_stderr = None
         try:
-            stdout_and_stderr, _last_modified = job_exe.get_log_text()
+            # Only the artifact lines are needed, so have Elasticsearch filter out the rest of the log
+            stdout_and_stderr, _last_modified = job_exe.get_log_text(keyword=ARTIFACT_KEYWORD)
         except:
             logger.exception('Failed to retrieve job execution logs')
         if stdout_and_stderr is None:
             stdout_and_stderr = ''
 
+        staged_post_steps = job_interface.stage_post_steps(job_exe, job_data, stdout_and_stderr)
+
         with transaction.atomic():
-            job_results, results_manifest = job_interface.perform_post_steps(job_exe, job_data, stdout_and_stderr)
+            job_results, results_manifest = job_interface.commit_post_steps(job_exe, job_data, staged_post_steps)
             JobExecution.objects.post_steps_results(job_exe.id, job_results, results_manifest)
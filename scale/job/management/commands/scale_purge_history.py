@@ -0,0 +1,32 @@
+"""Defines the command line method for purging old history rows from the database"""
+from __future__ import unicode_literals
+
+import logging
+
+from django.core.management.base import BaseCommand
+
+from job.purge import purge_history
+
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """Command that deletes the history rows that are older than their retention periods
+    """
+
+    help = 'Deletes the history rows (log entries, job loads, task updates, and ingests) older than their retention'
+
+    def handle(self, *args, **options):
+        """See :meth:`django.core.management.base.BaseCommand.handle`.
+
+        This method purges the old history rows.
+        """
+
+        logger.info('Command starting: scale_purge_history')
+
+        counts = purge_history()
+        for table_name in sorted(counts):
+            logger.info('Purged %i row(s) from %s', counts[table_name], table_name)
+
+        logger.info('Command completed: scale_purge_history')
@@ -34,11 +34,15 @@ from storage.models import ScaleFile, Workspace
 from trigger.configuration.exceptions import InvalidTriggerType
 from trigger.models import TriggerRule
 from util.exceptions import RollbackTransaction, ScaleLogicBug
+from util.memoize import ParsedObjectCache, parse_read_only
 from vault.secrets_handler import SecretsHandler
 
 
 logger = logging.getLogger(__name__)
 
+# Parsed job interfaces keyed by job type revision ID (revisions are never modified once they are created)
+job_interface_cache = ParsedObjectCache()
+
 
 # Required resource minimums for jobs (e.g. resources required for pre and post tasks)
 MIN_CPUS = 0.25
@@ -781,13 +785,15 @@ class Job(models.Model):
         return ExecutionConfiguration(self.configuration)
 
     def get_job_interface(self):
-        """Returns the interface for this job
+        """Returns the interface for this job. The interface is parsed once per job type revision and shared, so its
+        JSON is read-only.
 
         :returns: The interface for this job
         :rtype: :class:`job.configuration.interface.job_interface.JobInterface`
         """
 
-        return JobInterface(self.job_type_rev.interface)
+        return job_interface_cache.get(self.job_type_rev_id,
+                                         lambda: parse_read_only(JobInterface, self.job_type_rev.interface))
 
     def get_job_results(self):
         """Returns the results for this job
@@ -1254,6 +1260,12 @@ class JobExecution(models.Model):
     :type disk_out_scheduled: :class:`django.db.models.FloatField`
     :keyword disk_total_scheduled: The total amount of disk space in MiB scheduled for this job execution
     :type disk_total_scheduled: :class:`django.db.models.FloatField`
+    :keyword cpus_used: The peak number of CPUs used by the main job task, sampled while it was running
+    :type cpus_used: :class:`django.db.models.FloatField`
+    :keyword mem_used: The peak amount of RAM in MiB used by the main job task, sampled while it was running
+    :type mem_used: :class:`django.db.models.FloatField`
+    :keyword disk_used: The peak amount of disk space in MiB used by the main job task, sampled while it was running
+    :type disk_used: :class:`django.db.models.FloatField`
 
     :keyword pre_started: When the pre-task was started
     :type pre_started: :class:`django.db.models.DateTimeField`
@@ -1329,6 +1341,9 @@ class JobExecution(models.Model):
     disk_in_scheduled = models.FloatField(blank=True, null=True)
     disk_out_scheduled = models.FloatField(blank=True, null=True)
     disk_total_scheduled = models.FloatField(blank=True, null=True)
+    cpus_used = models.FloatField(blank=True, null=True)
+    mem_used = models.FloatField(blank=True, null=True)
+    disk_used = models.FloatField(blank=True, null=True)
 
     # TODO: Rename pre_completed, job_completed, etc to pre_ended, job_ended, etc. This will force changes through the
     # REST API though, so coordinate with UI
@@ -1579,7 +1594,7 @@ class JobExecution(models.Model):
 
         return self.job.job_type.version
 
-    def get_log_json(self, include_stdout=True, include_stderr=True, since=None):
+    def get_log_json(self, include_stdout=True, include_stderr=True, since=None, keyword=None):
         """Get log data from elasticsearch as a dict (from the raw JSON).
 
         :param include_stdout: If True, include stdout in the result
@@ -1588,6 +1603,9 @@ class JobExecution(models.Model):
         :type include_stderr: bool
         :param since: If present, only retrieve logs since this timestamp (non-inclusive).
         :type since: :class:`datetime.datetime` or None
+        :param keyword: If present, only retrieve log lines with a word starting with this keyword (case-insensitive).
+            This is a coarse filter performed by elasticsearch, callers should still check each returned line.
+        :type keyword: string or None
         :rtype: tuple of (dict, :class:`datetime.datetime`) with the results or None and the last modified timestamp
         """
 
@@ -1614,6 +1632,9 @@ class JobExecution(models.Model):
             q['query']['bool']['must'].append({'term': {'stream.raw': 'stderr'}})
         if since is not None:
             q['query']['bool']['must'].append({'range': {'@timestamp': {'gte': since.isoformat()}}})
+        if keyword is not None:
+            # The message field is analyzed, so its terms are lower case
+            q['query']['bool']['must'].append({'prefix': {'message': keyword.lower()}})
 
         hits = settings.ELASTICSEARCH.search(index='_all', body=q)
 
@@ -1622,7 +1643,7 @@ class JobExecution(models.Model):
         last_modified = max([util.parse.parse_datetime(h['_source']['@timestamp']) for h in hits['hits']['hits']])
         return hits, last_modified
 
-    def get_log_text(self, include_stdout=True, include_stderr=True, since=None, html=False):
+    def get_log_text(self, include_stdout=True, include_stderr=True, since=None, html=False, keyword=None):
         """Get log data from elasticsearch.
 
         :param include_stdout: If True, include stdout in the result
@@ -1633,10 +1654,12 @@ class JobExecution(models.Model):
         :type since: :class:`datetime.datetime` or None
         :param html: If True, wrap the lines in div elements with stdout/stderr css classes, otherwise use plain text
         :type html: bool
+        :param keyword: If present, only retrieve log lines with a word starting with this keyword (case-insensitive)
+        :type keyword: string or None
         :rtype: tuple of (str, :class:`datetime.datetime`) with the log or None and last modified timestamp
         """
 
-        hits, last_modified = self.get_log_json(include_stdout, include_stderr, since)
+        hits, last_modified = self.get_log_json(include_stdout, include_stderr, since, keyword)
         if hits is None:
             return None, last_modified
         valid_hits = []  # Make sure hits have the required message field
@@ -1866,6 +1889,73 @@ class JobTypeFailedStatus(object):
         self.last_error = last_error
 
 
+class JobTypeResourceUsage(object):
+    """Represents the resources actually used by the recently completed job executions of a job type.
+
+    :keyword job_type: The job type being profiled.
+    :type job_type: :class:`job.models.JobType`
+    :keyword count: The number of job executions with sampled resource usage.
+    :type count: int
+    :keyword cpus: The percentiles of the peak number of CPUs used, None if there are no samples.
+    :type cpus: dict
+    :keyword mem: The percentiles of the peak amount of RAM in MiB used, None if there are no samples.
+    :type mem: dict
+    :keyword disk: The percentiles of the peak amount of disk space in MiB used, None if there are no samples.
+    :type disk: dict
+    """
+
+    # The percentiles that are reported for each resource, the 100th percentile is the maximum
+    PERCENTILES = (('p50', 50), ('p90', 90), ('p95', 95), ('max', 100))
+
+    def __init__(self, job_type, cpus=None, mem=None, disk=None):
+        self.job_type = job_type
+        self._samples = {'cpus': sorted(cpus or []), 'mem': sorted(mem or []), 'disk': sorted(disk or [])}
+        self.count = max(len(samples) for samples in self._samples.values())
+        self.cpus = self._get_percentiles('cpus')
+        self.mem = self._get_percentiles('mem')
+        self.disk = self._get_percentiles('disk')
+
+    def get_percentile(self, name, percentile):
+        """Returns the given percentile of the sampled peak usage of the given resource
+
+        :param name: The name of the resource (cpus, mem, or disk)
+        :type name: string
+        :param percentile: The percentile, from 0 to 100
+        :type percentile: float
+        :returns: The percentile of the sampled peaks, None if there are no samples
+        :rtype: float
+        """
+
+        samples = self._samples[name]
+        if not samples:
+            return None
+        return samples[int(round((len(samples) - 1) * percentile / 100.0))]
+
+    def get_sample_count(self, name):
+        """Returns the number of job executions with a sampled peak usage of the given resource
+
+        :param name: The name of the resource (cpus, mem, or disk)
+        :type name: string
+        :returns: The number of samples
+        :rtype: int
+        """
+
+        return len(self._samples[name])
+
+    def _get_percentiles(self, name):
+        """Returns the reported percentiles of the sampled peak usage of the given resource
+
+        :param name: The name of the resource (cpus, mem, or disk)
+        :type name: string
+        :returns: The percentiles stored by label, None if there are no samples
+        :rtype: dict
+        """
+
+        if not self._samples[name]:
+            return None
+        return {label: self.get_percentile(name, percentile) for label, percentile in self.PERCENTILES}
+
+
 class JobTypeManager(models.Manager):
     """Provides additional methods for handling job types
     """
@@ -2316,6 +2406,42 @@ class JobTypeManager(models.Manager):
             results.append(status)
         return results
 
+    def get_resource_usage(self, started, ended=None, job_type_ids=None):
+        """Returns the resources actually used by the job executions of each job type that completed within the given
+        time range. Only job types with sampled resource usage are included.
+
+        :param started: Query job executions that completed after this time.
+        :type started: :class:`datetime.datetime`
+        :param ended: Query job executions that completed before this time.
+        :type ended: :class:`datetime.datetime`
+        :param job_type_ids: Query only job executions of the job types with these IDs.
+        :type job_type_ids: [int]
+        :returns: The list of the resource usage of each job type.
+        :rtype: [:class:`job.models.JobTypeResourceUsage`]
+        """
+
+        job_exe_qry = JobExecution.objects.filter(status='COMPLETED', ended__gte=started)
+        job_exe_qry = job_exe_qry.filter(Q(cpus_used__isnull=False) | Q(mem_used__isnull=False))
+        if ended:
+            job_exe_qry = job_exe_qry.filter(ended__lte=ended)
+        if job_type_ids:
+            job_exe_qry = job_exe_qry.filter(job__job_type_id__in=job_type_ids)
+
+        samples = {}  # {Job type ID: {Resource name: [Peak usage]}}
+        fields = ('job__job_type_id', 'cpus_used', 'mem_used', 'disk_used')
+        for job_type_id, cpus_used, mem_used, disk_used in job_exe_qry.values_list(*fields).iterator():
+            job_type_samples = samples.setdefault(job_type_id, {'cpus': [], 'mem': [], 'disk': []})
+            for name, value in (('cpus', cpus_used), ('mem', mem_used), ('disk', disk_used)):
+                if value is not None:
+                    job_type_samples[name].append(value)
+
+        results = []
+        for job_type in JobType.objects.filter(id__in=samples.keys()).order_by('name', 'version'):
+            job_type_samples = samples[job_type.id]
+            results.append(JobTypeResourceUsage(job_type, job_type_samples['cpus'], job_type_samples['mem'],
+                                                job_type_samples['disk']))
+        return results
+
     def set_job_type_secrets(self, secrets_key, secrets):
         """Sends request to SecretsHandler to write secrets for a job type.
 
@@ -2701,13 +2827,14 @@ class JobTypeRevision(models.Model):
     objects = JobTypeRevisionManager()
 
     def get_job_interface(self):
-        """Returns the job type interface for this revision
+        """Returns the job type interface for this revision. The interface is parsed once per revision and shared, so its
+        JSON is read-only.
 
         :returns: The job type interface for this revision
         :rtype: :class:`job.configuration.interface.job_interface.JobInterface`
         """
 
-        return JobInterface(self.interface)
+        return job_interface_cache.get(self.id, lambda: parse_read_only(JobInterface, self.interface))
 
     def natural_key(self):
         """Django method to define the natural key for a job type revision as the combination of job type and revision
@@ -0,0 +1,104 @@
+"""Defines the functions and clock event processor for purging old history rows from the database"""
+from __future__ import unicode_literals
+
+import datetime
+import logging
+
+from django.conf import settings
+from django.db import transaction
+from django.utils.timezone import now
+
+from job.clock import ClockEventError, ClockEventProcessor
+
+
+logger = logging.getLogger(__name__)
+
+# The maximum number of rows that are deleted within a single transaction
+PURGE_CHUNK_SIZE = 5000
+
+
+def get_purge_queries(when=None):
+    """Returns the queries for the history rows that are older than their retention periods. Tables with a retention
+    period of None are not included.
+
+    :param when: The current time, defaults to now
+    :type when: :class:`datetime.datetime`
+    :returns: The purge queries by table name
+    :rtype: [(string, :class:`django.db.models.QuerySet`)]
+    """
+
+    from error.models import LogEntry
+    from ingest.models import Ingest
+    from job.models import TaskUpdate
+    from queue.models import JobLoad
+
+    if not when:
+        when = now()
+
+    queries = []
+    if settings.LOG_ENTRY_RETENTION_DAYS is not None:
+        cutoff = when - datetime.timedelta(days=settings.LOG_ENTRY_RETENTION_DAYS)
+        queries.append(('logentry', LogEntry.objects.filter(created__lt=cutoff)))
+    if settings.JOB_LOAD_RETENTION_DAYS is not None:
+        cutoff = when - datetime.timedelta(days=settings.JOB_LOAD_RETENTION_DAYS)
+        queries.append(('job_load', JobLoad.objects.filter(measured__lt=cutoff)))
+    if settings.TASK_UPDATE_RETENTION_DAYS is not None:
+        # Only the updates of finished job executions are purged, the scheduler may still need the others
+        cutoff = when - datetime.timedelta(days=settings.TASK_UPDATE_RETENTION_DAYS)
+        task_updates = TaskUpdate.objects.filter(created__lt=cutoff)
+        task_updates = task_updates.filter(job_exe__status__in=['COMPLETED', 'FAILED', 'CANCELED'])
+        queries.append(('task_update', task_updates))
+    if settings.INGEST_RETENTION_DAYS is not None:
+        cutoff = when - datetime.timedelta(days=settings.INGEST_RETENTION_DAYS)
+        ingests = Ingest.objects.filter(last_modified__lt=cutoff, status__in=['INGESTED', 'ERRORED', 'DUPLICATE'])
+        queries.append(('ingest', ingests))
+    return queries
+
+
+def purge_history(when=None, chunk_size=PURGE_CHUNK_SIZE):
+    """Deletes the history rows that are older than their retention periods. The rows are deleted in chunks of the
+    oldest rows, each in its own transaction, so that no long running transaction holds locks on the tables.
+
+    :param when: The current time, defaults to now
+    :type when: :class:`datetime.datetime`
+    :param chunk_size: The maximum number of rows to delete in each transaction
+    :type chunk_size: int
+    :returns: The number of rows deleted by table name
+    :rtype: dict
+    """
+
+    counts = {}
+    for table_name, query in get_purge_queries(when):
+        counts[table_name] = 0
+        while True:
+            # The oldest rows have the lowest IDs, so this scan of the primary key index stops early
+            ids = list(query.order_by('id').values_list('id', flat=True)[:chunk_size])
+            if not ids:
+                break
+            with transaction.atomic():
+                query.model.objects.filter(id__in=ids).delete()
+            counts[table_name] += len(ids)
+            logger.info('Purged %i row(s) from %s so far', counts[table_name], table_name)
+            if len(ids) < chunk_size:
+                break
+    return counts
+
+
+class PurgeHistoryProcessor(ClockEventProcessor):
+    """This class schedules the job that purges old history rows"""
+
+    def process_event(self, event, last_event=None):
+        """See :meth:`job.clock.ClockEventProcessor.process_event`.
+
+        Queues a job to purge the history rows, since the clock processes events within a transaction.
+        """
+
+        from job.configuration.data.job_data import JobData
+        from job.models import JobType
+        from queue.models import Queue
+
+        job_type = JobType.objects.filter(name='scale-purge-history').last()
+        if not job_type:
+            raise ClockEventError('Missing required job type: scale-purge-history')
+
+        Queue.objects.queue_new_job(job_type, JobData(), event)
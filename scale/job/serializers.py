@@ -94,6 +94,23 @@ class JobTypeRunningStatusSerializer(serializers.Serializer):
     longest_running = serializers.DateTimeField()
 
 
+class ResourceUsagePercentilesSerializer(serializers.Serializer):
+    """Converts the percentiles of a resource's sampled peak usage to REST output."""
+    p50 = serializers.FloatField()
+    p90 = serializers.FloatField()
+    p95 = serializers.FloatField()
+    max = serializers.FloatField()
+
+
+class JobTypeResourceUsageSerializer(serializers.Serializer):
+    """Converts job type resource usage model and extra statistic fields to REST output."""
+    job_type = JobTypeBaseSerializer()
+    count = serializers.IntegerField()
+    cpus = ResourceUsagePercentilesSerializer()
+    mem = ResourceUsagePercentilesSerializer()
+    disk = ResourceUsagePercentilesSerializer()
+
+
 class JobTypeFailedStatusSerializer(serializers.Serializer):
     """Converts job type failed status model and extra statistic fields to REST output."""
     from error.serializers import ErrorSerializer
@@ -293,6 +310,9 @@ class JobExecutionDetailsSerializer(JobExecutionSerializer):
     disk_in_scheduled = serializers.FloatField()
     disk_out_scheduled = serializers.FloatField()
     disk_total_scheduled = serializers.FloatField()
+    cpus_used = serializers.FloatField()
+    mem_used = serializers.FloatField()
+    disk_used = serializers.FloatField()
 
     results = serializers.JSONField(default=dict)
 
@@ -98,6 +98,18 @@ class Task(object):
 
         return self._agent_id
 
+    @agent_id.setter
+    def agent_id(self, value):
+        """Sets the ID of the agent that the task is launched on. This is used for tasks that were recovered from the
+        database before their agent ID was known.
+
+        :param value: The agent ID
+        :type value: string
+        """
+
+        with self._lock:
+            self._agent_id = value
+
     @property
     def command(self):
         """Returns the command to execute for the task
@@ -314,6 +326,9 @@ class Task(object):
                 return
 
             self._last_status_update = task_update.timestamp
+            if not self._agent_id and task_update.agent_id:
+                # Recovered tasks learn their agent ID from their first status update
+                self._agent_id = task_update.agent_id
             if self._has_ended:  # Ended tasks no longer update
                 return
 
@@ -108,4 +108,18 @@ class TaskManager(object):
                     logger.error('Attempted to launch a task that has already been launched')
 
 
+    def recover_tasks(self, tasks):
+        """Adds tasks that were recovered from the database after a scheduler restart. The tasks have already been
+        launched, so they are not marked as launched again.
+
+        :param tasks: The recovered tasks to add
+        :type tasks: [:class:`job.tasks.base_task.Task`]
+        """
+
+        with self._lock:
+            for task in tasks:
+                if task.id not in self._tasks:
+                    self._tasks[task.id] = task
+
+
 task_mgr = TaskManager()
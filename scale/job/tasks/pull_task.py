@@ -15,22 +15,21 @@ COUNTER = AtomicCounter()
 
 
 def create_pull_command(image_name, check_exists=False):
-    """Creates the Docker pull command to pull the given image name
+    """Creates the Docker pull command to pull the given image name. Dangling images left behind by pulls are deleted
+    by the node cleanup tasks, not by the pull.
 
     :param image_name: The name of the Docker image to pull
     :type image_name: string
-    :param check_exists: If True, skips pull if image already exists, False pulls image regardless
+    :param check_exists: If True, skips pull if the image already exists (unless it is the "latest" tag), False pulls
+        image regardless
     :type check_exists: bool
     :returns: The Docker pull command
     :rtype: string
     """
 
-    # Create command that pulls image and deletes any dangling images
     pull_echo_cmd = 'echo \'Pulling image...\''
     pull_cmd = 'docker pull %s' % image_name
-    delete_echo_cmd = 'echo \'Cleaning up dangling images...\''
-    delete_cmd = 'for img in `docker images -q -f dangling=true`; do docker rmi $img; done'
-    command = '%s && %s && %s && %s' % (pull_echo_cmd, pull_cmd, delete_echo_cmd, delete_cmd)
+    command = '%s && %s' % (pull_echo_cmd, pull_cmd)
 
     # Setting DOCKER_CONFIG env var is needed if CONFIG_URI is set for custom Docker configuration
     if settings.CONFIG_URI:
@@ -39,30 +38,62 @@ def create_pull_command(image_name, check_exists=False):
         command = '%s && %s && %s' % (export_echo_cmd, export_cmd, command)
 
     # If check_exists and the image does not have a "latest" tag, check for image locally before pulling
-    if check_exists and not image_name.endswith(':latest'):
+    if check_exists and not is_image_latest(image_name):
         exists_echo_cmd = 'echo \'Checking if image is already pulled...\''
-        image_search_cmd = 'docker images --format \'{{.Repository}}:{{.Tag}}\' | grep %s' % image_name
-        exists_cmd = '(%s; if [[ $? = 0 ]]; then echo \'Image already pulled\'; else exit 1; fi;)' % image_search_cmd
+        image_inspect_cmd = 'docker inspect --type=image %s > /dev/null 2>&1' % image_name
+        exists_cmd = '(%s; if [[ $? = 0 ]]; then echo \'Image already pulled\'; else exit 1; fi;)' % image_inspect_cmd
         command = '%s && %s || %s' % (exists_echo_cmd, exists_cmd, command)
 
     return command
 
 
+def is_image_latest(image_name):
+    """Indicates whether the given Docker image name refers to the "latest" tag, either explicitly or by having no tag
+    or digest
+
+    :param image_name: The name of the Docker image
+    :type image_name: string
+    :returns: True if the image refers to the "latest" tag, False otherwise
+    :rtype: bool
+    """
+
+    if '@' in image_name:
+        return False
+    repository = image_name.rsplit('/', 1)[-1]
+    return ':' not in repository or repository.endswith(':latest')
+
+
+def is_image_pinned(image_name):
+    """Indicates whether the given Docker image name is pinned to an immutable image by a content digest (such as
+    "image@sha256:..."), so that a local copy of the image can never be out of date
+
+    :param image_name: The name of the Docker image
+    :type image_name: string
+    :returns: True if the image is pinned to a digest, False otherwise
+    :rtype: bool
+    """
+
+    return '@sha256:' in image_name
+
+
 class PullTask(Task):
     """Represents a task that pulls Docker images from the registry. This class is thread-safe.
     """
 
-    def __init__(self, framework_id, agent_id):
+    def __init__(self, framework_id, agent_id, image_name=None):
         """Constructor
 
         :param framework_id: The framework ID
         :type framework_id: string
         :param agent_id: The agent ID
         :type agent_id: string
+        :param image_name: The name of the Docker image to pull, defaults to the Scale Docker image
+        :type image_name: string
         """
 
         task_id = '%s_%s_%d' % (PULL_TASK_ID_PREFIX, framework_id, COUNTER.get_next())
-        super(PullTask, self).__init__(task_id, 'Scale Docker Pull', agent_id)
+        task_name = 'Scale Docker Pull' if not image_name else 'Scale Docker Pre-Pull'
+        super(PullTask, self).__init__(task_id, task_name, agent_id)
 
         self._uses_docker = False
         self._docker_image = None
@@ -70,7 +101,24 @@ class PullTask(Task):
         self._is_docker_privileged = False
         self._running_timeout_threshold = datetime.timedelta(minutes=15)
 
-        self._command = create_pull_command(self._create_scale_image_name(), check_exists=True)
+        # The Scale image is only pulled if it is missing from the node. A job image is only pre-pulled when the node
+        # does not recently have it and its tag may have been re-pushed, so it is pulled unless it is pinned to a digest.
+        if image_name:
+            self._image_name = image_name
+            self._command = create_pull_command(image_name, check_exists=is_image_pinned(image_name))
+        else:
+            self._image_name = self._create_scale_image_name()
+            self._command = create_pull_command(self._image_name, check_exists=True)
+
+    @property
+    def image_name(self):
+        """Returns the name of the Docker image that this task pulls
+
+        :returns: The Docker image name
+        :rtype: string
+        """
+
+        return self._image_name
 
     def get_resources(self):
         """See :meth:`job.tasks.base_task.Task.get_resources`
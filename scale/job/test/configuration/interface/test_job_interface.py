@@ -999,6 +999,34 @@ class TestJobInterfacePreSteps(TestCase):
         self.assertEqual(env_vars_value1, config_key_value[0], 'expected a different command from pre_steps')
         self.assertEqual(env_vars_value2, '', 'expected a different command from pre_steps')
 
+    def test_env_vars_replacement_shared_interface(self):
+        """Tests that executions sharing the same interface each get the values of their own configuration"""
+
+        job_interface_dict, job_data_dict, job_environment_dict = self._get_simple_interface_data_env()
+
+        job_interface_dict['version'] = '1.2'
+        job_interface_dict['command_arguments'] = ''
+        job_interface_dict['env_vars'] = [{
+            'name': 'test_var',
+            'value': '${setting1}',
+        }]
+        job_interface_dict['settings'] = [{
+            'name': 'setting1',
+            'required': False,
+        }]
+        job_interface = JobInterface(job_interface_dict)
+
+        job_config_1 = ExecutionConfiguration({'job_task': {'settings': [{'name': 'setting1', 'value': 'value1'}]}})
+        job_exe_1 = job_test_utils.create_job_exe(status='QUEUED', configuration=job_config_1.get_dict())
+        job_config_2 = ExecutionConfiguration({'job_task': {'settings': [{'name': 'setting1', 'value': 'value2'}]}})
+        job_exe_2 = job_test_utils.create_job_exe(status='QUEUED', configuration=job_config_2.get_dict())
+
+        env_vars_1 = job_interface.populate_env_vars_arguments(job_config_1, job_exe_1)
+        env_vars_2 = job_interface.populate_env_vars_arguments(job_config_2, job_exe_2)
+        self.assertEqual(env_vars_1[0]['value'], 'value1')
+        self.assertEqual(env_vars_2[0]['value'], 'value2')
+        self.assertEqual(job_interface.get_dict()['env_vars'][0]['value'], '${setting1}')
+
     def test_validate_populated_mounts_all_provided(self):
         """Tests the validation of required mounts when all required mounts are provided"""
 
@@ -35,6 +35,18 @@ class TestExecutionConfiguration(TestCase):
                   'job_task': {'workspaces': []}}
         self.assertRaises(InvalidExecutionConfiguration, ExecutionConfiguration, config)
 
+    def test_get_workspace_names(self):
+        """Tests getting the workspace names of all tasks, including workspaces added after creation"""
+
+        config = {'pre_task': {'workspaces': [{'name': 'name1', 'mode': 'rw'}]},
+                  'job_task': {'workspaces': [{'name': 'name1', 'mode': 'ro'}, {'name': 'name2', 'mode': 'ro'}]}}
+        exe_config = ExecutionConfiguration(config)
+        self.assertSetEqual(exe_config.get_workspace_names(), {'name1', 'name2'})
+
+        exe_config.add_post_task_workspace('name3', 'rw')
+        self.assertSetEqual(exe_config.get_workspace_names(), {'name1', 'name2', 'name3'})
+        self.assertRaises(InvalidExecutionConfiguration, exe_config.add_post_task_workspace, 'name3', 'rw')
+
     def test_populate_default_job_settings(self):
         """Tests the addition of default settings to the configuration."""
 
@@ -0,0 +1,44 @@
+from __future__ import unicode_literals
+
+import django
+from django.test import TestCase
+from django.utils.timezone import now
+
+import job.test.utils as job_test_utils
+from job.execution.tasks.job_task import JobTask
+from job.models import JobExecution
+from job.tasks.update import TaskStatusUpdate
+
+
+class TestJobTask(TestCase):
+    """Tests the JobTask class"""
+
+    def setUp(self):
+        django.setup()
+
+        self.job_exe = job_test_utils.create_job_exe()
+
+    def test_update_resource_usage(self):
+        """Tests that a job task keeps the peaks of the sampled resource usage while it is running"""
+
+        task = JobTask('agent_1', self.job_exe)
+        mib = 1024 * 1024
+
+        # Samples before the task starts are ignored
+        task.update_resource_usage({'timestamp': 0.0, 'cpus_user_time_secs': 0.0, 'mem_rss_bytes': 500 * mib})
+        update = job_test_utils.create_task_status_update(task.id, task.agent_id, TaskStatusUpdate.RUNNING, now())
+        task.update(update)
+
+        # The first sample only records the CPU time
+        task.update_resource_usage({'timestamp': 100.0, 'cpus_user_time_secs': 10.0, 'cpus_system_time_secs': 0.0,
+                                    'mem_rss_bytes': 100 * mib})
+        task.update_resource_usage({'timestamp': 110.0, 'cpus_user_time_secs': 25.0, 'cpus_system_time_secs': 5.0,
+                                    'mem_rss_bytes': 300 * mib})
+        task.update_resource_usage({'timestamp': 120.0, 'cpus_user_time_secs': 30.0, 'cpus_system_time_secs': 5.0,
+                                    'mem_rss_bytes': 200 * mib})
+
+        job_exe = JobExecution()
+        task.populate_job_exe_model(job_exe)
+        self.assertEqual(job_exe.cpus_used, 2.0)
+        self.assertEqual(job_exe.mem_used, 300.0)
+        self.assertIsNone(job_exe.disk_used)
@@ -228,6 +228,17 @@ class TestRunningJobExecution(TestCase):
         self.assertIsNotNone(job_exe.error_id)
         self.assertGreater(job_exe.ended, pre_task_failed)
 
+    def test_image_already_pulled(self):
+        """Tests that a job execution skips its pull task when the node recently pulled its Docker image"""
+
+        job_exe = JobExecution.objects.get_job_exe_with_job_and_job_type(self._job_exe_id)
+        running_job_exe = RunningJobExecution(self.agent_id, job_exe, is_image_pulled=True)
+        self.assertTrue(running_job_exe.is_next_task_ready())
+
+        # First task should be the pre-task
+        task = running_job_exe.start_next_task()
+        self.assertEqual(task.id, job_exe.get_pre_task_id())
+
     def test_timed_out_launch(self):
         """Tests running through a job execution where a task launch times out"""
 
@@ -985,3 +996,63 @@ class TestRunningJobExecution(TestCase):
         self.assertFalse(task_3.needs_reconciliation(check_time))
         # Task 4 did not even launch so it should not be reconciled
         self.assertFalse(task_4.needs_reconciliation(check_time))
+
+    def test_recover_tasks(self):
+        """Tests recovering a job execution whose pull-task finished and whose pre-task was lost and then started"""
+
+        job_exe = JobExecution.objects.get_job_exe_with_job_and_job_type(self._job_exe_id)
+        pull_task_id = job_exe.get_pull_task_id()
+        pre_task_id = job_exe.get_pre_task_id()
+        when = now()
+        updates = [job_test_utils.create_task_status_update(pull_task_id, '', TaskStatusUpdate.RUNNING,
+                                                            when - timedelta(minutes=10)),
+                   job_test_utils.create_task_status_update(pull_task_id, '', TaskStatusUpdate.FINISHED,
+                                                            when - timedelta(minutes=9)),
+                   job_test_utils.create_task_status_update(pre_task_id, '', TaskStatusUpdate.LOST,
+                                                            when - timedelta(minutes=8)),
+                   job_test_utils.create_task_status_update(pre_task_id + '_lost-1', '', TaskStatusUpdate.RUNNING,
+                                                            when - timedelta(minutes=7))]
+
+        running_job_exe = RunningJobExecution('', job_exe)
+        task = running_job_exe.recover_tasks(updates, when)
+
+        # Pre-task with its lost ID should be current and already started, job and post tasks remain
+        self.assertEqual(task.id, pre_task_id + '_lost-1')
+        self.assertEqual(running_job_exe.current_task.id, task.id)
+        self.assertTrue(task.has_started)
+        self.assertFalse(running_job_exe.is_finished())
+        self.assertFalse(running_job_exe.is_next_task_ready())
+
+        # Another lost pre-task gets a new unique ID
+        update = job_test_utils.create_task_status_update(task.id, 'agent', TaskStatusUpdate.LOST, when)
+        running_job_exe.task_update(update)
+        self.assertEqual(running_job_exe.next_task().id, pre_task_id + '_lost-2')
+
+    def test_recover_tasks_not_launched(self):
+        """Tests recovering a job execution that has no saved task updates"""
+
+        job_exe = JobExecution.objects.get_job_exe_with_job_and_job_type(self._job_exe_id)
+        running_job_exe = RunningJobExecution('', job_exe)
+
+        self.assertIsNone(running_job_exe.recover_tasks([], now()))
+        self.assertTrue(running_job_exe.is_next_task_ready())
+        self.assertEqual(running_job_exe.next_task().id, job_exe.get_pull_task_id())
+
+    def test_recover_tasks_last_task_finished(self):
+        """Tests recovering a job execution whose last task finished before the job execution was completed"""
+
+        job_exe = JobExecution.objects.get_job_exe_with_job_and_job_type(self._job_exe_id)
+        when = now()
+        updates = []
+        for task_id in [job_exe.get_pull_task_id(), job_exe.get_pre_task_id(), job_exe.get_job_task_id(),
+                        job_exe.get_post_task_id()]:
+            updates.append(job_test_utils.create_task_status_update(task_id, '', TaskStatusUpdate.RUNNING, when))
+            updates.append(job_test_utils.create_task_status_update(task_id, '', TaskStatusUpdate.FINISHED, when))
+
+        running_job_exe = RunningJobExecution('', job_exe)
+        task = running_job_exe.recover_tasks(updates, when)
+
+        # Post-task should be current and not ended so that its completion is handled after reconciliation
+        self.assertEqual(task.id, job_exe.get_post_task_id())
+        self.assertFalse(task.has_ended)
+        self.assertFalse(running_job_exe.is_finished())
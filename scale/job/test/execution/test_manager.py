@@ -11,7 +11,7 @@ import node.test.utils as node_test_utils
 from error.models import CACHED_BUILTIN_ERRORS
 from job.execution.job_exe import RunningJobExecution
 from job.execution.manager import JobExecutionManager
-from job.models import JobExecution
+from job.models import JobExecution, TaskUpdate
 from job.tasks.update import TaskStatusUpdate
 
 
@@ -109,6 +109,26 @@ class TestJobExecutionManager(TransactionTestCase):
         self.assertEqual(lost_job_exe.status, 'FAILED')
         self.assertEqual(lost_job_exe._error.name, 'node-lost')
 
+    def test_recover_running_job_exes(self):
+        """Tests calling recover_running_job_exes() successfully"""
+
+        self.job_exe_mgr.schedule_job_exes([self.job_exe_2])
+        pull_task_id = self.job_exe_model_1.get_pull_task_id()
+        started = now() - timedelta(minutes=5)
+        TaskUpdate.objects.create(job_exe=self.job_exe_model_1, task_id=pull_task_id, status='TASK_RUNNING',
+                                  timestamp=started)
+
+        tasks = self.job_exe_mgr.recover_running_job_exes(now())
+
+        # Execution 1 should be recovered with its running pull-task, execution 2 was already known
+        self.assertEqual(len(tasks), 1)
+        self.assertEqual(tasks[0].id, pull_task_id)
+        self.assertTrue(tasks[0].has_started)
+        self.assertEqual(len(self.job_exe_mgr.get_running_job_exes()), 2)
+        recovered_job_exe = self.job_exe_mgr.get_running_job_exe(self.job_exe_model_1.id)
+        self.assertEqual(recovered_job_exe.current_task.id, pull_task_id)
+        self.assertListEqual(self.job_exe_mgr.recover_running_job_exes(now()), [])
+
     def test_sync_with_database(self):
         """Tests calling sync_with_database() successfully"""
 
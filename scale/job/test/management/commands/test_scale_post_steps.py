@@ -40,7 +40,7 @@ class TestPostJobSteps(TransactionTestCase):
         """Tests successfully executing scale_post_steps."""
 
         # Set up mocks
-        mock_job_exe_manager.get_job_exe_with_job_and_job_type.return_value.get_job_interface.return_value.perform_post_steps.return_value = RESULTS
+        mock_job_exe_manager.get_job_exe_with_job_and_job_type.return_value.get_job_interface.return_value.commit_post_steps.return_value = RESULTS
         mock_job_exe_manager.get_job_exe_with_job_and_job_type.return_value.id = self.job_exe.id
 
         # Call method to test
@@ -86,7 +86,7 @@ class TestPostJobSteps(TransactionTestCase):
         """Tests executing scale_post_steps when an IO error occurs."""
 
         # Set up mocks
-        mock_job_exe_manager.get_job_exe_with_job_and_job_type.return_value.get_job_interface.return_value.perform_post_steps.side_effect = IOError()
+        mock_job_exe_manager.get_job_exe_with_job_and_job_type.return_value.get_job_interface.return_value.stage_post_steps.side_effect = IOError()
 
         # Call method to test
         cmd = PostCommand()
@@ -101,7 +101,7 @@ class TestPostJobSteps(TransactionTestCase):
         """Tests executing scale_post_steps when an invalid manifest occurs."""
 
         # Set up mocks
-        mock_job_exe_manager.get_job_exe_with_job_and_job_type.return_value.get_job_interface.return_value.perform_post_steps.side_effect = InvalidResultsManifest('')
+        mock_job_exe_manager.get_job_exe_with_job_and_job_type.return_value.get_job_interface.return_value.stage_post_steps.side_effect = InvalidResultsManifest('')
 
         # Call method to test
         cmd = PostCommand()
@@ -116,7 +116,7 @@ class TestPostJobSteps(TransactionTestCase):
         """Tests executing scale_post_steps when a missing output manifest occurs."""
 
         # Set up mocks
-        mock_job_exe_manager.get_job_exe_with_job_and_job_type.return_value.get_job_interface.return_value.perform_post_steps.side_effect = MissingRequiredOutput('')
+        mock_job_exe_manager.get_job_exe_with_job_and_job_type.return_value.get_job_interface.return_value.stage_post_steps.side_effect = MissingRequiredOutput('')
 
         # Call method to test
         cmd = PostCommand()
@@ -132,7 +132,7 @@ class TestPostJobSteps(TransactionTestCase):
         # Set up mocks
         mock_job_exe_manager.get_job_exe_with_job_and_job_type.return_value.stdout = 'something'
         mock_job_exe_manager.get_job_exe_with_job_and_job_type.return_value.stderr = None
-        mock_job_exe_manager.get_job_exe_with_job_and_job_type.return_value.get_job_interface.return_value.perform_post_steps.return_value = RESULTS
+        mock_job_exe_manager.get_job_exe_with_job_and_job_type.return_value.get_job_interface.return_value.commit_post_steps.return_value = RESULTS
         mock_job_exe_manager.get_job_exe_with_job_and_job_type.return_value.id = self.job_exe.id
 
         # Call method to test
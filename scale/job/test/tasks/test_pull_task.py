@@ -0,0 +1,68 @@
+from __future__ import unicode_literals
+
+import django
+from django.test import TestCase
+
+from job.tasks.pull_task import create_pull_command, is_image_latest, is_image_pinned
+
+
+class TestCreatePullCommand(TestCase):
+
+    def setUp(self):
+        django.setup()
+
+    def test_check_exists(self):
+        """Tests that the pull of an image is skipped if the image is already on the node"""
+
+        for image in ['registry/image:1.0', 'registry:5000/image:dev',
+                      'registry/image@sha256:0123456789abcdef0123456789abcdef0123456789abcdef0123456789abcdef']:
+            command = create_pull_command(image, check_exists=True)
+
+            self.assertIn('docker inspect --type=image %s' % image, command)
+            self.assertIn('docker pull %s' % image, command)
+
+    def test_check_exists_latest(self):
+        """Tests that an image with the "latest" tag is always pulled"""
+
+        for image in ['registry/image', 'registry:5000/image', 'registry/image:latest']:
+            command = create_pull_command(image, check_exists=True)
+
+            self.assertNotIn('docker inspect', command)
+            self.assertIn('docker pull %s' % image, command)
+
+    def test_no_check_exists(self):
+        """Tests that an image is always pulled when not checking if it exists"""
+
+        command = create_pull_command('registry/image:1.0')
+
+        self.assertNotIn('docker inspect', command)
+        self.assertIn('docker pull registry/image:1.0', command)
+
+    def test_no_image_cleanup(self):
+        """Tests that the pull does not delete dangling images, which is left to the node cleanup tasks"""
+
+        command = create_pull_command('registry/image:1.0', check_exists=True)
+
+        self.assertNotIn('docker rmi', command)
+
+
+class TestImageNames(TestCase):
+
+    def setUp(self):
+        django.setup()
+
+    def test_is_image_latest(self):
+        """Tests determining whether an image name refers to the "latest" tag"""
+
+        self.assertTrue(is_image_latest('image'))
+        self.assertTrue(is_image_latest('registry:5000/image'))
+        self.assertTrue(is_image_latest('registry/image:latest'))
+        self.assertFalse(is_image_latest('registry:5000/image:1.0'))
+        self.assertFalse(is_image_latest('registry/image@sha256:0123456789abcdef'))
+
+    def test_is_image_pinned(self):
+        """Tests determining whether an image name is pinned to a digest"""
+
+        self.assertTrue(is_image_pinned('registry/image@sha256:0123456789abcdef'))
+        self.assertFalse(is_image_pinned('registry/image:1.0'))
+        self.assertFalse(is_image_pinned('registry/image'))
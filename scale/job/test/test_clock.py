@@ -53,6 +53,24 @@ class TestClock(TestCase):
 
         self.assertEqual(mock_check_rule.call_count, 2)
 
+    @patch('job.clock._trigger_event')
+    @patch('job.clock._check_schedule')
+    def test_perform_tick_last_events(self, mock_check_schedule, mock_trigger_event):
+        """Tests performing a clock tick checks each rule against its own most recent event."""
+        mock_check_schedule.return_value = False
+
+        rule_1 = job_test_utils.create_clock_rule(name='test-name', schedule='PT1H0M0S')
+        rule_2 = job_test_utils.create_clock_rule(name='test-name', schedule='PT24H0M0S')
+        job_test_utils.create_clock_event(rule=rule_1, occurred=datetime.datetime(2013, 1, 1, tzinfo=utc))
+        last_1 = job_test_utils.create_clock_event(rule=rule_1, occurred=datetime.datetime(2014, 1, 1, tzinfo=utc))
+        last_2 = job_test_utils.create_clock_event(rule=rule_2, occurred=datetime.datetime(2012, 1, 1, tzinfo=utc))
+
+        clock.perform_tick()
+
+        mock_check_schedule.assert_any_call(datetime.timedelta(hours=1), last_1)
+        mock_check_schedule.assert_any_call(datetime.timedelta(hours=24), last_2)
+        self.assertFalse(mock_trigger_event.called)
+
     @patch('job.clock._trigger_event')
     @patch('job.clock._check_schedule')
     def test_check_rule(self, mock_check_schedule, mock_trigger_event):
@@ -372,6 +372,26 @@ class TestJob(TestCase):
 
         self.assertEqual(job.max_tries, 15)
 
+    def test_get_job_interface_cached(self):
+        """Tests that the job interface is parsed once and shared by all jobs of the same job type revision."""
+        job_1 = job_test_utils.create_job()
+        job_2 = Job.objects.get(pk=job_test_utils.create_job(job_type=job_1.job_type).id)
+
+        interface = job_1.get_job_interface()
+
+        self.assertIs(job_2.get_job_interface(), interface)
+        self.assertIs(job_1.job_type_rev.get_job_interface(), interface)
+
+    def test_get_job_interface_read_only(self):
+        """Tests that the shared job interface cannot be modified."""
+        job = job_test_utils.create_job()
+
+        interface = job.get_job_interface()
+
+        self.assertRaises(TypeError, interface.get_dict().__setitem__, 'command', 'other_cmd')
+        self.assertRaises(TypeError, interface.get_dict()['input_data'].append, {'name': 'other', 'type': 'file'})
+        self.assertEqual(interface.get_dict()['version'], job.job_type_rev.interface['version'])
+
 
 class TestJobExecution(TestCase):
 
@@ -1372,3 +1392,55 @@ class TestJobTypeFailedStatus(TestCase):
         self.assertEqual(status[3].count, 1)
         self.assertEqual(status[3].first_error, self.entry_4_time)
         self.assertEqual(status[3].last_error, self.entry_4_time)
+
+
+class TestJobTypeResourceUsage(TestCase):
+
+    def setUp(self):
+        django.setup()
+
+        self.job_type_1 = job_test_utils.create_job_type(name='Type 1', version='1.0')
+        self.job_type_2 = job_test_utils.create_job_type(name='Type 2', version='1.0')
+        self.job_type_3 = job_test_utils.create_job_type(name='Type 3', version='1.0')
+
+        when = timezone.now()
+        for cpus_used, mem_used in [(1.0, 100.0), (2.0, 200.0), (3.0, 300.0), (4.0, 400.0), (5.0, 500.0)]:
+            self._create_job_exe(self.job_type_1, 'COMPLETED', when, cpus_used, mem_used)
+        self._create_job_exe(self.job_type_2, 'COMPLETED', when, None, 50.0)
+        # Failed, old, and unsampled job executions are ignored
+        self._create_job_exe(self.job_type_1, 'FAILED', when, 10.0, 1000.0)
+        self._create_job_exe(self.job_type_1, 'COMPLETED', when - datetime.timedelta(days=30), 10.0, 1000.0)
+        self._create_job_exe(self.job_type_3, 'COMPLETED', when, None, None)
+
+    def _create_job_exe(self, job_type, status, ended, cpus_used, mem_used):
+        """Creates a finished job execution with the given sampled resource usage"""
+
+        job_exe = job_test_utils.create_job_exe(job_type=job_type, status=status, ended=ended)
+        job_exe.cpus_used = cpus_used
+        job_exe.mem_used = mem_used
+        job_exe.save()
+
+    def test_successful(self):
+        """Tests calling JobTypeManager.get_resource_usage()"""
+
+        resource_usage = JobType.objects.get_resource_usage(timezone.now() - datetime.timedelta(days=7))
+        self.assertEqual(len(resource_usage), 2)
+
+        self.assertEqual(resource_usage[0].job_type.id, self.job_type_1.id)
+        self.assertEqual(resource_usage[0].count, 5)
+        self.assertDictEqual(resource_usage[0].cpus, {'p50': 3.0, 'p90': 5.0, 'p95': 5.0, 'max': 5.0})
+        self.assertEqual(resource_usage[0].get_percentile('mem', 25), 200.0)
+        self.assertIsNone(resource_usage[0].disk)
+
+        self.assertEqual(resource_usage[1].job_type.id, self.job_type_2.id)
+        self.assertEqual(resource_usage[1].count, 1)
+        self.assertIsNone(resource_usage[1].cpus)
+        self.assertEqual(resource_usage[1].mem['max'], 50.0)
+
+    def test_job_type_ids(self):
+        """Tests calling JobTypeManager.get_resource_usage() for specific job types"""
+
+        resource_usage = JobType.objects.get_resource_usage(timezone.now() - datetime.timedelta(days=7),
+                                                             job_type_ids=[self.job_type_2.id])
+        self.assertEqual(len(resource_usage), 1)
+        self.assertEqual(resource_usage[0].job_type.id, self.job_type_2.id)
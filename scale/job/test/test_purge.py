@@ -0,0 +1,46 @@
+from __future__ import unicode_literals
+
+import datetime
+
+import django
+from django.test import TestCase
+from django.utils.timezone import now
+
+import job.test.utils as job_test_utils
+import queue.test.utils as queue_test_utils
+from error.models import LogEntry
+from job.models import TaskUpdate
+from job.purge import purge_history
+from queue.models import JobLoad
+
+
+class TestPurgeHistory(TestCase):
+
+    def setUp(self):
+        django.setup()
+
+    def test_purge_history(self):
+        """Tests purging the history rows that are older than their retention periods"""
+
+        when = now()
+        old = when - datetime.timedelta(days=100)
+
+        old_entry = LogEntry.objects.create(host='host', level='INFO', message='old')
+        LogEntry.objects.filter(id=old_entry.id).update(created=old)
+        new_entry = LogEntry.objects.create(host='host', level='INFO', message='new')
+
+        queue_test_utils.create_job_load(measured=old)
+        new_load = queue_test_utils.create_job_load(measured=when)
+
+        finished_exe = job_test_utils.create_job_exe(status='COMPLETED')
+        running_exe = job_test_utils.create_job_exe(status='RUNNING')
+        TaskUpdate.objects.create(job_exe=finished_exe, task_id='task_1', status='FINISHED')
+        TaskUpdate.objects.create(job_exe=running_exe, task_id='task_2', status='RUNNING')
+        TaskUpdate.objects.all().update(created=old)
+
+        counts = purge_history(when, chunk_size=1)
+
+        self.assertDictEqual(counts, {'logentry': 1, 'job_load': 1, 'task_update': 1})
+        self.assertListEqual(list(LogEntry.objects.values_list('id', flat=True)), [new_entry.id])
+        self.assertListEqual(list(JobLoad.objects.values_list('id', flat=True)), [new_load.id])
+        self.assertListEqual(list(TaskUpdate.objects.values_list('job_exe_id', flat=True)), [running_exe.id])
@@ -13,6 +13,8 @@ urlpatterns = [
     url(r'^job-types/status/$', views.JobTypesStatusView.as_view(), name='job_types_status_view'),
     url(r'^job-types/pending/$', views.JobTypesPendingView.as_view(), name='job_types_pending_view'),
     url(r'^job-types/running/$', views.JobTypesRunningView.as_view(), name='job_types_running_view'),
+    url(r'^job-types/resource-usage/$', views.JobTypesResourceUsageView.as_view(),
+        name='job_types_resource_usage_view'),
     url(r'^job-types/system-failures/$', views.JobTypesSystemFailuresView.as_view(),
         name='job_types_system_failures_view'),
 
@@ -22,7 +22,8 @@ from job.configuration.json.job.job_config import JobConfiguration
 from job.exceptions import InvalidJobField
 from job.serializers import (JobDetailsSerializer, JobSerializer, JobTypeDetailsSerializer,
                              JobTypeFailedStatusSerializer, JobTypeSerializer, JobTypePendingStatusSerializer,
-                             JobTypeRunningStatusSerializer, JobTypeStatusSerializer, JobUpdateSerializer,
+                             JobTypeResourceUsageSerializer, JobTypeRunningStatusSerializer,
+                             JobTypeStatusSerializer, JobUpdateSerializer,
                              JobWithExecutionSerializer, JobExecutionSerializer,
                              JobExecutionDetailsSerializer)
 from models import Job, JobExecution, JobType
@@ -470,6 +471,32 @@ class JobTypesRunningView(ListAPIView):
         return self.get_paginated_response(serializer.data)
 
 
+class JobTypesResourceUsageView(ListAPIView):
+    """This view is the endpoint for retrieving the resources actually used by the recent jobs of each job type."""
+    queryset = JobType.objects.all()
+    serializer_class = JobTypeResourceUsageSerializer
+
+    def list(self, request):
+        """Retrieves the resource usage of the job types and returns it in JSON form
+
+        :param request: the HTTP GET request
+        :type request: :class:`rest_framework.request.Request`
+        :rtype: :class:`rest_framework.response.Response`
+        :returns: the HTTP response to send back to the user
+        """
+
+        started = rest_util.parse_timestamp(request, 'started', 'P7D')
+        ended = rest_util.parse_timestamp(request, 'ended', required=False)
+        rest_util.check_time_range(started, ended)
+        job_type_ids = rest_util.parse_int_list(request, 'job_type_id', required=False)
+
+        resource_usage = JobType.objects.get_resource_usage(started, ended, job_type_ids)
+
+        page = self.paginate_queryset(resource_usage)
+        serializer = self.get_serializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
+
+
 class JobTypesSystemFailuresView(ListAPIView):
     """This view is the endpoint for viewing system errors organized by job type."""
     queryset = JobType.objects.all()
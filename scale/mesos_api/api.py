@@ -282,6 +282,26 @@ def get_slave_task_url(hostname, port, task_dir, file_name):
     return base_url + query_args
 
 
+def get_slave_task_statistics(hostname, port, timeout=None):
+    """Queries the Mesos slave REST API to get the resource usage statistics of the containers running on the slave
+
+    :param hostname: The hostname of the slave
+    :type hostname: str
+    :param port: The port of the slave
+    :type port: int
+    :param timeout: The number of seconds to wait for the slave to respond, possibly None
+    :type timeout: float
+    :returns: The resource usage statistics stored by executor ID, which is the task ID for command tasks
+    :rtype: dict
+    """
+    url = 'http://%s:%i/monitor/statistics.json' % (hostname, port)
+    response = urllib2.urlopen(url, timeout=timeout) if timeout else urllib2.urlopen(url)
+    statistics = {}
+    for executor_dict in json.load(response):
+        statistics[executor_dict['executor_id']] = executor_dict['statistics']
+    return statistics
+
+
 def _get_slave_dict(hostname, port, slave_id):
     """Queries the Mesos master REST API to get information for the given slave
 
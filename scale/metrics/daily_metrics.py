@@ -19,7 +19,8 @@ class DailyMetricsProcessor(ClockEventProcessor):
     def process_event(self, event, last_event=None):
         """See :meth:`job.clock.ClockEventProcessor.process_event`.
 
-        Compares the new event with the last event any missing metrics jobs.
+        Compares the new event with the last event any missing metrics jobs. Missing days are combined into a single
+        job that computes the whole range of dates at once.
         """
 
         # Attempt to get the daily metrics job type
@@ -36,8 +37,13 @@ class DailyMetricsProcessor(ClockEventProcessor):
             # Use the previous day when first triggered
             days = [timezone.now().date() - datetime.timedelta(days=1)]
 
-        # Schedule one job for each required day
-        for day in days:
-            job_data = JobData()
-            job_data.add_property_input('Day', day.strftime('%Y-%m-%d'))
-            Queue.objects.queue_new_job(job_type, job_data, event)
+        if not days:
+            return
+
+        # Schedule one job for the required days, using an ISO 8601 interval when catching up on multiple days
+        day_value = days[0].strftime('%Y-%m-%d')
+        if len(days) > 1:
+            day_value = '%s/%s' % (day_value, days[-1].strftime('%Y-%m-%d'))
+        job_data = JobData()
+        job_data.add_property_input('Day', day_value)
+        Queue.objects.queue_new_job(job_type, job_data, event)
@@ -21,7 +21,8 @@ class Command(BaseCommand):
 
 
     def add_arguments(self, parser):
-        parser.add_argument('day', help='The ISO 8601 date to compute metrics for.')
+        parser.add_argument('day', help='The ISO 8601 date to compute metrics for. An ISO 8601 interval of dates '
+                                        '(2015-01-01/2015-01-31) computes every date in the range at once.')
 
     def handle(self, *args, **options):
         """See :meth:`django.core.management.base.BaseCommand.handle`.
@@ -35,15 +36,15 @@ class Command(BaseCommand):
         logger.info(' - Day: %s', day)
 
         logger.info('Generating metrics...')
-        date = datetime.datetime.strptime(day, '%Y-%m-%d')
+        started, ended = self._parse_days(day)
 
-        # Run the calculations against each provider for the requested date
+        # Run the calculations against each provider for the requested dates
         failed = 0
         for provider in registry.get_providers():
             metrics_type = provider.get_metrics_type()
             try:
                 logger.info('Starting: %s', metrics_type.name)
-                self._calculate_metrics(provider, date)
+                self._calculate_metrics(provider, started, ended)
                 logger.info('Completed: %s', metrics_type.name)
             except:
                 failed += 1
@@ -54,14 +55,30 @@ class Command(BaseCommand):
             logger.info('Metric providers failed: %i', failed)
             sys.exit(failed)
 
+    def _parse_days(self, day):
+        """Parses the requested day argument into an inclusive range of dates
+
+        :param day: The ISO 8601 date or interval of dates
+        :type day: string
+        :returns: The first and last dates of the range
+        :rtype: tuple(:class:`datetime.date`, :class:`datetime.date`)
+        """
+
+        parts = day.split('/', 1)
+        started = datetime.datetime.strptime(parts[0], '%Y-%m-%d').date()
+        ended = datetime.datetime.strptime(parts[-1], '%Y-%m-%d').date()
+        return started, ended
+
     @retry_database_query
-    def _calculate_metrics(self, provider, date):
-        """Calculates the Scale metrics for the given date with the given provider
+    def _calculate_metrics(self, provider, started, ended):
+        """Calculates the Scale metrics for the given range of dates with the given provider
 
         :param provider: The metrics provider
         :type provider: :class:`metrics.registry.MetricsTypeProvider`
-        :param date: The date for generating metrics
-        :type date: :class:`datetime.datetime`
+        :param started: The first date for generating metrics
+        :type started: :class:`datetime.date`
+        :param ended: The last date for generating metrics
+        :type ended: :class:`datetime.date`
         """
 
-        provider.calculate(date)
+        provider.calculate_range(started, ended)
@@ -3,16 +3,18 @@ from __future__ import unicode_literals
 
 import datetime
 import logging
-import sys
 
 import django.contrib.gis.db.models as models
 import django.utils.timezone as timezone
 from django.db import transaction
+from django.db.models import Avg, Case, Count, F, FloatField, Func, IntegerField, Max, Min, Sum, Value, When
+from django.db.models.functions import Coalesce, Greatest, TruncDate
 
 from error.models import Error
 from job.models import Job, JobExecution, JobType
 from ingest.models import Ingest, Strike
-from metrics.registry import MetricsPlotData, MetricsType, MetricsTypeGroup, MetricsTypeFilter
+from metrics.registry import (MetricsPlotColumns, MetricsPlotData, MetricsType, MetricsTypeGroup,
+                              MetricsTypeFilter)
 
 logger = logging.getLogger(__name__)
 
@@ -67,32 +69,76 @@ class PlotIntegerField(models.IntegerField):
 PLOT_FIELD_TYPES = [PlotBigIntegerField, PlotIntegerField]
 
 
+class ElapsedSeconds(Func):
+    """Database expression that computes the non-negative number of seconds between two timestamp columns.
+
+    The result is null whenever either timestamp is null, which allows aggregates to skip incomplete records just like
+    the previous Python implementation did.
+
+    :keyword ended: The name of the field holding the later timestamp.
+    :type ended: string
+    :keyword started: The name of the field holding the earlier timestamp.
+    :type started: string
+    """
+    arg_joiner = ' - '
+    template = "CASE WHEN (%(expressions)s) < INTERVAL '0' THEN 0 ELSE EXTRACT(EPOCH FROM (%(expressions)s)) END"
+
+    def __init__(self, ended, started, **extra):
+        super(ElapsedSeconds, self).__init__(F(ended), F(started), output_field=FloatField(), **extra)
+
+
+def _count_if(**conditions):
+    """Builds an aggregate that counts the records matching the given field lookups.
+
+    :param conditions: The field lookups a record must match to be counted.
+    :type conditions: dict[string, object]
+    :returns: The conditional count aggregate.
+    :rtype: :class:`django.db.models.Sum`
+    """
+    return Sum(Case(When(then=Value(1), **conditions), default=Value(0), output_field=IntegerField()))
+
+
+def _get_datetime_range(started, ended):
+    """Gets the full range of UTC timestamps covered by the given inclusive range of days.
+
+    :param started: The first day of the range.
+    :type started: datetime.date
+    :param ended: The last day of the range.
+    :type ended: datetime.date
+    :returns: The first and last timestamps within the range.
+    :rtype: tuple(datetime.datetime, datetime.datetime)
+    """
+    range_started = datetime.datetime.combine(started, datetime.time.min).replace(tzinfo=timezone.utc)
+    range_ended = datetime.datetime.combine(ended, datetime.time.max).replace(tzinfo=timezone.utc)
+    return range_started, range_ended
+
+
 class MetricsErrorManager(models.Manager):
     """Provides additional methods for computing daily error metrics."""
 
     def calculate(self, date):
         """See :meth:`metrics.registry.MetricsTypeProvider.calculate`."""
 
-        started = datetime.datetime.combine(date, datetime.time.min).replace(tzinfo=timezone.utc)
-        ended = datetime.datetime.combine(date, datetime.time.max).replace(tzinfo=timezone.utc)
+        self.calculate_range(date, date)
 
-        # Fetch all the job executions with an error for the requested day
-        job_exes = JobExecution.objects.filter(error__is_builtin=True, ended__gte=started, ended__lte=ended)
-        job_exes = job_exes.select_related('error')
-        job_exes = job_exes.defer('environment', 'results', 'results_manifest', 'stdout', 'stderr')
+    def calculate_range(self, started, ended):
+        """See :meth:`metrics.registry.MetricsTypeProvider.calculate_range`."""
 
-        # Calculate the overall counts based on job status
-        entry_map = {}
-        for job_exe in job_exes.iterator():
-            if job_exe.error not in entry_map:
-                entry = MetricsError(error=job_exe.error, occurred=date, created=timezone.now())
-                entry.total_count = 0
-                entry_map[job_exe.error] = entry
-            entry = entry_map[job_exe.error]
-            entry.total_count += 1
+        range_started, range_ended = _get_datetime_range(started, ended)
+
+        # Count all the job executions with an error grouped by error and day
+        job_exes = JobExecution.objects.filter(error__is_builtin=True, ended__gte=range_started,
+                                               ended__lte=range_ended)
+        job_exes = job_exes.annotate(day=TruncDate('ended')).order_by().values('error_id', 'day')
+        job_exes = job_exes.annotate(total_count=Count('id'))
+
+        entries = []
+        for row in job_exes.iterator():
+            entries.append(MetricsError(error_id=row['error_id'], occurred=row['day'], created=timezone.now(),
+                                        total_count=row['total_count']))
 
         # Save the new metrics to the database
-        self._replace_entries(date, entry_map.values())
+        self._replace_entries(started, ended, entries)
 
     def get_metrics_type(self, include_choices=False):
         """See :meth:`metrics.registry.MetricsTypeProvider.get_metrics_type`."""
@@ -112,6 +158,36 @@ class MetricsErrorManager(models.Manager):
     def get_plot_data(self, started=None, ended=None, choice_ids=None, columns=None):
         """See :meth:`metrics.registry.MetricsTypeProvider.get_plot_data`."""
 
+        entries, columns = self._get_plot_entries(started, ended, choice_ids, columns)
+        column_names = [c.name for c in columns]
+        entries = entries.values('error_id', 'occurred', *column_names)
+
+        # Convert the database models to plot models
+        return MetricsPlotData.create(entries, 'occurred', 'error_id', choice_ids, columns)
+
+    def get_plot_columns(self, started=None, ended=None, choice_ids=None, columns=None, bucket=None, max_points=None):
+        """See :meth:`metrics.registry.MetricsTypeProvider.get_plot_columns`."""
+
+        entries, columns = self._get_plot_entries(started, ended, choice_ids, columns)
+
+        # Convert the database rows to columnar plot models
+        return MetricsPlotColumns.create(entries, 'occurred', 'error_id', choice_ids, columns, bucket, max_points)
+
+    def _get_plot_entries(self, started=None, ended=None, choice_ids=None, columns=None):
+        """Gets the metrics models and columns that match the given plot query parameters.
+
+        :param started: The start of the time range to query.
+        :type started: datetime.date
+        :param ended: The end of the time range to query.
+        :type ended: datetime.date
+        :param choice_ids: A list of related model identifiers to query.
+        :type choice_ids: list[string]
+        :param columns: A list of metric columns to include from the metric type.
+        :type columns: {:class:`metrics.registry.MetricsTypeColumn`}
+        :returns: The matching metrics models sorted by date and the columns to include.
+        :rtype: tuple(:class:`django.db.models.QuerySet`, list[:class:`metrics.registry.MetricsTypeColumn`])
+        """
+
         # Fetch all the matching job type metrics based on query filters
         entries = MetricsError.objects.all().order_by('occurred')
         if started:
@@ -122,24 +198,22 @@ class MetricsErrorManager(models.Manager):
             entries = entries.filter(error_id__in=choice_ids)
         if not columns:
             columns = self.get_metrics_type().columns
-        column_names = [c.name for c in columns]
-        entries = entries.values('error_id', 'occurred', *column_names)
-
-        # Convert the database models to plot models
-        return MetricsPlotData.create(entries, 'occurred', 'error_id', choice_ids, columns)
+        return entries, columns
 
     @transaction.atomic
-    def _replace_entries(self, date, entries):
-        """Replaces all the existing metric entries for the given date with new ones.
+    def _replace_entries(self, started, ended, entries):
+        """Replaces all the existing metric entries within the given range of dates with new ones.
 
-        :param date: The date when job executions associated with the metrics ended.
-        :type date: datetime.date
+        :param started: The first date when job executions associated with the metrics ended.
+        :type started: datetime.date
+        :param ended: The last date when job executions associated with the metrics ended.
+        :type ended: datetime.date
         :param entries: The new metrics model to save.
         :type entries: list[:class:`metrics.models.MetricsError`]
         """
 
         # Delete all the previous metrics entries
-        MetricsError.objects.filter(occurred=date).delete()
+        MetricsError.objects.filter(occurred__gte=started, occurred__lte=ended).delete()
 
         # Save all the new metrics models
         MetricsError.objects.bulk_create(entries)
@@ -185,30 +259,57 @@ class MetricsIngestManager(models.Manager):
     def calculate(self, date):
         """See :meth:`metrics.registry.MetricsTypeProvider.calculate`."""
 
-        started = datetime.datetime.combine(date, datetime.time.min).replace(tzinfo=timezone.utc)
-        ended = datetime.datetime.combine(date, datetime.time.max).replace(tzinfo=timezone.utc)
+        self.calculate_range(date, date)
+
+    def calculate_range(self, started, ended):
+        """See :meth:`metrics.registry.MetricsTypeProvider.calculate_range`."""
+
+        range_started, range_ended = _get_datetime_range(started, ended)
 
         # Fetch all the ingests relevant for metrics
         ingests = Ingest.objects.filter(status__in=['DEFERRED', 'INGESTED', 'ERRORED', 'DUPLICATE'],
-                                        ingest_ended__gte=started, ingest_ended__lte=ended, strike__isnull=False)
-        ingests = ingests.select_related('strike').defer('strike__configuration')
-
-        # Calculate the overall counts based on ingest status
-        entry_map = {}
-        for ingest in ingests.iterator():
-            if ingest.strike not in entry_map:
-                entry = MetricsIngest(strike=ingest.strike, occurred=date, created=timezone.now())
-                entry.deferred_count = 0
-                entry.ingested_count = 0
-                entry.errored_count = 0
-                entry.duplicate_count = 0
-                entry.total_count = 0
-                entry_map[ingest.strike] = entry
-            entry = entry_map[ingest.strike]
-            self._update_metrics(date, ingest, entry)
+                                        ingest_ended__gte=range_started, ingest_ended__lte=range_ended,
+                                        strike__isnull=False)
+
+        # Compute the per ingest values that contribute to the statistics
+        ingests = ingests.annotate(
+            day=TruncDate('ingest_ended'),
+            file_size_value=Case(When(file_size__gt=0, then=F('file_size')), output_field=models.BigIntegerField()),
+            transfer_secs=ElapsedSeconds('transfer_ended', 'transfer_started'),
+            ingest_secs=Case(When(status='INGESTED', then=ElapsedSeconds('ingest_ended', 'ingest_started')),
+                             output_field=FloatField()),
+        )
+
+        # Aggregate the statistics grouped by strike process and day
+        ingests = ingests.order_by().values('strike_id', 'day')
+        ingests = ingests.annotate(
+            deferred_count=_count_if(status='DEFERRED'),
+            ingested_count=_count_if(status='INGESTED'),
+            errored_count=_count_if(status='ERRORED'),
+            duplicate_count=_count_if(status='DUPLICATE'),
+            total_count=Count('id'),
+            file_size_sum=Sum('file_size_value'),
+            file_size_min=Min('file_size_value'),
+            file_size_max=Max('file_size_value'),
+            file_size_avg=Avg('file_size_value'),
+            transfer_time_sum=Sum('transfer_secs'),
+            transfer_time_min=Min('transfer_secs'),
+            transfer_time_max=Max('transfer_secs'),
+            transfer_time_avg=Avg('transfer_secs'),
+            ingest_time_sum=Sum('ingest_secs'),
+            ingest_time_min=Min('ingest_secs'),
+            ingest_time_max=Max('ingest_secs'),
+            ingest_time_avg=Avg('ingest_secs'),
+        )
+
+        entries = []
+        for row in ingests.iterator():
+            strike_id = row.pop('strike_id')
+            day = row.pop('day')
+            entries.append(MetricsIngest(strike_id=strike_id, occurred=day, created=timezone.now(), **row))
 
         # Save the new metrics to the database
-        self._replace_entries(date, entry_map.values())
+        self._replace_entries(started, ended, entries)
 
     def get_metrics_type(self, include_choices=False):
         """See :meth:`metrics.registry.MetricsTypeProvider.get_metrics_type`."""
@@ -228,6 +329,36 @@ class MetricsIngestManager(models.Manager):
     def get_plot_data(self, started=None, ended=None, choice_ids=None, columns=None):
         """See :meth:`metrics.registry.MetricsTypeProvider.get_plot_data`."""
 
+        entries, columns = self._get_plot_entries(started, ended, choice_ids, columns)
+        column_names = [c.name for c in columns]
+        entries = entries.values('strike_id', 'occurred', *column_names)
+
+        # Convert the database models to plot models
+        return MetricsPlotData.create(entries, 'occurred', 'strike_id', choice_ids, columns)
+
+    def get_plot_columns(self, started=None, ended=None, choice_ids=None, columns=None, bucket=None, max_points=None):
+        """See :meth:`metrics.registry.MetricsTypeProvider.get_plot_columns`."""
+
+        entries, columns = self._get_plot_entries(started, ended, choice_ids, columns)
+
+        # Convert the database rows to columnar plot models
+        return MetricsPlotColumns.create(entries, 'occurred', 'strike_id', choice_ids, columns, bucket, max_points)
+
+    def _get_plot_entries(self, started=None, ended=None, choice_ids=None, columns=None):
+        """Gets the metrics models and columns that match the given plot query parameters.
+
+        :param started: The start of the time range to query.
+        :type started: datetime.date
+        :param ended: The end of the time range to query.
+        :type ended: datetime.date
+        :param choice_ids: A list of related model identifiers to query.
+        :type choice_ids: list[string]
+        :param columns: A list of metric columns to include from the metric type.
+        :type columns: {:class:`metrics.registry.MetricsTypeColumn`}
+        :returns: The matching metrics models sorted by date and the columns to include.
+        :rtype: tuple(:class:`django.db.models.QuerySet`, list[:class:`metrics.registry.MetricsTypeColumn`])
+        """
+
         # Fetch all the matching ingest metrics based on query filters
         entries = MetricsIngest.objects.all().order_by('occurred')
         if started:
@@ -238,75 +369,22 @@ class MetricsIngestManager(models.Manager):
             entries = entries.filter(strike_id__in=choice_ids)
         if not columns:
             columns = self.get_metrics_type().columns
-        column_names = [c.name for c in columns]
-        entries = entries.values('strike_id', 'occurred', *column_names)
-
-        # Convert the database models to plot models
-        return MetricsPlotData.create(entries, 'occurred', 'strike_id', choice_ids, columns)
-
-    def _update_metrics(self, date, ingest, entry):
-        """Updates the metrics model attributes for a single ingest.
-
-        :param date: The date when ingests associated with the metrics ended.
-        :type date: datetime.date
-        :param ingest: The ingest from which to derive statistics.
-        :type ingest: :class:`ingest.models.Ingest`
-        :param entry: The metrics model to update.
-        :type entry: :class:`metrics.models.MetricsIngest`
-        """
-        if ingest.status == 'DEFERRED':
-            entry.deferred_count += 1
-            entry.total_count += 1
-        elif ingest.status == 'INGESTED':
-            entry.ingested_count += 1
-            entry.total_count += 1
-        elif ingest.status == 'ERRORED':
-            entry.errored_count += 1
-            entry.total_count += 1
-        elif ingest.status == 'DUPLICATE':
-            entry.duplicate_count += 1
-            entry.total_count += 1
-
-        # Update file size metrics
-        if ingest.file_size:
-            entry._file_count = (entry._file_count if hasattr(entry, '_file_count') else 0) + 1
-            entry.file_size_sum = (entry.file_size_sum or 0) + ingest.file_size
-            entry.file_size_min = min(entry.file_size_min or sys.maxint, ingest.file_size)
-            entry.file_size_max = max(entry.file_size_max or 0, ingest.file_size)
-            entry.file_size_avg = entry.file_size_sum / entry._file_count
-
-        # Update elapsed transfer time metrics
-        if ingest.transfer_started and ingest.transfer_ended:
-            transfer_secs = max((ingest.transfer_ended - ingest.transfer_started).total_seconds(), 0)
-            entry._transfer_count = (entry._transfer_count if hasattr(entry, '_transfer_count') else 0) + 1
-            entry.transfer_time_sum = (entry.transfer_time_sum or 0) + transfer_secs
-            entry.transfer_time_min = min(entry.transfer_time_min or sys.maxint, transfer_secs)
-            entry.transfer_time_max = max(entry.transfer_time_max or 0, transfer_secs)
-            entry.transfer_time_avg = entry.transfer_time_sum / entry._transfer_count
-
-        # Update elapsed ingest time metrics
-        if ingest.status == 'INGESTED' and ingest.ingest_started and ingest.ingest_ended:
-            ingest_secs = max((ingest.ingest_ended - ingest.ingest_started).total_seconds(), 0)
-            entry._ingest_count = (entry._ingest_count if hasattr(entry, '_ingest_count') else 0) + 1
-            entry.ingest_time_sum = (entry.ingest_time_sum or 0) + ingest_secs
-            entry.ingest_time_min = min(entry.ingest_time_min or sys.maxint, ingest_secs)
-            entry.ingest_time_max = max(entry.ingest_time_max or 0, ingest_secs)
-            entry.ingest_time_avg = entry.ingest_time_sum / entry._ingest_count
-
-        return entry
+        return entries, columns
 
     @transaction.atomic
-    def _replace_entries(self, date, entries):
-        """Replaces all the existing metric entries for the given date with new ones.
+    def _replace_entries(self, started, ended, entries):
+        """Replaces all the existing metric entries within the given range of dates with new ones.
 
-        :param date: The date when ingests associated with the metrics ended.
-        :type date: datetime.date
+        :param started: The first date when ingests associated with the metrics ended.
+        :type started: datetime.date
+        :param ended: The last date when ingests associated with the metrics ended.
+        :type ended: datetime.date
         :param entries: The new metrics model to save.
         :type entries: list[:class:`metrics.models.MetricsIngest`]
         """
 
         # Delete all the previous metrics entries
-        MetricsIngest.objects.filter(occurred=date).delete()
+        MetricsIngest.objects.filter(occurred__gte=started, occurred__lte=ended).delete()
 
         # Save all the new metrics models
         MetricsIngest.objects.bulk_create(entries)
@@ -436,45 +514,49 @@ class MetricsIngest(models.Model):
 class MetricsJobTypeManager(models.Manager):
     """Provides additional methods for computing daily job type metrics."""
 
+    # The names of the elapsed time statistics computed for each completed job execution
+    TIME_GROUPS = ['queue', 'pre', 'job', 'post', 'run', 'stage']
+
     def calculate(self, date):
         """See :meth:`metrics.registry.MetricsTypeProvider.calculate`."""
 
-        started = datetime.datetime.combine(date, datetime.time.min).replace(tzinfo=timezone.utc)
-        ended = datetime.datetime.combine(date, datetime.time.max).replace(tzinfo=timezone.utc)
+        self.calculate_range(date, date)
+
+    def calculate_range(self, started, ended):
+        """See :meth:`metrics.registry.MetricsTypeProvider.calculate_range`."""
+
+        range_started, range_ended = _get_datetime_range(started, ended)
 
-        # Fetch all the jobs relevant for metrics
-        jobs = Job.objects.filter(status__in=['CANCELED', 'COMPLETED', 'FAILED'], ended__gte=started, ended__lte=ended)
-        jobs = jobs.select_related('job_type', 'error').defer('data', 'configuration', 'results')
+        # Count all the jobs relevant for metrics grouped by job type and day
+        jobs = Job.objects.filter(status__in=['CANCELED', 'COMPLETED', 'FAILED'], ended__gte=range_started,
+                                  ended__lte=range_ended)
+        jobs = jobs.annotate(day=TruncDate('ended')).order_by().values('job_type_id', 'day')
+        jobs = jobs.annotate(
+            completed_count=_count_if(status='COMPLETED'),
+            failed_count=_count_if(status='FAILED'),
+            canceled_count=_count_if(status='CANCELED'),
+            total_count=Count('id'),
+            error_system_count=_count_if(error__category='SYSTEM'),
+            error_data_count=_count_if(error__category='DATA'),
+            error_algorithm_count=_count_if(error__category='ALGORITHM'),
+        )
 
-        # Calculate the overall counts based on job status
         entry_map = {}
-        for job in jobs.iterator():
-            if job.job_type not in entry_map:
-                entry = MetricsJobType(job_type=job.job_type, occurred=date, created=timezone.now())
-                entry.completed_count = 0
-                entry.failed_count = 0
-                entry.canceled_count = 0
-                entry.total_count = 0
-                entry.error_system_count = 0
-                entry.error_data_count = 0
-                entry.error_algorithm_count = 0
-                entry_map[job.job_type] = entry
-            entry = entry_map[job.job_type]
-            self._update_counts(date, job, entry)
-
-        # Fetch all the completed job executions for the requested day
-        job_exes = JobExecution.objects.filter(status__in=['COMPLETED'], ended__gte=started, ended__lte=ended)
-        job_exes = job_exes.select_related('job__job_type')
-        job_exes = job_exes.defer('environment', 'results', 'results_manifest', 'stdout', 'stderr')
-
-        # Calculate the metrics per job execution grouped by job type
-        for job_exe in job_exes.iterator():
-            job_type = job_exe.job.job_type
-            entry = entry_map[job_type]
-            self._update_times(date, job_exe, entry)
+        for row in jobs.iterator():
+            key = (row.pop('job_type_id'), row.pop('day'))
+            entry_map[key] = MetricsJobType(job_type_id=key[0], occurred=key[1], created=timezone.now(), **row)
+
+        # Aggregate the elapsed times of the completed job executions grouped by job type and day
+        for row in self._get_time_stats(range_started, range_ended).iterator():
+            key = (row.pop('job__job_type_id'), row.pop('day'))
+            if key not in entry_map:
+                entry_map[key] = MetricsJobType(job_type_id=key[0], occurred=key[1], created=timezone.now(),
+                                                completed_count=0, failed_count=0, canceled_count=0, total_count=0,
+                                                error_system_count=0, error_data_count=0, error_algorithm_count=0)
+            self._update_times(row, entry_map[key])
 
         # Save the new metrics to the database
-        self._replace_entries(date, entry_map.values())
+        self._replace_entries(started, ended, entry_map.values())
 
     def get_metrics_type(self, include_choices=False):
         """See :meth:`metrics.registry.MetricsTypeProvider.get_metrics_type`."""
@@ -494,6 +576,36 @@ class MetricsJobTypeManager(models.Manager):
     def get_plot_data(self, started=None, ended=None, choice_ids=None, columns=None):
         """See :meth:`metrics.registry.MetricsTypeProvider.get_plot_data`."""
 
+        entries, columns = self._get_plot_entries(started, ended, choice_ids, columns)
+        column_names = [c.name for c in columns]
+        entries = entries.values('job_type_id', 'occurred', *column_names)
+
+        # Convert the database models to plot models
+        return MetricsPlotData.create(entries, 'occurred', 'job_type_id', choice_ids, columns)
+
+    def get_plot_columns(self, started=None, ended=None, choice_ids=None, columns=None, bucket=None, max_points=None):
+        """See :meth:`metrics.registry.MetricsTypeProvider.get_plot_columns`."""
+
+        entries, columns = self._get_plot_entries(started, ended, choice_ids, columns)
+
+        # Convert the database rows to columnar plot models
+        return MetricsPlotColumns.create(entries, 'occurred', 'job_type_id', choice_ids, columns, bucket, max_points)
+
+    def _get_plot_entries(self, started=None, ended=None, choice_ids=None, columns=None):
+        """Gets the metrics models and columns that match the given plot query parameters.
+
+        :param started: The start of the time range to query.
+        :type started: datetime.date
+        :param ended: The end of the time range to query.
+        :type ended: datetime.date
+        :param choice_ids: A list of related model identifiers to query.
+        :type choice_ids: list[string]
+        :param columns: A list of metric columns to include from the metric type.
+        :type columns: {:class:`metrics.registry.MetricsTypeColumn`}
+        :returns: The matching metrics models sorted by date and the columns to include.
+        :rtype: tuple(:class:`django.db.models.QuerySet`, list[:class:`metrics.registry.MetricsTypeColumn`])
+        """
+
         # Fetch all the matching job type metrics based on query filters
         entries = MetricsJobType.objects.all().order_by('occurred')
         if started:
@@ -504,114 +616,82 @@ class MetricsJobTypeManager(models.Manager):
             entries = entries.filter(job_type_id__in=choice_ids)
         if not columns:
             columns = self.get_metrics_type().columns
-        column_names = [c.name for c in columns]
-        entries = entries.values('job_type_id', 'occurred', *column_names)
+        return entries, columns
 
-        # Convert the database models to plot models
-        return MetricsPlotData.create(entries, 'occurred', 'job_type_id', choice_ids, columns)
+    def _get_time_stats(self, started, ended):
+        """Gets a query that aggregates the elapsed time statistics of completed job executions.
 
-    def _update_counts(self, date, job, entry):
-        """Updates the metrics model attributes for a single job.
+        The results are grouped by job type and the day the execution ended. Times that could not be computed because
+        of missing timestamps are excluded from the statistics.
 
-        :param date: The date when jobs associated with the metrics ended.
-        :type date: datetime.date
-        :param job: The job from which to derive statistics.
-        :type job: :class:`job.models.Job`
-        :param entry: The metrics model to update.
-        :type entry: :class:`metrics.models.MetricsJobType`
+        :param started: The earliest time when job executions ended.
+        :type started: datetime.datetime
+        :param ended: The latest time when job executions ended.
+        :type ended: datetime.datetime
+        :returns: The aggregated statistics for each job type and day.
+        :rtype: :class:`django.db.models.QuerySet`
         """
-        if job.status == 'COMPLETED':
-            entry.completed_count += 1
-            entry.total_count += 1
-        elif job.status == 'FAILED':
-            entry.failed_count += 1
-            entry.total_count += 1
-        elif job.status == 'CANCELED':
-            entry.canceled_count += 1
-            entry.total_count += 1
-
-        if job.error:
-            if job.error.category == 'SYSTEM':
-                entry.error_system_count += 1
-            elif job.error.category == 'DATA':
-                entry.error_data_count += 1
-            elif job.error.category == 'ALGORITHM':
-                entry.error_algorithm_count += 1
-
-    def _update_times(self, date, job_exe, entry):
-        """Updates the metrics model attributes for a single job execution.
-
-        :param date: The date when job executions associated with the metrics ended.
-        :type date: datetime.date
-        :param job_exe: The job execution from which to derive statistics.
-        :type job_exe: :class:`job.models.JobExecution`
+
+        job_exes = JobExecution.objects.filter(status='COMPLETED', ended__gte=started, ended__lte=ended)
+        job_exes = job_exes.annotate(
+            day=TruncDate('ended'),
+            queue_secs=ElapsedSeconds('started', 'queued'),
+            pre_secs=ElapsedSeconds('pre_completed', 'pre_started'),
+            job_secs=ElapsedSeconds('job_completed', 'job_started'),
+            post_secs=ElapsedSeconds('post_completed', 'post_started'),
+            run_secs=ElapsedSeconds('ended', 'started'),
+        )
+
+        # Stage time is the overhead of the run time not spent within any of the tasks
+        task_secs = (Coalesce('pre_secs', 0, output_field=FloatField()) +
+                     Coalesce('job_secs', 0, output_field=FloatField()) +
+                     Coalesce('post_secs', 0, output_field=FloatField()))
+        job_exes = job_exes.annotate(
+            stage_secs=Case(When(run_secs__isnull=False,
+                                 then=Greatest(F('run_secs') - task_secs, 0, output_field=FloatField())),
+                            output_field=FloatField()),
+        )
+
+        aggregates = {}
+        for name in self.TIME_GROUPS:
+            aggregates['%s_time_sum' % name] = Sum('%s_secs' % name)
+            aggregates['%s_time_min' % name] = Min('%s_secs' % name)
+            aggregates['%s_time_max' % name] = Max('%s_secs' % name)
+        return job_exes.order_by().values('job__job_type_id', 'day').annotate(**aggregates)
+
+    def _update_times(self, stats, entry):
+        """Updates the metrics model time attributes with the aggregated statistics of completed job executions.
+
+        :param stats: The aggregated sum, min, and max values for each elapsed time statistic.
+        :type stats: dict[string, float]
         :param entry: The metrics model to update.
         :type entry: :class:`metrics.models.MetricsJobType`
         """
 
-        # Update elapsed queue time metrics
-        queue_secs = None
-        if job_exe.queued and job_exe.started:
-            queue_secs = max((job_exe.started - job_exe.queued).total_seconds(), 0)
-            entry.queue_time_sum = (entry.queue_time_sum or 0) + queue_secs
-            entry.queue_time_min = min(entry.queue_time_min or sys.maxint, queue_secs)
-            entry.queue_time_max = max(entry.queue_time_max or 0, queue_secs)
-            entry.queue_time_avg = entry.queue_time_sum / entry.completed_count
-
-        # Update elapsed pre-task time metrics
-        pre_secs = None
-        if job_exe.pre_started and job_exe.pre_completed:
-            pre_secs = max((job_exe.pre_completed - job_exe.pre_started).total_seconds(), 0)
-            entry.pre_time_sum = (entry.pre_time_sum or 0) + pre_secs
-            entry.pre_time_min = min(entry.pre_time_min or sys.maxint, pre_secs)
-            entry.pre_time_max = max(entry.pre_time_max or 0, pre_secs)
-            entry.pre_time_avg = entry.pre_time_sum / entry.completed_count
-
-        # Update elapsed actual job time metrics
-        job_secs = None
-        if job_exe.job_started and job_exe.job_completed:
-            job_secs = max((job_exe.job_completed - job_exe.job_started).total_seconds(), 0)
-            entry.job_time_sum = (entry.job_time_sum or 0) + job_secs
-            entry.job_time_min = min(entry.job_time_min or sys.maxint, job_secs)
-            entry.job_time_max = max(entry.job_time_max or 0, job_secs)
-            entry.job_time_avg = entry.job_time_sum / entry.completed_count
-
-        # Update elapsed post-task time metrics
-        post_secs = None
-        if job_exe.post_started and job_exe.post_completed:
-            post_secs = max((job_exe.post_completed - job_exe.post_started).total_seconds(), 0)
-            entry.post_time_sum = (entry.post_time_sum or 0) + post_secs
-            entry.post_time_min = min(entry.post_time_min or sys.maxint, post_secs)
-            entry.post_time_max = max(entry.post_time_max or 0, post_secs)
-            entry.post_time_avg = entry.post_time_sum / entry.completed_count
-
-        # Update elapsed overall run and stage time metrics
-        if job_exe.started and job_exe.ended:
-            run_secs = max((job_exe.ended - job_exe.started).total_seconds(), 0)
-            entry.run_time_sum = (entry.run_time_sum or 0) + run_secs
-            entry.run_time_min = min(entry.run_time_min or sys.maxint, run_secs)
-            entry.run_time_max = max(entry.run_time_max or 0, run_secs)
-            entry.run_time_avg = entry.run_time_sum / entry.completed_count
-
-            stage_secs = max(run_secs - ((pre_secs or 0) + (job_secs or 0) + (post_secs or 0)), 0)
-            entry.stage_time_sum = (entry.stage_time_sum or 0) + stage_secs
-            entry.stage_time_min = min(entry.stage_time_min or sys.maxint, stage_secs)
-            entry.stage_time_max = max(entry.stage_time_max or 0, stage_secs)
-            entry.stage_time_avg = entry.stage_time_sum / entry.completed_count
-        return entry
+        for name in self.TIME_GROUPS:
+            time_sum = stats['%s_time_sum' % name]
+            setattr(entry, '%s_time_sum' % name, time_sum)
+            setattr(entry, '%s_time_min' % name, stats['%s_time_min' % name])
+            setattr(entry, '%s_time_max' % name, stats['%s_time_max' % name])
+
+            # Averages are based on the number of completed jobs to match the historical metrics
+            if time_sum is not None and entry.completed_count:
+                setattr(entry, '%s_time_avg' % name, time_sum / entry.completed_count)
 
     @transaction.atomic
-    def _replace_entries(self, date, entries):
-        """Replaces all the existing metric entries for the given date with new ones.
+    def _replace_entries(self, started, ended, entries):
+        """Replaces all the existing metric entries within the given range of dates with new ones.
 
-        :param date: The date when job executions associated with the metrics ended.
-        :type date: datetime.date
+        :param started: The first date when job executions associated with the metrics ended.
+        :type started: datetime.date
+        :param ended: The last date when job executions associated with the metrics ended.
+        :type ended: datetime.date
         :param entries: The new metrics model to save.
         :type entries: list[:class:`metrics.models.MetricsJobType`]
         """
 
         # Delete all the previous metrics entries
-        MetricsJobType.objects.filter(occurred=date).delete()
+        MetricsJobType.objects.filter(occurred__gte=started, occurred__lte=ended).delete()
 
         # Save all the new metrics models
         MetricsJobType.objects.bulk_create(entries)
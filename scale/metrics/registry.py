@@ -12,6 +12,9 @@ logger = logging.getLogger(__name__)
 # Each metrics type model should be registered here to make them available to the REST layer
 _PROVIDERS = {}
 
+# The supported sizes of the time buckets used to group plot values
+PLOT_BUCKETS = ['day', 'week', 'month']
+
 
 class MetricsType(object):
     """Represents a type of metrics that can be queried.
@@ -311,6 +314,107 @@ class MetricsPlotData(object):
         return plot_value
 
 
+class MetricsPlotSeries(object):
+    """Represents the y-axis values of a single choice within a columnar series of plot values.
+
+    :keyword choice_id: The unique identifier of the choice model associated with the values, or None when the values
+        are aggregated across all choices.
+    :type choice_id: int
+    :keyword values: The plot values aligned with the dates of the owning plot columns. Missing values are None.
+    :type values: list[int]
+    """
+    def __init__(self, choice_id, values):
+        self.id = choice_id
+        self.values = values
+
+
+class MetricsPlotColumns(object):
+    """Represents a series of plot values for a single metrics type column stored as parallel arrays.
+
+    Each series contains exactly one value for every date in the shared list of dates, which keeps the payload compact
+    for long time ranges and many choices.
+
+    :keyword column: The metrics type column definition.
+    :type column: :class:`metrics.registry.MetricsTypeColumn`
+    :keyword dates: The sorted x-axis dates shared by every series.
+    :type dates: list[datetime.date]
+    :keyword series: The y-axis values for each choice.
+    :type series: list[:class:`metrics.registry.MetricsPlotSeries`]
+    """
+    def __init__(self, column, dates=None, series=None):
+        self.column = column
+        self.dates = dates or []
+        self.series = series or []
+
+        all_values = [value for plot_series in self.series for value in plot_series.values if value is not None]
+        self.min_x = self.dates[0] if self.dates else None
+        self.max_x = self.dates[-1] if self.dates else None
+        self.min_y = min(all_values) if all_values else None
+        self.max_y = max(all_values) if all_values else None
+
+    @classmethod
+    def create(cls, query_set, date_field, choice_field, choice_ids, columns, bucket=None, max_points=None):
+        """Creates new columnar metrics plot data from a query set of database models.
+
+        Values are grouped by choice and date in a single pass over lightweight database rows. When no choice filters
+        are used, the values are aggregated across all choices. Values are then optionally merged into larger time
+        buckets and downsampled so that each series has no more than the requested number of points. Merged values are
+        combined with the aggregate operation of their column.
+
+        :param query_set: A set of database models that are being counted towards metrics.
+        :type query_set: :class:`django.models.QuerySet`
+        :param date_field: The name of the field within each model that contains the recorded date.
+        :type date_field: string
+        :param choice_field: The name of the field within each model that contains the choice model relation.
+        :type choice_field: string
+        :param choice_ids: A list of related model identifiers to query.
+        :type choice_ids: list[string]
+        :param columns: A list of metrics type column definitions that should be included.
+        :type columns: list[:class:`metrics.registry.MetricsTypeColumn`]
+        :param bucket: The size of the time buckets used to group values, which is one of PLOT_BUCKETS.
+        :type bucket: string
+        :param max_points: The maximum number of dates to include in each series.
+        :type max_points: int
+        :returns: The columnar plot data models that were created.
+        :rtype: list[:class:`metrics.registry.MetricsPlotColumns`]
+        """
+        column_names = [column.name for column in columns]
+        rows = list(query_set.values_list(choice_field, date_field, *column_names))
+
+        # Map every recorded date onto the date that will be plotted for it
+        date_map = {entry_date: get_bucket_date(entry_date, bucket) for entry_date in {row[1] for row in rows}}
+        dates = sorted(set(date_map.values()))
+        if max_points and len(dates) > max_points:
+            step = (len(dates) + max_points - 1) // max_points
+            sample_map = {plot_date: dates[index - index % step] for index, plot_date in enumerate(dates)}
+            date_map = {entry_date: sample_map[plot_date] for entry_date, plot_date in date_map.items()}
+            dates = dates[::step]
+        date_index = {plot_date: index for index, plot_date in enumerate(dates)}
+
+        # Group the raw values of every column by choice and plotted date
+        groups = [{} for _column in columns]
+        for row in rows:
+            choice_id = row[0] if choice_ids else None
+            index = date_index[date_map[row[1]]]
+            for column_groups, entry_val in zip(groups, row[2:]):
+                if entry_val is None:
+                    continue
+                choice_values = column_groups.get(choice_id)
+                if choice_values is None:
+                    choice_values = [[] for _date in dates]
+                    column_groups[choice_id] = choice_values
+                choice_values[index].append(entry_val)
+
+        results = []
+        for column, column_groups in zip(columns, groups):
+            series = []
+            for choice_id in sorted(column_groups):
+                values = [_aggregate_values(column.aggregate, entry_vals) for entry_vals in column_groups[choice_id]]
+                series.append(MetricsPlotSeries(choice_id, values))
+            results.append(MetricsPlotColumns(column, dates if series else [], series))
+        return results
+
+
 class MetricsTypeError(Exception):
     """Error class used when there is a problem generating metrics."""
     pass
@@ -328,6 +432,19 @@ class MetricsTypeProvider(object):
         """
         raise NotImplemented()
 
+    def calculate_range(self, started, ended):
+        """Calculates and saves new metrics models grouped by date for every date within the given range.
+
+        Providers should compute the whole range with a single set of queries instead of one calculation per date, so
+        that catching up on many missed days remains fast.
+
+        :param started: The first target date metrics should be based on.
+        :type started: datetime.date
+        :param ended: The last target date metrics should be based on, inclusive.
+        :type ended: datetime.date
+        """
+        raise NotImplemented()
+
     def get_metrics_type(self, include_choices=False):
         """Gets the metrics type model handled by this provider.
 
@@ -356,6 +473,66 @@ class MetricsTypeProvider(object):
         """
         raise NotImplemented()
 
+    def get_plot_columns(self, started=None, ended=None, choice_ids=None, columns=None, bucket=None, max_points=None):
+        """Gets a list of columnar plot values based on the given query parameters.
+
+        :param started: The start of the time range to query.
+        :type started: datetime.date
+        :param ended: The end of the time range to query.
+        :type ended: datetime.date
+        :param choice_ids: A list of related model identifiers to query.
+        :type choice_ids: list[string]
+        :param columns: A list of metric columns to include from the metric type.
+        :type columns: {:class:`metrics.registry.MetricsTypeColumn`}
+        :param bucket: The size of the time buckets used to group values, which is one of PLOT_BUCKETS.
+        :type bucket: string
+        :param max_points: The maximum number of dates to include in each series.
+        :type max_points: int
+        :returns: A series of columnar plot values that match the query.
+        :rtype: list[:class:`metrics.registry.MetricsPlotColumns`]
+        """
+        raise NotImplemented()
+
+
+def get_bucket_date(date, bucket=None):
+    """Gets the first date of the time bucket that contains the given date.
+
+    :param date: The date to place within a bucket.
+    :type date: datetime.date
+    :param bucket: The size of the time bucket, which is one of PLOT_BUCKETS. Defaults to a single day.
+    :type bucket: string
+    :returns: The first date of the matching time bucket.
+    :rtype: datetime.date
+    """
+    if bucket == 'week':
+        return date - datetime.timedelta(days=date.weekday())
+    if bucket == 'month':
+        return date.replace(day=1)
+    return date
+
+
+def _aggregate_values(aggregate, values):
+    """Combines a list of plot values into a single value using the given aggregate operation.
+
+    :param aggregate: The math operation used to combine the values. Examples: avg, max, min, sum
+    :type aggregate: string
+    :param values: The plot values to combine.
+    :type values: list[int]
+    :returns: The combined value or None if there are no values. An average is always a float.
+    :rtype: int or float
+    """
+    if not values:
+        return None
+    if aggregate == 'min':
+        return min(values)
+    if aggregate == 'max':
+        return max(values)
+    if aggregate == 'avg':
+        return float(sum(values)) / len(values)
+    if aggregate != 'sum':
+        logger.warning('Unknown metrics aggregate type: %s', aggregate)
+    return sum(values)
+
 
 def register_provider(provider, serializer_class=None):
     """Registers the given metrics type definition to be called by the metrics management system.
@@ -75,6 +75,23 @@ class MetricsPlotMultiSerializer(MetricsPlotSerializer):
     values = MetricsPlotMultiValueSerializer(many=True)
 
 
+class MetricsPlotSeriesSerializer(serializers.Serializer):
+    """Converts columnar metrics plot values for a single choice to REST output"""
+    id = serializers.IntegerField()
+    values = serializers.ListField(child=serializers.IntegerField(allow_null=True))
+
+
+class MetricsPlotColumnsSerializer(serializers.Serializer):
+    """Converts columnar metrics plot values to REST output"""
+    column = MetricsTypeColumnSerializer()
+    min_x = serializers.DateField()
+    max_x = serializers.DateField()
+    min_y = serializers.IntegerField()
+    max_y = serializers.IntegerField()
+    dates = serializers.ListField(child=serializers.DateField())
+    series = MetricsPlotSeriesSerializer(many=True)
+
+
 class MetricsErrorDetailsSerializer(MetricsTypeDetailsSerializer):
     """Converts ingest metrics details model fields to REST output"""
     from error.serializers import ErrorBaseSerializer
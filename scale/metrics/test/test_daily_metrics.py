@@ -58,23 +58,12 @@ class TestDailyMetricsProcessor(TransactionTestCase):
 
         self.processor.process_event(event, last)
 
-        i = 1
-        for call_args in mock_Queue.objects.queue_new_job.call_args_list:
-            args = call_args[0]
-            self.assertEqual(self.job_type, args[0])
-            self.assertEqual(event, args[2])
-            if i == 1:
-                self.assertDictEqual({'input_data': [{'name': 'Day', 'value': '2015-01-07'}], 'output_data': [],
-                                      'version': '1.0'}, args[1].get_dict())
-            if i == 2:
-                self.assertDictEqual({'input_data': [{'name': 'Day', 'value': '2015-01-08'}], 'output_data': [],
-                                      'version': '1.0'}, args[1].get_dict())
-            if i == 3:
-                self.assertDictEqual({'input_data': [{'name': 'Day', 'value': '2015-01-09'}], 'output_data': [],
-                                      'version': '1.0'}, args[1].get_dict())
-            i += 1
-
-        self.assertEqual(mock_Queue.objects.queue_new_job.call_count, 3)
+        call_args = mock_Queue.objects.queue_new_job.call_args[0]
+        self.assertEqual(self.job_type, call_args[0])
+        self.assertDictEqual({'input_data': [{'name': 'Day', 'value': '2015-01-07/2015-01-09'}], 'output_data': [],
+                              'version': '1.0'}, call_args[1].get_dict())
+        self.assertEqual(event, call_args[2])
+        self.assertEqual(mock_Queue.objects.queue_new_job.call_count, 1)
 
     @patch('metrics.daily_metrics.Queue')
     @patch('metrics.daily_metrics.timezone.now', lambda: datetime.datetime(2015, 1, 10, tzinfo=utc))
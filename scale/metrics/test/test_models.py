@@ -401,6 +401,31 @@ class TestMetricsJobType(TestCase):
 
         self.assertEqual(len(entries), 1)
 
+    def test_calculate_range(self):
+        """Tests generating metrics for a range of dates at once."""
+        job_type = job_test_utils.create_job_type()
+        job1 = job_test_utils.create_job(job_type=job_type, status='COMPLETED',
+                                         ended=datetime.datetime(2015, 1, 1, 10, tzinfo=utc))
+        job_test_utils.create_job_exe(job=job1, status=job1.status, ended=job1.ended)
+        job2 = job_test_utils.create_job(job_type=job_type, status='FAILED',
+                                         ended=datetime.datetime(2015, 1, 3, 10, tzinfo=utc))
+        job_test_utils.create_job_exe(job=job2, status=job2.status, ended=job2.ended)
+        job3 = job_test_utils.create_job(job_type=job_type, status='COMPLETED',
+                                         ended=datetime.datetime(2015, 1, 5, 10, tzinfo=utc))
+        job_test_utils.create_job_exe(job=job3, status=job3.status, ended=job3.ended)
+        metrics_test_utils.create_job_type(job_type=job_type, occurred=datetime.date(2015, 1, 2), total_count=5)
+
+        MetricsJobType.objects.calculate_range(datetime.date(2015, 1, 1), datetime.date(2015, 1, 3))
+        entries = MetricsJobType.objects.filter(job_type=job_type).order_by('occurred')
+
+        self.assertEqual(len(entries), 2)
+        self.assertEqual(entries[0].occurred, datetime.date(2015, 1, 1))
+        self.assertEqual(entries[0].completed_count, 1)
+        self.assertEqual(entries[0].total_count, 1)
+        self.assertEqual(entries[1].occurred, datetime.date(2015, 1, 3))
+        self.assertEqual(entries[1].failed_count, 1)
+        self.assertEqual(entries[1].total_count, 1)
+
     def test_calculate_stats(self):
         """Tests calculating individual statistics for a metrics entry."""
         job_type = job_test_utils.create_job_type()
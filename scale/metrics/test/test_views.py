@@ -2,7 +2,10 @@ from __future__ import unicode_literals
 
 import json
 
+import datetime
+
 import django
+from django.core.cache import cache
 from django.test import TestCase, TransactionTestCase
 from rest_framework import status
 
@@ -174,3 +177,106 @@ class TestMetricPlotView(TransactionTestCase):
         result = json.loads(response.content)
         self.assertEqual(len(result['results']), 1)
         self.assertEqual(result['results'][0]['values'][0]['value'], 330)
+
+
+class TestMetricPlotColumnsView(TransactionTestCase):
+
+    def setUp(self):
+        django.setup()
+        cache.clear()
+
+        self.job_type1 = job_test_utils.create_job_type()
+        metrics_test_utils.create_job_type(job_type=self.job_type1, occurred=datetime.date(2015, 1, 5),
+                                           completed_count=8, job_time_max=200)
+        metrics_test_utils.create_job_type(job_type=self.job_type1, occurred=datetime.date(2015, 1, 6),
+                                           completed_count=2, job_time_max=100)
+        metrics_test_utils.create_job_type(job_type=self.job_type1, occurred=datetime.date(2015, 1, 12),
+                                           completed_count=1, job_time_max=300)
+
+        self.job_type2 = job_test_utils.create_job_type()
+        metrics_test_utils.create_job_type(job_type=self.job_type2, occurred=datetime.date(2015, 1, 6),
+                                           completed_count=4, job_time_max=400)
+
+    def test_successful(self):
+        """Tests successfully calling the columnar metric plot view."""
+
+        url = rest_util.get_url('/metrics/job-types/plot-columns/?column=completed_count')
+        response = self.client.generic('GET', url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.content)
+
+        result = json.loads(response.content)
+        self.assertEqual(len(result['results']), 1)
+        entry = result['results'][0]
+        self.assertEqual(entry['column']['name'], 'completed_count')
+        self.assertListEqual(entry['dates'], ['2015-01-05', '2015-01-06', '2015-01-12'])
+        self.assertEqual(len(entry['series']), 1)
+        self.assertIsNone(entry['series'][0]['id'])
+        self.assertListEqual(entry['series'][0]['values'], [8, 6, 1])
+        self.assertEqual(entry['min_y'], 1)
+        self.assertEqual(entry['max_y'], 8)
+
+    def test_choices(self):
+        """Tests calling the columnar metric plot view with choice filters."""
+
+        url = rest_util.get_url('/metrics/job-types/plot-columns/?column=completed_count&choice_id=%s&choice_id=%s' %
+                                (self.job_type1.id, self.job_type2.id))
+        response = self.client.generic('GET', url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.content)
+
+        result = json.loads(response.content)
+        series = {entry['id']: entry['values'] for entry in result['results'][0]['series']}
+        self.assertListEqual(series[self.job_type1.id], [8, 2, 1])
+        self.assertListEqual(series[self.job_type2.id], [None, 4, None])
+
+    def test_bucket(self):
+        """Tests calling the columnar metric plot view with weekly buckets."""
+
+        url = rest_util.get_url('/metrics/job-types/plot-columns/?column=completed_count&column=job_time_max'
+                                '&bucket=week')
+        response = self.client.generic('GET', url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.content)
+
+        result = json.loads(response.content)
+        for entry in result['results']:
+            self.assertListEqual(entry['dates'], ['2015-01-05', '2015-01-12'])
+            if entry['column']['name'] == 'completed_count':
+                self.assertListEqual(entry['series'][0]['values'], [14, 1])
+            else:
+                self.assertListEqual(entry['series'][0]['values'], [400, 300])
+
+    def test_max_points(self):
+        """Tests calling the columnar metric plot view with downsampling."""
+
+        url = rest_util.get_url('/metrics/job-types/plot-columns/?column=completed_count&max_points=2')
+        response = self.client.generic('GET', url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.content)
+
+        result = json.loads(response.content)
+        entry = result['results'][0]
+        self.assertListEqual(entry['dates'], ['2015-01-05', '2015-01-12'])
+        self.assertListEqual(entry['series'][0]['values'], [14, 1])
+
+    def test_bucket_average(self):
+        """Tests calling the columnar metric plot view with weekly buckets of an averaged column."""
+
+        metrics_test_utils.create_job_type(job_type=self.job_type1, occurred=datetime.date(2015, 1, 19),
+                                           job_time_avg=100)
+        metrics_test_utils.create_job_type(job_type=self.job_type1, occurred=datetime.date(2015, 1, 20),
+                                           job_time_avg=101)
+
+        url = rest_util.get_url('/metrics/job-types/plot-columns/?column=job_time_avg&bucket=week'
+                                '&started=2015-01-19T00:00:00Z')
+        response = self.client.generic('GET', url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.content)
+
+        result = json.loads(response.content)
+        entry = result['results'][0]
+        self.assertListEqual(entry['dates'], ['2015-01-19'])
+        self.assertListEqual(entry['series'][0]['values'], [100.5])
+
+    def test_bad_bucket(self):
+        """Tests calling the columnar metric plot view with an invalid bucket."""
+
+        url = rest_util.get_url('/metrics/job-types/plot-columns/?bucket=year')
+        response = self.client.generic('GET', url)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, response.content)
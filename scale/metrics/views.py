@@ -1,17 +1,20 @@
 """Defines the views for the RESTful metrics services"""
 from __future__ import unicode_literals
 
+import hashlib
 import logging
 
+from django.conf import settings
+from django.core.cache import cache
 from django.http.response import Http404
-from rest_framework.generics import ListAPIView, RetrieveAPIView
+from rest_framework.generics import GenericAPIView, ListAPIView, RetrieveAPIView
 from rest_framework.response import Response
 
 import metrics.registry as registry
 import util.rest as rest_util
-from metrics.registry import MetricsTypeError
-from metrics.serializers import (MetricsPlotSerializer, MetricsPlotMultiSerializer, MetricsTypeDetailsSerializer,
-                                 MetricsTypeSerializer)
+from metrics.registry import MetricsTypeError, PLOT_BUCKETS
+from metrics.serializers import (MetricsPlotColumnsSerializer, MetricsPlotSerializer, MetricsPlotMultiSerializer,
+                                 MetricsTypeDetailsSerializer, MetricsTypeSerializer)
 
 logger = logging.getLogger(__name__)
 
@@ -98,3 +101,64 @@ class MetricPlotView(ListAPIView):
         else:
             serializer = MetricsPlotSerializer(page, many=True)
         return self.get_paginated_response(serializer.data)
+
+
+class MetricPlotColumnsView(GenericAPIView):
+    """This view is the endpoint for retrieving columnar plot values of metrics."""
+    serializer_class = MetricsPlotColumnsSerializer
+
+    def get(self, request, name):
+        """Retrieves the columnar plot values for metrics and return them in JSON form
+
+        Responses are cached by the metrics type name and query parameters since metrics only change once a day.
+
+        :param request: the HTTP GET request
+        :type request: :class:`rest_framework.request.Request`
+        :param name: the name of the metrics detail to retrieve.
+        :type name: string
+        :rtype: :class:`rest_framework.response.Response`
+        :returns: the HTTP response to send back to the user
+        """
+        started = rest_util.parse_timestamp(request, 'started', required=False)
+        ended = rest_util.parse_timestamp(request, 'ended', required=False)
+        rest_util.check_time_range(started, ended)
+
+        choice_ids = rest_util.parse_string_list(request, 'choice_id', required=False)
+        column_names = rest_util.parse_string_list(request, 'column', required=False)
+        group_names = rest_util.parse_string_list(request, 'group', required=False)
+        bucket = rest_util.parse_string(request, 'bucket', 'day', required=False, accepted_values=PLOT_BUCKETS)
+        max_points = rest_util.parse_int(request, 'max_points', required=False)
+        if max_points is not None and max_points < 1:
+            raise rest_util.BadParameter('Parameter must be a positive integer: "max_points"')
+
+        try:
+            provider = registry.get_provider(name)
+            metrics_type = provider.get_metrics_type(include_choices=False)
+        except MetricsTypeError:
+            raise Http404
+
+        cache_key = self._get_cache_key(name, request)
+        data = cache.get(cache_key)
+        if data is None:
+            # Build a unique set of column names from groups
+            columns = metrics_type.get_column_set(column_names, group_names)
+
+            # Get the actual plot values
+            plot_columns = provider.get_plot_columns(started, ended, choice_ids, columns, bucket, max_points)
+
+            data = {'results': self.get_serializer(plot_columns, many=True).data}
+            cache.set(cache_key, data, settings.METRICS_PLOT_CACHE_TIMEOUT)
+        return Response(data)
+
+    def _get_cache_key(self, name, request):
+        """Builds the cache key for the given metrics type and request query parameters
+
+        :param name: the name of the metrics type.
+        :type name: string
+        :param request: the HTTP GET request
+        :type request: :class:`rest_framework.request.Request`
+        :returns: the key used to cache the response data
+        :rtype: string
+        """
+        params = sorted((key, sorted(values)) for key, values in request.query_params.lists())
+        return 'metrics-plot-columns:%s:%s' % (name, hashlib.md5(repr(params)).hexdigest())
@@ -0,0 +1,80 @@
+"""Defines the command line method for benchmarking the node resource operations used by the scheduler"""
+from __future__ import unicode_literals
+
+import logging
+import random
+import timeit
+
+from django.core.management.base import BaseCommand
+
+from node.resources.node_resources import NodeResources
+from node.resources.resource import Cpus, Disk, Mem
+
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """Command that benchmarks the node resource operations that the scheduler performs many times per scheduling pass,
+    comparing the batch fit checks to the equivalent individual checks
+    """
+
+    help = 'Benchmarks the node resource operations used by the scheduler'
+
+    def add_arguments(self, parser):
+        parser.add_argument('-n', '--number', action='store', type=int, default=100,
+                            help='The number of times each operation is performed')
+        parser.add_argument('--nodes', action='store', type=int, default=1000,
+                            help='The number of node resources to check each request against')
+        parser.add_argument('--requests', action='store', type=int, default=100,
+                            help='The number of requests to check each node resources against')
+
+    def handle(self, *args, **options):
+        """See :meth:`django.core.management.base.BaseCommand.handle`.
+
+        This method runs the benchmark and prints the results.
+        """
+
+        number = options.get('number')
+        rng = random.Random(0)
+
+        nodes = [NodeResources([Cpus(rng.uniform(0.0, 32.0)), Mem(rng.uniform(0.0, 131072.0)),
+                                Disk(rng.uniform(0.0, 1048576.0))]) for _ in xrange(options.get('nodes'))]
+        requests = [NodeResources([Cpus(rng.uniform(0.0, 8.0)), Mem(rng.uniform(0.0, 16384.0)),
+                                   Disk(rng.uniform(0.0, 102400.0))]) for _ in xrange(options.get('requests'))]
+        node = nodes[0]
+        request = requests[0]
+        logger.info('Benchmarking with %i node resources and %i requests %i time(s) each', len(nodes), len(requests),
+                    number)
+
+        def add_and_subtract():
+            resources = node.copy()
+            for req in requests:
+                resources.add(req)
+                resources.subtract(req)
+
+        self._report('Copy', number, lambda: [n.copy() for n in nodes])
+        self._report('Add and subtract', number, add_and_subtract)
+        self._report('Increase up to', number, lambda: [node.copy().increase_up_to(n) for n in nodes])
+        self._report('One request, many nodes (individual)', number,
+                     lambda: [n.is_sufficient_to_meet(request) for n in nodes])
+        self._report('One request, many nodes (batch)', number, lambda: request.is_met_by_each(nodes))
+        self._report('One node, many requests (individual)', number,
+                     lambda: len([req for req in requests if node.is_sufficient_to_meet(req)]))
+        self._report('One node, many requests (batch)', number, lambda: node.count_requests_met(requests))
+        self._report('Status JSON', number, lambda: [n.generate_status_json({}, 'total') for n in nodes])
+
+    def _report(self, name, number, func):
+        """Times the given function and prints the result
+
+        :param name: The name of the benchmark
+        :type name: string
+        :param number: The number of times to call the function
+        :type number: int
+        :param func: The function to time
+        :type func: function
+        """
+
+        seconds = timeit.timeit(func, number=number)
+        self.stdout.write('%-45s %10.3f ms total %10.3f ms per pass' % (name, seconds * 1000.0,
+                                                                        seconds * 1000.0 / number))
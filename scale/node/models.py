@@ -4,6 +4,7 @@ from __future__ import unicode_literals
 import logging
 
 from django.db import models, transaction
+from django.db.models import Count, Max
 from django.utils.timezone import now
 
 logger = logging.getLogger(__name__)
@@ -196,13 +197,14 @@ class NodeManager(models.Manager):
         except:
             return [NodeStatus(node) for node in nodes]
 
-        # Fetch a list of recent job executions
-        job_exes = JobExecution.objects.select_related('error')
-        job_exes = job_exes.filter(last_modified__gte=started)
+        node_ids = [node.id for node in nodes]
+
+        # Count the recent job executions of each node by status and error category in the database
+        job_exes = JobExecution.objects.filter(last_modified__gte=started, node_id__in=node_ids)
         if ended:
             job_exes = job_exes.filter(last_modified__lte=ended)
-            
-        job_exes = job_exes.values('node_id', 'last_modified', 'status', 'error__category')
+        job_exes = job_exes.values('node_id', 'status', 'error__category').order_by()
+        job_exes = job_exes.annotate(status_count=Count('id'), status_most_recent=Max('last_modified'))
 
         # Build a mapping of node_id -> (status + error category) -> associated counts
         job_exes_dict = {}
@@ -213,24 +215,15 @@ class NodeManager(models.Manager):
                 job_exes_dict[job_exe['node_id']] = {}
             job_exe_dict = job_exes_dict[job_exe['node_id']]
 
-            # Make sure the counts mapping entry exists
             status_key = '%s.%s' % (job_exe['status'], job_exe['error__category'])
-            if status_key not in job_exe_dict:
-                job_exe_dict[status_key] = NodeStatusCounts(job_exe['status'])
-
-            # Update the count based on the status
-            status_counts = job_exe_dict[status_key]
-            status_counts.count += 1
-            if not status_counts.most_recent or job_exe['last_modified'] > status_counts.most_recent:
-                status_counts.most_recent = job_exe['last_modified']
-            if job_exe['error__category']:
-                status_counts.category = job_exe['error__category']
+            job_exe_dict[status_key] = NodeStatusCounts(job_exe['status'], job_exe['status_count'],
+                                                        job_exe['status_most_recent'], job_exe['error__category'])
 
         # Build a mapping of node_id -> running job executions
         running_dict = {}
-        running_exes = JobExecution.objects.filter(status='RUNNING').order_by('last_modified')
-        running_exes = running_exes.select_related('job').defer('stdout', 'stderr')
-        for job_exe in running_exes:
+        running_exes = JobExecution.objects.filter(status='RUNNING', node_id__in=node_ids).order_by('last_modified')
+        running_exes = running_exes.select_related('job__job_type', 'error').defer('stdout', 'stderr')
+        for job_exe in running_exes.iterator():
             if job_exe.node_id not in running_dict:
                 running_dict[job_exe.node_id] = []
             running_dict[job_exe.node_id].append(job_exe)
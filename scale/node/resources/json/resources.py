@@ -3,12 +3,12 @@ from __future__ import unicode_literals
 
 import logging
 
-from jsonschema import validate
 from jsonschema.exceptions import ValidationError
 
 from node.resources.exceptions import InvalidResources
 from node.resources.node_resources import NodeResources
 from node.resources.resource import ScalarResource
+from util.validation import validate
 
 logger = logging.getLogger(__name__)
 
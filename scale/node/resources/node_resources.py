@@ -3,13 +3,21 @@ from __future__ import unicode_literals
 
 from util.exceptions import ScaleLogicBug
 
-from node.resources.resource import Cpus, Disk, Mem
+from node.resources.resource import Cpus, Disk, Mem, ScalarResource
+
+
+# The names of the standard resources that every set of node resources has
+STANDARD_RESOURCES = ('cpus', 'mem', 'disk')
 
 
 class NodeResources(object):
-    """This class encapsulates a set of node resources
+    """This class encapsulates a set of node resources. The standard resources (CPUs, memory, and disk) are stored in
+    fixed slots and any custom resources are stored in an overflow dict, so the arithmetic and comparison methods that
+    the scheduler calls many times per scheduling pass do not create any resource objects.
     """
 
+    __slots__ = ('_cpus', '_mem', '_disk', '_custom')
+
     def __init__(self, resources=None):
         """Constructor
 
@@ -17,20 +25,15 @@ class NodeResources(object):
         :type resources: list
         """
 
-        self._resources = {}  # {Name: Resource}
+        self._cpus = 0.0
+        self._mem = 0.0
+        self._disk = 0.0
+        self._custom = {}  # {Name: float}
         if resources:
             for resource in resources:
                 if resource.resource_type != 'SCALAR':
                     raise ScaleLogicBug('Resource type "%s" is not currently supported', resource.resource_type)
-                self._resources[resource.name] = resource
-
-        # Make sure standard resources are defined
-        if 'cpus' not in self._resources:
-            self._resources['cpus'] = Cpus(0.0)
-        if 'mem' not in self._resources:
-            self._resources['mem'] = Mem(0.0)
-        if 'disk' not in self._resources:
-            self._resources['disk'] = Disk(0.0)
+                self._set_value(resource.name, resource.value)
 
     def __str__(self):
         """Converts the resource to a readable logging string
@@ -39,7 +42,7 @@ class NodeResources(object):
         :rtype: string
         """
 
-        logging_str = ', '.join(['%.2f %s' % (resource.value, resource.name) for resource in self._resources.values()])
+        logging_str = ', '.join(['%.2f %s' % (resource.value, resource.name) for resource in self.resources])
         return '[%s]' % logging_str
 
     @property
@@ -50,7 +53,7 @@ class NodeResources(object):
         :rtype: float
         """
 
-        return self._resources['cpus'].value
+        return self._cpus
 
     @property
     def disk(self):
@@ -60,7 +63,7 @@ class NodeResources(object):
         :rtype: float
         """
 
-        return self._resources['disk'].value
+        return self._disk
 
     @property
     def mem(self):
@@ -70,17 +73,20 @@ class NodeResources(object):
         :rtype: float
         """
 
-        return self._resources['mem'].value
+        return self._mem
 
     @property
     def resources(self):
-        """The list of resources
+        """The list of resources. The returned resources are copies, editing them will not affect these resources.
 
         :returns: The list of resources
         :rtype: list
         """
 
-        return self._resources.values()
+        resources = [Cpus(self._cpus), Mem(self._mem), Disk(self._disk)]
+        for name, value in self._custom.items():
+            resources.append(ScalarResource(name, value))
+        return resources
 
     def add(self, node_resources):
         """Adds the given resources
@@ -89,11 +95,13 @@ class NodeResources(object):
         :type node_resources: :class:`node.resources.NodeResources`
         """
 
-        for resource in node_resources.resources:
-            if resource.name in self._resources:
-                self._resources[resource.name].value += resource.value  # Assumes SCALAR type
-            else:
-                self._resources[resource.name] = resource.copy()
+        self._cpus += node_resources._cpus
+        self._mem += node_resources._mem
+        self._disk += node_resources._disk
+        if node_resources._custom:
+            custom = self._custom
+            for name, value in node_resources._custom.items():
+                custom[name] = custom.get(name, 0.0) + value
 
     def copy(self):
         """Returns a deep copy of these resources. Editing one of the resources objects will not affect the other.
@@ -103,9 +111,33 @@ class NodeResources(object):
         """
 
         resources_copy = NodeResources()
-        resources_copy.add(self)
+        resources_copy._cpus = self._cpus
+        resources_copy._mem = self._mem
+        resources_copy._disk = self._disk
+        if self._custom:
+            resources_copy._custom = dict(self._custom)
         return resources_copy
 
+    def count_requests_met(self, requests):
+        """Returns the number of the given requested resources that these resources are sufficient to meet. This is
+        equivalent to calling is_sufficient_to_meet() for each request, but checks all of the requests in a single pass.
+
+        :param requests: The list of requested resources
+        :type requests: [:class:`node.resources.NodeResources`]
+        :returns: The number of requests that these resources are sufficient to meet
+        :rtype: int
+        """
+
+        cpus = self._cpus
+        mem = self._mem
+        disk = self._disk
+        count = 0
+        for request in requests:
+            if request._cpus <= cpus and request._mem <= mem and request._disk <= disk:
+                if not request._custom or self._is_custom_sufficient(request._custom):
+                    count += 1
+        return count
+
     def generate_status_json(self, resources_dict, key_name):
         """Generates the portion of the status JSON that describes these resources
 
@@ -115,15 +147,14 @@ class NodeResources(object):
         :type key_name: string
         """
 
-        for resource in self._resources.values():
-            if resource.name in resources_dict:
-                resource_dict = resources_dict[resource.name]
+        for name, value in self._items():
+            if name in resources_dict:
+                resource_dict = resources_dict[name]
             else:
                 resource_dict = {}
-                resources_dict[resource.name] = resource_dict
+                resources_dict[name] = resource_dict
 
-            # Assumes SCALAR type
-            resource_dict[key_name] = resource.value
+            resource_dict[key_name] = value
 
     def get_json(self):
         """Returns these resources as a JSON schema
@@ -133,10 +164,7 @@ class NodeResources(object):
         """
 
         from node.resources.json.resources import Resources
-        resources_dict = {}
-        for resource in self._resources.values():
-            resources_dict[resource.name] = resource.value  # Assumes SCALAR type
-        return Resources({'resources': resources_dict})
+        return Resources({'resources': dict(self._items())})
 
     def increase_up_to(self, node_resources):
         """Increases each resource up to the value in the given node resources
@@ -145,12 +173,17 @@ class NodeResources(object):
         :type node_resources: :class:`node.resources.NodeResources`
         """
 
-        for resource in node_resources.resources:
-            if resource.name in self._resources:
-                if self._resources[resource.name].value < resource.value:  # Assumes SCALAR type
-                    self._resources[resource.name].value = resource.value
-            else:
-                self._resources[resource.name] = resource.copy()
+        if self._cpus < node_resources._cpus:
+            self._cpus = node_resources._cpus
+        if self._mem < node_resources._mem:
+            self._mem = node_resources._mem
+        if self._disk < node_resources._disk:
+            self._disk = node_resources._disk
+        if node_resources._custom:
+            custom = self._custom
+            for name, value in node_resources._custom.items():
+                if name not in custom or custom[name] < value:
+                    custom[name] = value
 
     def is_equal(self, node_resources):
         """Indicates if these resources are equal. This should be used for testing only.
@@ -162,18 +195,35 @@ class NodeResources(object):
         """
 
         # Make sure they have the exact same set of resource names
-        names = set()
-        for resource in node_resources.resources:
-            names.add(resource.name)
-        if set(self._resources.keys()) != names:
+        if set(self._custom.keys()) != set(node_resources._custom.keys()):
             return False
 
-        for resource in node_resources.resources:
-            if round(self._resources[resource.name].value, 5) != round(resource.value, 5):  # Assumes SCALAR type
+        for name, value in node_resources._items():
+            if round(self._get_value(name), 5) != round(value, 5):
                 return False
 
         return True
 
+    def is_met_by_each(self, node_resources_list):
+        """Indicates, for each of the given resources, whether it is sufficient to meet these requested resources. This
+        is equivalent to calling is_sufficient_to_meet() on each of the given resources, but checks one request against
+        all of them in a single pass.
+
+        :param node_resources_list: The list of resources to check, such as the remaining resources of many nodes
+        :type node_resources_list: [:class:`node.resources.NodeResources`]
+        :returns: A list with a boolean for each of the given resources, True if it is sufficient to meet these
+            requested resources
+        :rtype: [bool]
+        """
+
+        cpus = self._cpus
+        mem = self._mem
+        disk = self._disk
+        if self._custom:
+            return [r._cpus >= cpus and r._mem >= mem and r._disk >= disk and r._is_custom_sufficient(self._custom)
+                    for r in node_resources_list]
+        return [r._cpus >= cpus and r._mem >= mem and r._disk >= disk for r in node_resources_list]
+
     def is_sufficient_to_meet(self, node_resources):
         """Indicates if these resources are sufficient to meet the requested resources
 
@@ -183,16 +233,9 @@ class NodeResources(object):
         :rtype: bool
         """
 
-        for resource in node_resources.resources:
-            if resource.name in self._resources:
-                if self._resources[resource.name].value < resource.value:  # Assumes SCALAR type
-                    return False
-            else:
-                # Do not have this resource, not a problem if requesting 0.0
-                if resource.value > 0.0:
-                    return False
-
-        return True
+        if self._cpus < node_resources._cpus or self._mem < node_resources._mem or self._disk < node_resources._disk:
+            return False
+        return not node_resources._custom or self._is_custom_sufficient(node_resources._custom)
 
     def limit_to(self, node_resources):
         """Limits each resource, subtracting any amount that goes over the amount in the given node resources
@@ -201,12 +244,19 @@ class NodeResources(object):
         :type node_resources: :class:`node.resources.NodeResources`
         """
 
-        for resource in self._resources.values():
-            if resource.name in node_resources._resources:
-                if resource.value > node_resources._resources[resource.name].value:  # Assumes SCALAR type
-                    resource.value = node_resources._resources[resource.name].value
-            else:
-                self.remove_resource(resource.name)
+        if self._cpus > node_resources._cpus:
+            self._cpus = node_resources._cpus
+        if self._mem > node_resources._mem:
+            self._mem = node_resources._mem
+        if self._disk > node_resources._disk:
+            self._disk = node_resources._disk
+        if self._custom:
+            for name in self._custom.keys():
+                if name in node_resources._custom:
+                    if self._custom[name] > node_resources._custom[name]:
+                        self._custom[name] = node_resources._custom[name]
+                else:
+                    del self._custom[name]
 
     def remove_resource(self, name):
         """Removes the resource with the given name
@@ -215,18 +265,20 @@ class NodeResources(object):
         :type name: string
         """
 
-        if name in self._resources:
-            if name in ['cpus', 'mem', 'disk']:
-                self._resources[name].value = 0.0
-            else:
-                del self._resources[name]
+        if name in STANDARD_RESOURCES:
+            self._set_value(name, 0.0)
+        elif name in self._custom:
+            del self._custom[name]
 
     def round_values(self):
         """Rounds all of the resource values
         """
 
-        for resource in self._resources.values():
-            resource.value = round(resource.value, 2)  # Assumes SCALAR type
+        self._cpus = round(self._cpus, 2)
+        self._mem = round(self._mem, 2)
+        self._disk = round(self._disk, 2)
+        for name, value in self._custom.items():
+            self._custom[name] = round(value, 2)
 
     def subtract(self, node_resources):
         """Subtracts the given resources
@@ -235,6 +287,77 @@ class NodeResources(object):
         :type node_resources: :class:`node.resources.NodeResources`
         """
 
-        for resource in node_resources.resources:
-            if resource.name in self._resources:
-                self._resources[resource.name].value -= resource.value  # Assumes SCALAR type
+        self._cpus -= node_resources._cpus
+        self._mem -= node_resources._mem
+        self._disk -= node_resources._disk
+        if node_resources._custom and self._custom:
+            custom = self._custom
+            for name, value in node_resources._custom.items():
+                if name in custom:
+                    custom[name] -= value
+
+    def _get_value(self, name):
+        """Returns the value of the resource with the given name, 0.0 if the resource is not defined
+
+        :param name: The name of the resource
+        :type name: string
+        :returns: The value of the resource
+        :rtype: float
+        """
+
+        if name == 'cpus':
+            return self._cpus
+        elif name == 'mem':
+            return self._mem
+        elif name == 'disk':
+            return self._disk
+        return self._custom.get(name, 0.0)
+
+    def _is_custom_sufficient(self, requested_custom):
+        """Indicates if the custom resources of these resources are sufficient to meet the given requested custom
+        resources
+
+        :param requested_custom: The requested custom resources
+        :type requested_custom: {string: float}
+        :returns: True if the custom resources are sufficient for the request, False otherwise
+        :rtype: bool
+        """
+
+        custom = self._custom
+        for name, value in requested_custom.items():
+            if name in custom:
+                if custom[name] < value:
+                    return False
+            elif value > 0.0:
+                # Do not have this resource, not a problem if requesting 0.0
+                return False
+        return True
+
+    def _items(self):
+        """Returns the name and value of each resource
+
+        :returns: The list of resource names and values
+        :rtype: [(string, float)]
+        """
+
+        items = [('cpus', self._cpus), ('mem', self._mem), ('disk', self._disk)]
+        items.extend(self._custom.items())
+        return items
+
+    def _set_value(self, name, value):
+        """Sets the value of the resource with the given name
+
+        :param name: The name of the resource
+        :type name: string
+        :param value: The value of the resource
+        :type value: float
+        """
+
+        if name == 'cpus':
+            self._cpus = value
+        elif name == 'mem':
+            self._mem = value
+        elif name == 'disk':
+            self._disk = value
+        else:
+            self._custom[name] = value
@@ -0,0 +1,98 @@
+from __future__ import unicode_literals
+
+import django
+from django.test import TestCase
+
+from node.resources.node_resources import NodeResources
+from node.resources.resource import Cpus, Disk, Mem, ScalarResource
+
+
+class TestNodeResources(TestCase):
+
+    def setUp(self):
+        django.setup()
+
+    def test_add_and_subtract(self):
+        """Tests adding and subtracting resources, including custom resources"""
+
+        resources = NodeResources([Cpus(10.0), Mem(1024.0), ScalarResource('gpus', 2.0)])
+        resources.add(NodeResources([Cpus(1.0), Disk(100.0), ScalarResource('foo', 3.0)]))
+        expected = NodeResources([Cpus(11.0), Mem(1024.0), Disk(100.0), ScalarResource('gpus', 2.0),
+                                  ScalarResource('foo', 3.0)])
+        self.assertTrue(resources.is_equal(expected))
+
+        # Subtracting a resource that is not defined is ignored
+        resources.subtract(NodeResources([Cpus(2.0), ScalarResource('gpus', 1.0), ScalarResource('bar', 1.0)]))
+        expected = NodeResources([Cpus(9.0), Mem(1024.0), Disk(100.0), ScalarResource('gpus', 1.0),
+                                  ScalarResource('foo', 3.0)])
+        self.assertTrue(resources.is_equal(expected))
+
+    def test_copy(self):
+        """Tests that editing a copy does not affect the original resources"""
+
+        resources = NodeResources([Cpus(10.0), ScalarResource('gpus', 2.0)])
+        resources_copy = resources.copy()
+        resources_copy.subtract(NodeResources([Cpus(1.0), ScalarResource('gpus', 1.0)]))
+
+        self.assertTrue(resources.is_equal(NodeResources([Cpus(10.0), ScalarResource('gpus', 2.0)])))
+        self.assertTrue(resources_copy.is_equal(NodeResources([Cpus(9.0), ScalarResource('gpus', 1.0)])))
+
+    def test_increase_up_to_and_limit_to(self):
+        """Tests increasing and limiting resources"""
+
+        resources = NodeResources([Cpus(10.0), Mem(50.0), ScalarResource('gpus', 2.0)])
+        resources.increase_up_to(NodeResources([Cpus(5.0), Mem(100.0), ScalarResource('foo', 1.0)]))
+        expected = NodeResources([Cpus(10.0), Mem(100.0), ScalarResource('gpus', 2.0), ScalarResource('foo', 1.0)])
+        self.assertTrue(resources.is_equal(expected))
+
+        # Custom resources that are not in the limit are removed
+        resources.limit_to(NodeResources([Cpus(8.0), Mem(200.0), ScalarResource('foo', 0.5)]))
+        expected = NodeResources([Cpus(8.0), Mem(100.0), ScalarResource('foo', 0.5)])
+        self.assertTrue(resources.is_equal(expected))
+
+    def test_is_sufficient_to_meet(self):
+        """Tests checking whether resources are sufficient to meet a request"""
+
+        resources = NodeResources([Cpus(10.0), Mem(1024.0), ScalarResource('gpus', 1.0)])
+
+        self.assertTrue(resources.is_sufficient_to_meet(NodeResources([Cpus(10.0), Mem(512.0)])))
+        self.assertFalse(resources.is_sufficient_to_meet(NodeResources([Cpus(10.1)])))
+        self.assertTrue(resources.is_sufficient_to_meet(NodeResources([ScalarResource('gpus', 1.0)])))
+        self.assertFalse(resources.is_sufficient_to_meet(NodeResources([ScalarResource('gpus', 2.0)])))
+        # Requesting 0.0 of a resource that is not defined is not a problem
+        self.assertTrue(resources.is_sufficient_to_meet(NodeResources([ScalarResource('foo', 0.0)])))
+        self.assertFalse(resources.is_sufficient_to_meet(NodeResources([ScalarResource('foo', 1.0)])))
+
+    def test_count_requests_met(self):
+        """Tests counting the requests that resources are sufficient to meet"""
+
+        resources = NodeResources([Cpus(4.0), Mem(1024.0), ScalarResource('gpus', 1.0)])
+        requests = [NodeResources([Cpus(1.0), Mem(512.0)]), NodeResources([Cpus(8.0)]),
+                    NodeResources([Cpus(1.0), ScalarResource('gpus', 1.0)]), NodeResources([ScalarResource('foo', 1.0)])]
+
+        self.assertEqual(resources.count_requests_met(requests), 2)
+        self.assertEqual(resources.count_requests_met([]), 0)
+
+    def test_is_met_by_each(self):
+        """Tests checking one request against many resources at once"""
+
+        node_resources_list = [NodeResources([Cpus(4.0), Mem(1024.0)]), NodeResources([Cpus(1.0), Mem(1024.0)]),
+                               NodeResources([Cpus(4.0), Mem(1024.0), ScalarResource('gpus', 1.0)])]
+
+        request = NodeResources([Cpus(2.0), Mem(512.0)])
+        self.assertListEqual(request.is_met_by_each(node_resources_list), [True, False, True])
+
+        request = NodeResources([Cpus(2.0), ScalarResource('gpus', 1.0)])
+        self.assertListEqual(request.is_met_by_each(node_resources_list), [False, False, True])
+
+    def test_json(self):
+        """Tests converting resources to and from JSON"""
+
+        resources = NodeResources([Cpus(1.0), Mem(2.0), ScalarResource('gpus', 3.0)])
+        resources_dict = resources.get_json().get_dict()
+        self.assertDictEqual(resources_dict['resources'], {'cpus': 1.0, 'mem': 2.0, 'disk': 0.0, 'gpus': 3.0})
+
+        status_dict = {}
+        resources.generate_status_json(status_dict, 'total')
+        self.assertDictEqual(status_dict['gpus'], {'total': 3.0})
+        self.assertTrue(resources.get_json().get_node_resources().is_equal(resources))
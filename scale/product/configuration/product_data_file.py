@@ -11,7 +11,7 @@ from job.configuration.data.data_file import AbstractDataFileStore
 from job.execution.container import SCALE_JOB_EXE_OUTPUT_PATH
 from product.models import FileAncestryLink, ProductFile
 from recipe.models import Recipe
-from storage.models import Workspace
+from storage.models import ScaleFile, Workspace
 
 
 class ProductDataFileStore(AbstractDataFileStore):
@@ -19,6 +19,22 @@ class ProductDataFileStore(AbstractDataFileStore):
     product data files.
     """
 
+    def commit_staged_files(self, staged_files, input_file_ids, job_exe):
+        """See :meth:`job.configuration.data.data_file.AbstractDataFileStore.commit_staged_files`
+        """
+
+        results = {}
+        product_files = []
+        for full_local_path, product_file in staged_files:
+            product_files.append(product_file)
+        ScaleFile.objects.save_files(product_files)
+        for full_local_path, product_file in staged_files:
+            results[full_local_path] = product_file.id
+
+        FileAncestryLink.objects.create_file_ancestry_links(input_file_ids, set(results.values()), job_exe)
+
+        return results
+
     def get_workspaces(self, workspace_ids):
         """See :meth:`job.configuration.data.data_file.AbstractDataFileStore.get_workspaces`
         """
@@ -31,46 +47,55 @@ class ProductDataFileStore(AbstractDataFileStore):
 
         return results
 
-    def store_files(self, data_files, input_file_ids, job_exe):
-        """See :meth:`job.configuration.data.data_file.AbstractDataFileStore.store_files`
+    def stage_files(self, data_files, input_file_ids, job_exe):
+        """See :meth:`job.configuration.data.data_file.AbstractDataFileStore.stage_files`
+
+        The product files are transferred to their workspaces and a list of tuples of each full local path and its
+        unsaved product model is returned.
         """
 
         workspace_ids = data_files.keys()
         workspaces = Workspace.objects.filter(id__in=workspace_ids)
-        results = {}
+        staged_files = []
         remote_path = self._calculate_remote_path(job_exe, input_file_ids)
 
-        with transaction.atomic():
-            for workspace in workspaces:
-                file_list = data_files[workspace.id]
-                files_to_store = []
-                for file_tuple in file_list:
-                    local_path = file_tuple[0]
-                    media_type = file_tuple[1]
-                    output_name = file_tuple[2]
-                    if local_path.startswith(SCALE_JOB_EXE_OUTPUT_PATH):
-                        rel_local_path = os.path.relpath(local_path, SCALE_JOB_EXE_OUTPUT_PATH)
-                    else:
-                        rel_local_path = os.path.basename(local_path)
-                    remote_file_path = os.path.join(remote_path, rel_local_path)
-
-                    # Pass along geospatial information if available
-                    if len(file_tuple) > 3:
-                        file_to_store = (local_path, remote_file_path, media_type, output_name, file_tuple[3])
-                    else:
-                        file_to_store = (local_path, remote_file_path, media_type, output_name)
-                    files_to_store.append(file_to_store)
-
-                product_files = ProductFile.objects.upload_files(files_to_store, input_file_ids, job_exe, workspace)
-
-                for i in range(len(product_files)):
-                    full_local_path = file_list[i][0]
-                    product_file = product_files[i]
-                    results[full_local_path] = product_file.id
-
-            FileAncestryLink.objects.create_file_ancestry_links(input_file_ids, set(results.values()), job_exe)
+        for workspace in workspaces:
+            file_list = data_files[workspace.id]
+            files_to_store = []
+            for file_tuple in file_list:
+                local_path = file_tuple[0]
+                media_type = file_tuple[1]
+                output_name = file_tuple[2]
+                if local_path.startswith(SCALE_JOB_EXE_OUTPUT_PATH):
+                    rel_local_path = os.path.relpath(local_path, SCALE_JOB_EXE_OUTPUT_PATH)
+                else:
+                    rel_local_path = os.path.basename(local_path)
+                remote_file_path = os.path.join(remote_path, rel_local_path)
+
+                # Pass along geospatial information if available
+                if len(file_tuple) > 3:
+                    file_to_store = (local_path, remote_file_path, media_type, output_name, file_tuple[3])
+                else:
+                    file_to_store = (local_path, remote_file_path, media_type, output_name)
+                files_to_store.append(file_to_store)
+
+            product_files = ProductFile.objects.transfer_files(files_to_store, input_file_ids, job_exe, workspace)
+
+            for i in range(len(product_files)):
+                staged_files.append((file_list[i][0], product_files[i]))
+
+        return staged_files
 
-        return results
+    def store_files(self, data_files, input_file_ids, job_exe):
+        """See :meth:`job.configuration.data.data_file.AbstractDataFileStore.store_files`
+
+        The files are transferred before the transaction that saves the product models is started so that the
+        transaction is short.
+        """
+
+        staged_files = self.stage_files(data_files, input_file_ids, job_exe)
+        with transaction.atomic():
+            return self.commit_staged_files(staged_files, input_file_ids, job_exe)
 
     def _calculate_remote_path(self, job_exe, input_file_ids):
         """Returns the remote path for storing the products
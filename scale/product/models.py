@@ -193,7 +193,8 @@ class ProductFileManager(models.GeoManager):
     def filter_products(self, started=None, ended=None, time_field=None, job_type_ids=None, job_type_names=None,
                         job_type_categories=None, job_ids=None, is_operational=None, is_published=None, 
                         is_superseded=None, file_name=None, job_output=None, recipe_ids=None, recipe_type_ids=None, 
-                        recipe_job=None, batch_ids=None, order=None):
+                        recipe_job=None, batch_ids=None, geometry=None, countries=None, data_started=None,
+                        data_ended=None, order=None):
         """Returns a query for product models that filters on the given fields. The returned query includes the related
         workspace, job_type, and job fields, except for the workspace.json_config field. The related countries are set
         to be pre-fetched as part of the query.
@@ -230,6 +231,14 @@ class ProductFileManager(models.GeoManager):
         :type recipe_type_ids: list[int]
         :keyword batch_ids: Query product files produced by batches with the given identifiers.
         :type batch_ids: list[int]
+        :param geometry: Query product files whose geometry intersects this geometry.
+        :type geometry: :class:`django.contrib.gis.geos.GEOSGeometry`
+        :param countries: Query product files within any of the countries with these ISO 3166 alpha-2 or alpha-3 codes.
+        :type countries: list[str]
+        :param data_started: Query product files whose data ends at or after this time.
+        :type data_started: :class:`datetime.datetime`
+        :param data_ended: Query product files whose data starts at or before this time.
+        :type data_ended: :class:`datetime.datetime`
         :param order: A list of fields to control the sort order.
         :type order: list[str]
         :returns: The product file query
@@ -289,6 +298,8 @@ class ProductFileManager(models.GeoManager):
             products = products.filter(recipe_type__in=recipe_type_ids)
         if batch_ids:
             products = products.filter(batch_id__in=batch_ids)
+        products = ScaleFile.objects.filter_coverage(products, geometry=geometry, countries=countries,
+                                                     data_started=data_started, data_ended=data_ended)
 
         # Apply sorting
         if order:
@@ -301,7 +312,7 @@ class ProductFileManager(models.GeoManager):
     def get_products(self, started=None, ended=None, time_field=None, job_type_ids=None, job_type_names=None,
                      job_type_categories=None, job_ids=None, is_operational=None, is_published=None, 
                      file_name=None, job_output=None, recipe_ids=None, recipe_type_ids=None, recipe_job=None, 
-                     batch_ids=None, order=None):
+                     batch_ids=None, geometry=None, countries=None, data_started=None, data_ended=None, order=None):
         """Returns a list of product files within the given time range.
 
         :param started: Query product files updated after this amount of time.
@@ -334,6 +345,14 @@ class ProductFileManager(models.GeoManager):
         :type recipe_type_ids: list[int]
         :keyword batch_ids: Query product files produced by batches with the given identifiers.
         :type batch_ids: list[int]
+        :param geometry: Query product files whose geometry intersects this geometry.
+        :type geometry: :class:`django.contrib.gis.geos.GEOSGeometry`
+        :param countries: Query product files within any of the countries with these ISO 3166 alpha-2 or alpha-3 codes.
+        :type countries: list[str]
+        :param data_started: Query product files whose data ends at or after this time.
+        :type data_started: :class:`datetime.datetime`
+        :param data_ended: Query product files whose data starts at or before this time.
+        :type data_ended: :class:`datetime.datetime`
         :param order: A list of fields to control the sort order.
         :type order: list[str]
         :returns: The list of product files that match the time range.
@@ -345,7 +364,8 @@ class ProductFileManager(models.GeoManager):
                                     job_ids=None, is_operational=is_operational, is_published=is_published, 
                                     is_superseded=False, file_name=file_name, job_output=job_output, 
                                     recipe_ids=recipe_ids, recipe_type_ids=recipe_type_ids, recipe_job=recipe_job, 
-                                    batch_ids=batch_ids, order=order)
+                                    batch_ids=batch_ids, geometry=geometry, countries=countries,
+                                    data_started=data_started, data_ended=data_ended, order=order)
 
     def get_product_sources(self, product_file_id, started=None, ended=None, time_field=None, is_parsed=None, 
                             file_name=None, order=None):
@@ -498,6 +518,26 @@ class ProductFileManager(models.GeoManager):
         query = self.filter(job_id=root_job_id, is_published=True)
         query.update(is_published=False, unpublished=when, last_modified=last_modified)
 
+    def transfer_files(self, file_entries, input_file_ids, job_exe, workspace):
+        """Transfers the given local product files into the workspace without saving the product models. This is the
+        first phase of a staged upload, see :meth:`storage.models.ScaleFileManager.transfer_files`.
+
+        :param file_entries: List of files where each file is a tuple of (absolute local path, workspace path for
+            storing the file, media_type, output_name)
+        :type file_entries: list of tuple(str, str, str, str)
+        :param input_file_ids: List of identifiers for files used to produce the given file entries
+        :type input_file_ids: list of int
+        :param job_exe: The job_exe model with the related job and job_type fields
+        :type job_exe: :class:`job.models.JobExecution`
+        :param workspace: The workspace to use for storing the product files
+        :type workspace: :class:`storage.models.Workspace`
+        :returns: The list of the transferred (unsaved) product models
+        :rtype: list of :class:`storage.models.ScaleFile`
+        """
+
+        products_to_save = self._create_product_uploads(file_entries, input_file_ids, job_exe)
+        return ScaleFile.objects.transfer_files(workspace, products_to_save)
+
     def upload_files(self, file_entries, input_file_ids, job_exe, workspace):
         """Uploads the given local product files into the workspace.
 
@@ -514,6 +554,23 @@ class ProductFileManager(models.GeoManager):
         :rtype: list of :class:`storage.models.ScaleFile`
         """
 
+        products_to_save = self._create_product_uploads(file_entries, input_file_ids, job_exe)
+        return ScaleFile.objects.upload_files(workspace, products_to_save)
+
+    def _create_product_uploads(self, file_entries, input_file_ids, job_exe):
+        """Creates the (unsaved) product models for the given local product files
+
+        :param file_entries: List of files where each file is a tuple of (absolute local path, workspace path for
+            storing the file, media_type, output_name)
+        :type file_entries: list of tuple(str, str, str, str)
+        :param input_file_ids: List of identifiers for files used to produce the given file entries
+        :type input_file_ids: list of int
+        :param job_exe: The job_exe model with the related job and job_type fields
+        :type job_exe: :class:`job.models.JobExecution`
+        :returns: The list of product files to upload
+        :rtype: [:class:`storage.brokers.broker.FileUpload`]
+        """
+
         # Build a list of UUIDs for the input files
         input_files = ScaleFile.objects.filter(pk__in=input_file_ids).values('uuid', 'id').order_by('uuid')
         input_file_uuids = [f['uuid'] for f in input_files]
@@ -602,7 +659,7 @@ class ProductFileManager(models.GeoManager):
 
             products_to_save.append(FileUpload(product, local_path))
 
-        return ScaleFile.objects.upload_files(workspace, products_to_save)
+        return products_to_save
 
 
 class ProductFile(ScaleFile):
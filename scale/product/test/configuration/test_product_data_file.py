@@ -53,9 +53,10 @@ class TestProductDataFileStoreStoreFiles(TransactionTestCase):
         self.remote_base_path = os.path.join('jobs', get_valid_filename(self.job.job_type.name),
                                              get_valid_filename(self.job.job_type.version))
 
+    @patch('product.configuration.product_data_file.ScaleFile.objects.save_files')
     @patch('product.models.FileAncestryLink.objects.create_file_ancestry_links')
-    @patch('product.models.ProductFile.objects.upload_files')
-    def test_successful(self, mock_upload_files, mock_create_file_ancestry_links):
+    @patch('product.models.ProductFile.objects.transfer_files')
+    def test_successful(self, mock_transfer_files, mock_create_file_ancestry_links, mock_save_files):
         """Tests calling ProductDataFileType.store_files() successfully"""
 
         local_path_1 = os.path.join('my', 'path', 'one', 'my_test.txt')
@@ -72,7 +73,7 @@ class TestProductDataFileStoreStoreFiles(TransactionTestCase):
         job_output_4 = 'mock_output_4'
 
         # Set up mocks
-        def new_upload_files(file_entries, input_file_ids, job_exe, workspace):
+        def new_transfer_files(file_entries, input_file_ids, job_exe, workspace):
             results = []
             for file_entry in file_entries:
                 # Check base remote path for job type name and version
@@ -94,7 +95,7 @@ class TestProductDataFileStoreStoreFiles(TransactionTestCase):
                     mock_4.id = 4
                     results.append(mock_4)
             return results
-        mock_upload_files.side_effect = new_upload_files
+        mock_transfer_files.side_effect = new_transfer_files
 
         data_files = {self.workspace_1.id: [(local_path_1, media_type_1, job_output_1), (local_path_2, media_type_2, job_output_2)],
                       self.workspace_2.id: [(local_path_3, media_type_3, job_output_3), (local_path_4, media_type_4, job_output_4)]}
@@ -106,10 +107,14 @@ class TestProductDataFileStoreStoreFiles(TransactionTestCase):
         self.assertDictEqual(results, {local_path_1: long(1), local_path_2: long(2), local_path_3: long(3),
                                        local_path_4: long(4)})
         mock_create_file_ancestry_links.assert_called_once_with(parent_ids, {1, 2, 3, 4}, self.job_exe)
+        # All of the product models are saved together after the files are transferred
+        self.assertEqual(mock_save_files.call_count, 1)
+        self.assertEqual(len(mock_save_files.call_args[0][0]), 4)
 
+    @patch('product.configuration.product_data_file.ScaleFile.objects.save_files')
     @patch('product.models.FileAncestryLink.objects.create_file_ancestry_links')
-    @patch('product.models.ProductFile.objects.upload_files')
-    def test_successful_recipe_path(self, mock_upload_files, mock_create_file_ancestry_links):
+    @patch('product.models.ProductFile.objects.transfer_files')
+    def test_successful_recipe_path(self, mock_transfer_files, mock_create_file_ancestry_links, mock_save_files):
         """Tests calling ProductDataFileType.store_files() successfully with a job that is in a recipe"""
 
         job_exe_in_recipe = job_utils.create_job_exe(status='RUNNING')
@@ -134,7 +139,7 @@ class TestProductDataFileStoreStoreFiles(TransactionTestCase):
         job_output_4 = 'mock_output_4'
 
         # Set up mocks
-        def new_upload_files(file_entries, input_file_ids, job_exe, workspace):
+        def new_transfer_files(file_entries, input_file_ids, job_exe, workspace):
             results = []
             for file_entry in file_entries:
                 # Check base remote path for recipe type and job type information
@@ -156,7 +161,7 @@ class TestProductDataFileStoreStoreFiles(TransactionTestCase):
                     mock_4.id = 4
                     results.append(mock_4)
             return results
-        mock_upload_files.side_effect = new_upload_files
+        mock_transfer_files.side_effect = new_transfer_files
 
         data_files = {self.workspace_1.id: [(local_path_1, media_type_1, job_output_1), (local_path_2, media_type_2, job_output_2)],
                       self.workspace_2.id: [(local_path_3, media_type_3, job_output_3), (local_path_4, media_type_4, job_output_4)]}
@@ -165,9 +170,10 @@ class TestProductDataFileStoreStoreFiles(TransactionTestCase):
 
         ProductDataFileStore().store_files(data_files, parent_ids, job_exe_in_recipe)
 
+    @patch('product.configuration.product_data_file.ScaleFile.objects.save_files')
     @patch('product.models.FileAncestryLink.objects.create_file_ancestry_links')
-    @patch('product.models.ProductFile.objects.upload_files')
-    def test_geo_metadata(self, mock_upload_files, mock_create_file_ancestry_links):
+    @patch('product.models.ProductFile.objects.transfer_files')
+    def test_geo_metadata(self, mock_transfer_files, mock_create_file_ancestry_links, mock_save_files):
         """Tests calling ProductDataFileType.store_files() successfully"""
 
         geo_metadata = {
@@ -197,4 +203,4 @@ class TestProductDataFileStoreStoreFiles(TransactionTestCase):
         ProductDataFileStore().store_files(data_files, parent_ids, self.job_exe)
         files_to_store = [(full_local_path_1, remote_path_1, media_type_1, job_output_1, geo_metadata),
                           (full_local_path_2, remote_path_2, media_type_2, job_output_2)]
-        mock_upload_files.assert_called_with(files_to_store, parent_ids, self.job_exe, self.workspace_1)
+        mock_transfer_files.assert_called_with(files_to_store, parent_ids, self.job_exe, self.workspace_1)
@@ -17,7 +17,7 @@ from storage.models import ScaleFile
 logger = logging.getLogger(__name__)
 
 
-class ProductsView(ListAPIView):
+class ProductsView(rest_util.CursorPaginationMixin, ListAPIView):
     """This view is the endpoint for retrieving a product by filename"""
     queryset = ScaleFile.objects.all()
     serializer_class = ProductFileSerializer
@@ -48,6 +48,15 @@ class ProductsView(ListAPIView):
         recipe_type_ids = rest_util.parse_int_list(request, 'recipe_type_id', required=False)
         recipe_job = rest_util.parse_string(request, 'recipe_job', required=False)
         batch_ids = rest_util.parse_int_list(request, 'batch_id', required=False)
+        geometry = rest_util.parse_geometry(request, 'intersects', required=False)
+        bbox = rest_util.parse_bbox(request, 'bbox', required=False)
+        if geometry and bbox:
+            raise rest_util.BadParameter('Only one of "intersects" and "bbox" may be given')
+        geometry = geometry or bbox
+        countries = rest_util.parse_string_list(request, 'country', required=False)
+        data_started = rest_util.parse_timestamp(request, 'data_started', required=False)
+        data_ended = rest_util.parse_timestamp(request, 'data_ended', required=False)
+        rest_util.check_time_range(data_started, data_ended)
 
         order = rest_util.parse_string_list(request, 'order', required=False)
 
@@ -56,7 +65,8 @@ class ProductsView(ListAPIView):
             job_type_names=job_type_names, job_type_categories=job_type_categories, job_ids=job_ids,
             is_operational=is_operational, is_published=is_published, file_name=file_name, 
             job_output=job_output, recipe_ids=recipe_ids, recipe_type_ids=recipe_type_ids, 
-            recipe_job=recipe_job, batch_ids=batch_ids, order=order,
+            recipe_job=recipe_job, batch_ids=batch_ids, geometry=geometry, countries=countries,
+            data_started=data_started, data_ended=data_ended, order=order,
         )
 
         page = self.paginate_queryset(products)
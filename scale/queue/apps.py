@@ -12,8 +12,23 @@ class QueueConfig(AppConfig):
     verbose_name = 'Queue'
 
     def ready(self):
-        """Registers the job load metrics processor with the clock system."""
+        """Registers the job load metrics processor with the clock system and registers the queue message types."""
         import job.clock as clock
+        from messaging.messages.factory import add_message_type
         from queue.job_load import JobLoadProcessor
+        from queue.messages.cancel_jobs_bulk import CancelJobsBulk
+        from queue.messages.completed_jobs import CompletedJobs
+        from queue.messages.failed_jobs import FailedJobs
+        from queue.messages.queue_ready_jobs import QueueReadyJobs
+        from queue.messages.requeue_jobs_bulk import RequeueJobsBulk
+        from queue.messages.update_recipes import UpdateRecipes
 
         clock.register_processor('scale-job-load', JobLoadProcessor)
+
+        # Register message types
+        add_message_type(CancelJobsBulk)
+        add_message_type(CompletedJobs)
+        add_message_type(FailedJobs)
+        add_message_type(QueueReadyJobs)
+        add_message_type(RequeueJobsBulk)
+        add_message_type(UpdateRecipes)
@@ -1,6 +1,10 @@
 """Defines the class that represents queued job executions being considered to be scheduled"""
 from __future__ import unicode_literals
 
+from job.configuration.json.execution.exe_config import ExecutionConfiguration
+from node.resources.node_resources import NodeResources
+from node.resources.resource import Cpus, Mem
+
 
 class QueuedJobExecution(object):
     """This class represents a queued job execution that is being considered to be scheduled."""
@@ -18,8 +22,10 @@ class QueuedJobExecution(object):
         self._required_resources = queue.get_resources()
 
         self._provided_agent_id = None
+        self._provided_docker_image = None
         self._provided_node_id = None
         self._provided_resources = None
+        self._workspace_names = None
 
     @property
     def id(self):
@@ -31,6 +37,16 @@ class QueuedJobExecution(object):
 
         return self._queue.job_exe_id
 
+    @property
+    def job_type_id(self):
+        """Returns the ID of the job type of this job execution
+
+        :returns: The ID of the job type of this job execution
+        :rtype: int
+        """
+
+        return self._queue.job_type_id
+
     @property
     def provided_agent_id(self):
         """Returns the ID of the agent that has been provided to run this job execution
@@ -41,6 +57,17 @@ class QueuedJobExecution(object):
 
         return self._provided_agent_id
 
+    @property
+    def provided_docker_image(self):
+        """Returns the name of the Docker image that the provided node recently pulled for this job execution, possibly
+        None
+
+        :returns: The name of the Docker image that the provided node recently pulled, possibly None
+        :rtype: string
+        """
+
+        return self._provided_docker_image
+
     @property
     def provided_node_id(self):
         """Returns the ID of the node that has been provided to run this job execution
@@ -81,7 +108,20 @@ class QueuedJobExecution(object):
 
         return self._required_resources
 
-    def accepted(self, agent_id, node_id, resources):
+    @property
+    def workspace_names(self):
+        """Returns the names of the workspaces used by this job execution. The execution configuration is only parsed
+        the first time this is called.
+
+        :returns: The names of the workspaces used by this job execution
+        :rtype: set
+        """
+
+        if self._workspace_names is None:
+            self._workspace_names = ExecutionConfiguration(self._queue.configuration).get_workspace_names()
+        return self._workspace_names
+
+    def accepted(self, agent_id, node_id, resources, docker_image=None):
         """Indicates that this job execution has been accepted to be scheduled and passes the node and resources being
         provided
 
@@ -91,8 +131,27 @@ class QueuedJobExecution(object):
         :type node_id: int
         :param resources: The provided resources
         :type resources: :class:`node.resources.node_resources.NodeResources`
+        :param docker_image: The name of the job Docker image if the node recently pulled it, possibly None
+        :type docker_image: string
         """
 
         self._provided_agent_id = agent_id
+        self._provided_docker_image = docker_image
         self._provided_node_id = node_id
         self._provided_resources = resources
+
+    def apply_resource_profile(self, profile):
+        """Lowers the CPUs and memory required by this job execution to the given resource profile of its job type.
+        Resources are never raised above what the job requires. The lowered resources are also the resources that the
+        job execution is launched with, so the profile must cover the job's peak usage.
+
+        :param profile: The profiled resource values stored by resource name
+        :type profile: {string: float}
+        """
+
+        if 'cpus' in profile and profile['cpus'] < self._required_resources.cpus:
+            self._required_resources.remove_resource('cpus')
+            self._required_resources.add(NodeResources([Cpus(profile['cpus'])]))
+        if 'mem' in profile and profile['mem'] < self._required_resources.mem:
+            self._required_resources.remove_resource('mem')
+            self._required_resources.add(NodeResources([Mem(profile['mem'])]))
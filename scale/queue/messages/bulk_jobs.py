@@ -0,0 +1,123 @@
+"""Defines the base class for command messages that update every job matching a filter, one chunk at a time"""
+from __future__ import unicode_literals
+
+import logging
+from abc import abstractmethod
+
+from job.models import Job
+from messaging.messages.message import CommandMessage
+from util.parse import datetime_to_string, parse_datetime
+
+
+logger = logging.getLogger(__name__)
+
+# The maximum number of jobs that are updated by a single message
+MAX_CHUNK_SIZE = 500
+
+# The job filter fields that are passed through to Job.objects.filter_jobs()
+FILTER_LIST_FIELDS = ('statuses', 'job_ids', 'job_type_ids', 'job_type_names', 'job_type_categories',
+                      'error_categories')
+
+
+class BulkJobsCommandMessage(CommandMessage):
+    """Base class for command messages that update all of the jobs matching a filter. Each message updates one chunk
+    of at most MAX_CHUNK_SIZE jobs in ID order within its own transaction, and then sends a copy of itself that starts
+    after the last job in the chunk, until no matching jobs remain. Progress is carried in the message and logged after
+    each chunk.
+    """
+
+    def __init__(self, message_type):
+        """Constructor
+
+        :param message_type: The message type
+        :type message_type: string
+        """
+
+        super(BulkJobsCommandMessage, self).__init__(message_type)
+
+        self.started = None
+        self.ended = None
+        self.statuses = None
+        self.job_ids = None
+        self.job_type_ids = None
+        self.job_type_names = None
+        self.job_type_categories = None
+        self.error_categories = None
+
+        # The ID of the last job that has been handled, the next chunk starts after it
+        self.current_job_id = 0
+        # The number of matching jobs that have been handled so far
+        self.handled_count = 0
+        # The number of jobs that have actually been updated so far
+        self.updated_count = 0
+
+    def execute(self):
+        """See :meth:`messaging.messages.message.CommandMessage.execute`
+        """
+
+        job_qry = Job.objects.filter_jobs(started=self.started, ended=self.ended, statuses=self.statuses,
+                                          job_ids=self.job_ids, job_type_ids=self.job_type_ids,
+                                          job_type_names=self.job_type_names,
+                                          job_type_categories=self.job_type_categories,
+                                          error_categories=self.error_categories, order=['id'])
+        job_qry = job_qry.filter(id__gt=self.current_job_id)
+        job_ids = list(job_qry.values_list('id', flat=True)[:MAX_CHUNK_SIZE])
+
+        if job_ids:
+            self.updated_count += self.update_jobs(job_ids)
+            self.handled_count += len(job_ids)
+            self.current_job_id = job_ids[-1]
+        logger.info('%s: %i job(s) handled and %i job(s) updated so far', self.type, self.handled_count,
+                    self.updated_count)
+
+        if len(job_ids) == MAX_CHUNK_SIZE:
+            # There may be more matching jobs, so send a message to handle the next chunk
+            self.new_messages.append(self.from_json(self.to_json()))
+        else:
+            logger.info('%s: finished', self.type)
+        return True
+
+    def to_json(self):
+        """See :meth:`messaging.messages.message.CommandMessage.to_json`
+        """
+
+        json_dict = {'current_job_id': self.current_job_id, 'handled_count': self.handled_count,
+                     'updated_count': self.updated_count}
+        if self.started:
+            json_dict['started'] = datetime_to_string(self.started)
+        if self.ended:
+            json_dict['ended'] = datetime_to_string(self.ended)
+        for field in FILTER_LIST_FIELDS:
+            value = getattr(self, field)
+            if value:
+                json_dict[field] = list(value)
+        return json_dict
+
+    def populate_from_json(self, json_dict):
+        """Populates the filter and progress of this message from the given JSON
+
+        :param json_dict: The message JSON
+        :type json_dict: dict
+        """
+
+        if json_dict.get('started'):
+            self.started = parse_datetime(json_dict['started'])
+        if json_dict.get('ended'):
+            self.ended = parse_datetime(json_dict['ended'])
+        for field in FILTER_LIST_FIELDS:
+            setattr(self, field, json_dict.get(field))
+        self.current_job_id = json_dict.get('current_job_id', 0)
+        self.handled_count = json_dict.get('handled_count', 0)
+        self.updated_count = json_dict.get('updated_count', 0)
+
+    @abstractmethod
+    def update_jobs(self, job_ids):
+        """Updates the chunk of jobs with the given IDs within a single transaction
+
+        :param job_ids: The IDs of the jobs in the chunk
+        :type job_ids: [int]
+        :returns: The number of jobs that were actually updated
+        :rtype: int
+        """
+
+        raise NotImplementedError()
@@ -0,0 +1,33 @@
+"""Defines a command message that cancels all of the jobs matching a filter"""
+from __future__ import unicode_literals
+
+from django.utils.timezone import now
+
+from queue.messages.bulk_jobs import BulkJobsCommandMessage
+
+
+class CancelJobsBulk(BulkJobsCommandMessage):
+    """Command message that cancels all of the jobs matching a filter, one chunk at a time
+    """
+
+    def __init__(self):
+        """Constructor
+        """
+
+        super(CancelJobsBulk, self).__init__('cancel_jobs_bulk')
+
+    @staticmethod
+    def from_json(json_dict):
+        """See :meth:`messaging.messages.message.CommandMessage.from_json`
+        """
+
+        message = CancelJobsBulk()
+        message.populate_from_json(json_dict)
+        return message
+
+    def update_jobs(self, job_ids):
+        """See :meth:`queue.messages.bulk_jobs.BulkJobsCommandMessage.update_jobs`
+        """
+
+        from queue.models import Queue
+        return Queue.objects.cancel_jobs(job_ids, now())
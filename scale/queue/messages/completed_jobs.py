@@ -0,0 +1,72 @@
+"""Defines a command message that handles job executions that have completed"""
+from __future__ import unicode_literals
+
+import logging
+
+from messaging.messages.message import CommandMessage
+from queue.messages.job_exe_end import JobExeEnd, MAX_NUM_JOB_EXES
+from queue.messages.update_recipes import create_update_recipes_messages
+
+
+logger = logging.getLogger(__name__)
+
+
+class CompletedJobs(CommandMessage):
+    """Command message that completes a batch of job executions and their jobs in a single transaction. Job executions
+    that are no longer RUNNING are ignored, so repeating this message has no effect.
+    """
+
+    def __init__(self):
+        """Constructor
+        """
+
+        super(CompletedJobs, self).__init__('completed_jobs')
+
+        self._job_exe_ends = []
+
+    def add_job_exe_end(self, job_exe_end):
+        """Adds the given job execution end to this message
+
+        :param job_exe_end: The job execution end
+        :type job_exe_end: :class:`queue.messages.job_exe_end.JobExeEnd`
+        """
+
+        self._job_exe_ends.append(job_exe_end)
+
+    def can_fit_more(self):
+        """Indicates whether more job executions can fit in this message
+
+        :returns: True if more job executions can fit, False otherwise
+        :rtype: bool
+        """
+
+        return len(self._job_exe_ends) < MAX_NUM_JOB_EXES
+
+    def execute(self):
+        """See :meth:`messaging.messages.message.CommandMessage.execute`
+        """
+
+        from queue.models import Queue
+
+        job_ids = Queue.objects.complete_job_exes(self._job_exe_ends)
+        logger.info('Completed %i job execution(s)', len(job_ids))
+
+        # Jobs that are in recipes may now have dependent jobs that are ready to be queued
+        self.new_messages.extend(create_update_recipes_messages(job_ids))
+        return True
+
+    @staticmethod
+    def from_json(json_dict):
+        """See :meth:`messaging.messages.message.CommandMessage.from_json`
+        """
+
+        message = CompletedJobs()
+        for job_exe_end_dict in json_dict['job_exes']:
+            message.add_job_exe_end(JobExeEnd.from_json(job_exe_end_dict))
+        return message
+
+    def to_json(self):
+        """See :meth:`messaging.messages.message.CommandMessage.to_json`
+        """
+
+        return {'job_exes': [job_exe_end.to_json() for job_exe_end in self._job_exe_ends]}
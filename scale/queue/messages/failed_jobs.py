@@ -0,0 +1,75 @@
+"""Defines a command message that handles job executions that have failed"""
+from __future__ import unicode_literals
+
+import logging
+
+from messaging.messages.message import CommandMessage
+from queue.messages.job_exe_end import JobExeEnd, MAX_NUM_JOB_EXES
+from queue.messages.queue_ready_jobs import create_queue_ready_jobs_messages
+from queue.messages.update_recipes import create_update_recipes_messages
+
+
+logger = logging.getLogger(__name__)
+
+
+class FailedJobs(CommandMessage):
+    """Command message that fails a batch of job executions and their jobs in a single transaction. Job executions that
+    are no longer RUNNING are ignored, so repeating this message has no effect.
+    """
+
+    def __init__(self):
+        """Constructor
+        """
+
+        super(FailedJobs, self).__init__('failed_jobs')
+
+        self._job_exe_ends = []
+
+    def add_job_exe_end(self, job_exe_end):
+        """Adds the given job execution end to this message
+
+        :param job_exe_end: The job execution end
+        :type job_exe_end: :class:`queue.messages.job_exe_end.JobExeEnd`
+        """
+
+        self._job_exe_ends.append(job_exe_end)
+
+    def can_fit_more(self):
+        """Indicates whether more job executions can fit in this message
+
+        :returns: True if more job executions can fit, False otherwise
+        :rtype: bool
+        """
+
+        return len(self._job_exe_ends) < MAX_NUM_JOB_EXES
+
+    def execute(self):
+        """See :meth:`messaging.messages.message.CommandMessage.execute`
+        """
+
+        from queue.models import Queue
+
+        jobs_to_retry, failed_job_ids = Queue.objects.fail_job_exes(self._job_exe_ends)
+        logger.info('Failed %i job execution(s), %i job(s) will be retried', len(jobs_to_retry) + len(failed_job_ids),
+                    len(jobs_to_retry))
+
+        # Jobs with tries remaining are queued again, the rest may block dependent jobs in their recipes
+        self.new_messages.extend(create_queue_ready_jobs_messages(jobs_to_retry))
+        self.new_messages.extend(create_update_recipes_messages(failed_job_ids))
+        return True
+
+    @staticmethod
+    def from_json(json_dict):
+        """See :meth:`messaging.messages.message.CommandMessage.from_json`
+        """
+
+        message = FailedJobs()
+        for job_exe_end_dict in json_dict['job_exes']:
+            message.add_job_exe_end(JobExeEnd.from_json(job_exe_end_dict))
+        return message
+
+    def to_json(self):
+        """See :meth:`messaging.messages.message.CommandMessage.to_json`
+        """
+
+        return {'job_exes': [job_exe_end.to_json() for job_exe_end in self._job_exe_ends]}
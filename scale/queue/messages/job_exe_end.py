@@ -0,0 +1,135 @@
+"""Defines the class that represents the end of a job execution within a command message"""
+from __future__ import unicode_literals
+
+from util.parse import datetime_to_string, parse_datetime
+
+
+# The maximum number of job executions that are sent within a single job completion or failure message
+MAX_NUM_JOB_EXES = 100
+
+# The job execution fields that are populated from the job execution's tasks
+TASK_DATETIME_FIELDS = ('pre_started', 'pre_completed', 'job_started', 'job_completed', 'post_started',
+                        'post_completed')
+TASK_INTEGER_FIELDS = ('pre_exit_code', 'job_exit_code', 'post_exit_code')
+TASK_USAGE_FIELDS = ('cpus_used', 'mem_used', 'disk_used')
+TASK_FIELDS = TASK_DATETIME_FIELDS + TASK_INTEGER_FIELDS + TASK_USAGE_FIELDS
+
+
+class JobExeEnd(object):
+    """This class represents a job execution that has ended (completed or failed) in the scheduler, along with the
+    information from its tasks that needs to be saved to the job execution model
+    """
+
+    def __init__(self, job_exe_id, when, error_id=None, task_fields=None):
+        """Constructor
+
+        :param job_exe_id: The ID of the job execution
+        :type job_exe_id: int
+        :param when: When the job execution ended
+        :type when: :class:`datetime.datetime`
+        :param error_id: The ID of the error that caused the job execution to fail, possibly None
+        :type error_id: int
+        :param task_fields: The job execution field values from the tasks, {Field name: value}
+        :type task_fields: dict
+        """
+
+        self.job_exe_id = job_exe_id
+        self.when = when
+        self.error_id = error_id
+        self.task_fields = task_fields if task_fields else {}
+
+    @staticmethod
+    def from_json(json_dict):
+        """Creates a job execution end from the given JSON
+
+        :param json_dict: The JSON dict
+        :type json_dict: dict
+        :returns: The job execution end
+        :rtype: :class:`queue.messages.job_exe_end.JobExeEnd`
+        """
+
+        task_fields = {}
+        for name, value in json_dict.get('task_fields', {}).items():
+            if name in TASK_DATETIME_FIELDS:
+                value = parse_datetime(value)
+            task_fields[name] = value
+        return JobExeEnd(json_dict['id'], parse_datetime(json_dict['when']), json_dict.get('error_id'), task_fields)
+
+    @staticmethod
+    def from_running_job_exe(running_job_exe):
+        """Creates a job execution end from the given finished running job execution
+
+        :param running_job_exe: The finished running job execution
+        :type running_job_exe: :class:`job.execution.job_exe.RunningJobExecution`
+        :returns: The job execution end
+        :rtype: :class:`queue.messages.job_exe_end.JobExeEnd`
+        """
+
+        from job.models import JobExecution
+
+        job_exe = JobExecution()
+        running_job_exe.populate_job_exe_model(job_exe)
+        task_fields = {}
+        for name in TASK_FIELDS:
+            value = getattr(job_exe, name)
+            if value is not None:
+                task_fields[name] = value
+        error_id = running_job_exe.error.id if running_job_exe.error else None
+        return JobExeEnd(running_job_exe.id, running_job_exe.finished, error_id, task_fields)
+
+    def populate_job_exe_model(self, job_exe):
+        """Populates the given job execution model with the information from the tasks
+
+        :param job_exe: The job execution model
+        :type job_exe: :class:`job.models.JobExecution`
+        """
+
+        for name, value in self.task_fields.items():
+            setattr(job_exe, name, value)
+
+    def to_json(self):
+        """Returns the JSON for this job execution end
+
+        :returns: The JSON dict
+        :rtype: dict
+        """
+
+        task_fields = {}
+        for name, value in self.task_fields.items():
+            if name in TASK_DATETIME_FIELDS:
+                value = datetime_to_string(value)
+            task_fields[name] = value
+        json_dict = {'id': self.job_exe_id, 'when': datetime_to_string(self.when), 'task_fields': task_fields}
+        if self.error_id:
+            json_dict['error_id'] = self.error_id
+        return json_dict
+
+
+def create_job_exe_end_messages(running_job_exes):
+    """Creates the messages for handling the given finished running job executions, putting up to MAX_NUM_JOB_EXES job
+    executions in each message
+
+    :param running_job_exes: The finished running job executions
+    :type running_job_exes: [:class:`job.execution.job_exe.RunningJobExecution`]
+    :returns: The list of messages
+    :rtype: [:class:`messaging.messages.message.CommandMessage`]
+    """
+
+    from queue.messages.completed_jobs import CompletedJobs
+    from queue.messages.failed_jobs import FailedJobs
+
+    messages = []
+    completed_message = None
+    failed_message = None
+    for running_job_exe in running_job_exes:
+        if running_job_exe.status == 'COMPLETED':
+            if not completed_message or not completed_message.can_fit_more():
+                completed_message = CompletedJobs()
+                messages.append(completed_message)
+            completed_message.add_job_exe_end(JobExeEnd.from_running_job_exe(running_job_exe))
+        elif running_job_exe.status == 'FAILED':
+            if not failed_message or not failed_message.can_fit_more():
+                failed_message = FailedJobs()
+                messages.append(failed_message)
+            failed_message.add_job_exe_end(JobExeEnd.from_running_job_exe(running_job_exe))
+    return messages
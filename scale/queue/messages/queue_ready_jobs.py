@@ -0,0 +1,69 @@
+"""Defines a command message that queues jobs that are ready to be queued"""
+from __future__ import unicode_literals
+
+import logging
+
+from messaging.messages.message import CommandMessage
+
+
+logger = logging.getLogger(__name__)
+
+# The maximum number of jobs that are queued by a single message
+MAX_NUM_JOBS = 500
+
+
+def create_queue_ready_jobs_messages(jobs):
+    """Creates the messages for queuing the given jobs, putting up to MAX_NUM_JOBS jobs in each message
+
+    :param jobs: The jobs to queue, {Job ID: Number of executions the job had when it became ready}
+    :type jobs: dict
+    :returns: The list of messages
+    :rtype: [:class:`queue.messages.queue_ready_jobs.QueueReadyJobs`]
+    """
+
+    messages = []
+    job_tuples = sorted(jobs.items())
+    for i in xrange(0, len(job_tuples), MAX_NUM_JOBS):
+        message = QueueReadyJobs()
+        message.jobs = dict(job_tuples[i:i + MAX_NUM_JOBS])
+        messages.append(message)
+    return messages
+
+
+class QueueReadyJobs(CommandMessage):
+    """Command message that queues a batch of jobs in a single transaction. Each job is only queued if it still has the
+    same number of executions that it had when it became ready, so repeating this message has no effect.
+    """
+
+    def __init__(self):
+        """Constructor
+        """
+
+        super(QueueReadyJobs, self).__init__('queue_ready_jobs')
+
+        self.jobs = {}  # {Job ID: Number of executions}
+
+    def execute(self):
+        """See :meth:`messaging.messages.message.CommandMessage.execute`
+        """
+
+        from queue.models import Queue
+
+        job_exes = Queue.objects.queue_ready_jobs(self.jobs)
+        logger.info('Queued %i job(s)', len(job_exes))
+        return True
+
+    @staticmethod
+    def from_json(json_dict):
+        """See :meth:`messaging.messages.message.CommandMessage.from_json`
+        """
+
+        message = QueueReadyJobs()
+        message.jobs = {job_id: num_exes for job_id, num_exes in json_dict['jobs']}
+        return message
+
+    def to_json(self):
+        """See :meth:`messaging.messages.message.CommandMessage.to_json`
+        """
+
+        return {'jobs': [[job_id, num_exes] for job_id, num_exes in sorted(self.jobs.items())]}
@@ -0,0 +1,43 @@
+"""Defines a command message that re-queues all of the jobs matching a filter"""
+from __future__ import unicode_literals
+
+from queue.messages.bulk_jobs import BulkJobsCommandMessage
+
+
+class RequeueJobsBulk(BulkJobsCommandMessage):
+    """Command message that re-queues all of the jobs matching a filter, one chunk at a time
+    """
+
+    def __init__(self):
+        """Constructor
+        """
+
+        super(RequeueJobsBulk, self).__init__('requeue_jobs_bulk')
+
+        self.priority = None
+
+    def to_json(self):
+        """See :meth:`messaging.messages.message.CommandMessage.to_json`
+        """
+
+        json_dict = super(RequeueJobsBulk, self).to_json()
+        if self.priority is not None:
+            json_dict['priority'] = self.priority
+        return json_dict
+
+    @staticmethod
+    def from_json(json_dict):
+        """See :meth:`messaging.messages.message.CommandMessage.from_json`
+        """
+
+        message = RequeueJobsBulk()
+        message.populate_from_json(json_dict)
+        message.priority = json_dict.get('priority')
+        return message
+
+    def update_jobs(self, job_ids):
+        """See :meth:`queue.messages.bulk_jobs.BulkJobsCommandMessage.update_jobs`
+        """
+
+        from queue.models import Queue
+        return Queue.objects.requeue_jobs(job_ids, self.priority)
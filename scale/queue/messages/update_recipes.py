@@ -0,0 +1,73 @@
+"""Defines a command message that updates the recipes containing jobs that have changed status"""
+from __future__ import unicode_literals
+
+import logging
+
+from messaging.messages.message import CommandMessage
+from queue.messages.queue_ready_jobs import create_queue_ready_jobs_messages
+
+
+logger = logging.getLogger(__name__)
+
+# The maximum number of jobs that are handled by a single update recipes message
+MAX_NUM_JOBS = 100
+
+
+def create_update_recipes_messages(job_ids):
+    """Creates the messages for updating the recipes containing the jobs with the given IDs, putting up to MAX_NUM_JOBS
+    jobs in each message
+
+    :param job_ids: The IDs of the jobs that have completed, failed, or been canceled
+    :type job_ids: [int]
+    :returns: The list of messages
+    :rtype: [:class:`queue.messages.update_recipes.UpdateRecipes`]
+    """
+
+    messages = []
+    job_ids = list(job_ids)
+    for i in xrange(0, len(job_ids), MAX_NUM_JOBS):
+        message = UpdateRecipes()
+        message.job_ids = job_ids[i:i + MAX_NUM_JOBS]
+        messages.append(message)
+    return messages
+
+
+class UpdateRecipes(CommandMessage):
+    """Command message that updates the recipes containing the given jobs. The dependent jobs of completed jobs that are
+    now ready have their data populated and are sent on to be queued, recipes whose jobs have all completed are marked
+    completed, and the dependent jobs of failed or canceled jobs are blocked. The current status of each job is read from
+    the database, so repeating this message has no effect.
+    """
+
+    def __init__(self):
+        """Constructor
+        """
+
+        super(UpdateRecipes, self).__init__('update_recipes')
+
+        self.job_ids = []
+
+    def execute(self):
+        """See :meth:`messaging.messages.message.CommandMessage.execute`
+        """
+
+        from queue.models import Queue
+
+        jobs_to_queue = Queue.objects.update_recipes_for_jobs(self.job_ids)
+        self.new_messages.extend(create_queue_ready_jobs_messages(jobs_to_queue))
+        return True
+
+    @staticmethod
+    def from_json(json_dict):
+        """See :meth:`messaging.messages.message.CommandMessage.from_json`
+        """
+
+        message = UpdateRecipes()
+        message.job_ids = json_dict['job_ids']
+        return message
+
+    def to_json(self):
+        """See :meth:`messaging.messages.message.CommandMessage.to_json`
+        """
+
+        return {'job_ids': self.job_ids}
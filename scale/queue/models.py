@@ -252,6 +252,164 @@ class QueueManager(models.Manager):
     # List of queue event processor class definitions
     _processors = []
 
+    @transaction.atomic
+    def cancel_jobs(self, job_ids, when):
+        """Cancels the jobs with the given IDs using a fixed number of queries, regardless of the number of jobs. Any
+        job that cannot be canceled, or that has a new job execution created while it is being canceled, is ignored.
+        All database changes occur in an atomic transaction.
+
+        :param job_ids: The IDs of the jobs to cancel
+        :type job_ids: [int]
+        :param when: When the jobs were canceled
+        :type when: :class:`datetime.datetime`
+        :returns: The number of jobs that were canceled
+        :rtype: int
+        """
+
+        # Acquire model locks on unfinished job executions
+        job_exe_qry = JobExecution.objects.select_for_update().defer('stdout', 'stderr')
+        job_exe_qry = job_exe_qry.filter(job_id__in=job_ids, status__in=['QUEUED', 'RUNNING']).order_by('id')
+        job_exes = {job_exe.job_id: job_exe for job_exe in job_exe_qry.iterator()}
+
+        # Acquire model locks on jobs
+        jobs = Job.objects.get_locked_jobs(job_ids)
+
+        # Check unfinished job executions again to ensure no new job execution was just created. Any job with a
+        # conflict (should be quite rare) is not canceled.
+        job_exe_qry = JobExecution.objects.filter(job_id__in=job_ids, status__in=['QUEUED', 'RUNNING'])
+        job_exe_ids_2 = dict(job_exe_qry.values_list('job_id', 'id'))
+
+        jobs_to_cancel = []
+        job_exes_to_cancel = []
+        queued_job_exe_ids = []
+        for job in jobs:
+            job_exe = job_exes.get(job.id)
+            if (job_exe.id if job_exe else None) != job_exe_ids_2.get(job.id):
+                logger.warning('Job %i could not be canceled due to a rare status conflict', job.id)
+                continue
+            if not job.can_be_canceled:
+                continue
+            if job_exe:
+                # Stop the current job execution, removing it from the queue if applicable
+                job_exe.job = job
+                job_exes_to_cancel.append(job_exe)
+                if job_exe.status == 'QUEUED':
+                    queued_job_exe_ids.append(job_exe.id)
+            else:
+                # Latest job execution was finished, so just mark the job as CANCELED
+                jobs_to_cancel.append(job)
+
+        if queued_job_exe_ids:
+            Queue.objects.filter(job_exe_id__in=queued_job_exe_ids).delete()
+        if job_exes_to_cancel:
+            JobExecution.objects.update_status(job_exes_to_cancel, 'CANCELED', when)
+        if jobs_to_cancel:
+            Job.objects.update_status(jobs_to_cancel, 'CANCELED', when)
+
+        # Update dependent recipe jobs (with model locks) so that they are BLOCKED
+        canceled_job_ids = [job.id for job in jobs_to_cancel] + [job_exe.job_id for job_exe in job_exes_to_cancel]
+        jobs_to_blocked = []
+        if canceled_job_ids:
+            for handler in Recipe.objects.get_recipe_handlers_for_jobs(canceled_job_ids):
+                jobs_to_blocked.extend(handler.get_blocked_jobs())
+        if jobs_to_blocked:
+            Job.objects.update_status(jobs_to_blocked, 'BLOCKED', when)
+
+        return len(canceled_job_ids)
+
+    @transaction.atomic
+    def complete_job_exes(self, job_exe_ends):
+        """Completes the given job executions and their jobs. Job executions that are no longer RUNNING are ignored. All
+        database changes occur in an atomic transaction.
+
+        :param job_exe_ends: The job executions that have completed
+        :type job_exe_ends: [:class:`queue.messages.job_exe_end.JobExeEnd`]
+        :returns: The IDs of the jobs that were completed
+        :rtype: [int]
+        """
+
+        job_exe_ends_by_id = {job_exe_end.job_exe_id: job_exe_end for job_exe_end in job_exe_ends}
+        job_exes = self._lock_running_job_exes(job_exe_ends_by_id.keys())
+        if not job_exes:
+            return []
+
+        for job_exe in job_exes:
+            job_exe_end = job_exe_ends_by_id[job_exe.id]
+            job_exe_end.populate_job_exe_model(job_exe)
+            JobExecution.objects.complete_job_exe(job_exe, job_exe_end.when)
+
+        # Execute any registered processors from other applications
+        for processor_class in self._processors:
+            try:
+                processor = processor_class()
+                for job_exe in job_exes:
+                    processor.process_completed(job_exe)
+            except:
+                logger.exception('Unable to call queue processor for completed job executions: %s', processor_class)
+
+        return [job_exe.job_id for job_exe in job_exes]
+
+    @transaction.atomic
+    def fail_job_exes(self, job_exe_ends):
+        """Fails the given job executions. Jobs with tries remaining are returned to be put back on the queue, the other
+        jobs are marked failed. Job executions that are no longer RUNNING are ignored. All database changes occur in an
+        atomic transaction.
+
+        :param job_exe_ends: The job executions that have failed
+        :type job_exe_ends: [:class:`queue.messages.job_exe_end.JobExeEnd`]
+        :returns: The jobs to retry, {Job ID: Number of executions}, and the IDs of the jobs that failed without retry
+        :rtype: (dict, [int])
+        """
+
+        job_exe_ends_by_id = {job_exe_end.job_exe_id: job_exe_end for job_exe_end in job_exe_ends}
+        job_exes = self._lock_running_job_exes(job_exe_ends_by_id.keys())
+        if not job_exes:
+            return {}, []
+
+        # Retrieve all of the errors with a single query
+        error_ids = {job_exe_end.error_id for job_exe_end in job_exe_ends if job_exe_end.error_id}
+        errors = {error.id: error for error in Error.objects.filter(id__in=error_ids)} if error_ids else {}
+        unknown_error = Error.objects.get_unknown_error()
+
+        # Update the job executions and jobs with a query for each distinct error and failure time
+        job_exes_by_failure = {}  # {(Error ID, When): [JobExecution]}
+        for job_exe in job_exes:
+            job_exe_end = job_exe_ends_by_id[job_exe.id]
+            job_exe_end.populate_job_exe_model(job_exe)
+            error = errors.get(job_exe_end.error_id, unknown_error)
+            job_exes_by_failure.setdefault((error.id, job_exe_end.when), []).append(job_exe)
+            job_exe.error = error
+        for (_error_id, when), job_exe_list in job_exes_by_failure.items():
+            JobExecution.objects.update_status(job_exe_list, 'FAILED', when, job_exe_list[0].error)
+        for job_exe in job_exes:
+            job_exe.save(update_fields=[name for name in job_exe_ends_by_id[job_exe.id].task_fields])
+
+        # Execute any registered processors from other applications
+        for processor_class in self._processors:
+            try:
+                processor = processor_class()
+                for job_exe in job_exes:
+                    processor.process_failed(job_exe)
+            except:
+                logger.exception('Unable to call queue processor for failed job executions: %s', processor_class)
+
+        jobs_to_retry = {}
+        failed_job_ids = []
+        for job_exe in job_exes:
+            job = job_exe.job
+            # Re-try job if error supports re-try and there are more tries left
+            retry = job_exe.error.should_be_retried and job.num_exes < job.max_tries
+            # Also re-try long running jobs
+            retry = retry or job.job_type.is_long_running
+            # Do not re-try superseded jobs
+            retry = retry and not job.is_superseded
+            if retry:
+                jobs_to_retry[job.id] = job.num_exes
+            else:
+                failed_job_ids.append(job.id)
+
+        return jobs_to_retry, failed_job_ids
+
     def get_queue(self, order_mode, ignore_job_type_ids=None):
         """Returns the list of queue models sorted according to their priority first, and then according to the provided
         mode
@@ -374,22 +532,7 @@ class QueueManager(models.Manager):
                                  processor_class, job_exe_id)
 
         # If this job is in a recipe, queue any jobs in the recipe that have their job dependencies completed
-        handler = Recipe.objects.get_recipe_handler_for_job(job_exe.job_id)
-        if handler:
-            if not job_exe.job.is_superseded:  # Do not queue dependent jobs for superseded jobs
-                jobs_to_queue = []
-                for job_tuple in handler.get_existing_jobs_to_queue():
-                    job = job_tuple[0]
-                    job_data = job_tuple[1]
-                    try:
-                        Job.objects.populate_job_data(job, job_data)
-                    except InvalidData as ex:
-                        raise Exception('Scale created invalid job data: %s' % str(ex))
-                    jobs_to_queue.append(job)
-                if jobs_to_queue:
-                    self._queue_jobs(jobs_to_queue)
-            if handler.is_completed():
-                Recipe.objects.complete_recipe(handler.recipe.id, when)
+        self._handle_completed_recipe_jobs([job_exe.job_id], when)
 
     @transaction.atomic
     def handle_job_failure(self, job_exe_id, when, tasks, error=None):
@@ -529,17 +672,7 @@ class QueueManager(models.Manager):
         """
 
         handler = Recipe.objects.create_recipe(recipe_type, data, event, superseded_recipe, delta, superseded_jobs)
-        jobs_to_queue = []
-        for job_tuple in handler.get_existing_jobs_to_queue():
-            job = job_tuple[0]
-            job_data = job_tuple[1]
-            try:
-                Job.objects.populate_job_data(job, job_data)
-            except InvalidData as ex:
-                raise Exception('Scale created invalid job data: %s' % str(ex))
-            jobs_to_queue.append(job)
-        if jobs_to_queue:
-            self._queue_jobs(jobs_to_queue, priority)
+        self._populate_and_queue_jobs(handler.get_existing_jobs_to_queue(), priority)
 
         return handler
 
@@ -567,6 +700,26 @@ class QueueManager(models.Manager):
 
         return self.queue_new_recipe(recipe_type, data, event)
 
+    @transaction.atomic
+    def queue_ready_jobs(self, jobs):
+        """Queues the given jobs that are ready to be queued. A job is only queued if it is PENDING or FAILED and still
+        has the given number of executions, so jobs that have been queued or canceled since becoming ready are ignored.
+        All database changes occur in an atomic transaction.
+
+        :param jobs: The jobs to queue, {Job ID: Number of executions the job had when it became ready}
+        :type jobs: dict
+        :returns: The new queued job execution models
+        :rtype: [:class:`job.models.JobExecution`]
+        """
+
+        jobs_to_queue = []
+        for job in Job.objects.get_locked_jobs(jobs.keys()):
+            if job.status in ['PENDING', 'FAILED'] and job.num_exes == jobs[job.id]:
+                jobs_to_queue.append(job)
+        if not jobs_to_queue:
+            return []
+        return self._queue_jobs(jobs_to_queue)
+
     def register_processor(self, processor_class):
         """Registers the given processor class to be called when job executions change status.
 
@@ -587,6 +740,8 @@ class QueueManager(models.Manager):
         :type job_ids: [int]
         :param priority: An optional argument to reset the jobs' priority before they are queued
         :type priority: int
+        :returns: The number of jobs that were re-queued
+        :rtype: int
         """
 
         jobs_to_requeue = Job.objects.get_locked_jobs(job_ids)
@@ -620,6 +775,8 @@ class QueueManager(models.Manager):
         if jobs_to_pending:
             Job.objects.update_status(jobs_to_pending, 'PENDING', when)
 
+        return len(all_valid_job_ids)
+
     @transaction.atomic
     def schedule_job_executions(self, framework_id, job_executions, workspaces):
         """Schedules the given job executions on the provided nodes and resources. The corresponding queue models will
@@ -649,6 +806,7 @@ class QueueManager(models.Manager):
 
         # Set up job executions to schedule
         executions_to_schedule = []
+        pulled_images = {}  # {Job exe ID: Name of the Docker image that the node recently pulled}
         for job_execution in job_executions:
             node_id = job_execution.provided_node_id
             agent_id = job_execution.provided_agent_id
@@ -662,12 +820,15 @@ class QueueManager(models.Manager):
                 continue
 
             executions_to_schedule.append((job_exe, node_id, resources, input_file_size, agent_id))
+            pulled_images[job_exe.id] = job_execution.provided_docker_image
 
         # Schedule job executions
         scheduled_job_exes = []
         job_exe_ids_scheduled = []
         for job_exe in JobExecution.objects.schedule_job_executions(framework_id, executions_to_schedule, workspaces):
-            scheduled_job_exes.append(RunningJobExecution(job_exe.agent_id, job_exe))
+            pulled_image = pulled_images.get(job_exe.id)
+            is_image_pulled = pulled_image is not None and pulled_image == job_exe.get_docker_image()
+            scheduled_job_exes.append(RunningJobExecution(job_exe.agent_id, job_exe, is_image_pulled))
             job_exe_ids_scheduled.append(job_exe.id)
 
         # Clear the scheduled job executions from the queue
@@ -675,6 +836,109 @@ class QueueManager(models.Manager):
 
         return scheduled_job_exes
 
+    @transaction.atomic
+    def update_recipes_for_jobs(self, job_ids):
+        """Updates the recipes containing the jobs with the given IDs based on the current status of each job. The data
+        of each dependent job that is ready now that its parents have completed is populated and the ready jobs are
+        returned to be queued, recipes that have finished are marked completed, and the dependent jobs of failed or
+        canceled jobs are blocked. All database changes occur in an atomic transaction.
+
+        :param job_ids: The IDs of the jobs that have completed, failed, or been canceled
+        :type job_ids: [int]
+        :returns: The jobs that are ready to be queued, {Job ID: Number of executions}
+        :rtype: dict
+        """
+
+        when = timezone.now()
+        completed_job_ids = []
+        blocking_job_ids = []
+        for job in Job.objects.get_locked_jobs(job_ids):
+            if job.status == 'COMPLETED':
+                completed_job_ids.append(job.id)
+            elif job.status in ['FAILED', 'CANCELED']:
+                blocking_job_ids.append(job.id)
+
+        jobs_to_queue = {}
+        if completed_job_ids:
+            job_tuples, recipe_ids = Recipe.objects.get_jobs_to_queue_for_completed_jobs(completed_job_ids)
+            for job, job_data in job_tuples:
+                try:
+                    Job.objects.populate_job_data(job, job_data)
+                except InvalidData as ex:
+                    raise Exception('Scale created invalid job data: %s' % str(ex))
+                jobs_to_queue[job.id] = job.num_exes
+            for recipe_id in Recipe.objects.get_completed_recipe_ids(recipe_ids):
+                Recipe.objects.complete_recipe(recipe_id, when)
+
+        if blocking_job_ids:
+            jobs_to_blocked = []
+            for handler in Recipe.objects.get_recipe_handlers_for_jobs(blocking_job_ids):
+                jobs_to_blocked.extend(handler.get_blocked_jobs())
+            if jobs_to_blocked:
+                Job.objects.update_status(jobs_to_blocked, 'BLOCKED', when)
+
+        return jobs_to_queue
+
+    def _handle_completed_recipe_jobs(self, job_ids, when):
+        """Queues the recipe jobs that have become ready now that the jobs with the given IDs have been completed and
+        marks any recipes that are now finished as completed. The caller must have obtained model locks on the job
+        models for the given IDs.
+
+        :param job_ids: The IDs of the completed jobs
+        :type job_ids: [int]
+        :param when: When the jobs were completed
+        :type when: :class:`datetime.datetime`
+        """
+
+        jobs_to_queue, recipe_ids = Recipe.objects.get_jobs_to_queue_for_completed_jobs(job_ids)
+        if not recipe_ids:
+            return
+
+        self._populate_and_queue_jobs(jobs_to_queue)
+        for recipe_id in Recipe.objects.get_completed_recipe_ids(recipe_ids):
+            Recipe.objects.complete_recipe(recipe_id, when)
+
+    def _lock_running_job_exes(self, job_exe_ids):
+        """Obtains model locks on the job executions with the given IDs that are still RUNNING, and then on their jobs,
+        and returns the job executions with their related job models
+
+        :param job_exe_ids: The IDs of the job executions
+        :type job_exe_ids: [int]
+        :returns: The locked RUNNING job executions
+        :rtype: [:class:`job.models.JobExecution`]
+        """
+
+        job_exe_qry = JobExecution.objects.select_for_update().defer('stdout', 'stderr')
+        job_exe_qry = job_exe_qry.filter(id__in=job_exe_ids, status='RUNNING').order_by('id')
+        job_exes = list(job_exe_qry.iterator())
+        if not job_exes:
+            return []
+
+        jobs = {job.id: job for job in Job.objects.get_locked_jobs([job_exe.job_id for job_exe in job_exes])}
+        for job_exe in job_exes:
+            job_exe.job = jobs[job_exe.job_id]
+        return job_exes
+
+    def _populate_and_queue_jobs(self, job_tuples, priority=None):
+        """Populates the data of the given jobs and queues them. The caller must have obtained model locks on the job
+        models.
+
+        :param job_tuples: The list of jobs to queue along with their data
+        :type job_tuples: [(:class:`job.models.Job`, :class:`job.configuration.data.job_data.JobData`)]
+        :param priority: An optional argument to reset the jobs' priority before they are queued
+        :type priority: int
+        """
+
+        jobs_to_queue = []
+        for job, job_data in job_tuples:
+            try:
+                Job.objects.populate_job_data(job, job_data)
+            except InvalidData as ex:
+                raise Exception('Scale created invalid job data: %s' % str(ex))
+            jobs_to_queue.append(job)
+        if jobs_to_queue:
+            self._queue_jobs(jobs_to_queue, priority)
+
     def _queue_jobs(self, jobs, priority=None):
         """Queues the given jobs and returns the new queued job executions. The caller must have obtained model locks on
         the job models. Any jobs that are not in a valid status for being queued, are without job data, or are
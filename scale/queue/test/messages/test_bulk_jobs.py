@@ -0,0 +1,72 @@
+from __future__ import unicode_literals
+
+import django
+from django.test import TransactionTestCase
+from mock import patch
+
+import job.test.utils as job_test_utils
+from job.models import Job
+from queue.messages.cancel_jobs_bulk import CancelJobsBulk
+from queue.messages.requeue_jobs_bulk import RequeueJobsBulk
+
+
+class TestBulkJobsMessages(TransactionTestCase):
+
+    def setUp(self):
+        django.setup()
+
+        self.job_type = job_test_utils.create_job_type()
+        self.job_1 = job_test_utils.create_job(job_type=self.job_type, status='FAILED', num_exes=1)
+        self.job_2 = job_test_utils.create_job(job_type=self.job_type, status='FAILED', num_exes=1)
+        self.job_3 = job_test_utils.create_job(job_type=self.job_type, status='PENDING')
+        self.other_job = job_test_utils.create_job(status='FAILED', num_exes=1)
+
+    def test_json(self):
+        """Tests converting a bulk message to and from JSON"""
+
+        message = RequeueJobsBulk()
+        message.statuses = ['FAILED']
+        message.job_type_ids = [self.job_type.id]
+        message.priority = 10
+        message.current_job_id = 5
+        message.handled_count = 2
+
+        new_message = RequeueJobsBulk.from_json(message.to_json())
+        self.assertListEqual(new_message.statuses, ['FAILED'])
+        self.assertListEqual(new_message.job_type_ids, [self.job_type.id])
+        self.assertEqual(new_message.priority, 10)
+        self.assertEqual(new_message.current_job_id, 5)
+        self.assertEqual(new_message.handled_count, 2)
+
+    @patch('queue.messages.bulk_jobs.MAX_CHUNK_SIZE', 1)
+    def test_requeue_in_chunks(self):
+        """Tests that a bulk requeue message handles one chunk and sends a message for the next chunk"""
+
+        message = RequeueJobsBulk()
+        message.statuses = ['FAILED']
+        message.job_type_ids = [self.job_type.id]
+
+        # Run each message and the message it sends until there are no more chunks
+        chunk_count = 0
+        while message:
+            self.assertTrue(message.execute())
+            chunk_count += 1
+            message = message.new_messages[0] if message.new_messages else None
+
+        self.assertEqual(chunk_count, 3)
+        self.assertEqual(Job.objects.get(pk=self.job_1.id).status, 'QUEUED')
+        self.assertEqual(Job.objects.get(pk=self.job_2.id).status, 'QUEUED')
+        self.assertEqual(Job.objects.get(pk=self.other_job.id).status, 'FAILED')
+
+    def test_cancel(self):
+        """Tests that a bulk cancel message cancels the matching jobs"""
+
+        message = CancelJobsBulk()
+        message.job_type_ids = [self.job_type.id]
+
+        self.assertTrue(message.execute())
+        self.assertListEqual(message.new_messages, [])
+        self.assertEqual(message.handled_count, 3)
+        self.assertEqual(message.updated_count, 3)
+        self.assertEqual(Job.objects.filter(job_type=self.job_type, status='CANCELED').count(), 3)
+        self.assertEqual(Job.objects.get(pk=self.other_job.id).status, 'FAILED')
@@ -0,0 +1,64 @@
+from __future__ import unicode_literals
+
+import django
+from django.test import TransactionTestCase
+from django.utils.timezone import now
+
+import job.test.utils as job_test_utils
+from job.models import Job, JobExecution
+from queue.messages.completed_jobs import CompletedJobs
+from queue.messages.job_exe_end import JobExeEnd
+from queue.messages.queue_ready_jobs import QueueReadyJobs
+
+
+class TestJobLifecycleMessages(TransactionTestCase):
+
+    def setUp(self):
+        django.setup()
+
+    def test_completed_jobs_json(self):
+        """Tests converting a CompletedJobs message to and from JSON"""
+
+        when = now()
+        message = CompletedJobs()
+        message.add_job_exe_end(JobExeEnd(1, when, task_fields={'job_started': when, 'job_exit_code': 0}))
+
+        new_message = CompletedJobs.from_json(message.to_json())
+        self.assertEqual(len(new_message._job_exe_ends), 1)
+        job_exe_end = new_message._job_exe_ends[0]
+        self.assertEqual(job_exe_end.job_exe_id, 1)
+        self.assertEqual(job_exe_end.when, when)
+        self.assertEqual(job_exe_end.task_fields['job_started'], when)
+        self.assertEqual(job_exe_end.task_fields['job_exit_code'], 0)
+
+    def test_completed_jobs_execute(self):
+        """Tests executing a CompletedJobs message, including repeating it"""
+
+        job_exe = job_test_utils.create_job_exe(status='RUNNING')
+        when = now()
+        message = CompletedJobs()
+        message.add_job_exe_end(JobExeEnd(job_exe.id, when, task_fields={'job_exit_code': 0}))
+
+        self.assertTrue(message.execute())
+        job_exe = JobExecution.objects.get(pk=job_exe.id)
+        self.assertEqual(job_exe.status, 'COMPLETED')
+        self.assertEqual(job_exe.job_exit_code, 0)
+        self.assertEqual(Job.objects.get(pk=job_exe.job_id).status, 'COMPLETED')
+
+        # Repeating the message should have no effect
+        self.assertTrue(CompletedJobs.from_json(message.to_json()).execute())
+        self.assertEqual(JobExecution.objects.get(pk=job_exe.id).status, 'COMPLETED')
+
+    def test_queue_ready_jobs(self):
+        """Tests that a QueueReadyJobs message only queues jobs that still have the same number of executions"""
+
+        job_1 = job_test_utils.create_job(status='PENDING', num_exes=0)
+        job_2 = job_test_utils.create_job(status='FAILED', num_exes=2)
+
+        message = QueueReadyJobs()
+        message.jobs = {job_1.id: 0, job_2.id: 1}
+        message = QueueReadyJobs.from_json(message.to_json())
+
+        self.assertTrue(message.execute())
+        self.assertEqual(Job.objects.get(pk=job_1.id).status, 'QUEUED')
+        self.assertEqual(Job.objects.get(pk=job_2.id).status, 'FAILED')
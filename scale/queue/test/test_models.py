@@ -231,6 +231,35 @@ class TestQueueManager(TransactionTestCase):
         self.assertEqual(job_exe.error_id, error.id)
 
 
+class TestQueueManagerCancelJobs(TransactionTestCase):
+
+    def setUp(self):
+        django.setup()
+
+    def test_successful(self):
+        """Tests calling QueueManager.cancel_jobs() successfully with jobs in different statuses."""
+
+        pending_job = job_test_utils.create_job(status='PENDING')
+        queued_job = job_test_utils.create_job()
+        queued_job_exe_id = Queue.objects._queue_jobs([queued_job])[0].id
+        running_job_exe = job_test_utils.create_job_exe()
+        completed_job = job_test_utils.create_job(status='COMPLETED')
+        job_test_utils.create_job_exe(job=completed_job, status='COMPLETED')
+
+        job_ids = [pending_job.id, queued_job.id, running_job_exe.job_id, completed_job.id]
+        count = Queue.objects.cancel_jobs(job_ids, now())
+
+        self.assertEqual(count, 3)
+        statuses = dict(Job.objects.filter(id__in=job_ids).values_list('id', 'status'))
+        self.assertEqual(statuses[pending_job.id], 'CANCELED')
+        self.assertEqual(statuses[queued_job.id], 'CANCELED')
+        self.assertEqual(statuses[running_job_exe.job_id], 'CANCELED')
+        self.assertEqual(statuses[completed_job.id], 'COMPLETED')
+        self.assertEqual(JobExecution.objects.get(pk=queued_job_exe_id).status, 'CANCELED')
+        self.assertEqual(JobExecution.objects.get(pk=running_job_exe.id).status, 'CANCELED')
+        self.assertEqual(Queue.objects.filter(job_exe_id=queued_job_exe_id).count(), 0)
+
+
 class TestQueueManagerHandleJobCancellation(TransactionTestCase):
 
     def setUp(self):
@@ -6,6 +6,7 @@ import time
 import django
 import django.utils.timezone as timezone
 from django.test import TestCase, TransactionTestCase
+from mock import patch
 from rest_framework import status
 
 import error.test.utils as error_test_utils
@@ -545,3 +546,33 @@ class TestRequeueJobsView(TestCase):
         self.assertEqual(result['results'][0]['id'], self.job_2.id)
         self.assertEqual(result['results'][0]['status'], 'QUEUED')
         self.assertEqual(result['results'][0]['priority'], 123)
+
+
+class TestCancelJobsBulkView(TestCase):
+
+    def setUp(self):
+        django.setup()
+
+    @patch('queue.views.CommandMessageManager')
+    def test_no_filters(self, mock_msg_mgr):
+        """Tests calling the cancel jobs bulk view without any filters, which must not cancel every job"""
+
+        url = rest_util.get_url('/queue/cancel-jobs/bulk/')
+        response = self.client.post(url, json.dumps({}), 'application/json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, response.content)
+        self.assertFalse(mock_msg_mgr.return_value.send_messages.called)
+
+    @patch('queue.views.CommandMessageManager')
+    def test_successful(self, mock_msg_mgr):
+        """Tests calling the cancel jobs bulk view with a filter"""
+
+        json_data = {
+            'job_type_ids': [1, 2],
+        }
+
+        url = rest_util.get_url('/queue/cancel-jobs/bulk/')
+        response = self.client.post(url, json.dumps(json_data), 'application/json')
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED, response.content)
+
+        message = mock_msg_mgr.return_value.send_messages.call_args[0][0][0]
+        self.assertListEqual(message.job_type_ids, [1, 2])
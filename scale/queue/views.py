@@ -15,16 +15,44 @@ import util.rest as rest_util
 from job.configuration.data.exceptions import InvalidData
 from job.models import Job, JobType
 from job.serializers import JobDetailsSerializer, JobSerializer
+from messaging.manager import CommandMessageManager
+from queue.messages.cancel_jobs_bulk import CancelJobsBulk
+from queue.messages.requeue_jobs_bulk import RequeueJobsBulk
 from queue.models import JobLoad, Queue
 from queue.serializers import JobLoadGroupSerializer, QueueStatusSerializer, RequeueJobSerializer
 from recipe.configuration.data.exceptions import InvalidRecipeData
 from recipe.configuration.data.recipe_data import RecipeData
 from recipe.models import Recipe, RecipeType
 from recipe.serializers import RecipeDetailsSerializer
+from util.rest import BadParameter
 
 logger = logging.getLogger(__name__)
 
 
+class CancelJobsBulkView(GenericAPIView):
+    """This view is the endpoint for canceling all jobs that match a filter."""
+    parser_classes = (JSONParser,)
+    queryset = Job.objects.all()
+    serializer_class = RequeueJobSerializer
+
+    def post(self, request):
+        """Sends a command message that asynchronously cancels all jobs matching the filters in chunks
+
+        :param request: the HTTP POST request
+        :type request: :class:`rest_framework.request.Request`
+        :rtype: :class:`rest_framework.response.Response`
+        :returns: the HTTP response to send back to the user
+        """
+
+        message = CancelJobsBulk()
+        _populate_bulk_jobs_message(request, message)
+        if not _has_bulk_jobs_filter(message):
+            raise BadParameter('At least one filter is required to cancel jobs in bulk')
+        CommandMessageManager().send_messages([message])
+
+        return Response(status=status.HTTP_202_ACCEPTED)
+
+
 class JobLoadView(ListAPIView):
     """This view is the endpoint for retrieving the job load for a given time range."""
     queryset = JobLoad.objects.all()
@@ -194,3 +222,62 @@ class RequeueJobsView(GenericAPIView):
         page = self.paginate_queryset(jobs)
         serializer = JobSerializer(page, many=True)
         return self.get_paginated_response(serializer.data)
+
+
+class RequeueJobsBulkView(GenericAPIView):
+    """This view is the endpoint for re-queuing all jobs that match a filter."""
+    parser_classes = (JSONParser,)
+    queryset = Job.objects.all()
+    serializer_class = RequeueJobSerializer
+
+    def post(self, request):
+        """Sends a command message that asynchronously re-queues all jobs matching the filters in chunks
+
+        :param request: the HTTP POST request
+        :type request: :class:`rest_framework.request.Request`
+        :rtype: :class:`rest_framework.response.Response`
+        :returns: the HTTP response to send back to the user
+        """
+
+        message = RequeueJobsBulk()
+        _populate_bulk_jobs_message(request, message)
+        message.priority = rest_util.parse_int(request, 'priority', required=False)
+        CommandMessageManager().send_messages([message])
+
+        return Response(status=status.HTTP_202_ACCEPTED)
+
+
+def _has_bulk_jobs_filter(message):
+    """Indicates whether the given bulk jobs message has at least one job filter, without any filter it matches every
+    job
+
+    :param message: The bulk jobs message
+    :type message: :class:`queue.messages.bulk_jobs.BulkJobsCommandMessage`
+    :returns: True if the message has a job filter, False otherwise
+    :rtype: bool
+    """
+
+    return any([message.started, message.ended, message.statuses, message.job_ids, message.job_type_ids,
+                message.job_type_names, message.job_type_categories, message.error_categories])
+
+
+def _populate_bulk_jobs_message(request, message):
+    """Populates the job filter of the given bulk jobs message from the request
+
+    :param request: the HTTP POST request
+    :type request: :class:`rest_framework.request.Request`
+    :param message: The bulk jobs message
+    :type message: :class:`queue.messages.bulk_jobs.BulkJobsCommandMessage`
+    """
+
+    message.started = rest_util.parse_timestamp(request, 'started', required=False)
+    message.ended = rest_util.parse_timestamp(request, 'ended', required=False)
+    rest_util.check_time_range(message.started, message.ended)
+
+    job_status = rest_util.parse_string(request, 'status', required=False)
+    message.statuses = [job_status] if job_status else None
+    message.job_ids = rest_util.parse_int_list(request, 'job_ids', required=False)
+    message.job_type_ids = rest_util.parse_int_list(request, 'job_type_ids', required=False)
+    message.job_type_names = rest_util.parse_string_list(request, 'job_type_names', required=False)
+    message.job_type_categories = rest_util.parse_string_list(request, 'job_type_categories', required=False)
+    message.error_categories = rest_util.parse_string_list(request, 'error_categories', required=False)
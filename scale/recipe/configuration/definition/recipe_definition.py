@@ -2,7 +2,6 @@
 from __future__ import unicode_literals
 
 from django.db.models import Q
-from jsonschema import validate
 from jsonschema.exceptions import ValidationError
 
 from job.configuration.data.exceptions import InvalidConnection
@@ -15,6 +14,7 @@ from job.models import JobType
 from recipe.configuration.data.exceptions import InvalidRecipeConnection
 from recipe.configuration.definition.exceptions import InvalidDefinition
 from recipe.handlers.graph import RecipeGraph
+from util.validation import validate
 
 
 DEFAULT_VERSION = '1.0'
@@ -16,6 +16,7 @@ class RecipeGraph(object):
         self.inputs = {}  # {Input name: Input}
         self._nodes = {}  # {Job name: Node}
         self._root_nodes = {}  # {Job name: Node}
+        self._topological_order = None  # Cached list of job names, cleared whenever the graph changes
 
     def add_dependency(self, parent_job_name, child_job_name, connections):
         """Adds a dependency that one job has upon another job
@@ -39,6 +40,7 @@ class RecipeGraph(object):
 
         child_node.add_dependency(parent_node, dependency_connections)
         parent_node.add_child(child_node)
+        self._topological_order = None
         if child_job_name in self._root_nodes:
             del self._root_nodes[child_job_name]
 
@@ -68,6 +70,7 @@ class RecipeGraph(object):
         node = RecipeNode(job_name, job_type_name, job_type_version)
         self._nodes[job_name] = node
         self._root_nodes[job_name] = node
+        self._topological_order = None
 
     def add_recipe_input_connection(self, recipe_input, job_name, job_input):
         """Adds a recipe input connection from the given recipe input to the given job input
@@ -89,6 +92,24 @@ class RecipeGraph(object):
         input_conn = RecipeInputConnection(job_input, self.inputs[recipe_input])
         self.get_node(job_name).add_recipe_input(input_conn)
 
+    def get_dependent_job_names(self, job_name):
+        """Returns the names of all of the jobs that depend upon the job with the given name, directly or indirectly
+
+        :param job_name: The job name
+        :type job_name: string
+        :returns: The set of names of the dependent jobs
+        :rtype: {string}
+        """
+
+        job_names = set()
+        nodes_to_visit = list(self.get_node(job_name).children)
+        while nodes_to_visit:
+            node = nodes_to_visit.pop()
+            if node.job_name not in job_names:
+                job_names.add(node.job_name)
+                nodes_to_visit.extend(node.children)
+        return job_names
+
     def get_node(self, job_name):
         """Returns the node with the given job_name
 
@@ -109,16 +130,20 @@ class RecipeGraph(object):
         :rtype: [string]
         """
 
-        results = []
-        perm_set = set()
-        temp_set = set()
-        unmarked_set = set(self._nodes.keys())
-        while unmarked_set:
-            job_name = unmarked_set.pop()
-            node = self._nodes[job_name]
-            self._get_topological_order_visit(node, results, perm_set, temp_set)
-            unmarked_set = set(self._nodes.keys()) - perm_set
-        return results
+        if self._topological_order is None:
+            results = []
+            perm_set = set()
+            temp_set = set()
+            unmarked_set = set(self._nodes.keys())
+            while unmarked_set:
+                job_name = unmarked_set.pop()
+                node = self._nodes[job_name]
+                self._get_topological_order_visit(node, results, perm_set, temp_set)
+                unmarked_set = set(self._nodes.keys()) - perm_set
+            self._topological_order = results
+
+        # Return a copy so that callers are free to modify the list
+        return list(self._topological_order)
 
     def _get_topological_order_visit(self, node, results, perm_set, temp_set):
         """Recursive depth-first search algorithm for determining a topological ordering of the recipe jobs
@@ -20,7 +20,7 @@ class RecipeHandler(object):
         self.recipe_jobs = recipe_jobs
 
         self._data = recipe.get_recipe_data()
-        self._graph = recipe.get_recipe_definition().get_graph()
+        self._graph = recipe.get_recipe_graph()
         self._jobs_by_id = {}  # {Job ID: Recipe Job}
         self._jobs_by_name = {}  # {Job Name: Recipe Job}
 
@@ -17,6 +17,14 @@ from recipe.triggers.configuration.trigger_rule import RecipeTriggerRuleConfigur
 from storage.models import ScaleFile
 from trigger.configuration.exceptions import InvalidTriggerType
 from trigger.models import TriggerEvent, TriggerRule
+from util.memoize import ParsedObjectCache, parse_read_only
+
+
+# Parsed recipe definitions keyed by recipe type revision ID (revisions are never modified once they are created)
+recipe_definition_cache = ParsedObjectCache()
+
+# Recipe graphs keyed by recipe type revision ID, built once from the cached recipe definitions
+recipe_graph_cache = ParsedObjectCache()
 
 
 # IMPORTANT NOTE: Locking order
@@ -213,6 +221,110 @@ class RecipeManager(models.Manager):
         RecipeJob.objects.bulk_create(recipe_jobs_to_create)
         return recipe_jobs_to_create
 
+    def get_completed_recipe_ids(self, recipe_ids):
+        """Returns the IDs of the given recipes where every job has been completed
+
+        :param recipe_ids: The recipe IDs
+        :type recipe_ids: [int]
+        :returns: The IDs of the completed recipes
+        :rtype: [int]
+        """
+
+        recipe_job_qry = RecipeJob.objects.filter(recipe_id__in=recipe_ids).exclude(job__status='COMPLETED')
+        incomplete_recipe_ids = set(recipe_job_qry.values_list('recipe_id', flat=True).distinct())
+        return [recipe_id for recipe_id in recipe_ids if recipe_id not in incomplete_recipe_ids]
+
+    def get_jobs_to_queue_for_completed_jobs(self, job_ids):
+        """Returns the recipe jobs that have become ready to be queued now that the jobs with the given IDs have been
+        completed, along with their data. Instead of building a handler for the entire recipe of each completed job,
+        only the direct children of the completed jobs (found using the cached recipe graphs) and the parents of those
+        children are loaded, so this works for many completed jobs at once. The caller must first have obtained model
+        locks on all of the job models for the given IDs. This method will acquire model locks on the PENDING children
+        of the given jobs, allowing their data to be populated. The children of superseded jobs are not returned.
+
+        :param job_ids: The IDs of the completed jobs
+        :type job_ids: [int]
+        :returns: The list of jobs that are ready to be queued along with their data, and the set of IDs of the
+            non-superseded recipes that contain the given jobs
+        :rtype: ([(:class:`job.models.Job`, :class:`job.configuration.data.job_data.JobData`)], {int})
+        """
+
+        # Find the names of the children of each completed job from the cached recipe graphs
+        recipe_ids = set()
+        graph_per_recipe = {}  # {Recipe ID: Recipe graph}
+        child_names_per_recipe = {}  # {Recipe ID: {Job name}}
+        recipe_job_qry = RecipeJob.objects.filter(job_id__in=job_ids, recipe__is_superseded=False)
+        for recipe_id, job_name, is_superseded, recipe_type_rev_id in recipe_job_qry.values_list(
+                'recipe_id', 'job_name', 'job__is_superseded', 'recipe__recipe_type_rev_id').iterator():
+            recipe_ids.add(recipe_id)
+            if is_superseded:
+                continue  # Do not queue dependent jobs for superseded jobs
+            graph = self._get_recipe_graph(recipe_type_rev_id)
+            graph_per_recipe[recipe_id] = graph
+            if recipe_id not in child_names_per_recipe:
+                child_names_per_recipe[recipe_id] = set()
+            for child_node in graph.get_node(job_name).children:
+                child_names_per_recipe[recipe_id].add(child_node.job_name)
+        if not child_names_per_recipe:
+            return [], recipe_ids
+
+        # Lock the children that are PENDING, only they are able to be queued
+        all_child_names = set.union(*child_names_per_recipe.values())
+        child_qry = RecipeJob.objects.filter(recipe_id__in=child_names_per_recipe.keys(), job_name__in=all_child_names)
+        child_qry = child_qry.filter(job__status='PENDING')
+        child_job_ids = set()
+        for recipe_id, job_name, job_id in child_qry.values_list('recipe_id', 'job_name', 'job_id').iterator():
+            if job_name in child_names_per_recipe[recipe_id]:
+                child_job_ids.add(job_id)
+        if not child_job_ids:
+            return [], recipe_ids
+        Job.objects.lock_jobs(child_job_ids)
+
+        # Load the locked children and all of their parents in a single query
+        names_to_load = set(all_child_names)
+        for recipe_id, child_names in child_names_per_recipe.items():
+            graph = graph_per_recipe[recipe_id]
+            for job_name in child_names:
+                names_to_load.update(parent_node.job_name for parent_node in graph.get_node(job_name).parents)
+        recipe_job_qry = RecipeJob.objects.select_related('recipe', 'job__job_type', 'job__job_type_rev')
+        recipe_job_qry = recipe_job_qry.filter(recipe_id__in=child_names_per_recipe.keys(), job_name__in=names_to_load)
+        jobs_per_recipe = {}  # {Recipe ID: {Job name: Recipe job}}
+        for recipe_job in recipe_job_qry.iterator():
+            if recipe_job.recipe_id not in jobs_per_recipe:
+                jobs_per_recipe[recipe_job.recipe_id] = {}
+            jobs_per_recipe[recipe_job.recipe_id][recipe_job.job_name] = recipe_job
+
+        # Create the data for each child whose parents have all completed
+        jobs_to_queue = []
+        for recipe_id, child_names in child_names_per_recipe.items():
+            graph = graph_per_recipe[recipe_id]
+            recipe_jobs_by_name = jobs_per_recipe.get(recipe_id, {})
+            recipe_data = None
+            for job_name in child_names:
+                if job_name not in recipe_jobs_by_name:
+                    continue
+                recipe_job = recipe_jobs_by_name[job_name]
+                job = recipe_job.job
+                if job.id not in child_job_ids or job.status != 'PENDING':
+                    continue  # Only PENDING jobs are able to be queued
+                node = graph.get_node(job_name)
+                parent_results = {}  # {Job name: Job results}
+                for parent_node in node.parents:
+                    parent_recipe_job = recipe_jobs_by_name.get(parent_node.job_name)
+                    if not parent_recipe_job or parent_recipe_job.job.status != 'COMPLETED':
+                        parent_results = None
+                        break
+                    parent_results[parent_node.job_name] = parent_recipe_job.job.get_job_results()
+                if parent_results is None:
+                    continue  # Only queue jobs whose parents have completed
+
+                if recipe_data is None:
+                    recipe_data = recipe_job.recipe.get_recipe_data()
+                job_data = node.create_job_data(job.get_job_interface(), recipe_data, parent_results)
+                jobs_to_queue.append((job, job_data))
+
+        return jobs_to_queue, recipe_ids
+
     def get_recipe_for_job(self, job_id):
         """Returns the original recipe for the job with the given ID (returns None if the job is not in a recipe). The
         returned model will have its related recipe_type and recipe_type_rev models populated. If the job exists in
@@ -261,32 +373,52 @@ class RecipeManager(models.Manager):
         """
 
         # Figure out the non-superseded recipe ID (if applicable) for each job ID
-        recipe_id_per_job_id = {}  # {Job ID: Recipe ID}
-        for recipe_job in RecipeJob.objects.filter(job_id__in=job_ids, recipe__is_superseded=False).iterator():
-            # A job should match at most one non-superseded recipe
-            recipe_id_per_job_id[recipe_job.job_id] = recipe_job.recipe_id
+        recipe_id_per_job_id = self.get_recipe_ids_for_jobs(job_ids)
         if not recipe_id_per_job_id:
-            return {}
-
-        # Get handlers for all recipes and figure out dependent jobs to lock
-        recipe_ids = recipe_id_per_job_id.values()
-        handlers = self._get_recipe_handlers(recipe_ids)
+            return []
+
+        # Figure out the dependent jobs to lock from the cached recipe graphs, without building the handlers
+        recipe_ids = set(recipe_id_per_job_id.values())
+        job_ids_per_recipe = {}  # {Recipe ID: {Job name: Job ID}}
+        graph_per_recipe = {}  # {Recipe ID: Recipe graph}
+        recipe_job_qry = RecipeJob.objects.filter(recipe_id__in=recipe_ids)
+        for recipe_id, job_name, job_id, recipe_type_rev_id in recipe_job_qry.values_list(
+                'recipe_id', 'job_name', 'job_id', 'recipe__recipe_type_rev_id').iterator():
+            if recipe_id not in job_ids_per_recipe:
+                job_ids_per_recipe[recipe_id] = {}
+                graph_per_recipe[recipe_id] = self._get_recipe_graph(recipe_type_rev_id)
+            job_ids_per_recipe[recipe_id][job_name] = job_id
         job_ids_to_lock = set()
-        for job_id in recipe_id_per_job_id:
-            recipe_id = recipe_id_per_job_id[job_id]
-            if recipe_id in handlers:
-                handler = handlers[recipe_id]
-                job_ids_to_lock |= handler.get_dependent_job_ids(job_id)  # Add dependent IDs by doing set union
+        for recipe_id, job_ids_by_name in job_ids_per_recipe.items():
+            graph = graph_per_recipe[recipe_id]
+            for job_name, job_id in job_ids_by_name.items():
+                if recipe_id_per_job_id.get(job_id) == recipe_id:
+                    for dependent_name in graph.get_dependent_job_names(job_name):
+                        job_ids_to_lock.add(job_ids_by_name[dependent_name])
+
+        if job_ids_to_lock:
+            # Lock dependent recipe jobs
+            Job.objects.lock_jobs(job_ids_to_lock)
+
+        # Return handlers with data loaded after all dependent jobs have been locked
+        return self._get_recipe_handlers(recipe_ids).values()
 
-        if not job_ids_to_lock:
-            # No dependent jobs, just return handlers
-            return handlers.values()
+    def get_recipe_ids_for_jobs(self, job_ids):
+        """Returns the ID of the non-superseded recipe containing each of the jobs with the given IDs. Jobs that are not
+        in a non-superseded recipe are not included.
 
-        # Lock dependent recipe jobs
-        Job.objects.lock_jobs(job_ids_to_lock)
+        :param job_ids: The job IDs
+        :type job_ids: [int]
+        :returns: Dict where each job ID maps to the ID of its recipe
+        :rtype: {int: int}
+        """
 
-        # Return handlers with updated data after all dependent jobs have been locked
-        return self._get_recipe_handlers(recipe_ids).values()
+        recipe_id_per_job_id = {}  # {Job ID: Recipe ID}
+        recipe_job_qry = RecipeJob.objects.filter(job_id__in=job_ids, recipe__is_superseded=False)
+        for job_id, recipe_id in recipe_job_qry.values_list('job_id', 'recipe_id').iterator():
+            # A job should match at most one non-superseded recipe
+            recipe_id_per_job_id[job_id] = recipe_id
+        return recipe_id_per_job_id
 
     def get_recipes(self, started=None, ended=None, type_ids=None, type_names=None, batch_ids=None, 
                     include_superseded=False, order=None):
@@ -446,6 +578,23 @@ class RecipeManager(models.Manager):
         except ImportError:
             raise ReprocessError('Unable to import from queue application')
 
+    def _get_recipe_graph(self, recipe_type_rev_id):
+        """Returns the cached recipe graph for the given recipe type revision ID. The graph is shared, so it must not be
+        modified.
+
+        :param recipe_type_rev_id: The recipe type revision ID
+        :type recipe_type_rev_id: int
+        :returns: The recipe graph
+        :rtype: :class:`recipe.handlers.graph.RecipeGraph`
+        """
+
+        def build_graph():
+            definition = recipe_definition_cache.get(recipe_type_rev_id, lambda: parse_read_only(
+                RecipeDefinition, RecipeTypeRevision.objects.get(id=recipe_type_rev_id).definition))
+            return definition.get_graph()
+
+        return recipe_graph_cache.get(recipe_type_rev_id, build_graph)
+
     def _get_recipe_handlers(self, recipe_ids):
         """Returns the handlers for the given recipe IDs. If a given recipe ID is not valid it will not be included in
         the results.
@@ -563,13 +712,25 @@ class Recipe(models.Model):
         return RecipeData(self.data)
 
     def get_recipe_definition(self):
-        """Returns the definition for this recipe
+        """Returns the definition for this recipe. The definition is parsed once per recipe type revision and shared, so
+        its JSON is read-only.
 
         :returns: The definition for this recipe
         :rtype: :class:`recipe.configuration.definition.recipe_definition.RecipeDefinition`
         """
 
-        return RecipeDefinition(self.recipe_type_rev.definition)
+        return recipe_definition_cache.get(
+            self.recipe_type_rev_id, lambda: parse_read_only(RecipeDefinition, self.recipe_type_rev.definition))
+
+    def get_recipe_graph(self):
+        """Returns the graph for this recipe. The graph is built once per recipe type revision and shared, so it must
+        not be modified.
+
+        :returns: The graph for this recipe
+        :rtype: :class:`recipe.handlers.graph.RecipeGraph`
+        """
+
+        return recipe_graph_cache.get(self.recipe_type_rev_id, lambda: self.get_recipe_definition().get_graph())
 
     class Meta(object):
         """meta information for the db"""
@@ -1012,13 +1173,14 @@ class RecipeTypeRevision(models.Model):
     objects = RecipeTypeRevisionManager()
 
     def get_recipe_definition(self):
-        """Returns the recipe type definition for this revision
+        """Returns the recipe type definition for this revision. The definition is parsed once per revision and shared,
+        so its JSON is read-only.
 
         :returns: The recipe type definition for this revision
         :rtype: :class:`recipe.configuration.definition.recipe_definition.RecipeDefinition`
         """
 
-        return RecipeDefinition(self.definition)
+        return recipe_definition_cache.get(self.id, lambda: parse_read_only(RecipeDefinition, self.definition))
 
     class Meta(object):
         """meta information for the db"""
@@ -160,3 +160,10 @@ class TestRecipeGraph(TestCase):
         valid_order = ['Job C', 'Job B', 'Job A', 'Job E', 'Job D', 'Job G', 'Job F', 'Job H']
 
         self.assertListEqual(order, valid_order)
+
+    def test_get_dependent_job_names(self):
+        """Tests calling RecipeGraph.get_dependent_job_names() successfully"""
+
+        self.assertSetEqual(self.graph.get_dependent_job_names('Job B'), {'Job D', 'Job E', 'Job F', 'Job G', 'Job H'})
+        self.assertSetEqual(self.graph.get_dependent_job_names('Job C'), {'Job H'})
+        self.assertSetEqual(self.graph.get_dependent_job_names('Job F'), set())
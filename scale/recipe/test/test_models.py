@@ -347,6 +347,48 @@ class TestRecipeManager(TransactionTestCase):
             recipe_ids.add(handler.recipe.id)
         self.assertSetEqual(recipe_ids, {self.recipe_a.id, self.recipe_b.id})
 
+    @patch('recipe.models.Job.objects.lock_jobs')
+    def test_get_jobs_to_queue_for_completed_jobs(self, mock_lock_jobs):
+        """Tests calling RecipeManager.get_jobs_to_queue_for_completed_jobs() successfully"""
+
+        job_type_1 = job_test_utils.create_job_type()
+        job_type_2 = job_test_utils.create_job_type()
+        job_type_3 = job_test_utils.create_job_type()
+        definition = {
+            'version': '1.0',
+            'input_data': [],
+            'jobs': [{
+                'name': 'Job 1',
+                'job_type': {'name': job_type_1.name, 'version': job_type_1.version},
+            }, {
+                'name': 'Job 2',
+                'job_type': {'name': job_type_2.name, 'version': job_type_2.version},
+                'dependencies': [{'name': 'Job 1'}],
+            }, {
+                'name': 'Job 3',
+                'job_type': {'name': job_type_3.name, 'version': job_type_3.version},
+                'dependencies': [{'name': 'Job 1'}, {'name': 'Job 2'}],
+            }],
+        }
+        recipe_type = recipe_test_utils.create_recipe_type(definition=definition)
+        job_1 = job_test_utils.create_job(job_type=job_type_1, status='COMPLETED')
+        job_2 = job_test_utils.create_job(job_type=job_type_2, status='PENDING')
+        job_3 = job_test_utils.create_job(job_type=job_type_3, status='PENDING')
+        recipe = recipe_test_utils.create_recipe(recipe_type=recipe_type,
+                                                 data={'version': '1.0', 'input_data': [], 'workspace_id': 1})
+        recipe_test_utils.create_recipe_job(recipe=recipe, job_name='Job 1', job=job_1)
+        recipe_test_utils.create_recipe_job(recipe=recipe, job_name='Job 2', job=job_2)
+        recipe_test_utils.create_recipe_job(recipe=recipe, job_name='Job 3', job=job_3)
+
+        jobs_to_queue, recipe_ids = Recipe.objects.get_jobs_to_queue_for_completed_jobs([job_1.id,
+                                                                                          self.standalone_job.id])
+
+        # Job 3 is not ready since Job 2 has not completed
+        mock_lock_jobs.assert_called_with({job_2.id, job_3.id})
+        self.assertListEqual([job.id for job, _job_data in jobs_to_queue], [job_2.id])
+        self.assertSetEqual(recipe_ids, {recipe.id})
+        self.assertListEqual(Recipe.objects.get_completed_recipe_ids([recipe.id]), [])
+
 
 class TestRecipeManagerCreateRecipe(TransactionTestCase):
 
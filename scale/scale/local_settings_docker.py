@@ -51,6 +51,9 @@ if ELASTICSEARCH_URLS:
 # Broker URL for connection to messaging backend. Bootstrap must populate.
 BROKER_URL = os.environ.get('SCALE_BROKER_URL', BROKER_URL)
 QUEUE_NAME = os.environ.get('SCALE_QUEUE_NAME', QUEUE_NAME)
+JOB_LIFECYCLE_MESSAGES_ENABLED = os.environ.get('SCALE_JOB_LIFECYCLE_MESSAGES', 'false').lower() in ['true', '1', 't']
+RESOURCE_USAGE_SAMPLING_ENABLED = os.environ.get('SCALE_RESOURCE_USAGE_SAMPLING', 'false').lower() in ['true', '1', 't']
+SCHEDULER_RESOURCE_PROFILES_ENABLED = os.environ.get('SCALE_RESOURCE_PROFILES', 'false').lower() in ['true', '1', 't']
 
 DB_HOST = os.environ.get('SCALE_DB_HOST', '')
 if DB_HOST == '':
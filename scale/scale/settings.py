@@ -26,6 +26,38 @@ MESOS_MASTER = None
 
 # Zookeeper URL for scheduler leader election. If this is None, only a single scheduler is used.
 SCHEDULER_ZK = None
+# Whether lower priority jobs may backfill a node reserved for a higher priority job when they are predicted to finish
+# before the reserved job could start
+SCHEDULER_BACKFILL_ENABLED = False
+# Number of days of job type metrics used to estimate job run times for backfill scheduling
+SCHEDULER_BACKFILL_HISTORY_DAYS = 7
+# Whether the scheduler saves task updates and its status and checks for canceled job executions in a separate worker
+# process, keeping that database work off of the process that runs scheduling and the Mesos driver callbacks
+SCHEDULER_DATABASE_WORKER_ENABLED = True
+# Whether the scheduler hands completed and failed job executions to the message workers (scale_process_messages)
+# instead of updating the database itself
+JOB_LIFECYCLE_MESSAGES_ENABLED = False
+# Whether the scheduler samples the resources used by running jobs from the Mesos agents every 30 seconds and saves the
+# largest samples with each job execution. The samples are point-in-time values (such as the resident memory), so they
+# underestimate the true peaks, and jobs that finish within 30 seconds are usually never sampled.
+RESOURCE_USAGE_SAMPLING_ENABLED = False
+# Whether the scheduler schedules jobs with the resources that recent jobs of the same type actually used (a percentile
+# of the sampled peaks), instead of the resources the job type requests, once enough samples exist. Jobs that are being
+# retried are always scheduled with the resources the job type requests.
+SCHEDULER_RESOURCE_PROFILES_ENABLED = False
+# The percentile of the sampled resource usage peaks that is used for scheduling jobs. The profiled resources become the
+# limits of the job's container, so anything below 100 (the largest peak) will get some jobs killed for using too much
+# memory. Since the sampled peaks underestimate the true peaks, the profile also adds headroom.
+SCHEDULER_RESOURCE_PROFILE_PERCENTILE = 100
+# Number of days of completed job executions used to calculate the resource usage of each job type
+SCHEDULER_RESOURCE_PROFILE_HISTORY_DAYS = 7
+
+# The number of days that finished history rows are kept before the scale_purge_history job deletes them, None keeps
+# the rows forever
+LOG_ENTRY_RETENTION_DAYS = 30
+JOB_LOAD_RETENTION_DAYS = 90
+TASK_UPDATE_RETENTION_DAYS = 30
+INGEST_RETENTION_DAYS = None
 
 # The full name for the Scale Docker image (without version tag)
 SCALE_DOCKER_IMAGE = 'geoint/scale'
@@ -37,6 +69,9 @@ CONFIG_URI = None
 # Directory for rotating metrics storage
 METRICS_DIR = None
 
+# Number of seconds that columnar metrics plot responses are cached for identical query parameters
+METRICS_PLOT_CACHE_TIMEOUT = 300
+
 # URL for logstash, or None to disable logstash
 LOGGING_ADDRESS = None
 LOGGING_HEALTH_ADDRESS = None
@@ -58,6 +93,12 @@ SECRETS_TOKEN = None
 DCOS_SERVICE_ACCOUNT = None
 # Flag for raising SSL warnings associated with secrets transactions.
 SECRETS_SSL_WARNINGS = True
+# Number of seconds that cached job type secrets are used before being fetched again
+SECRETS_CACHE_TTL = 300
+# Maximum number of concurrent requests made to the secrets backend
+SECRETS_MAX_CONCURRENT_REQUESTS = 10
+# Number of seconds that a secrets backend authentication is re-used before authenticating again
+SECRETS_TOKEN_LIFETIME = 3600
 
 # Quick-start development settings - unsuitable for production
 # See https://docs.djangoproject.com/en/1.7/howto/deployment/checklist/
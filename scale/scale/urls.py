@@ -22,6 +22,7 @@ REST_API_APPS = [
     'queue',
     'recipe',
     'scheduler',
+    'shared_resource',
     'source',
     'storage',
 ]
@@ -1,14 +1,32 @@
 """Defines the class that handles a node's cleanup"""
 from __future__ import unicode_literals
 
+import datetime
 import logging
+import math
+from collections import deque
+
+from django.utils.timezone import now
 
 from job.execution.tasks.cleanup_task import CleanupTask
 from scheduler.manager import scheduler_mgr
 
 
+# The number of job executions waiting to be cleaned up on a node that triggers a warning
 JOB_EXES_WARNING_THRESHOLD = 100
-MAX_JOB_EXES_PER_CLEANUP = 25
+
+# The minimum and maximum number of job executions that are cleaned up by a single cleanup task. Between these limits
+# the batch size grows with the backlog, taking BACKLOG_FRACTION of the waiting job executions in each task.
+MIN_JOB_EXES_PER_CLEANUP = 25
+MAX_JOB_EXES_PER_CLEANUP = 250
+BACKLOG_FRACTION = 0.5
+
+# The amount of disk space in MiB scheduled for the job executions waiting to be cleaned up on a node that indicates
+# disk pressure, under disk pressure every cleanup task takes the maximum batch size
+DISK_PRESSURE_THRESHOLD = 50 * 1024.0
+
+# The period of time over which the cleanup drain rate is measured
+DRAIN_RATE_PERIOD = datetime.timedelta(minutes=10)
 
 
 logger = logging.getLogger(__name__)
@@ -21,6 +39,7 @@ class NodeCleanup(object):
         """Constructor
         """
 
+        self._cleaned_history = deque()  # (When, Number of job executions cleaned up) for the drain rate
         self._job_exes = {}  # {Job Exe ID: RunningJobExecution}
 
     def add_job_execution(self, job_exe):
@@ -39,9 +58,12 @@ class NodeCleanup(object):
         :type job_exes: [:class:`job.execution.job_exe.RunningJobExecution`]
         """
 
+        num_deleted = 0
         for job_exe in job_exes:
             if job_exe.id in self._job_exes:
                 del self._job_exes[job_exe.id]
+                num_deleted += 1
+        self._cleaned_history.append((now(), num_deleted))
 
     def create_next_task(self, agent_id, hostname, is_initial_cleanup_completed):
         """Creates and returns the next cleanup task that needs to be run, possibly None
@@ -56,8 +78,7 @@ class NodeCleanup(object):
         :rtype: :class:`job.tasks.base_task.Task`
         """
 
-        total_job_exes = self._job_exes.values()
-        count = len(total_job_exes)
+        count = len(self._job_exes)
         if count > JOB_EXES_WARNING_THRESHOLD:
             logger.warning('Node %s has %d job executions waiting to be cleaned up', hostname, count)
 
@@ -66,13 +87,21 @@ class NodeCleanup(object):
             if count == 0:
                 # No job executions to clean, so no task
                 return None
-            for job_exe in total_job_exes:
-                cleanup_job_exes.append(job_exe)
-                if len(cleanup_job_exes) >= MAX_JOB_EXES_PER_CLEANUP:
-                    break
+            # Clean up the job executions with the largest volumes first, then the oldest
+            job_exes = sorted(self._job_exes.values(), key=lambda job_exe: (-job_exe.disk_scheduled, job_exe.id))
+            cleanup_job_exes = job_exes[:self._get_batch_size(job_exes)]
 
         return CleanupTask(scheduler_mgr.framework_id, agent_id, cleanup_job_exes)
 
+    def generate_status_json(self, node_dict):
+        """Generates the portion of the status JSON that describes this node's cleanup
+
+        :param node_dict: The dict for this node within the status JSON
+        :type node_dict: dict
+        """
+
+        node_dict['cleanup'] = {'backlog': len(self._job_exes), 'drain_rate_per_min': self._get_drain_rate()}
+
     def get_num_job_exes(self):
         """Returns the number of job executions waiting to be cleaned up
 
@@ -80,4 +109,31 @@ class NodeCleanup(object):
         :rtype: int
         """
 
-        return len(self._job_exes.values())
+        return len(self._job_exes)
+
+    def _get_batch_size(self, job_exes):
+        """Returns the number of the given waiting job executions to clean up in the next task
+
+        :param job_exes: The job executions waiting to be cleaned up
+        :type job_exes: [:class:`job.execution.job_exe.RunningJobExecution`]
+        :returns: The batch size
+        :rtype: int
+        """
+
+        if sum(job_exe.disk_scheduled for job_exe in job_exes) >= DISK_PRESSURE_THRESHOLD:
+            return MAX_JOB_EXES_PER_CLEANUP
+        batch_size = int(math.ceil(len(job_exes) * BACKLOG_FRACTION))
+        return min(max(batch_size, MIN_JOB_EXES_PER_CLEANUP), MAX_JOB_EXES_PER_CLEANUP)
+
+    def _get_drain_rate(self):
+        """Returns the number of job executions cleaned up per minute over the recent drain rate period
+
+        :returns: The drain rate
+        :rtype: float
+        """
+
+        cutoff = now() - DRAIN_RATE_PERIOD
+        while self._cleaned_history and self._cleaned_history[0][0] < cutoff:
+            self._cleaned_history.popleft()
+        num_cleaned = sum(num_deleted for _, num_deleted in self._cleaned_history)
+        return round(num_cleaned / (DRAIN_RATE_PERIOD.total_seconds() / 60.0), 2)
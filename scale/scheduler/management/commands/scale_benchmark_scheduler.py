@@ -0,0 +1,218 @@
+"""Defines the command line method for benchmarking the scheduler against a simulated Mesos cluster"""
+from __future__ import unicode_literals
+
+import logging
+import random
+import resource
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils.timezone import now
+
+from job.configuration.data.job_data import JobData
+from job.configuration.interface.job_interface import JobInterface
+from job.execution.manager import job_exe_mgr
+from job.models import JobType
+from node.resources.node_resources import NodeResources
+from node.resources.resource import Cpus, Disk, Mem
+from queue.models import Queue
+from scheduler.cleanup.manager import cleanup_mgr
+from scheduler.initialize import initialize_system
+from scheduler.manager import scheduler_mgr
+from scheduler.node.manager import node_mgr
+from scheduler.scale_scheduler import ScaleScheduler
+from scheduler.scheduling.manager import SchedulingManager
+from scheduler.simulation import SimulatedCluster, SimulatedDriver
+from scheduler.sync.job_type_manager import job_type_mgr
+from scheduler.sync.shared_resource_manager import shared_resource_mgr
+from scheduler.sync.workspace_manager import workspace_mgr
+from scheduler.task.manager import task_update_mgr
+from trigger.models import TriggerEvent
+from util.host import HostAddress
+
+
+logger = logging.getLogger(__name__)
+
+# Choices for the resources required by the synthetic job types
+JOB_TYPE_CPUS = [0.5, 1.0, 2.0, 4.0]
+JOB_TYPE_MEM = [256.0, 512.0, 1024.0, 4096.0]
+JOB_TYPE_DISK = [0.0, 1024.0, 10240.0]
+
+
+class Command(BaseCommand):
+    """Command that benchmarks the scheduler by running its scheduling loop against a simulated Mesos cluster with
+    synthetic nodes, job types, and queued jobs. The synthetic models are saved in the database and are not removed, so
+    this command should only be run against a disposable database.
+    """
+
+    help = 'Benchmarks the scheduler against a simulated Mesos cluster (creates synthetic models in the database)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--nodes', action='store', type=int, default=1000,
+                            help='The number of nodes in the simulated cluster')
+        parser.add_argument('--node-cpus', action='store', type=float, default=16.0,
+                            help='The number of CPUs of each node')
+        parser.add_argument('--node-mem', action='store', type=float, default=65536.0,
+                            help='The memory of each node in MiB')
+        parser.add_argument('--node-disk', action='store', type=float, default=1048576.0,
+                            help='The disk space of each node in MiB')
+        parser.add_argument('--job-types', action='store', type=int, default=50,
+                            help='The number of synthetic job types to create')
+        parser.add_argument('--jobs', action='store', type=int, default=10000,
+                            help='The number of synthetic jobs to queue')
+        parser.add_argument('--loops', action='store', type=int, default=500,
+                            help='The maximum number of scheduling loops to run')
+        parser.add_argument('--task-duration', action='store', type=int, default=3,
+                            help='The number of scheduling loops that each simulated task runs')
+        parser.add_argument('--sync-interval', action='store', type=int, default=10,
+                            help='The number of scheduling loops between each sync with the database')
+        parser.add_argument('--seed', action='store', type=int, default=0,
+                            help='The seed for generating the synthetic job types and jobs')
+
+    def handle(self, *args, **options):
+        """See :meth:`django.core.management.base.BaseCommand.handle`.
+
+        This method runs the benchmark and prints the results.
+        """
+
+        run_id = now().strftime('%Y%m%d%H%M%S')
+        framework_id = 'scale-benchmark-%s' % run_id
+        rng = random.Random(options.get('seed'))
+
+        initialize_system()
+        self._create_queued_jobs(run_id, options.get('job_types'), options.get('jobs'), rng)
+
+        scheduler_mgr.update_from_mesos(framework_id, HostAddress('localhost', 5050))
+        job_exe_mgr.init_with_database()
+        agent_resources = NodeResources([Cpus(options.get('node_cpus')), Mem(options.get('node_mem')),
+                                         Disk(options.get('node_disk'))])
+        cluster = SimulatedCluster(framework_id, options.get('nodes'), agent_resources, options.get('task_duration'),
+                                   prefix='benchmark-%s' % run_id)
+        driver = SimulatedDriver(cluster)
+        scheduler = ScaleScheduler()
+        manager = SchedulingManager()
+
+        loop_times = []
+        query_counts = []
+        callback_time = 0.0
+        job_exe_count = 0
+        sync_interval = max(options.get('sync_interval'), 1)
+        started = time.time()
+        for loop in xrange(options.get('loops')):
+            # Deliver the simulated status updates and offers through the real scheduler callbacks
+            callback_started = time.time()
+            for status in cluster.advance():
+                scheduler.statusUpdate(driver, status)
+            offers = cluster.create_offers()
+            if offers:
+                scheduler.resourceOffers(driver, offers)
+            callback_time += time.time() - callback_started
+
+            # Perform the work of the other scheduler threads, which is not part of the scheduling loop
+            if loop % sync_interval == 0:
+                self._sync(driver)
+            task_update_mgr.push_to_database()
+
+            running_count = len(job_exe_mgr.get_running_job_exes())
+            with CaptureQueriesContext(connection) as queries:
+                loop_started = time.time()
+                manager.perform_scheduling(driver, now())
+                loop_times.append(time.time() - loop_started)
+            query_counts.append(len(queries.captured_queries))
+            job_exe_count += len(job_exe_mgr.get_running_job_exes()) - running_count
+
+            if loop and not cluster.running_task_count and not Queue.objects.exists():
+                break
+        total_time = time.time() - started
+
+        self._report(loop_times, query_counts, callback_time, total_time, job_exe_count, driver)
+
+    def _create_queued_jobs(self, run_id, job_type_count, job_count, rng):
+        """Creates the synthetic job types and queues the synthetic jobs
+
+        :param run_id: The unique ID of this benchmark run
+        :type run_id: string
+        :param job_type_count: The number of job types to create
+        :type job_type_count: int
+        :param job_count: The number of jobs to queue
+        :type job_count: int
+        :param rng: The random number generator
+        :type rng: :class:`random.Random`
+        """
+
+        logger.info('Creating %i job type(s) and queuing %i job(s)', job_type_count, job_count)
+        job_types = []
+        for i in xrange(job_type_count):
+            interface = JobInterface({'version': '1.4', 'command': 'benchmark', 'command_arguments': ''})
+            job_type = JobType.objects.create_job_type('benchmark-%s-%i' % (run_id, i), '1.0.0', interface,
+                                                       docker_image='scale-benchmark-%i' % i,
+                                                       priority=rng.randint(1, 200),
+                                                       cpus_required=rng.choice(JOB_TYPE_CPUS),
+                                                       mem_const_required=rng.choice(JOB_TYPE_MEM),
+                                                       disk_out_const_required=rng.choice(JOB_TYPE_DISK))
+            job_types.append(job_type)
+
+        event = TriggerEvent.objects.create_trigger_event('USER', None, {'user': 'Benchmark'}, now())
+        for i in xrange(job_count):
+            Queue.objects.queue_new_job(rng.choice(job_types), JobData(), event)
+            if (i + 1) % 1000 == 0:
+                logger.info('Queued %i job(s)', i + 1)
+
+    def _report(self, loop_times, query_counts, callback_time, total_time, job_exe_count, driver):
+        """Prints the results of the benchmark
+
+        :param loop_times: The duration in seconds of each scheduling loop
+        :type loop_times: [float]
+        :param query_counts: The number of database queries made by each scheduling loop
+        :type query_counts: [int]
+        :param callback_time: The total duration in seconds of the offer and status update callbacks
+        :type callback_time: float
+        :param total_time: The total duration in seconds of the simulation
+        :type total_time: float
+        :param job_exe_count: The number of job executions that were scheduled
+        :type job_exe_count: int
+        :param driver: The simulated driver
+        :type driver: :class:`scheduler.simulation.SimulatedDriver`
+        """
+
+        loop_count = len(loop_times)
+        if not loop_count:
+            return
+        scheduling_time = sum(loop_times)
+        sorted_times = sorted(loop_times)
+        # ru_maxrss is reported in KiB on Linux
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0
+
+        self.stdout.write('%-35s %10i' % ('Scheduling loops', loop_count))
+        for name, percentile in [('p50', 50), ('p90', 90), ('p99', 99), ('max', 100)]:
+            value = sorted_times[int(round((loop_count - 1) * percentile / 100.0))]
+            self.stdout.write('%-35s %10.3f ms' % ('Loop latency %s' % name, value * 1000.0))
+        self.stdout.write('%-35s %10.3f ms' % ('Loop latency mean', scheduling_time * 1000.0 / loop_count))
+        self.stdout.write('%-35s %10.1f' % ('Queries per loop mean', sum(query_counts) / float(loop_count)))
+        self.stdout.write('%-35s %10i' % ('Queries per loop max', max(query_counts)))
+        self.stdout.write('%-35s %10i' % ('Job executions scheduled', job_exe_count))
+        if scheduling_time:
+            self.stdout.write('%-35s %10.1f' % ('Jobs scheduled per loop second', job_exe_count / scheduling_time))
+        self.stdout.write('%-35s %10i' % ('Tasks launched', driver.cluster.launched_task_count))
+        self.stdout.write('%-35s %10i' % ('Launch calls', driver.launch_call_count))
+        self.stdout.write('%-35s %10.3f s' % ('Offer and status callbacks', callback_time))
+        self.stdout.write('%-35s %10.3f s' % ('Total simulation', total_time))
+        self.stdout.write('%-35s %10.1f MiB' % ('Peak memory', max_rss))
+
+    def _sync(self, driver):
+        """Performs the periodic database sync of the scheduler
+
+        :param driver: The simulated driver
+        :type driver: :class:`scheduler.simulation.SimulatedDriver`
+        """
+
+        scheduler_mgr.sync_with_database()
+        job_type_mgr.sync_with_database()
+        workspace_mgr.sync_with_database()
+        shared_resource_mgr.sync_with_database()
+        node_mgr.sync_with_database(scheduler_mgr.config)
+        cleanup_mgr.update_nodes(node_mgr.get_nodes())
+        for task_to_kill in job_exe_mgr.sync_with_database():
+            driver.cluster.kill_task(task_to_kill.id)
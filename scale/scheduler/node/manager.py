@@ -32,6 +32,21 @@ class NodeManager(object):
             self._new_agents = {}
             self._nodes = {}
 
+    def add_docker_image(self, agent_id, image_name):
+        """Records that the given job Docker image has been pulled onto the node with the given agent ID
+
+        :param agent_id: The agent ID of the node
+        :type agent_id: string
+        :param image_name: The Docker image name
+        :type image_name: string
+        """
+
+        with self._lock:
+            if agent_id not in self._agents:
+                return
+            hostname = self._agents[agent_id].hostname
+            self._nodes[hostname].add_docker_image(image_name)
+
     def generate_status_json(self, status_dict):
         """Generates the portion of the status JSON that describes the nodes
 
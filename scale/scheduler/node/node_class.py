@@ -28,6 +28,11 @@ class Node(object):
     CLEANUP_ERR_THRESHOLD = datetime.timedelta(minutes=2)
     HEALTH_ERR_THRESHOLD = datetime.timedelta(minutes=2)
     IMAGE_PULL_ERR_THRESHOLD = datetime.timedelta(minutes=5)
+    PRE_PULL_ERR_THRESHOLD = datetime.timedelta(minutes=30)
+
+    # How long after a job Docker image is pulled onto a node that it is trusted to still match its tag, job executions
+    # do not pull the image again within this period
+    DOCKER_IMAGE_REFRESH_PERIOD = datetime.timedelta(minutes=30)
 
     # Normal health check task threshold
     NORMAL_HEALTH_THRESHOLD = datetime.timedelta(minutes=5)
@@ -69,6 +74,7 @@ class Node(object):
         self._cleanup = NodeCleanup()
         self._cleanup_task = None
         self._conditions = NodeConditions(self._hostname)
+        self._docker_images = {}  # {Image name: When the job Docker image was last pulled onto the node}
         self._health_task = None
         self._is_active = node.is_active
         self._is_image_pulled = False
@@ -79,6 +85,9 @@ class Node(object):
         self._last_heath_task = None
         self._lock = threading.Lock()
         self._port = node.port
+        self._pre_pull_errors = {}  # {Image name: When pre-pull last failed}
+        self._pre_pull_images = []  # Names of job Docker images to pre-pull, in order of importance
+        self._pre_pull_task = None
         self._pull_task = None
         self._state = None
         self._update_state()
@@ -123,6 +132,26 @@ class Node(object):
 
         return self._is_active
 
+    @property
+    def port(self):
+        """Returns the Mesos port of the node
+
+        :returns: The port
+        :rtype: int
+        """
+
+        return self._port
+
+    def add_docker_image(self, image_name):
+        """Records that the given job Docker image has just been pulled onto this node
+
+        :param image_name: The Docker image name
+        :type image_name: string
+        """
+
+        with self._lock:
+            self._docker_images[image_name] = now()
+
     def add_job_execution(self, job_exe):
         """Adds a job execution that needs to be cleaned up
 
@@ -146,8 +175,20 @@ class Node(object):
             node_dict = {'id': self._id, 'hostname': self._hostname, 'agent_id': self._agent_id,
                          'is_active': self._is_active, 'state': state_dict}
             self._conditions.generate_status_json(node_dict)
+            self._cleanup.generate_status_json(node_dict)
         nodes_list.append(node_dict)
 
+    def get_docker_images(self):
+        """Returns the names of the job Docker images that were pulled onto this node within the refresh period
+
+        :returns: The set of Docker image names
+        :rtype: set
+        """
+
+        when = now()
+        with self._lock:
+            return {image_name for image_name in self._docker_images if self._is_docker_image_recent(image_name, when)}
+
     def get_next_tasks(self, when):
         """Returns the next node tasks to launch
 
@@ -175,6 +216,10 @@ class Node(object):
             if self._is_ready_for_pull_task(when) and self._pull_task and not self._pull_task.has_been_launched:
                 tasks.append(self._pull_task)
 
+            # Check if ready for pre-pull task and it hasn't been launched yet
+            if self._state == Node.READY and self._pre_pull_task and not self._pre_pull_task.has_been_launched:
+                tasks.append(self._pre_pull_task)
+
             return tasks
 
     def handle_task_timeout(self, task):
@@ -201,6 +246,12 @@ class Node(object):
                 if self._pull_task.has_ended:
                     self._pull_task = None
                 self._conditions.handle_pull_task_timeout()
+            elif self._pre_pull_task and self._pre_pull_task.id == task.id:
+                logger.warning('Pre-pull task for image %s on node %s timed out', self._pre_pull_task.image_name,
+                               self._hostname)
+                self._pre_pull_errors[self._pre_pull_task.image_name] = now()
+                if self._pre_pull_task.has_ended:
+                    self._pre_pull_task = None
             self._update_state()
 
     def handle_task_update(self, task_update):
@@ -217,6 +268,8 @@ class Node(object):
                 self._handle_health_task_update(task_update)
             elif self._pull_task and self._pull_task.id == task_update.task_id:
                 self._handle_pull_task_update(task_update)
+            elif self._pre_pull_task and self._pre_pull_task.id == task_update.task_id:
+                self._handle_pre_pull_task_update(task_update)
             self._update_state()
 
     def is_ready_for_new_job(self):
@@ -237,6 +290,17 @@ class Node(object):
 
         return self._state not in [Node.DEPRECATED, Node.OFFLINE]
 
+    def set_images_to_pre_pull(self, image_names):
+        """Sets the job Docker images that this node should pull in the background while it is idle, so that job
+        executions of those types do not need to wait for an image pull when they are scheduled here
+
+        :param image_names: The Docker image names, in order of importance
+        :type image_names: [string]
+        """
+
+        with self._lock:
+            self._pre_pull_images = list(image_names)
+
     def should_be_removed(self):
         """Indicates whether this node should be removed from the scheduler. If the node is no longer active and is also
         no longer online, there's no reason for the scheduler to continue to track it.
@@ -260,6 +324,9 @@ class Node(object):
 
         with self._lock:
             if agent_id:
+                if agent_id != self._agent_id:
+                    # A new agent may not have the same images
+                    self._docker_images = {}
                 self._agent_id = agent_id
             if port:
                 self._port = port
@@ -314,6 +381,50 @@ class Node(object):
         if not self._pull_task and self._is_ready_for_pull_task(when):
             self._pull_task = PullTask(scheduler_mgr.framework_id, self._agent_id)
 
+        # If we have a pre-pull task, check that node's agent ID has not changed
+        if self._pre_pull_task and self._pre_pull_task.agent_id != self._agent_id:
+            self._pre_pull_task = None
+
+        if not self._pre_pull_task and self._state == Node.READY:
+            image_name = self._get_next_image_to_pre_pull(when)
+            if image_name:
+                self._pre_pull_task = PullTask(scheduler_mgr.framework_id, self._agent_id, image_name)
+
+    def _get_next_image_to_pre_pull(self, when):
+        """Returns the next job Docker image that this node should pre-pull, possibly None. Images that were recently
+        pulled onto the node or that recently failed to pull are skipped, so the images of busy job types are pulled
+        again to keep them recent. Caller must have obtained the thread lock.
+
+        :param when: The current time
+        :type when: :class:`datetime.datetime`
+        :returns: The Docker image name, possibly None
+        :rtype: string
+        """
+
+        for image_name in self._pre_pull_images:
+            if self._is_docker_image_recent(image_name, when):
+                continue
+            last_error = self._pre_pull_errors.get(image_name)
+            if last_error and when - last_error <= Node.PRE_PULL_ERR_THRESHOLD:
+                continue
+            return image_name
+        return None
+
+    def _is_docker_image_recent(self, image_name, when):
+        """Indicates whether the given job Docker image was pulled onto this node within the refresh period. Caller must
+        have obtained the thread lock.
+
+        :param image_name: The Docker image name
+        :type image_name: string
+        :param when: The current time
+        :type when: :class:`datetime.datetime`
+        :returns: True if the image was recently pulled, False otherwise
+        :rtype: bool
+        """
+
+        pulled = self._docker_images.get(image_name)
+        return pulled is not None and when - pulled < Node.DOCKER_IMAGE_REFRESH_PERIOD
+
     def _image_pull_completed(self):
         """Tells this node that its image pull task has succeeded. Caller must have obtained the thread lock.
         """
@@ -449,6 +560,28 @@ class Node(object):
         if self._health_task and self._health_task.has_ended:
             self._health_task = None
 
+    def _handle_pre_pull_task_update(self, task_update):
+        """Handles the given task update for a pre-pull task. Caller must have obtained the thread lock.
+
+        :param task_update: The pre-pull task update
+        :type task_update: :class:`job.tasks.update.TaskStatusUpdate`
+        """
+
+        image_name = self._pre_pull_task.image_name
+        if task_update.status == TaskStatusUpdate.FINISHED:
+            logger.info('Node %s has finished pre-pulling image %s', self._hostname, image_name)
+            self._docker_images[image_name] = now()
+        elif task_update.status == TaskStatusUpdate.FAILED:
+            logger.warning('Pre-pull task for image %s on node %s failed', image_name, self._hostname)
+            self._pre_pull_errors[image_name] = now()
+        elif task_update.status == TaskStatusUpdate.KILLED:
+            logger.warning('Pre-pull task for image %s on node %s killed', image_name, self._hostname)
+        elif task_update.status == TaskStatusUpdate.LOST:
+            logger.warning('Pre-pull task for image %s on node %s lost', image_name, self._hostname)
+            self._pre_pull_task = None
+        if self._pre_pull_task and self._pre_pull_task.has_ended:
+            self._pre_pull_task = None
+
     def _handle_pull_task_update(self, task_update):
         """Handles the given task update for a pull task. Caller must have obtained the thread lock.
 
@@ -9,8 +9,17 @@ from django.utils.timezone import now
 from mesos.interface import mesos_pb2
 
 COUNT_WARNING_THRESHOLD = 1000  # If the total list count hits this threshold, log a warning
+
+# A reconciliation request for a task that has not been answered within this threshold is sent again
 FULL_RECON_THRESHOLD = datetime.timedelta(minutes=2)
 
+# The maximum number of tasks that are sent in a single explicit reconciliation request. Larger sets of tasks are
+# spread across subsequent requests.
+MAX_TASKS_PER_RECON = 500
+
+# Tasks that have received a status update within this threshold are not sent for reconciliation until it passes
+RECENT_UPDATE_THRESHOLD = datetime.timedelta(seconds=15)
+
 logger = logging.getLogger(__name__)
 
 
@@ -28,7 +37,10 @@ class ReconciliationManager(object):
         # After their first reconciliation request, they will move to self._tasks
         self._rookie_tasks = {}  # {Task ID: Task}
         self._tasks = {}  # {Task ID: Task}
-        self._last_full_reconciliation = now()  # Last time all tasks were reconciled
+        self._last_reconciled = {}  # {Task ID: Last time the task was sent for reconciliation}
+        # Set when the driver (re-)registers, cleared once the implicit reconciliation request has been sent
+        self._is_implicit_reconciliation_needed = False
+        self._recent_updates = {}  # {Task ID: Time of the task's latest status update}
 
     @property
     def driver(self):
@@ -48,7 +60,10 @@ class ReconciliationManager(object):
         :type value: :class:`mesos_api.mesos.SchedulerDriver`
         """
 
-        self._driver = value
+        with self._lock:
+            self._driver = value
+            # A new driver has just (re-)registered, so perform an implicit reconciliation right away
+            self._is_implicit_reconciliation_needed = True
 
     def add_tasks(self, tasks):
         """Adds a list of tasks that need to be reconciled
@@ -63,48 +78,82 @@ class ReconciliationManager(object):
                     self._rookie_tasks[task.id] = task
 
     def perform_reconciliation(self):
-        """Performs task reconciliation with the Mesos master
+        """Performs task reconciliation with the Mesos master. An implicit reconciliation request is only sent after the
+        driver (re-)registers, since it makes the master send a status update for every task it knows about at once.
+        At most MAX_TASKS_PER_RECON tasks are sent in each explicit reconciliation request. New tasks are sent first,
+        followed by the tasks whose previous request has gone unanswered the longest.
         """
 
-        tasks_to_reconcile = {}
+        tasks_to_reconcile = []
+        send_implicit = False
         with self._lock:
             when = now()
-            # Reconcile all tasks if time threshold has been reached
-            if when > self._last_full_reconciliation + FULL_RECON_THRESHOLD:
-                self._last_full_reconciliation = when
-                for task in self._tasks.values():
-                    tasks_to_reconcile[task.id] = task
-            # Always reconcile rookie tasks and move them to self._tasks
-            # This enables tasks to be quickly reconciled the first time
+            if self._is_implicit_reconciliation_needed:
+                self._is_implicit_reconciliation_needed = False
+                send_implicit = True
+
+            for task_id, updated in list(self._recent_updates.items()):
+                if when > updated + RECENT_UPDATE_THRESHOLD:
+                    del self._recent_updates[task_id]
+
+            # Rookie tasks go first so that tasks are quickly reconciled the first time, unless they just received
+            # a status update
             for task in self._rookie_tasks.values():
-                tasks_to_reconcile[task.id] = task
+                if len(tasks_to_reconcile) >= MAX_TASKS_PER_RECON:
+                    break
+                if task.id not in self._recent_updates:
+                    tasks_to_reconcile.append(task)
+
+            # Send again the tasks whose reconciliation requests have not been answered, oldest first
+            resend_ids = [task_id for task_id, last_reconciled in self._last_reconciled.items()
+                          if when > last_reconciled + FULL_RECON_THRESHOLD]
+            resend_ids.sort(key=lambda task_id: self._last_reconciled[task_id])
+            for task_id in resend_ids[:MAX_TASKS_PER_RECON - len(tasks_to_reconcile)]:
+                tasks_to_reconcile.append(self._tasks[task_id])
+
+            # Sent tasks move to self._tasks
+            for task in tasks_to_reconcile:
+                if task.id in self._rookie_tasks:
+                    del self._rookie_tasks[task.id]
                 self._tasks[task.id] = task
-            self._rookie_tasks = {}
+                self._last_reconciled[task.id] = when
+
+            total_count = len(self._rookie_tasks) + len(self._tasks)
+            driver = self._driver
+
+        if total_count >= COUNT_WARNING_THRESHOLD:
+            logger.warning('%d task(s) are waiting to be reconciled', total_count)
+
+        if send_implicit:
+            logger.info('Performing implicit task reconciliation')
+            driver.reconcileTasks([])
 
         if not tasks_to_reconcile:
             return
 
         logger.info('Reconciling %d task(s)', len(tasks_to_reconcile))
         task_statuses = []
-        for task in tasks_to_reconcile.values():
+        for task in tasks_to_reconcile:
             task_status = mesos_pb2.TaskStatus()
             task_status.task_id.value = task.id
             task_status.state = mesos_pb2.TASK_LOST
             task_statuses.append(task_status)
-        self._driver.reconcileTasks(task_statuses)
+        driver.reconcileTasks(task_statuses)
 
     def remove_task_id(self, task_id):
-        """Removes the task ID from the reconciliation set
+        """Removes the task ID from the reconciliation set since the task has just received a status update
 
         :param task_id: The task ID to remove
         :type task_id: string
         """
 
         with self._lock:
+            self._recent_updates[task_id] = now()
             if task_id in self._rookie_tasks:
                 del self._rookie_tasks[task_id]
             if task_id in self._tasks:
                 del self._tasks[task_id]
+                del self._last_reconciled[task_id]
 
 
 recon_mgr = ReconciliationManager()
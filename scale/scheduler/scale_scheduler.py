@@ -6,12 +6,14 @@ import datetime
 import logging
 import threading
 
+from django.conf import settings
 from django.utils.timezone import now
 from mesos.interface import Scheduler as MesosScheduler
 
 from error.models import Error
 from job.execution.manager import job_exe_mgr
 from job.execution.tasks.exe_task import JOB_TASK_ID_PREFIX
+from job.execution.tasks.pull_task import PullTask as JobExePullTask
 from job.models import JobExecution
 from job.tasks.manager import task_mgr
 from job.tasks.update import TaskStatusUpdate
@@ -29,14 +31,18 @@ from scheduler.recon.manager import recon_mgr
 from scheduler.resources.manager import resource_mgr
 from scheduler.resources.offer import ResourceOffer
 from scheduler.sync.job_type_manager import job_type_mgr
+from scheduler.sync.shared_resource_manager import shared_resource_mgr
 from scheduler.sync.workspace_manager import workspace_mgr
 from scheduler.task.manager import task_update_mgr
+from scheduler.threads.messaging import MessagingThread
 from scheduler.threads.recon import ReconciliationThread
+from scheduler.threads.resource_usage import ResourceUsageThread
 from scheduler.threads.schedule import SchedulingThread
 from scheduler.threads.scheduler_status import SchedulerStatusThread
 from scheduler.threads.sync import SyncThread
 from scheduler.threads.task_handling import TaskHandlingThread
 from scheduler.threads.task_update import TaskUpdateThread
+from scheduler.worker.manager import db_worker_mgr
 from util.host import HostAddress
 
 
@@ -61,7 +67,9 @@ class ScaleScheduler(MesosScheduler):
         self._master_hostname = None
         self._master_port = None
 
+        self._messaging_thread = None
         self._recon_thread = None
+        self._resource_usage_thread = None
         self._scheduler_status_thread = None
         self._scheduling_thread = None
         self._sync_thread = None
@@ -93,9 +101,16 @@ class ScaleScheduler(MesosScheduler):
         # Initial database sync
         logger.info('Performing initial sync with Scale database')
         job_exe_mgr.init_with_database()
+        # Recover job executions that were running when the scheduler stopped, they are reconciled below
+        task_mgr.recover_tasks(job_exe_mgr.recover_running_job_exes(now()))
         job_type_mgr.sync_with_database()
         scheduler_mgr.sync_with_database()
         workspace_mgr.sync_with_database()
+        shared_resource_mgr.sync_with_database()
+
+        # Start up the database worker process before any background threads are running
+        if settings.SCHEDULER_DATABASE_WORKER_ENABLED:
+            db_worker_mgr.start()
 
         # Start up background threads
         self._recon_thread = ReconciliationThread()
@@ -128,6 +143,18 @@ class ScaleScheduler(MesosScheduler):
         task_update_thread.daemon = True
         task_update_thread.start()
 
+        if settings.JOB_LIFECYCLE_MESSAGES_ENABLED:
+            self._messaging_thread = MessagingThread()
+            messaging_thread = threading.Thread(target=self._messaging_thread.run)
+            messaging_thread.daemon = True
+            messaging_thread.start()
+
+        if settings.RESOURCE_USAGE_SAMPLING_ENABLED:
+            self._resource_usage_thread = ResourceUsageThread()
+            resource_usage_thread = threading.Thread(target=self._resource_usage_thread.run)
+            resource_usage_thread.daemon = True
+            resource_usage_thread.start()
+
         self._reconcile_running_jobs()
 
     def reregistered(self, driver, masterInfo):
@@ -284,8 +311,13 @@ class ScaleScheduler(MesosScheduler):
         # Update task with latest status
         # This should happen before the job execution or node manager are updated, since they will assume that the task
         # has already been updated
+        task = task_mgr.get_task(task_id)
         task_mgr.handle_task_update(task_update)
 
+        if isinstance(task, JobExePullTask) and task_update.status == TaskStatusUpdate.FINISHED:
+            # Remember that the node has this job's image so that future executions of the job type prefer this node
+            node_mgr.add_docker_image(task_update.agent_id, task.image_name)
+
         if task_id.startswith(JOB_TASK_ID_PREFIX):
             # Job task, so update the job execution
             try:
@@ -424,12 +456,17 @@ class ScaleScheduler(MesosScheduler):
         """
 
         logger.info('Scheduler shutdown invoked, stopping background threads')
+        if self._messaging_thread:
+            self._messaging_thread.shutdown()
         self._recon_thread.shutdown()
+        if self._resource_usage_thread:
+            self._resource_usage_thread.shutdown()
         self._scheduler_status_thread.shutdown()
         self._scheduling_thread.shutdown()
         self._sync_thread.shutdown()
         self._task_handling_thread.shutdown()
         self._task_update_thread.shutdown()
+        db_worker_mgr.stop()
 
     def _reconcile_running_jobs(self):
         """Looks up all currently running jobs in the database and sets them up to be reconciled with Mesos"""
@@ -448,7 +485,7 @@ class ScaleScheduler(MesosScheduler):
                 if task:
                     tasks_to_reconcile.append(task)
             else:
-                # Fail any executions that the scheduler has lost
+                # Fail any executions that the scheduler has lost and could not recover
                 Queue.objects.handle_job_failure(job_exe.id, now(), [],
                                                  Error.objects.get_builtin_error('scheduler-lost'))
 
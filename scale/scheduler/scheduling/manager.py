@@ -5,11 +5,13 @@ from __future__ import unicode_literals
 import datetime
 import logging
 
+from django.conf import settings
 from django.db.utils import DatabaseError
 from django.utils.timezone import now
 from mesos.interface import mesos_pb2
 
 from job.execution.manager import job_exe_mgr
+from job.models import Job
 from job.tasks.manager import task_mgr
 from mesos_api.tasks import create_mesos_task
 from node.resources.node_resources import NodeResources
@@ -21,6 +23,7 @@ from scheduler.resources.agent import ResourceSet
 from scheduler.resources.manager import resource_mgr
 from scheduler.scheduling.scheduling_node import SchedulingNode
 from scheduler.sync.job_type_manager import job_type_mgr
+from scheduler.sync.shared_resource_manager import shared_resource_mgr
 from scheduler.sync.workspace_manager import workspace_mgr
 from util.retry import retry_database_query
 
@@ -36,6 +39,9 @@ LAUNCH_TASK_WARN_THRESHOLD = datetime.timedelta(milliseconds=300)
 # It is considered a resource shortage if a task waits this many generations without being scheduled
 TASK_SHORTAGE_WAIT_COUNT = 10
 
+# Maximum number of job Docker images that idle nodes pre-pull, taken from the job types with the most queued jobs
+PRE_PULL_IMAGE_COUNT = 3
+
 logger = logging.getLogger(__name__)
 
 
@@ -48,6 +54,7 @@ class SchedulingManager(object):
         """Constructor
         """
 
+        self._queued_job_type_counts = {}  # {Job Type ID: int}
         self._waiting_tasks = {}  # {Task ID: int}
 
     def perform_scheduling(self, driver, when):
@@ -74,13 +81,15 @@ class SchedulingManager(object):
         fulfilled_nodes = self._schedule_waiting_tasks(nodes, running_job_exes, when)
 
         job_type_limits = self._calculate_job_type_limits(job_types, running_job_exes)
+        shared_resource_limits = shared_resource_mgr.calculate_remaining(running_job_exes)
         job_exe_count = self._schedule_new_job_exes(framework_id, fulfilled_nodes, job_types, job_type_limits,
-                                                    job_type_resources, workspaces)
+                                                    shared_resource_limits, job_type_resources, workspaces)
 
         if framework_id != scheduler_mgr.framework_id:
             logger.warning('Scheduler framework ID changed, skipping task launch')
             return 0
 
+        self._request_image_pre_pulls(nodes, job_types)
         self._allocate_offers(nodes)
         task_count, offer_count = self._launch_tasks(driver, nodes)
         scheduler_mgr.add_scheduling_counts(job_exe_count, task_count, offer_count)
@@ -152,6 +161,35 @@ class SchedulingManager(object):
 
         return ignore_job_type_ids
 
+    def _get_retried_job_ids(self, queues):
+        """Returns the IDs of the jobs on the given queue models that have already had an earlier execution
+
+        :param queues: The list of queue models
+        :type queues: list
+        :returns: The set of IDs of the jobs that are being retried
+        :rtype: set
+        """
+
+        job_ids = [queue.job_id for queue in queues]
+        return set(Job.objects.filter(id__in=job_ids, num_exes__gt=1).values_list('id', flat=True))
+
+    def _is_shared_resource_usage_available(self, shared_resource_usage, shared_resource_limits):
+        """Indicates whether there are enough units of each shared resource still available for the given usage
+
+        :param shared_resource_usage: The units of each shared resource that would be used, stored by shared resource
+            ID
+        :type shared_resource_usage: dict
+        :param shared_resource_limits: The dict of shared resource IDs mapping to the units that are still available
+        :type shared_resource_limits: dict
+        :returns: True if the usage fits within the available units of every shared resource, False otherwise
+        :rtype: bool
+        """
+
+        for shared_resource_id, usage in shared_resource_usage.items():
+            if usage > shared_resource_limits.get(shared_resource_id, 0):
+                return False
+        return True
+
     def _launch_tasks(self, driver, nodes):
         """Launches all of the tasks that have been scheduled on the given nodes
 
@@ -274,7 +312,7 @@ class SchedulingManager(object):
             scheduling_nodes[scheduling_node.node_id] = scheduling_node
         return scheduling_nodes
 
-    def _process_queue(self, nodes, job_types, job_type_limits, job_type_resources):
+    def _process_queue(self, nodes, job_types, job_type_limits, shared_resource_limits, job_type_resources):
         """Retrieves the top of the queue and schedules new job executions on available nodes as resources and limits
         allow
 
@@ -284,6 +322,8 @@ class SchedulingManager(object):
         :type job_types: dict
         :param job_type_limits: The dict of job type IDs mapping to job type limits
         :type job_type_limits: dict
+        :param shared_resource_limits: The dict of shared resource IDs mapping to the units that are still available
+        :type shared_resource_limits: dict
         :param job_type_resources: The list of all of the job type resource requirements
         :type job_type_resources: list
         :returns: The list of queued job executions that were scheduled on nodes
@@ -292,24 +332,44 @@ class SchedulingManager(object):
 
         queued_job_executions = []
         ignore_job_type_ids = self._calculate_job_types_to_ignore(job_types, job_type_limits)
+        self._queued_job_type_counts = {}
+        job_type_durations = job_type_mgr.get_job_type_durations() if settings.SCHEDULER_BACKFILL_ENABLED else None
+        job_type_profiles = job_type_mgr.get_job_type_profiles() if settings.SCHEDULER_RESOURCE_PROFILES_ENABLED else {}
         started = now()
 
-        for queue in Queue.objects.get_queue(scheduler_mgr.config.queue_mode, ignore_job_type_ids)[:QUEUE_LIMIT]:
+        queues = list(Queue.objects.get_queue(scheduler_mgr.config.queue_mode, ignore_job_type_ids)[:QUEUE_LIMIT])
+        retried_job_ids = self._get_retried_job_ids(queues) if job_type_profiles else set()
+
+        for queue in queues:
             # If there are no longer any available nodes, break
             if not nodes:
                 break
 
             # Check limit for this execution's job type
             job_type_id = queue.job_type_id
+            self._queued_job_type_counts[job_type_id] = self._queued_job_type_counts.get(job_type_id, 0) + 1
             if job_type_id in job_type_limits and job_type_limits[job_type_id] < 1:
                 continue
 
-            # Try to schedule job execution and adjust job type limit if needed
+            # Check the shared resources this execution would use against what is still available
             job_exe = QueuedJobExecution(queue)
-            if self._schedule_new_job_exe(job_exe, nodes, job_type_resources):
+            shared_resource_usage = shared_resource_mgr.get_usage(job_exe) if shared_resource_limits else {}
+            if not self._is_shared_resource_usage_available(shared_resource_usage, shared_resource_limits):
+                continue
+
+            # Try to schedule job execution and adjust job type and shared resource limits if needed
+            if job_type_id in job_type_profiles and queue.job_id not in retried_job_ids:
+                # Schedule with the resources that recent jobs of this type actually used. The profile is also the
+                # container limit, so a retried job may have been killed for exceeding it and gets what it requests.
+                job_exe.apply_resource_profile(job_type_profiles[job_type_id])
+            docker_image = job_types[job_type_id].docker_image if job_type_id in job_types else None
+            if self._schedule_new_job_exe(job_exe, nodes, job_type_resources, docker_image, job_type_durations,
+                                          started):
                 queued_job_executions.append(job_exe)
                 if job_type_id in job_type_limits:
                     job_type_limits[job_type_id] -= 1
+                for shared_resource_id, usage in shared_resource_usage.items():
+                    shared_resource_limits[shared_resource_id] -= usage
 
         duration = now() - started
         msg = 'Processing queue took %.3f seconds'
@@ -320,7 +380,30 @@ class SchedulingManager(object):
 
         return queued_job_executions
 
-    def _schedule_new_job_exe(self, job_exe, nodes, job_type_resources):
+    def _request_image_pre_pulls(self, nodes, job_types):
+        """Asks idle nodes to pull the Docker images of the job types with the most queued job executions in the
+        background, so that those images are already present when the job executions are scheduled. Nodes that are not
+        idle are asked to stop pre-pulling.
+
+        :param nodes: The dict of all scheduling nodes stored by node ID
+        :type nodes: dict
+        :param job_types: The dict of job type models stored by job type ID
+        :type job_types: dict
+        """
+
+        image_counts = {}  # {Image name: int}
+        for job_type_id, count in self._queued_job_type_counts.items():
+            if job_type_id in job_types:
+                job_type = job_types[job_type_id]
+                if job_type.docker_image and not job_type.is_system:
+                    image_counts[job_type.docker_image] = image_counts.get(job_type.docker_image, 0) + count
+        hot_images = sorted(image_counts, key=lambda image: image_counts[image], reverse=True)[:PRE_PULL_IMAGE_COUNT]
+
+        for node in nodes.values():
+            node.request_image_pre_pulls(hot_images if node.is_idle else [])
+
+    def _schedule_new_job_exe(self, job_exe, nodes, job_type_resources, docker_image=None, job_type_durations=None,
+                              when=None):
         """Schedules the given job execution on the queue on one of the available nodes, if possible
 
         :param job_exe: The job execution to schedule
@@ -329,6 +412,12 @@ class SchedulingManager(object):
         :type nodes: dict
         :param job_type_resources: The list of all of the job type resource requirements
         :type job_type_resources: list
+        :param docker_image: The Docker image of the job execution, possibly None
+        :type docker_image: string
+        :param job_type_durations: The estimated run times stored by job type ID, None if backfill is disabled
+        :type job_type_durations: {int: :class:`datetime.timedelta`}
+        :param when: The current time, required if backfill is enabled
+        :type when: :class:`datetime.datetime`
         :returns: True if scheduled, False otherwise
         :rtype: bool
         """
@@ -338,9 +427,24 @@ class SchedulingManager(object):
         best_reservation_node = None
         best_reservation_score = None
 
-        for node in nodes.values():
+        duration = None
+        if job_type_durations is not None:
+            duration = job_type_durations.get(job_exe.queue.job_type_id)
+
+        # Check the job execution's resources against the remaining resources of every node at once so that nodes that
+        # cannot fit the job execution are not scored for scheduling
+        node_list = nodes.values()
+        node_fits = job_exe.required_resources.is_met_by_each([node.remaining_resources for node in node_list])
+
+        for node, fits in zip(node_list, node_fits):
+            if node.is_reserved:
+                # Reserved node can only be backfilled by job executions that will finish before the reservation starts
+                if not node.is_backfill_allowed(duration, when):
+                    continue
             # Check node for scheduling this job execution
-            score = node.score_job_exe_for_scheduling(job_exe, job_type_resources)
+            score = None
+            if fits:
+                score = node.score_job_exe_for_scheduling(job_exe, job_type_resources, docker_image)
             if score is not None:
                 # Job execution could be scheduled on this node, check its score
                 if best_scheduling_node is None or score < best_scheduling_score:
@@ -349,7 +453,7 @@ class SchedulingManager(object):
                     best_scheduling_score = score
                     best_reservation_node = None  # No need to reserve a node if we can schedule the job execution
                     best_reservation_score = None  # No need to reserve a node if we can schedule the job execution
-            if best_scheduling_node is None:
+            if best_scheduling_node is None and not node.is_reserved:
                 # No nodes yet to schedule this job execution on, check whether we should reserve this node
                 score = node.score_job_exe_for_reservation(job_exe, job_type_resources)
                 if score is not None:
@@ -361,16 +465,24 @@ class SchedulingManager(object):
 
         # Schedule the job execution on the best node
         if best_scheduling_node:
-            if best_scheduling_node.accept_new_job_exe(job_exe):
+            if best_scheduling_node.accept_new_job_exe(job_exe, docker_image):
                 return True
 
         # Could not schedule job execution, reserve a node to run this execution if possible
         if best_reservation_node:
-            del nodes[best_reservation_node.node_id]
+            reservation_start = None
+            if job_type_durations is not None:
+                reservation_start = best_reservation_node.estimate_reservation_start(job_exe, job_type_durations, when)
+            if reservation_start:
+                # Backfill: keep the node available for job executions that will finish before the reservation starts
+                best_reservation_node.reserve(reservation_start)
+            else:
+                del nodes[best_reservation_node.node_id]
 
         return False
 
-    def _schedule_new_job_exes(self, framework_id, nodes, job_types, job_type_limits, job_type_resources, workspaces):
+    def _schedule_new_job_exes(self, framework_id, nodes, job_types, job_type_limits, shared_resource_limits,
+                               job_type_resources, workspaces):
         """Schedules new job executions from the queue and adds them to the appropriate node
 
         :param framework_id: The scheduling framework ID
@@ -381,6 +493,8 @@ class SchedulingManager(object):
         :type job_types: dict
         :param job_type_limits: The dict of job type IDs mapping to job type limits
         :type job_type_limits: dict
+        :param shared_resource_limits: The dict of shared resource IDs mapping to the units that are still available
+        :type shared_resource_limits: dict
         :param job_type_resources: The list of all of the job type resource requirements
         :type job_type_resources: list
         :param workspaces: A dict of all workspaces stored by name
@@ -396,7 +510,8 @@ class SchedulingManager(object):
                 available_nodes[node.node_id] = node
 
         try:
-            queued_job_exes = self._process_queue(available_nodes, job_types, job_type_limits, job_type_resources)
+            queued_job_exes = self._process_queue(available_nodes, job_types, job_type_limits, shared_resource_limits,
+                                                  job_type_resources)
             scheduled_job_exes = self._schedule_new_job_exes_in_database(framework_id, queued_job_exes, workspaces)
             all_scheduled_job_exes = []
             for node_id in scheduled_job_exes:
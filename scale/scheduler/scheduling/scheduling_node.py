@@ -35,11 +35,13 @@ class SchedulingNode(object):
         self.allocated_tasks = []  # Tasks that have been allocated resources from this node
 
         self._node = node
+        self._docker_images = node.get_docker_images()  # Cache this for consistency
         self._allocated_queued_job_exes = []  # New queued job executions that have been allocated resources
         self._allocated_running_job_exes = []  # Running job executions that have been allocated resources
         self._running_job_exes = running_job_exes
         self._running_tasks = tasks
 
+        self._reserved_until = None  # Estimated time that the job execution that reserved this node could start
         self._offered_resources = NodeResources()  # The amount of resources that were originally offered
         self._offered_resources.add(resource_set.offered_resources)
         self._remaining_resources = NodeResources()
@@ -47,6 +49,38 @@ class SchedulingNode(object):
         self._task_resources = resource_set.task_resources
         self._watermark_resources = resource_set.watermark_resources
 
+    @property
+    def is_idle(self):
+        """Indicates whether this node is ready for new job executions but has no running or newly scheduled job
+        executions
+
+        :returns: True if this node is idle, False otherwise
+        :rtype: bool
+        """
+
+        return self.is_ready_for_new_job and not self._running_job_exes and not self._allocated_queued_job_exes and \
+            not self._allocated_running_job_exes
+
+    @property
+    def is_reserved(self):
+        """Indicates whether this node has been reserved for a higher priority job execution that is waiting on it
+
+        :returns: True if this node is reserved, False otherwise
+        :rtype: bool
+        """
+
+        return self._reserved_until is not None
+
+    @property
+    def remaining_resources(self):
+        """Returns the offered resources on this node that have not been allocated yet
+
+        :returns: The remaining resources
+        :rtype: :class:`node.resources.node_resources.NodeResources`
+        """
+
+        return self._remaining_resources
+
     def accept_job_exe_next_task(self, job_exe, waiting_tasks):
         """Asks the node if it can accept the next task for the given job execution. If the next task is waiting on
         resources, the task is added to the given waiting list. This should be used for job executions that have already
@@ -66,6 +100,9 @@ class SchedulingNode(object):
         task = job_exe.next_task()
         if not task:
             return False
+        if not task.agent_id:
+            # Job executions recovered on scheduler start up do not know their agent ID until they are scheduled
+            task.agent_id = self.agent_id
         task_resources = task.get_resources()
         if self._remaining_resources.is_sufficient_to_meet(task_resources):
             self._allocated_running_job_exes.append(job_exe)
@@ -77,11 +114,13 @@ class SchedulingNode(object):
         waiting_tasks.append(task)
         return True
 
-    def accept_new_job_exe(self, job_exe):
+    def accept_new_job_exe(self, job_exe, docker_image=None):
         """Asks the node if it can accept the given new job execution
 
         :param job_exe: The new job execution
         :type job_exe: :class:`queue.job_exe.QueuedJobExecution`
+        :param docker_image: The Docker image of the job execution, possibly None
+        :type docker_image: string
         :returns: True if the new job execution was accepted, False otherwise
         :rtype: bool
         """
@@ -94,7 +133,9 @@ class SchedulingNode(object):
             self._allocated_queued_job_exes.append(job_exe)
             self.allocated_resources.add(resources)
             self._remaining_resources.subtract(resources)
-            job_exe.accepted(self.agent_id, self.node_id, resources)
+            if docker_image not in self._docker_images:
+                docker_image = None  # The node has not recently pulled the image, so the job execution must pull it
+            job_exe.accepted(self.agent_id, self.node_id, resources, docker_image)
             return True
 
         return False
@@ -165,6 +206,84 @@ class SchedulingNode(object):
         self._allocated_queued_job_exes = []
         self._allocated_running_job_exes.extend(job_exes)
 
+    def estimate_reservation_start(self, job_exe, job_type_durations, when):
+        """Estimates when enough resources will be free on this node to run the given job execution, based on the
+        estimated run times of the job executions on the node. Job executions whose run time cannot be estimated are
+        assumed to never finish. If the start time cannot be estimated, None is returned.
+
+        :param job_exe: The job execution that would reserve this node
+        :type job_exe: :class:`queue.job_exe.QueuedJobExecution`
+        :param job_type_durations: The estimated run times stored by job type ID
+        :type job_type_durations: {int: :class:`datetime.timedelta`}
+        :param when: The current time
+        :type when: :class:`datetime.datetime`
+        :returns: The estimated start time, possibly None
+        :rtype: :class:`datetime.datetime`
+        """
+
+        # Start with our best guess of the resources currently available to Scale on this node
+        free_resources = NodeResources()
+        free_resources.add(self._watermark_resources)
+        free_resources.subtract(self._task_resources)
+        free_resources.subtract(self.allocated_resources)
+        if free_resources.is_sufficient_to_meet(job_exe.required_resources):
+            return when
+
+        # Estimate when each running and newly scheduled job execution will finish and release its resources
+        releases = []  # [(When resources are released, NodeResources)]
+        for running_job_exe in self._running_job_exes:
+            task = running_job_exe.current_task
+            if not task:
+                task = running_job_exe.next_task()
+            duration = job_type_durations.get(running_job_exe.job_type_id)
+            if task and duration is not None and running_job_exe.started:
+                releases.append((max(running_job_exe.started + duration, when), task.get_resources()))
+        for queued_job_exe in self._allocated_queued_job_exes:
+            duration = job_type_durations.get(queued_job_exe.queue.job_type_id)
+            if duration is not None:
+                releases.append((when + duration, queued_job_exe.required_resources))
+
+        for released, resources in sorted(releases, key=lambda release: release[0]):
+            free_resources.add(resources)
+            if free_resources.is_sufficient_to_meet(job_exe.required_resources):
+                return released
+        return None
+
+    def is_backfill_allowed(self, duration, when):
+        """Indicates whether a new job execution with the given estimated run time may be scheduled on this node. Nodes
+        that are not reserved allow any job execution. Reserved nodes only allow job executions that are estimated to
+        finish before the job execution that reserved the node could start.
+
+        :param duration: The estimated run time of the job execution, possibly None if unknown
+        :type duration: :class:`datetime.timedelta`
+        :param when: The current time
+        :type when: :class:`datetime.datetime`
+        :returns: True if the job execution may be scheduled on this node, False otherwise
+        :rtype: bool
+        """
+
+        if self._reserved_until is None:
+            return True
+        return duration is not None and when + duration <= self._reserved_until
+
+    def request_image_pre_pulls(self, image_names):
+        """Asks the node to pull the given job Docker images in the background
+
+        :param image_names: The Docker image names, in order of importance
+        :type image_names: [string]
+        """
+
+        self._node.set_images_to_pre_pull(image_names)
+
+    def reserve(self, until):
+        """Reserves this node for a higher priority job execution that is estimated to be able to start at the given time
+
+        :param until: The estimated start time of the job execution that reserved this node
+        :type until: :class:`datetime.datetime`
+        """
+
+        self._reserved_until = until
+
     def reset_new_job_exes(self):
         """Resets the allocated new job executions and deallocates any resources associated with them
         """
@@ -219,14 +338,9 @@ class SchedulingNode(object):
         available_resources.subtract(job_exe.required_resources)
         # Score is the number of job types that can fit within the estimated remaining resources. A better (lower) score
         # indicates a higher utilization of this node, reducing resource fragmentation.
-        score = 0
-        for job_type_resource in job_type_resources:
-            if available_resources.is_sufficient_to_meet(job_type_resource):
-                score += 1
-
-        return score
+        return available_resources.count_requests_met(job_type_resources)
 
-    def score_job_exe_for_scheduling(self, job_exe, job_type_resources):
+    def score_job_exe_for_scheduling(self, job_exe, job_type_resources, docker_image=None):
         """Returns an integer score (lower is better) indicating how well the given job execution fits on this node for
         scheduling. If the job execution cannot be scheduled on this node, None is returned.
 
@@ -234,6 +348,8 @@ class SchedulingNode(object):
         :type job_exe: :class:`queue.job_exe.QueuedJobExecution`
         :param job_type_resources: The list of all of the job type resource requirements
         :type job_type_resources: list
+        :param docker_image: The Docker image of the job execution, possibly None
+        :type docker_image: string
         :returns: The integer score indicating how good of a fit this job execution is for this node, possibly None
         :rtype: int
         """
@@ -251,10 +367,12 @@ class SchedulingNode(object):
 
         # Score is the number of job types that can fit within the estimated resources on this node still available to
         # Scale. A better (lower) score indicates a higher utilization of this node, reducing resource fragmentation.
-        score = 0
-        for job_type_resource in job_type_resources:
-            if total_resources_available.is_sufficient_to_meet(job_type_resource):
-                score += 1
+        score = total_resources_available.count_requests_met(job_type_resources)
+
+        # Nodes that already have the job's Docker image are always preferred over nodes that would need to pull it,
+        # so the penalty is larger than any possible utilization score
+        if docker_image and docker_image not in self._docker_images:
+            score += len(job_type_resources) + 1
 
         return score
 
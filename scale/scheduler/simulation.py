@@ -0,0 +1,270 @@
+"""Defines the classes that simulate a Mesos cluster so that the scheduler can be benchmarked without Mesos"""
+from __future__ import unicode_literals
+
+import logging
+import time
+from collections import OrderedDict
+
+from mesos.interface import mesos_pb2
+
+from node.resources.node_resources import NodeResources
+from node.resources.resource import ScalarResource
+
+
+logger = logging.getLogger(__name__)
+
+
+class SimulatedAgent(object):
+    """This class represents an agent within a simulated Mesos cluster"""
+
+    def __init__(self, agent_id, hostname, resources):
+        """Constructor
+
+        :param agent_id: The agent ID
+        :type agent_id: string
+        :param hostname: The agent's host name
+        :type hostname: string
+        :param resources: The total resources of the agent
+        :type resources: :class:`node.resources.node_resources.NodeResources`
+        """
+
+        self.agent_id = agent_id
+        self.hostname = hostname
+        self.available = resources.copy()  # Resources that are neither offered nor used by tasks
+
+
+class SimulatedTask(object):
+    """This class represents a task running within a simulated Mesos cluster"""
+
+    def __init__(self, task_id, agent_id, resources, finish_tick):
+        """Constructor
+
+        :param task_id: The task ID
+        :type task_id: string
+        :param agent_id: The ID of the agent running the task
+        :type agent_id: string
+        :param resources: The resources used by the task
+        :type resources: :class:`node.resources.node_resources.NodeResources`
+        :param finish_tick: The tick on which the task will finish
+        :type finish_tick: int
+        """
+
+        self.task_id = task_id
+        self.agent_id = agent_id
+        self.resources = resources
+        self.finish_tick = finish_tick
+
+
+class SimulatedCluster(object):
+    """This class simulates a Mesos cluster of identical agents. Time advances in ticks: each tick the cluster produces
+    offers for the resources of each agent that are neither offered nor used by tasks, and status updates for the tasks
+    that started or finished. Every task runs for a fixed number of ticks and then finishes successfully. This class is
+    NOT thread-safe.
+    """
+
+    def __init__(self, framework_id, agent_count, agent_resources, task_duration, prefix='sim'):
+        """Constructor
+
+        :param framework_id: The framework ID of the scheduler
+        :type framework_id: string
+        :param agent_count: The number of agents in the cluster
+        :type agent_count: int
+        :param agent_resources: The total resources of each agent
+        :type agent_resources: :class:`node.resources.node_resources.NodeResources`
+        :param task_duration: The number of ticks that each task runs
+        :type task_duration: int
+        :param prefix: The prefix for the agent IDs and host names
+        :type prefix: string
+        """
+
+        self.framework_id = framework_id
+        self.task_duration = max(task_duration, 1)
+        self.launched_task_count = 0
+        self.killed_task_count = 0
+
+        self._agents = OrderedDict()  # {Agent ID: SimulatedAgent}
+        for i in xrange(agent_count):
+            agent_id = '%s-agent-%i' % (prefix, i)
+            hostname = '%s-host-%i' % (prefix, i)
+            self._agents[agent_id] = SimulatedAgent(agent_id, hostname, agent_resources)
+        self._offer_counter = 0
+        self._offers = {}  # {Offer ID: (Agent ID, NodeResources)}
+        self._statuses = []  # Pending status updates
+        self._tasks = {}  # {Task ID: SimulatedTask}
+        self._tick = 0
+
+    @property
+    def running_task_count(self):
+        """Returns the number of tasks currently running in the cluster
+
+        :returns: The number of running tasks
+        :rtype: int
+        """
+
+        return len(self._tasks)
+
+    def advance(self):
+        """Advances the cluster by one tick, finishing any tasks whose time has come, and returns all of the status
+        updates produced since the last tick
+
+        :returns: The list of status updates to send to the scheduler
+        :rtype: [:class:`mesos_pb2.TaskStatus`]
+        """
+
+        self._tick += 1
+        for task in self._tasks.values():
+            if task.finish_tick <= self._tick:
+                self._remove_task(task.task_id, mesos_pb2.TASK_FINISHED)
+
+        statuses = self._statuses
+        self._statuses = []
+        return statuses
+
+    def create_offers(self):
+        """Creates and returns an offer for the resources of each agent that are neither offered nor used by tasks
+
+        :returns: The list of new offers to send to the scheduler
+        :rtype: [:class:`mesos_pb2.Offer`]
+        """
+
+        offers = []
+        for agent in self._agents.values():
+            if not any(resource.value > 0.0 for resource in agent.available.resources):
+                continue
+            self._offer_counter += 1
+            offer = mesos_pb2.Offer()
+            offer.id.value = 'offer-%i' % self._offer_counter
+            offer.framework_id.value = self.framework_id
+            offer.slave_id.value = agent.agent_id
+            offer.hostname = agent.hostname
+            for resource in agent.available.resources:
+                if resource.value > 0.0:
+                    offer_resource = offer.resources.add()
+                    offer_resource.name = resource.name
+                    offer_resource.type = mesos_pb2.Value.SCALAR
+                    offer_resource.scalar.value = resource.value
+            self._offers[offer.id.value] = (agent.agent_id, agent.available)
+            agent.available = NodeResources()
+            offers.append(offer)
+        return offers
+
+    def kill_task(self, task_id):
+        """Kills the given task
+
+        :param task_id: The ID of the task to kill
+        :type task_id: string
+        """
+
+        if task_id in self._tasks:
+            self.killed_task_count += 1
+            self._remove_task(task_id, mesos_pb2.TASK_KILLED)
+
+    def launch_tasks(self, offer_ids, mesos_tasks):
+        """Launches the given tasks using the given offers. The resources of the offers that are not used by the tasks
+        are returned to the agents.
+
+        :param offer_ids: The IDs of the offers being accepted
+        :type offer_ids: [string]
+        :param mesos_tasks: The tasks to launch
+        :type mesos_tasks: [:class:`mesos_pb2.TaskInfo`]
+        """
+
+        for offer_id in offer_ids:
+            if offer_id in self._offers:
+                agent_id, resources = self._offers.pop(offer_id)
+                self._agents[agent_id].available.add(resources)
+
+        for mesos_task in mesos_tasks:
+            task_id = mesos_task.task_id.value
+            agent_id = mesos_task.slave_id.value
+            resources = NodeResources([ScalarResource(r.name, r.scalar.value) for r in mesos_task.resources])
+            if agent_id not in self._agents:
+                self._add_status(task_id, agent_id, mesos_pb2.TASK_LOST)
+                continue
+            self._agents[agent_id].available.subtract(resources)
+            self._tasks[task_id] = SimulatedTask(task_id, agent_id, resources, self._tick + self.task_duration)
+            self.launched_task_count += 1
+            self._add_status(task_id, agent_id, mesos_pb2.TASK_RUNNING)
+
+    def reconcile_tasks(self, task_statuses):
+        """Produces a status update with the current state of each of the given tasks
+
+        :param task_statuses: The statuses of the tasks to reconcile
+        :type task_statuses: [:class:`mesos_pb2.TaskStatus`]
+        """
+
+        for task_status in task_statuses:
+            task_id = task_status.task_id.value
+            if task_id in self._tasks:
+                self._add_status(task_id, self._tasks[task_id].agent_id, mesos_pb2.TASK_RUNNING)
+            else:
+                self._add_status(task_id, task_status.slave_id.value, mesos_pb2.TASK_LOST)
+
+    def _add_status(self, task_id, agent_id, state):
+        """Adds a pending status update for the given task
+
+        :param task_id: The task ID
+        :type task_id: string
+        :param agent_id: The agent ID
+        :type agent_id: string
+        :param state: The Mesos task state
+        :type state: int
+        """
+
+        status = mesos_pb2.TaskStatus()
+        status.task_id.value = task_id
+        status.slave_id.value = agent_id
+        status.state = state
+        status.timestamp = time.time()
+        self._statuses.append(status)
+
+    def _remove_task(self, task_id, state):
+        """Removes the given task from the cluster, returning its resources to its agent, and adds a status update with
+        the given final state
+
+        :param task_id: The task ID
+        :type task_id: string
+        :param state: The final Mesos task state
+        :type state: int
+        """
+
+        task = self._tasks.pop(task_id)
+        self._agents[task.agent_id].available.add(task.resources)
+        self._add_status(task_id, task.agent_id, state)
+
+
+class SimulatedDriver(object):
+    """This class is a fake Mesos scheduler driver that forwards the calls made by the scheduler to a simulated cluster
+    and counts them
+    """
+
+    def __init__(self, cluster):
+        """Constructor
+
+        :param cluster: The simulated cluster
+        :type cluster: :class:`scheduler.simulation.SimulatedCluster`
+        """
+
+        self.cluster = cluster
+        self.launch_call_count = 0
+        self.reconcile_call_count = 0
+
+    def killTask(self, taskId):
+        """See :meth:`mesos_api.mesos.SchedulerDriver.killTask`
+        """
+
+        self.cluster.kill_task(taskId.value)
+
+    def launchTasks(self, offerIds, tasks, filters=None):
+        """See :meth:`mesos_api.mesos.SchedulerDriver.launchTasks`
+        """
+
+        self.launch_call_count += 1
+        self.cluster.launch_tasks([offer_id.value for offer_id in offerIds], tasks)
+
+    def reconcileTasks(self, tasks):
+        """See :meth:`mesos_api.mesos.SchedulerDriver.reconcileTasks`
+        """
+
+        self.reconcile_call_count += 1
+        self.cluster.reconcile_tasks(tasks)
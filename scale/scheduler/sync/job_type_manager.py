@@ -1,13 +1,28 @@
 """Defines the class that manages the syncing of the scheduler with the job type models"""
 from __future__ import unicode_literals
 
+import datetime
 import threading
 
-from job.models import JobType
+from django.conf import settings
+from django.db.models import Sum
+from django.utils.timezone import now
 
+from job.models import JobType, MIN_CPUS, MIN_MEM
+from metrics.models import MetricsJobType
 
-# TODO: when we calculate duration averages for job types, create a new job type class that contains model, resources,
-# stats, etc
+
+# The minimum number of sampled job executions that a job type needs before its resource usage is used for scheduling
+MIN_PROFILE_SAMPLES = 20
+
+# The factor applied to the sampled resource usage percentile, leaving headroom for job executions that use more
+PROFILE_HEADROOM = 1.25
+
+# The period between recalculations of the job type resource profiles
+PROFILE_REFRESH_PERIOD = datetime.timedelta(minutes=5)
+
+
+# TODO: create a new job type class that contains model, resources, stats, etc
 class JobTypeManager(object):
     """This class manages the syncing of the scheduler with the job type models. This class is thread-safe."""
 
@@ -15,6 +30,9 @@ class JobTypeManager(object):
         """Constructor
         """
 
+        self._job_type_durations = {}  # {Job Type ID: datetime.timedelta}
+        self._job_type_profiles = {}  # {Job Type ID: {Resource name: float}}
+        self._job_type_profiles_calculated = None  # When the job type resource profiles were last calculated
         self._job_type_resources = []
         self._job_types = {}  # {Job Type ID: Job Type}
         self._lock = threading.Lock()
@@ -49,6 +67,31 @@ class JobTypeManager(object):
                 return self._job_types[job_type_id]
             return None
 
+    def get_job_type_durations(self):
+        """Returns the estimated run time of each job type, calculated from the job type metrics. Job types without any
+        recently completed job executions are not included. Durations are only calculated when backfill scheduling is
+        enabled.
+
+        :returns: The estimated run times stored by job type ID
+        :rtype: {int: :class:`datetime.timedelta`}
+        """
+
+        with self._lock:
+            return dict(self._job_type_durations)
+
+    def get_job_type_profiles(self):
+        """Returns the resources to schedule for the jobs of each job type, calculated from the resources that the
+        recently completed job executions of the type actually used. Only CPUs and memory are profiled, and a resource
+        is only included once its job type has enough samples. Profiles are only calculated when resource profile
+        scheduling is enabled.
+
+        :returns: The profiled resource values stored by resource name, stored by job type ID
+        :rtype: {int: {string: float}}
+        """
+
+        with self._lock:
+            return dict(self._job_type_profiles)
+
     def get_job_type_resources(self):
         """Returns a list of all of the job type resource requirements
 
@@ -79,9 +122,65 @@ class JobTypeManager(object):
             updated_job_types[job_type.id] = job_type
             update_job_type_resources.append(job_type.get_resources())
 
+        updated_job_type_durations = {}
+        if settings.SCHEDULER_BACKFILL_ENABLED:
+            updated_job_type_durations = self._calculate_job_type_durations()
+
+        when = now()
+        updated_job_type_profiles = None
+        if not settings.SCHEDULER_RESOURCE_PROFILES_ENABLED:
+            updated_job_type_profiles = {}
+        elif not self._job_type_profiles_calculated or \
+                when > self._job_type_profiles_calculated + PROFILE_REFRESH_PERIOD:
+            updated_job_type_profiles = self._calculate_job_type_profiles()
+
         with self._lock:
+            self._job_type_durations = updated_job_type_durations
+            if updated_job_type_profiles is not None:
+                self._job_type_profiles = updated_job_type_profiles
+                self._job_type_profiles_calculated = when if settings.SCHEDULER_RESOURCE_PROFILES_ENABLED else None
             self._job_type_resources = update_job_type_resources
             self._job_types = updated_job_types
 
+    def _calculate_job_type_durations(self):
+        """Calculates the average run time of each job type from the recent job type metrics
+
+        :returns: The average run times stored by job type ID
+        :rtype: {int: :class:`datetime.timedelta`}
+        """
+
+        since = now().date() - datetime.timedelta(days=settings.SCHEDULER_BACKFILL_HISTORY_DAYS)
+        metrics_qry = MetricsJobType.objects.filter(occurred__gte=since).values('job_type_id')
+        metrics_qry = metrics_qry.annotate(total_run_time=Sum('run_time_sum'), total_completed=Sum('completed_count'))
+
+        durations = {}
+        for row in metrics_qry:
+            if row['total_run_time'] is not None and row['total_completed']:
+                seconds = row['total_run_time'] / float(row['total_completed'])
+                durations[row['job_type_id']] = datetime.timedelta(seconds=seconds)
+        return durations
+
+    def _calculate_job_type_profiles(self):
+        """Calculates the resource profile of each job type from the resources that its recently completed job
+        executions used, taking the configured percentile of the sampled peaks plus headroom
+
+        :returns: The profiled resource values stored by resource name, stored by job type ID
+        :rtype: {int: {string: float}}
+        """
+
+        since = now() - datetime.timedelta(days=settings.SCHEDULER_RESOURCE_PROFILE_HISTORY_DAYS)
+        percentile = settings.SCHEDULER_RESOURCE_PROFILE_PERCENTILE
+
+        profiles = {}
+        for resource_usage in JobType.objects.get_resource_usage(since):
+            profile = {}
+            for name, minimum in (('cpus', MIN_CPUS), ('mem', MIN_MEM)):
+                if resource_usage.get_sample_count(name) >= MIN_PROFILE_SAMPLES:
+                    value = resource_usage.get_percentile(name, percentile) * PROFILE_HEADROOM
+                    profile[name] = max(value, minimum)
+            if profile:
+                profiles[resource_usage.job_type.id] = profile
+        return profiles
+
 
 job_type_mgr = JobTypeManager()
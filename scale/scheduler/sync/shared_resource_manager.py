@@ -0,0 +1,98 @@
+"""Defines the class that manages the syncing of the scheduler with the shared resource models"""
+from __future__ import unicode_literals
+
+import threading
+
+from shared_resource.models import SharedResource, SharedResourceRequirement
+
+
+class SharedResourceManager(object):
+    """This class manages the syncing of the scheduler with the shared resource models and calculates how many units of
+    each shared resource the job executions use. This class is thread-safe.
+    """
+
+    def __init__(self):
+        """Constructor
+        """
+
+        self._job_type_usage = {}  # {Job Type ID: {Shared Resource ID: int}}
+        self._limits = {}  # {Shared Resource ID: int}
+        self._workspace_usage = {}  # {Workspace Name: {Shared Resource ID: int}}
+        self._lock = threading.Lock()
+
+    def calculate_remaining(self, running_job_exes):
+        """Calculates and returns the units of each shared resource that are not used by the given running job
+        executions
+
+        :param running_job_exes: The currently running job executions
+        :type running_job_exes: list
+        :returns: A dict where shared resource ID maps to the number of units that are still available. Counts may be
+            negative if the shared resource is used above its limit.
+        :rtype: dict
+        """
+
+        with self._lock:
+            remaining = dict(self._limits)
+            if not remaining:
+                return remaining
+            for running_job_exe in running_job_exes:
+                for shared_resource_id, usage in self._get_usage(running_job_exe).items():
+                    remaining[shared_resource_id] -= usage
+        return remaining
+
+    def get_usage(self, job_exe):
+        """Returns the units of each shared resource that the given job execution uses
+
+        :param job_exe: The job execution, either queued or running
+        :type job_exe: :class:`queue.job_exe.QueuedJobExecution` or :class:`job.execution.job_exe.RunningJobExecution`
+        :returns: The units used stored by shared resource ID
+        :rtype: {int: int}
+        """
+
+        with self._lock:
+            return self._get_usage(job_exe)
+
+    def sync_with_database(self):
+        """Syncs with the database to retrieve updated shared resource models
+        """
+
+        updated_limits = {}
+        for shared_resource in SharedResource.objects.all().iterator():
+            updated_limits[shared_resource.id] = shared_resource.limit
+
+        updated_job_type_usage = {}
+        updated_workspace_usage = {}
+        for requirement in SharedResourceRequirement.objects.select_related('workspace').iterator():
+            if requirement.shared_resource_id not in updated_limits:
+                continue  # Shared resource was created after the query above
+            if requirement.job_type_id is not None:
+                usage = updated_job_type_usage.setdefault(requirement.job_type_id, {})
+            else:
+                usage = updated_workspace_usage.setdefault(requirement.workspace.name, {})
+            usage[requirement.shared_resource_id] = usage.get(requirement.shared_resource_id, 0) + requirement.usage
+
+        with self._lock:
+            self._job_type_usage = updated_job_type_usage
+            self._limits = updated_limits
+            self._workspace_usage = updated_workspace_usage
+
+    def _get_usage(self, job_exe):
+        """Returns the units of each shared resource that the given job execution uses. Caller must have obtained the
+        lock.
+
+        :param job_exe: The job execution, either queued or running
+        :type job_exe: :class:`queue.job_exe.QueuedJobExecution` or :class:`job.execution.job_exe.RunningJobExecution`
+        :returns: The units used stored by shared resource ID
+        :rtype: {int: int}
+        """
+
+        usage = dict(self._job_type_usage.get(job_exe.job_type_id, {}))
+        if self._workspace_usage:
+            # Only look up the workspaces when there are workspace requirements, since it can parse the configuration
+            for workspace_name in job_exe.workspace_names:
+                for shared_resource_id, units in self._workspace_usage.get(workspace_name, {}).items():
+                    usage[shared_resource_id] = usage.get(shared_resource_id, 0) + units
+        return usage
+
+
+shared_resource_mgr = SharedResourceManager()
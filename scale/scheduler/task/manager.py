@@ -37,14 +37,16 @@ class TaskUpdateManager(object):
 
     def push_to_database(self):
         """Pushes the recent status updates to the database
-
-        :returns: The total number of status updates pushed
-        :rtype: int
         """
 
-        with self._lock:
-            task_updates = self._task_updates
-            self._task_updates = []
+        self.save_task_updates(self.take_task_updates())
+
+    def save_task_updates(self, task_updates):
+        """Saves the given status updates to the database in batches
+
+        :param task_updates: The task update models to save
+        :type task_updates: [:class:`job.models.TaskUpdate`]
+        """
 
         total_count = len(task_updates)
         if total_count >= TaskUpdateManager.COUNT_WARNING_THRESHOLD:
@@ -65,6 +67,18 @@ class TaskUpdateManager(object):
         if models:
             self._bulk_save(models)
 
+    def take_task_updates(self):
+        """Removes and returns the recent status updates that have not yet been pushed to the database
+
+        :returns: The task update models
+        :rtype: [:class:`job.models.TaskUpdate`]
+        """
+
+        with self._lock:
+            task_updates = self._task_updates
+            self._task_updates = []
+        return task_updates
+
     @retry_database_query
     def _bulk_save(self, models):
         """Performs a bulk save of the given task update models
@@ -0,0 +1,61 @@
+from __future__ import unicode_literals
+
+import django
+from django.test import TestCase
+from mock import patch
+
+from job.execution.job_exe import RunningJobExecution
+from job.test import utils as job_test_utils
+from scheduler.cleanup.node import NodeCleanup
+
+
+class TestNodeCleanup(TestCase):
+
+    def setUp(self):
+        django.setup()
+
+    def _add_job_exe(self, cleanup, disk_out_scheduled):
+        """Adds a new job execution with the given scheduled disk to the given node cleanup"""
+
+        job_exe = job_test_utils.create_job_exe()
+        job_exe.disk_in_scheduled = 0.0
+        job_exe.disk_out_scheduled = disk_out_scheduled
+        running_job_exe = RunningJobExecution('agent_1', job_exe)
+        cleanup.add_job_execution(running_job_exe)
+        return running_job_exe
+
+    @patch('scheduler.cleanup.node.MIN_JOB_EXES_PER_CLEANUP', 2)
+    @patch('scheduler.cleanup.node.MAX_JOB_EXES_PER_CLEANUP', 3)
+    def test_create_next_task(self):
+        """Tests that cleanup tasks are sized from the backlog and take the largest job executions first"""
+
+        cleanup = NodeCleanup()
+        small_job_exe = self._add_job_exe(cleanup, 10.0)
+        large_job_exe = self._add_job_exe(cleanup, 1000.0)
+        medium_job_exe = self._add_job_exe(cleanup, 100.0)
+
+        # Half of a backlog of 3 rounds up to 2
+        task = cleanup.create_next_task('agent_1', 'host_1', True)
+        self.assertListEqual(task.job_exes, [large_job_exe, medium_job_exe])
+
+        for _ in range(5):
+            self._add_job_exe(cleanup, 10.0)
+        task = cleanup.create_next_task('agent_1', 'host_1', True)
+        self.assertEqual(len(task.job_exes), 3)
+
+        cleanup.delete_job_executions([large_job_exe, medium_job_exe, small_job_exe])
+        node_dict = {}
+        cleanup.generate_status_json(node_dict)
+        self.assertEqual(node_dict['cleanup']['backlog'], 5)
+        self.assertEqual(node_dict['cleanup']['drain_rate_per_min'], 0.3)
+
+    @patch('scheduler.cleanup.node.DISK_PRESSURE_THRESHOLD', 1000.0)
+    def test_create_next_task_disk_pressure(self):
+        """Tests that cleanup tasks take the maximum batch size under disk pressure"""
+
+        cleanup = NodeCleanup()
+        for _ in range(30):
+            self._add_job_exe(cleanup, 100.0)
+
+        task = cleanup.create_next_task('agent_1', 'host_1', True)
+        self.assertEqual(len(task.job_exes), 30)
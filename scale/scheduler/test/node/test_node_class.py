@@ -58,7 +58,8 @@ class TestNode(TestCase):
                              'warnings': [{'name': 'CLEANUP', 'title': NodeConditions.CLEANUP_WARNING.title,
                                            'description': NodeConditions.CLEANUP_WARNING.description % num_job_exes,
                                            'started': datetime_to_string(right_now),
-                                           'last_updated': datetime_to_string(right_now)}]}]
+                                           'last_updated': datetime_to_string(right_now)}],
+                             'cleanup': {'backlog': 0, 'drain_rate_per_min': 0.0}}]
         self.assertListEqual(nodes_list, expected_results)
 
     def test_handle_failed_cleanup_task(self):
@@ -509,6 +510,65 @@ class TestNode(TestCase):
         # Node should now be ready
         self.assertEqual(node._state, Node.READY)
 
+    def test_pre_pull_task(self):
+        """Tests a ready node pre-pulling job Docker images"""
+
+        when = now()
+        node = Node(self.node_agent, self.node, self.scheduler)
+        node._last_heath_task = when
+        node._initial_cleanup_completed()
+        node._image_pull_completed()
+        node._update_state()
+        self.assertEqual(node._state, Node.READY)
+        self.assertListEqual([], node.get_next_tasks(when))
+
+        node.set_images_to_pre_pull(['image_1:1.0', 'image_2:1.0'])
+
+        # Get pre-pull task for first image
+        task = node.get_next_tasks(when)[0]
+        self.assertTrue(task.id.startswith(PULL_TASK_ID_PREFIX))
+        self.assertEqual(task.image_name, 'image_1:1.0')
+
+        # Complete pre-pull task, the image should now be on the node and the next image should be pulled
+        self.task_mgr.launch_tasks([task], now())
+        update = job_test_utils.create_task_status_update(task.id, task.agent_id, TaskStatusUpdate.FINISHED, now())
+        self.task_mgr.handle_task_update(update)
+        node.handle_task_update(update)
+        self.assertSetEqual(node.get_docker_images(), {'image_1:1.0'})
+        task = node.get_next_tasks(when)[0]
+        self.assertEqual(task.image_name, 'image_2:1.0')
+
+        # Fail pre-pull task, the image should not be tried again right away
+        self.task_mgr.launch_tasks([task], now())
+        update = job_test_utils.create_task_status_update(task.id, task.agent_id, TaskStatusUpdate.FAILED, now())
+        self.task_mgr.handle_task_update(update)
+        node.handle_task_update(update)
+        self.assertListEqual([], node.get_next_tasks(when))
+
+    @patch('scheduler.node.node_class.now')
+    def test_docker_image_refresh(self, mock_now):
+        """Tests that a job Docker image is only considered to be on a node for the refresh period after its pull"""
+
+        when = now()
+        mock_now.return_value = when
+        node = Node(self.node_agent, self.node, self.scheduler)
+        node._last_heath_task = when
+        node._initial_cleanup_completed()
+        node._image_pull_completed()
+        node._update_state()
+        node.add_docker_image('image_1:1.0')
+        node.set_images_to_pre_pull(['image_1:1.0'])
+        self.assertSetEqual(node.get_docker_images(), {'image_1:1.0'})
+        self.assertListEqual([], node.get_next_tasks(when))
+
+        # After the refresh period, the image should no longer be trusted and should be pre-pulled again
+        when += Node.DOCKER_IMAGE_REFRESH_PERIOD
+        mock_now.return_value = when
+        self.assertSetEqual(node.get_docker_images(), set())
+        tasks = [task for task in node.get_next_tasks(when) if task.id.startswith(PULL_TASK_ID_PREFIX)]
+        self.assertEqual(len(tasks), 1)
+        self.assertEqual(tasks[0].image_name, 'image_1:1.0')
+
     def test_handle_killed_pull_task(self):
         """Tests handling killed cleanup task"""
 
@@ -0,0 +1,109 @@
+from __future__ import unicode_literals
+
+import datetime
+
+import django
+from django.test import TestCase
+from django.utils.timezone import now
+from mock import MagicMock, patch
+
+from job.tasks.base_task import Task
+from node.resources.node_resources import NodeResources
+from scheduler.recon.manager import ReconciliationManager
+
+
+# Non-abstract class to test implementation of base Task class
+class ImplementedTask(Task):
+
+    def get_resources(self):
+        """Returns the resources that are required/have been scheduled for this task
+
+        :returns: The scheduled resources for this task
+        :rtype: :class:`node.resources.node_resources.NodeResources`
+        """
+
+        return NodeResources()
+
+
+class TestReconciliationManager(TestCase):
+    """Tests the ReconciliationManager class"""
+
+    def setUp(self):
+        django.setup()
+
+        self.driver = MagicMock()
+        self.manager = ReconciliationManager()
+        self.manager.driver = self.driver
+
+    def _get_reconciled_task_ids(self):
+        """Returns the IDs of the tasks sent in each explicit reconciliation request since the last call"""
+
+        task_ids = []
+        for call in self.driver.reconcileTasks.call_args_list:
+            task_statuses = call[0][0]
+            if task_statuses:
+                task_ids.append([task_status.task_id.value for task_status in task_statuses])
+        self.driver.reconcileTasks.reset_mock()
+        return task_ids
+
+    def test_implicit_reconciliation(self):
+        """Tests that implicit reconciliation is only performed after the driver (re-)registers"""
+
+        self.manager.perform_reconciliation()
+        self.driver.reconcileTasks.assert_called_once_with([])
+
+        # No implicit request goes out between registrations, no matter how much time passes
+        self.driver.reconcileTasks.reset_mock()
+        self.manager.perform_reconciliation()
+        for minutes in [6, 60, 24 * 60]:
+            later = now() + datetime.timedelta(minutes=minutes)
+            with patch('scheduler.recon.manager.now', return_value=later):
+                self.manager.perform_reconciliation()
+        self.assertFalse(self.driver.reconcileTasks.called)
+
+        # Driver re-registers
+        self.manager.driver = self.driver
+        self.manager.perform_reconciliation()
+        self.driver.reconcileTasks.assert_called_once_with([])
+
+    @patch('scheduler.recon.manager.MAX_TASKS_PER_RECON', 2)
+    def test_bounded_requests(self):
+        """Tests that explicit reconciliation requests are bounded and that unanswered tasks are sent again"""
+
+        tasks = [ImplementedTask('task_%d' % i, 'Task %d' % i, 'agent_1') for i in range(3)]
+        self.manager.add_tasks(tasks)
+
+        self.manager.perform_reconciliation()
+        first_ids = self._get_reconciled_task_ids()
+        self.assertEqual(len(first_ids), 1)
+        self.assertEqual(len(first_ids[0]), 2)
+        self.manager.perform_reconciliation()
+        second_ids = self._get_reconciled_task_ids()
+        self.assertEqual(len(second_ids[0]), 1)
+        self.assertSetEqual(set(first_ids[0] + second_ids[0]), {'task_0', 'task_1', 'task_2'})
+
+        # Nothing is sent again until the threshold passes, and then one task that was answered is skipped
+        self.manager.perform_reconciliation()
+        self.assertListEqual(self._get_reconciled_task_ids(), [])
+        self.manager.remove_task_id(first_ids[0][0])
+        later = now() + datetime.timedelta(minutes=3)
+        with patch('scheduler.recon.manager.now', return_value=later):
+            self.manager.perform_reconciliation()
+        resent_ids = self._get_reconciled_task_ids()
+        self.assertEqual(len(resent_ids), 1)
+        self.assertSetEqual(set(resent_ids[0]), {first_ids[0][1], second_ids[0][0]})
+
+    def test_skip_recent_updates(self):
+        """Tests that a task which just received a status update is not sent until the update is no longer recent"""
+
+        task = ImplementedTask('task_1', 'Task 1', 'agent_1')
+        self.manager.remove_task_id(task.id)
+        self.manager.add_tasks([task])
+
+        self.manager.perform_reconciliation()
+        self.assertListEqual(self._get_reconciled_task_ids(), [])
+
+        later = now() + datetime.timedelta(seconds=30)
+        with patch('scheduler.recon.manager.now', return_value=later):
+            self.manager.perform_reconciliation()
+        self.assertListEqual(self._get_reconciled_task_ids(), [['task_1']])
@@ -8,6 +8,7 @@ from mock import MagicMock, patch
 
 from job.execution.job_exe import RunningJobExecution
 from job.execution.manager import job_exe_mgr
+from job.models import Job
 from job.test import utils as job_test_utils
 from node.resources.node_resources import NodeResources
 from node.resources.resource import Cpus, Disk, Mem
@@ -21,6 +22,8 @@ from scheduler.resources.manager import resource_mgr
 from scheduler.resources.offer import ResourceOffer
 from scheduler.scheduling.manager import SchedulingManager
 from scheduler.sync.job_type_manager import job_type_mgr
+from scheduler.sync.shared_resource_manager import shared_resource_mgr
+from shared_resource.models import SharedResource
 
 
 class TestSchedulingManager(TestCase):
@@ -55,6 +58,7 @@ class TestSchedulingManager(TestCase):
         self.queue_2 = queue_test_utils.create_queue(cpus_required=8.0, mem_required=512.0, disk_in_required=400.0,
                                                      disk_out_required=45.0, disk_total_required=445.0)
         job_type_mgr.sync_with_database()
+        shared_resource_mgr.sync_with_database()
 
     @patch('mesos_api.tasks.mesos_pb2.TaskInfo')
     def test_successful_schedule(self, mock_taskinfo):
@@ -160,3 +164,63 @@ class TestSchedulingManager(TestCase):
         scheduling_manager = SchedulingManager()
         num_tasks = scheduling_manager.perform_scheduling(self._driver, now())
         self.assertEqual(num_tasks, 3)  # One is already running, should only be able to schedule 3 more
+
+    @patch('mesos_api.tasks.mesos_pb2.TaskInfo')
+    def test_shared_resource_limit(self, mock_taskinfo):
+        """Tests calling perform_scheduling() with a shared resource limit"""
+        mock_taskinfo.return_value = MagicMock()
+
+        Queue.objects.all().delete()
+        job_type = job_test_utils.create_job_type()
+        SharedResource.objects.create_shared_resource('external-service', None, None, 5,
+                                                      [{'job_type_id': job_type.id, 'usage': 2}])
+        job_exe_1 = job_test_utils.create_job_exe(job_type=job_type, status='RUNNING')
+        for _ in range(4):
+            queue_test_utils.create_queue(job_type=job_type)
+        job_type_mgr.sync_with_database()
+        shared_resource_mgr.sync_with_database()
+        # One job of this type is already running and using 2 units
+        job_exe_mgr.schedule_job_exes([RunningJobExecution(self.agent_1.agent_id, job_exe_1)])
+
+        offer_1 = ResourceOffer('offer_1', self.agent_1.agent_id, self.framework_id,
+                                NodeResources([Cpus(2.0), Mem(1024.0), Disk(1024.0)]), now())
+        offer_2 = ResourceOffer('offer_2', self.agent_2.agent_id, self.framework_id,
+                                NodeResources([Cpus(25.0), Mem(2048.0), Disk(2048.0)]), now())
+        resource_mgr.add_new_offers([offer_1, offer_2])
+
+        scheduling_manager = SchedulingManager()
+        num_tasks = scheduling_manager.perform_scheduling(self._driver, now())
+        self.assertEqual(num_tasks, 1)  # Only 3 units are left, enough for 1 more job execution
+
+    @patch('mesos_api.tasks.mesos_pb2.TaskInfo')
+    @patch('scheduler.scheduling.manager.job_type_mgr.get_job_type_profiles')
+    def test_resource_profile(self, mock_get_profiles, mock_taskinfo):
+        """Tests calling perform_scheduling() with a resource profile that lowers the resources of a job type"""
+        mock_taskinfo.return_value = MagicMock()
+        mock_get_profiles.return_value = {self.queue_1.job_type_id: {'cpus': 1.0, 'mem': 256.0}}
+
+        offer = ResourceOffer('offer', self.agent_1.agent_id, self.framework_id,
+                              NodeResources([Cpus(2.0), Mem(1024.0), Disk(1024.0)]), now())
+        resource_mgr.add_new_offers([offer])
+
+        scheduling_manager = SchedulingManager()
+        with self.settings(SCHEDULER_RESOURCE_PROFILES_ENABLED=True):
+            num_tasks = scheduling_manager.perform_scheduling(self._driver, now())
+        self.assertEqual(num_tasks, 1)  # Job 1 only fits with its profiled CPUs
+
+    @patch('mesos_api.tasks.mesos_pb2.TaskInfo')
+    @patch('scheduler.scheduling.manager.job_type_mgr.get_job_type_profiles')
+    def test_resource_profile_retried_job(self, mock_get_profiles, mock_taskinfo):
+        """Tests calling perform_scheduling() with a resource profile for a job that is being retried"""
+        mock_taskinfo.return_value = MagicMock()
+        mock_get_profiles.return_value = {self.queue_1.job_type_id: {'cpus': 1.0, 'mem': 256.0}}
+        Job.objects.filter(id=self.queue_1.job_id).update(num_exes=2)
+
+        offer = ResourceOffer('offer', self.agent_1.agent_id, self.framework_id,
+                              NodeResources([Cpus(2.0), Mem(1024.0), Disk(1024.0)]), now())
+        resource_mgr.add_new_offers([offer])
+
+        scheduling_manager = SchedulingManager()
+        with self.settings(SCHEDULER_RESOURCE_PROFILES_ENABLED=True):
+            num_tasks = scheduling_manager.perform_scheduling(self._driver, now())
+        self.assertEqual(num_tasks, 0)  # Retried job 1 needs the 4 CPUs it requests
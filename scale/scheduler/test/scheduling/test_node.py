@@ -1,6 +1,8 @@
 from __future__ import absolute_import
 from __future__ import unicode_literals
 
+import datetime
+
 import django
 from django.test import TestCase
 from django.utils.timezone import now
@@ -162,6 +164,36 @@ class TestSchedulingNode(TestCase):
         self.assertTrue(scheduling_node._remaining_resources.is_equal(NodeResources([Cpus(9.0), Mem(40.0)])))
         self.assertEqual(job_exe.provided_node_id, node.id)
 
+    def test_accept_new_job_exe_docker_image(self):
+        """Tests calling accept_new_job_exe() passes the job's Docker image only if the node recently pulled it"""
+
+        node = MagicMock()
+        node.hostname = 'host_1'
+        node.id = 1
+        node.is_ready_for_new_job = MagicMock()
+        node.is_ready_for_new_job.return_value = True
+        node.is_ready_for_next_job_task = MagicMock()
+        node.is_ready_for_next_job_task.return_value = True
+        node.get_docker_images = MagicMock()
+        node.get_docker_images.return_value = {'my-image:1.0'}
+        offered_resources = NodeResources([Cpus(10.0), Mem(50.0)])
+        task_resources = NodeResources()
+        watermark_resources = NodeResources([Cpus(100.0), Mem(500.0)])
+        resource_set = ResourceSet(offered_resources, task_resources, watermark_resources)
+        scheduling_node = SchedulingNode('agent_1', node, [], [], resource_set)
+
+        queue_model_1 = queue_test_utils.create_queue(cpus_required=1.0, mem_required=10.0, disk_in_required=0.0,
+                                                      disk_out_required=0.0, disk_total_required=0.0)
+        job_exe_1 = QueuedJobExecution(queue_model_1)
+        queue_model_2 = queue_test_utils.create_queue(cpus_required=1.0, mem_required=10.0, disk_in_required=0.0,
+                                                      disk_out_required=0.0, disk_total_required=0.0)
+        job_exe_2 = QueuedJobExecution(queue_model_2)
+
+        self.assertTrue(scheduling_node.accept_new_job_exe(job_exe_1, 'my-image:1.0'))
+        self.assertTrue(scheduling_node.accept_new_job_exe(job_exe_2, 'other-image:1.0'))
+        self.assertEqual(job_exe_1.provided_docker_image, 'my-image:1.0')
+        self.assertIsNone(job_exe_2.provided_docker_image)
+
     def test_accept_new_job_exe_insufficient_resources(self):
         """Tests calling accept_new_job_exe() when there are not enough resources"""
 
@@ -447,6 +479,67 @@ class TestSchedulingNode(TestCase):
         self.assertTrue(scheduling_node.allocated_resources.is_equal(NodeResources()))
         self.assertTrue(scheduling_node._remaining_resources.is_equal(offered_resources))
 
+    def test_estimate_reservation_start(self):
+        """Tests calling estimate_reservation_start() successfully"""
+
+        when = now()
+        node = MagicMock()
+        node.hostname = 'host_1'
+        node.id = 1
+        node.is_ready_for_new_job = MagicMock()
+        node.is_ready_for_new_job.return_value = True
+        node.is_ready_for_next_job_task = MagicMock()
+        node.is_ready_for_next_job_task.return_value = True
+        # Two running job executions use 8 of the 10 CPUs
+        job_exe_model_1 = job_test_utils.create_job_exe(resources=NodeResources([Cpus(4.0), Mem(10.0)]),
+                                                        started=when - datetime.timedelta(minutes=50))
+        job_exe_1 = RunningJobExecution(self.agent_id, job_exe_model_1)
+        job_exe_model_2 = job_test_utils.create_job_exe(resources=NodeResources([Cpus(4.0), Mem(10.0)]),
+                                                        started=when - datetime.timedelta(minutes=10))
+        job_exe_2 = RunningJobExecution(self.agent_id, job_exe_model_2)
+        offered_resources = NodeResources([Cpus(2.0), Mem(80.0)])
+        task_resources = NodeResources([Cpus(8.0), Mem(20.0)])
+        watermark_resources = NodeResources([Cpus(10.0), Mem(100.0)])
+        resource_set = ResourceSet(offered_resources, task_resources, watermark_resources)
+        scheduling_node = SchedulingNode('agent_1', node, [], [job_exe_1, job_exe_2], resource_set)
+
+        queue_model = queue_test_utils.create_queue(cpus_required=5.0, mem_required=10.0, disk_in_required=0.0,
+                                                    disk_out_required=0.0, disk_total_required=0.0)
+        job_exe = QueuedJobExecution(queue_model)
+        durations = {job_exe_1.job_type_id: datetime.timedelta(hours=1),
+                     job_exe_2.job_type_id: datetime.timedelta(hours=1)}
+
+        # First job execution is expected to finish in 10 minutes, freeing enough CPUs
+        start = scheduling_node.estimate_reservation_start(job_exe, durations, when)
+        self.assertEqual(start, when + datetime.timedelta(minutes=10))
+
+        # Without a duration for the first job execution, the second one must finish (in 50 minutes)
+        del durations[job_exe_1.job_type_id]
+        start = scheduling_node.estimate_reservation_start(job_exe, durations, when)
+        self.assertEqual(start, when + datetime.timedelta(minutes=50))
+
+        # Without any durations, the start cannot be estimated
+        self.assertIsNone(scheduling_node.estimate_reservation_start(job_exe, {}, when))
+
+    def test_is_backfill_allowed(self):
+        """Tests calling is_backfill_allowed() for reserved and unreserved nodes"""
+
+        when = now()
+        node = MagicMock()
+        node.hostname = 'host_1'
+        node.id = 1
+        resource_set = ResourceSet(NodeResources(), NodeResources(), NodeResources())
+        scheduling_node = SchedulingNode('agent_1', node, [], [], resource_set)
+
+        self.assertFalse(scheduling_node.is_reserved)
+        self.assertTrue(scheduling_node.is_backfill_allowed(None, when))
+
+        scheduling_node.reserve(when + datetime.timedelta(minutes=30))
+        self.assertTrue(scheduling_node.is_reserved)
+        self.assertTrue(scheduling_node.is_backfill_allowed(datetime.timedelta(minutes=20), when))
+        self.assertFalse(scheduling_node.is_backfill_allowed(datetime.timedelta(minutes=40), when))
+        self.assertFalse(scheduling_node.is_backfill_allowed(None, when))
+
     def test_reset_new_job_exes(self):
         """Tests calling reset_new_job_exes() successfully"""
 
@@ -618,6 +711,38 @@ class TestSchedulingNode(TestCase):
                                                                        job_type_resource_3, job_type_resource_4])
         self.assertEqual(score, 2)
 
+    def test_score_job_exe_for_scheduling_image_locality(self):
+        """Tests calling score_job_exe_for_scheduling() where nodes that already have the job's image are preferred"""
+
+        node = MagicMock()
+        node.hostname = 'host_1'
+        node.id = 1
+        node.is_ready_for_new_job = MagicMock()
+        node.is_ready_for_new_job.return_value = True
+        node.is_ready_for_next_job_task = MagicMock()
+        node.is_ready_for_next_job_task.return_value = True
+        node.get_docker_images = MagicMock()
+        node.get_docker_images.return_value = {'my-image:1.0'}
+        offered_resources = NodeResources([Cpus(20.0), Mem(100.0)])
+        task_resources = NodeResources()
+        watermark_resources = NodeResources([Cpus(20.0), Mem(100.0)])
+        resource_set = ResourceSet(offered_resources, task_resources, watermark_resources)
+        scheduling_node = SchedulingNode('agent_1', node, [], [], resource_set)
+
+        queue_model = queue_test_utils.create_queue(cpus_required=5.0, mem_required=40.0, disk_in_required=0.0,
+                                                    disk_out_required=0.0, disk_total_required=0.0)
+        job_exe = QueuedJobExecution(queue_model)
+        job_type_resource_1 = NodeResources([Cpus(2.0), Mem(10.0)])
+        job_type_resource_2 = NodeResources([Cpus(200.0), Mem(10.0)])
+        job_type_resources = [job_type_resource_1, job_type_resource_2]
+
+        # Image is on node, so only the utilization score applies
+        score = scheduling_node.score_job_exe_for_scheduling(job_exe, job_type_resources, 'my-image:1.0')
+        self.assertEqual(score, 1)
+        # Image is not on node, so score is worse than any node that has the image
+        score = scheduling_node.score_job_exe_for_scheduling(job_exe, job_type_resources, 'other-image:1.0')
+        self.assertEqual(score, 4)
+
     def test_score_job_exe_for_scheduling_insufficient_resources(self):
         """Tests calling score_job_exe_for_scheduling() when there are not enough resources to schedule the job"""
 
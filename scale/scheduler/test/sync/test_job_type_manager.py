@@ -1,8 +1,12 @@
 from __future__ import unicode_literals
 
+import datetime
+
 import django
 from django.test import TestCase
 
+import job.test.utils as job_test_utils
+import metrics.test.utils as metrics_test_utils
 from scheduler.sync.job_type_manager import JobTypeManager
 
 
@@ -22,3 +26,18 @@ class TestJobTypeManager(TestCase):
         manager.generate_status_json(status_dict)
 
         self.assertEqual(len(status_dict['job_types']), 1)
+
+    def test_job_type_durations(self):
+        """Tests calculating the job type durations used for backfill scheduling"""
+
+        job_type = job_test_utils.create_job_type()
+        metrics_test_utils.create_job_type(job_type=job_type, completed_count=2, run_time_sum=300)
+        metrics_test_utils.create_job_type(job_type=job_type, completed_count=1, run_time_sum=600)
+
+        manager = JobTypeManager()
+        manager.sync_with_database()
+        self.assertDictEqual(manager.get_job_type_durations(), {})
+
+        with self.settings(SCHEDULER_BACKFILL_ENABLED=True):
+            manager.sync_with_database()
+        self.assertDictEqual(manager.get_job_type_durations(), {job_type.id: datetime.timedelta(seconds=300)})
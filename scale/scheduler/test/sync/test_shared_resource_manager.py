@@ -0,0 +1,41 @@
+from __future__ import unicode_literals
+
+import django
+from django.test import TestCase
+from mock import MagicMock
+
+import job.test.utils as job_test_utils
+import storage.test.utils as storage_test_utils
+from scheduler.sync.shared_resource_manager import SharedResourceManager
+from shared_resource.models import SharedResource
+
+
+class TestSharedResourceManager(TestCase):
+
+    def setUp(self):
+        django.setup()
+
+        self.job_type_1 = job_test_utils.create_job_type()
+        self.job_type_2 = job_test_utils.create_job_type()
+        self.workspace = storage_test_utils.create_workspace(name='ws1')
+        self.bandwidth = SharedResource.objects.create_shared_resource('bandwidth', None, None, 10,
+                                                                       [{'workspace_id': self.workspace.id}])
+        self.service = SharedResource.objects.create_shared_resource('service', None, None, 3,
+                                                                     [{'job_type_id': self.job_type_1.id, 'usage': 2}])
+
+    def test_calculate_remaining(self):
+        """Tests calculating the units of each shared resource left by the running job executions"""
+
+        manager = SharedResourceManager()
+        manager.sync_with_database()
+
+        job_exe_1 = MagicMock(job_type_id=self.job_type_1.id, workspace_names={'ws1'})
+        job_exe_2 = MagicMock(job_type_id=self.job_type_2.id, workspace_names={'ws1', 'ws2'})
+        job_exe_3 = MagicMock(job_type_id=self.job_type_2.id, workspace_names=set())
+
+        self.assertDictEqual(manager.get_usage(job_exe_1), {self.bandwidth.id: 1, self.service.id: 2})
+        self.assertDictEqual(manager.get_usage(job_exe_2), {self.bandwidth.id: 1})
+        self.assertDictEqual(manager.get_usage(job_exe_3), {})
+
+        remaining = manager.calculate_remaining([job_exe_1, job_exe_2, job_exe_3])
+        self.assertDictEqual(remaining, {self.bandwidth.id: 8, self.service.id: 1})
@@ -21,9 +21,10 @@ class TestScheduler(TransactionTestCase):
 
         # mock out threading.start
 
+    @patch('scheduler.scale_scheduler.db_worker_mgr')
     @patch('scheduler.scale_scheduler.initialize_system')
     @patch('scheduler.scale_scheduler.threading.Thread.start')
-    def _get_mocked_scheduler_driver_master(self, _m1, _m2):
+    def _get_mocked_scheduler_driver_master(self, _m1, _m2, _m3):
         """gets a registered scheduler with some stuff mocked out for testing"""
         return self._get_registered_scheduler_driver_master()
 
@@ -39,11 +40,13 @@ class TestScheduler(TransactionTestCase):
         my_scheduler.registered(driver, framework_id, master_info)
         return my_scheduler, driver, master_info
 
+    @patch('scheduler.scale_scheduler.db_worker_mgr')
     @patch('scheduler.scale_scheduler.initialize_system')
     @patch('scheduler.scale_scheduler.threading.Thread.start')
-    def testRegistration(self, mock_thread_start, mock_initializer):
+    def testRegistration(self, mock_thread_start, mock_initializer, mock_db_worker_mgr):
         my_scheduler, driver, master_info = self._get_registered_scheduler_driver_master()
         self.assertTrue(mock_initializer.called, 'initializer should be called on registration')
+        self.assertTrue(mock_db_worker_mgr.start.called, 'database worker should be started on registration')
         self.assertEqual(
             mock_thread_start.call_count, 6,
             '6 threads should be started (6 != %d)' % mock_thread_start.call_count
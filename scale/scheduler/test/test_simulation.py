@@ -0,0 +1,89 @@
+from __future__ import unicode_literals
+
+import django
+from django.test import TestCase
+from mesos.interface import mesos_pb2
+
+from node.resources.node_resources import NodeResources
+from node.resources.resource import Cpus, Disk, Mem
+from scheduler.simulation import SimulatedCluster, SimulatedDriver
+
+
+class TestSimulatedCluster(TestCase):
+
+    def setUp(self):
+        django.setup()
+
+        resources = NodeResources([Cpus(10.0), Mem(1024.0), Disk(2048.0)])
+        self.cluster = SimulatedCluster('framework_1', 2, resources, 2)
+        self.driver = SimulatedDriver(self.cluster)
+
+    def _create_task(self, task_id, agent_id, cpus):
+        mesos_task = mesos_pb2.TaskInfo()
+        mesos_task.task_id.value = task_id
+        mesos_task.slave_id.value = agent_id
+        mesos_task.name = task_id
+        task_resource = mesos_task.resources.add()
+        task_resource.name = 'cpus'
+        task_resource.type = mesos_pb2.Value.SCALAR
+        task_resource.scalar.value = cpus
+        return mesos_task
+
+    def test_task_lifecycle(self):
+        """Tests offering resources, launching a task, and the task finishing"""
+
+        offers = self.cluster.create_offers()
+        self.assertEqual(len(offers), 2)
+        # Offered resources are not offered again
+        self.assertListEqual(self.cluster.create_offers(), [])
+
+        offer = offers[0]
+        offer_id = mesos_pb2.OfferID()
+        offer_id.value = offer.id.value
+        self.driver.launchTasks([offer_id], [self._create_task('task_1', offer.slave_id.value, 4.0)])
+        self.assertEqual(self.driver.launch_call_count, 1)
+        self.assertEqual(self.cluster.running_task_count, 1)
+
+        # Unused resources of the accepted offer are offered again
+        offers = self.cluster.create_offers()
+        self.assertEqual(len(offers), 1)
+        cpus = [r.scalar.value for r in offers[0].resources if r.name == 'cpus'][0]
+        self.assertEqual(cpus, 6.0)
+
+        statuses = self.cluster.advance()
+        self.assertEqual(len(statuses), 1)
+        self.assertEqual(statuses[0].state, mesos_pb2.TASK_RUNNING)
+
+        statuses = self.cluster.advance()
+        self.assertEqual(len(statuses), 1)
+        self.assertEqual(statuses[0].task_id.value, 'task_1')
+        self.assertEqual(statuses[0].state, mesos_pb2.TASK_FINISHED)
+        self.assertEqual(self.cluster.running_task_count, 0)
+
+        # Resources of the finished task are offered again
+        offers = self.cluster.create_offers()
+        self.assertEqual(len(offers), 1)
+        cpus = [r.scalar.value for r in offers[0].resources if r.name == 'cpus'][0]
+        self.assertEqual(cpus, 4.0)
+
+    def test_kill_and_reconcile(self):
+        """Tests killing and reconciling tasks"""
+
+        offer = self.cluster.create_offers()[0]
+        offer_id = mesos_pb2.OfferID()
+        offer_id.value = offer.id.value
+        self.driver.launchTasks([offer_id], [self._create_task('task_1', offer.slave_id.value, 1.0)])
+        self.cluster.advance()
+
+        task_id = mesos_pb2.TaskID()
+        task_id.value = 'task_1'
+        self.driver.killTask(task_id)
+        self.assertEqual(self.cluster.killed_task_count, 1)
+
+        status = mesos_pb2.TaskStatus()
+        status.task_id.value = 'task_1'
+        status.state = mesos_pb2.TASK_RUNNING
+        self.driver.reconcileTasks([status])
+
+        statuses = self.cluster.advance()
+        self.assertListEqual([s.state for s in statuses], [mesos_pb2.TASK_KILLED, mesos_pb2.TASK_LOST])
@@ -0,0 +1,55 @@
+from __future__ import unicode_literals
+
+import django
+from django.test import TestCase
+from mock import MagicMock, patch
+
+from job.execution.tasks.job_task import JobTask
+from scheduler.threads.resource_usage import ResourceUsageThread
+
+
+class TestResourceUsageThread(TestCase):
+
+    def setUp(self):
+        django.setup()
+
+        self.task = MagicMock(spec=JobTask, id='task_1', agent_id='agent_1', has_started=True, has_ended=False)
+        self.node = MagicMock(hostname='host_1', port=5051)
+
+    @patch('scheduler.threads.resource_usage.get_slave_task_statistics')
+    @patch('scheduler.threads.resource_usage.node_mgr')
+    @patch('scheduler.threads.resource_usage.job_exe_mgr')
+    def test_execute(self, mock_job_exe_mgr, mock_node_mgr, mock_get_statistics):
+        """Tests that the statistics of each agent are passed to its running job tasks"""
+
+        mock_job_exe_mgr.get_running_job_exes.return_value = [MagicMock(current_task=self.task)]
+        mock_node_mgr.get_node.return_value = self.node
+        mock_get_statistics.return_value = {'task_1': {'mem_rss_bytes': 1048576}}
+
+        ResourceUsageThread()._execute()
+
+        mock_get_statistics.assert_called_once_with('host_1', 5051, 5.0)
+        self.task.update_resource_usage.assert_called_once_with({'mem_rss_bytes': 1048576})
+
+    @patch('scheduler.threads.resource_usage.logger')
+    @patch('scheduler.threads.resource_usage.get_slave_task_statistics')
+    @patch('scheduler.threads.resource_usage.node_mgr')
+    @patch('scheduler.threads.resource_usage.job_exe_mgr')
+    def test_unreachable_node(self, mock_job_exe_mgr, mock_node_mgr, mock_get_statistics, mock_logger):
+        """Tests that an unreachable agent is only warned about once per warning period"""
+
+        mock_job_exe_mgr.get_running_job_exes.return_value = [MagicMock(current_task=self.task)]
+        mock_node_mgr.get_node.return_value = self.node
+        mock_get_statistics.side_effect = IOError('Connection refused')
+
+        thread = ResourceUsageThread()
+        thread._execute()
+        thread._execute()
+
+        self.assertEqual(mock_logger.warning.call_count, 1)
+        self.assertFalse(self.task.update_resource_usage.called)
+
+        mock_get_statistics.side_effect = None
+        mock_get_statistics.return_value = {}
+        thread._execute()
+        self.assertEqual(mock_logger.info.call_count, 1)
@@ -0,0 +1,144 @@
+from __future__ import unicode_literals
+
+import datetime
+
+import django
+from django.test import TestCase
+from django.utils.timezone import now
+from mock import MagicMock, patch
+from requests.exceptions import ConnectionError, Timeout
+
+from scheduler.vault.manager import SecretsManager
+from vault.exceptions import InvalidSecretsAuthorization, InvalidSecretsRequest
+
+
+class TestSecretsManager(TestCase):
+
+    def setUp(self):
+        django.setup()
+
+        self.handler = MagicMock()
+        self.handler.list_job_types.return_value = ['job-a-1.0', 'job-b-1.0']
+        self.handler.get_job_type_secrets.side_effect = lambda job: {'secret': job}
+
+    @patch('scheduler.vault.manager.SecretsHandler')
+    def test_refresh_secrets(self, mock_handler_class):
+        """Tests refreshing the secrets cache from the backend"""
+
+        mock_handler_class.return_value = self.handler
+        manager = SecretsManager()
+        manager.refresh_secrets()
+
+        self.assertDictEqual(manager.retrieve_job_type_secrets('job-a-1.0'), {'secret': 'job-a-1.0'})
+        self.assertDictEqual(manager.retrieve_job_type_secrets('job-b-1.0'), {'secret': 'job-b-1.0'})
+        self.assertDictEqual(manager.retrieve_job_type_secrets('job-c-1.0'), {})
+
+    @patch('scheduler.vault.manager.SecretsHandler')
+    def test_refresh_secrets_ttl(self, mock_handler_class):
+        """Tests that cached secrets are only fetched again once their TTL expires"""
+
+        mock_handler_class.return_value = self.handler
+        manager = SecretsManager()
+        when = now()
+
+        with self.settings(SECRETS_CACHE_TTL=60):
+            manager.refresh_secrets(when)
+            self.assertEqual(self.handler.get_job_type_secrets.call_count, 2)
+
+            manager.refresh_secrets(when + datetime.timedelta(seconds=30))
+            self.assertEqual(self.handler.get_job_type_secrets.call_count, 2)
+
+            manager.refresh_secrets(when + datetime.timedelta(seconds=60))
+            self.assertEqual(self.handler.get_job_type_secrets.call_count, 4)
+
+        # Authentication was re-used for every refresh
+        self.assertEqual(mock_handler_class.call_count, 1)
+
+    @patch('scheduler.vault.manager.SecretsHandler')
+    def test_refresh_secrets_removed(self, mock_handler_class):
+        """Tests that secrets are removed from the cache when the job type is no longer in the backend"""
+
+        mock_handler_class.return_value = self.handler
+        manager = SecretsManager()
+        manager.refresh_secrets()
+
+        self.handler.list_job_types.return_value = ['job-b-1.0']
+        manager.refresh_secrets()
+
+        self.assertDictEqual(manager.retrieve_job_type_secrets('job-a-1.0'), {})
+        self.assertDictEqual(manager.retrieve_job_type_secrets('job-b-1.0'), {'secret': 'job-b-1.0'})
+
+    @patch('scheduler.vault.manager.SecretsHandler')
+    def test_refresh_secrets_fetch_error(self, mock_handler_class):
+        """Tests that previously cached secrets are kept when fetching them fails"""
+
+        mock_handler_class.return_value = self.handler
+        manager = SecretsManager()
+        when = now()
+        manager.refresh_secrets(when)
+
+        self.handler.get_job_type_secrets.side_effect = InvalidSecretsRequest('Down for maintenance')
+        with self.settings(SECRETS_CACHE_TTL=60):
+            manager.refresh_secrets(when + datetime.timedelta(seconds=60))
+
+        self.assertDictEqual(manager.retrieve_job_type_secrets('job-a-1.0'), {'secret': 'job-a-1.0'})
+
+    @patch('scheduler.vault.manager.SecretsHandler')
+    def test_refresh_secrets_reauthenticate(self, mock_handler_class):
+        """Tests that a new authentication is made after a permission error or once the token lifetime expires"""
+
+        mock_handler_class.return_value = self.handler
+        manager = SecretsManager()
+        when = now()
+
+        with self.settings(SECRETS_TOKEN_LIFETIME=600):
+            self.handler.list_job_types.side_effect = InvalidSecretsAuthorization('Token expired')
+            manager.refresh_secrets(when)
+            self.handler.list_job_types.side_effect = None
+            manager.refresh_secrets(when)
+            self.assertEqual(mock_handler_class.call_count, 2)
+
+            manager.refresh_secrets(when + datetime.timedelta(seconds=600))
+            self.assertEqual(mock_handler_class.call_count, 3)
+
+    @patch('scheduler.vault.manager.SecretsHandler')
+    def test_refresh_secrets_transport_error(self, mock_handler_class):
+        """Tests that a connection error or timeout keeps the cached secrets instead of stopping the refresh"""
+
+        mock_handler_class.return_value = self.handler
+        manager = SecretsManager()
+        when = now()
+        manager.refresh_secrets(when)
+
+        def get_secrets(job):
+            if job == 'job-a-1.0':
+                raise Timeout()
+            return {'secret': 'new'}
+        self.handler.get_job_type_secrets.side_effect = get_secrets
+        with self.settings(SECRETS_CACHE_TTL=60):
+            manager.refresh_secrets(when + datetime.timedelta(seconds=60))
+        self.assertDictEqual(manager.retrieve_job_type_secrets('job-a-1.0'), {'secret': 'job-a-1.0'})
+        self.assertDictEqual(manager.retrieve_job_type_secrets('job-b-1.0'), {'secret': 'new'})
+
+        # The backend cannot be reached at all
+        self.handler.list_job_types.side_effect = ConnectionError()
+        manager.refresh_secrets(when + datetime.timedelta(seconds=120))
+        self.assertDictEqual(manager.retrieve_job_type_secrets('job-a-1.0'), {'secret': 'job-a-1.0'})
+
+    @patch('scheduler.vault.manager.SecretsHandler')
+    def test_refresh_secrets_fetch_auth_error(self, mock_handler_class):
+        """Tests that a permission error while fetching secrets forces a new authentication on the next refresh"""
+
+        mock_handler_class.return_value = self.handler
+        manager = SecretsManager()
+        when = now()
+
+        self.handler.get_job_type_secrets.side_effect = InvalidSecretsAuthorization('Token expired')
+        manager.refresh_secrets(when)
+        self.assertEqual(mock_handler_class.call_count, 1)
+        self.assertDictEqual(manager.retrieve_job_type_secrets('job-a-1.0'), {})
+
+        self.handler.get_job_type_secrets.side_effect = lambda job: {'secret': job}
+        manager.refresh_secrets(when)
+        self.assertEqual(mock_handler_class.call_count, 2)
+        self.assertDictEqual(manager.retrieve_job_type_secrets('job-a-1.0'), {'secret': 'job-a-1.0'})
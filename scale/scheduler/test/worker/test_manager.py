@@ -0,0 +1,63 @@
+from __future__ import unicode_literals
+
+import django
+from django.test import TestCase
+from mock import MagicMock, patch
+
+from scheduler.worker.manager import DatabaseWorkerManager
+
+
+class TestDatabaseWorkerManager(TestCase):
+
+    def setUp(self):
+        django.setup()
+
+    @patch('scheduler.worker.manager.task_update_mgr')
+    @patch('scheduler.worker.manager.connections')
+    @patch('scheduler.worker.manager.multiprocessing')
+    def test_worker_died(self, mock_multiprocessing, mock_connections, mock_task_update_mgr):
+        """Tests that a dead worker process is not restarted and that its work is then performed locally"""
+
+        process = MagicMock()
+        process.is_alive.return_value = True
+        mock_multiprocessing.Process.return_value = process
+        manager = DatabaseWorkerManager()
+        manager.start()
+        self.assertTrue(manager.is_running)
+
+        process.is_alive.return_value = False
+        process.exitcode = -9
+        manager.check_running()
+        manager.start()
+        self.assertEqual(mock_multiprocessing.Process.call_count, 1)
+        self.assertFalse(manager.is_running)
+
+        manager.save_task_updates(['update_1'])
+        mock_task_update_mgr.save_task_updates.assert_called_once_with(['update_1'])
+
+    @patch('scheduler.worker.manager.connections')
+    @patch('scheduler.worker.manager.multiprocessing')
+    def test_generate_status_json(self, mock_multiprocessing, mock_connections):
+        """Tests that the scheduler status JSON reports the state of the worker process"""
+
+        process = MagicMock(pid=1234)
+        process.is_alive.return_value = True
+        mock_multiprocessing.Process.return_value = process
+        manager = DatabaseWorkerManager()
+
+        status_dict = {'scheduler': {}}
+        manager.generate_status_json(status_dict)
+        self.assertDictEqual(status_dict['scheduler']['db_worker'],
+                             {'state': 'NOT_STARTED', 'pid': None, 'exit_code': None})
+
+        manager.start()
+        manager.generate_status_json(status_dict)
+        self.assertDictEqual(status_dict['scheduler']['db_worker'],
+                             {'state': 'RUNNING', 'pid': 1234, 'exit_code': None})
+
+        process.is_alive.return_value = False
+        process.exitcode = -9
+        manager.check_running()
+        manager.generate_status_json(status_dict)
+        self.assertDictEqual(status_dict['scheduler']['db_worker'],
+                             {'state': 'DEAD', 'pid': None, 'exit_code': -9})
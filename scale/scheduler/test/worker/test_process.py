@@ -0,0 +1,39 @@
+from __future__ import unicode_literals
+
+from Queue import Queue
+
+import django
+from django.test import TestCase
+from mock import patch
+
+from scheduler.worker.process import CANCELED_JOB_EXES, SCHEDULER_STATUS, TASK_UPDATES, run_database_worker
+
+
+class TestDatabaseWorkerProcess(TestCase):
+
+    def setUp(self):
+        django.setup()
+
+    @patch('scheduler.worker.process._get_canceled_job_exe_ids')
+    @patch('scheduler.worker.process._save_scheduler_status')
+    @patch('scheduler.worker.process.task_update_mgr')
+    def test_requests_are_combined(self, mock_task_update_mgr, mock_save_status, mock_get_canceled):
+        """Tests that the worker combines all of its queued requests and stops on a None request"""
+
+        mock_get_canceled.return_value = [2]
+        requests = Queue()
+        responses = Queue()
+        requests.put((TASK_UPDATES, ['update_1', 'update_2']))
+        requests.put((SCHEDULER_STATUS, {'timestamp': 'old'}))
+        requests.put((CANCELED_JOB_EXES, [1, 2]))
+        requests.put((TASK_UPDATES, ['update_3']))
+        requests.put((SCHEDULER_STATUS, {'timestamp': 'new'}))
+        requests.put(None)
+
+        run_database_worker(requests, responses)
+
+        mock_task_update_mgr.save_task_updates.assert_called_once_with(['update_1', 'update_2', 'update_3'])
+        mock_save_status.assert_called_once_with({'timestamp': 'new'})
+        mock_get_canceled.assert_called_once_with([1, 2])
+        self.assertEqual(responses.get_nowait(), (CANCELED_JOB_EXES, [2]))
+        self.assertTrue(responses.empty())
@@ -0,0 +1,42 @@
+"""Defines the class that manages the messaging background thread"""
+from __future__ import unicode_literals
+
+import datetime
+import logging
+
+from job.execution.manager import job_exe_mgr
+from messaging.manager import CommandMessageManager
+from scheduler.threads.base_thread import BaseSchedulerThread
+
+
+THROTTLE = datetime.timedelta(seconds=1)
+WARN_THRESHOLD = datetime.timedelta(milliseconds=500)
+
+logger = logging.getLogger(__name__)
+
+
+class MessagingThread(BaseSchedulerThread):
+    """This class manages the messaging background thread for the scheduler, which sends the command messages that
+    handle finished job executions
+    """
+
+    def __init__(self):
+        """Constructor
+        """
+
+        super(MessagingThread, self).__init__('Messaging', THROTTLE, WARN_THRESHOLD)
+
+        self._messages = []  # Messages that have not been sent yet
+
+    def _execute(self):
+        """See :meth:`scheduler.threads.base_thread.BaseSchedulerThread._execute`
+        """
+
+        self._messages.extend(job_exe_mgr.get_messages())
+        if not self._messages:
+            return
+
+        # Messages that fail to send are kept and sent again on the next loop
+        CommandMessageManager().send_messages(self._messages)
+        logger.info('Sent %i message(s)', len(self._messages))
+        self._messages = []
@@ -0,0 +1,108 @@
+"""Defines the class that manages the resource usage background thread"""
+from __future__ import unicode_literals
+
+import datetime
+import logging
+import time
+from multiprocessing import TimeoutError
+from multiprocessing.pool import ThreadPool
+
+from django.utils.timezone import now
+
+from job.execution.manager import job_exe_mgr
+from job.execution.tasks.job_task import JobTask
+from mesos_api.api import get_slave_task_statistics
+from scheduler.node.manager import node_mgr
+from scheduler.threads.base_thread import BaseSchedulerThread
+
+
+THROTTLE = datetime.timedelta(seconds=30)
+WARN_THRESHOLD = datetime.timedelta(seconds=10)
+
+# The number of seconds to wait for an agent to return its resource usage statistics
+AGENT_TIMEOUT = 5.0
+# The maximum number of agents that are queried at the same time
+MAX_CONCURRENT_REQUESTS = 10
+# The number of seconds to wait for all of the agents to return their resource usage statistics, agents that have not
+# responded by then are skipped until the next loop
+TOTAL_TIMEOUT = 8.0
+# How often the failure to query the same agent is logged as a warning
+UNREACHABLE_WARNING_PERIOD = datetime.timedelta(minutes=10)
+
+logger = logging.getLogger(__name__)
+
+
+class ResourceUsageThread(BaseSchedulerThread):
+    """This class manages the resource usage background thread for the scheduler, which samples the resources used by
+    the running job tasks from the resource usage statistics of their agents. The agents are queried in parallel.
+    """
+
+    def __init__(self):
+        """Constructor
+        """
+
+        super(ResourceUsageThread, self).__init__('Resource usage', THROTTLE, WARN_THRESHOLD)
+
+        self._unreachable_nodes = {}  # {Hostname: When the last warning was logged}
+
+    def _execute(self):
+        """See :meth:`scheduler.threads.base_thread.BaseSchedulerThread._execute`
+        """
+
+        tasks_by_node = {}  # {Node: [JobTask]}
+        for job_exe in job_exe_mgr.get_running_job_exes():
+            task = job_exe.current_task
+            if isinstance(task, JobTask) and task.has_started and not task.has_ended:
+                node = node_mgr.get_node(task.agent_id)
+                if node and node.port:
+                    tasks_by_node.setdefault(node, []).append(task)
+        if not tasks_by_node:
+            return
+
+        pool = ThreadPool(min(len(tasks_by_node), MAX_CONCURRENT_REQUESTS))
+        try:
+            results = [(node, pool.apply_async(get_slave_task_statistics, (node.hostname, node.port, AGENT_TIMEOUT)))
+                       for node in tasks_by_node]
+            deadline = time.time() + TOTAL_TIMEOUT
+            for node, result in results:
+                try:
+                    statistics = result.get(max(deadline - time.time(), 0.0))
+                except TimeoutError:
+                    logger.debug('Timed out waiting for resource usage statistics from node %s', node.hostname)
+                    continue
+                except Exception:
+                    self._node_unreachable(node.hostname)
+                    continue
+                self._node_reachable(node.hostname)
+                for task in tasks_by_node[node]:
+                    if task.id in statistics:
+                        task.update_resource_usage(statistics[task.id])
+        finally:
+            # Every request has a timeout, so any request still running finishes shortly
+            pool.terminate()
+
+    def _node_reachable(self, hostname):
+        """Records that the resource usage statistics of the given node were retrieved
+
+        :param hostname: The hostname of the node
+        :type hostname: string
+        """
+
+        if self._unreachable_nodes.pop(hostname, None):
+            logger.info('Retrieved resource usage statistics from node %s again', hostname)
+
+    def _node_unreachable(self, hostname):
+        """Records that the resource usage statistics of the given node could not be retrieved. A warning is only logged
+        for the first failure and then once per warning period while the node stays unreachable.
+
+        :param hostname: The hostname of the node
+        :type hostname: string
+        """
+
+        when = now()
+        last_warning = self._unreachable_nodes.get(hostname)
+        if last_warning and when < last_warning + UNREACHABLE_WARNING_PERIOD:
+            logger.debug('Unable to retrieve resource usage statistics from node %s', hostname, exc_info=True)
+            return
+        self._unreachable_nodes[hostname] = when
+        logger.warning('Unable to retrieve resource usage statistics from node %s', hostname, exc_info=True)
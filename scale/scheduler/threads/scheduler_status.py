@@ -7,11 +7,11 @@ from django.utils.timezone import now
 
 from job.execution.manager import job_exe_mgr
 from scheduler.manager import scheduler_mgr
-from scheduler.models import Scheduler
 from scheduler.node.manager import node_mgr
 from scheduler.resources.manager import resource_mgr
 from scheduler.sync.job_type_manager import job_type_mgr
 from scheduler.threads.base_thread import BaseSchedulerThread
+from scheduler.worker.manager import db_worker_mgr
 from util.parse import datetime_to_string
 
 
@@ -35,7 +35,7 @@ class SchedulerStatusThread(BaseSchedulerThread):
         self._generate_status_json(now())
 
     def _generate_status_json(self, when):
-        """Generates the scheduler status JSON
+        """Generates the scheduler status JSON and sends it to be saved in the database
 
         :param when: The current time
         :type when: :class:`datetime.datetime`
@@ -47,4 +47,5 @@ class SchedulerStatusThread(BaseSchedulerThread):
         resource_mgr.generate_status_json(status_dict)
         job_exe_mgr.generate_status_json(status_dict['nodes'], when)
         job_type_mgr.generate_status_json(status_dict)
-        Scheduler.objects.all().update(status=status_dict)
+        db_worker_mgr.generate_status_json(status_dict)
+        db_worker_mgr.save_scheduler_status(status_dict)
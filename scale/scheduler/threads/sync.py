@@ -7,15 +7,16 @@ import logging
 from django.conf import settings
 from mesos.interface import mesos_pb2
 
-from job.execution.manager import job_exe_mgr
 from scheduler.cleanup.manager import cleanup_mgr
 from scheduler.manager import scheduler_mgr
 from scheduler.node.manager import node_mgr
 from scheduler.resources.manager import resource_mgr
 from scheduler.sync.job_type_manager import job_type_mgr
+from scheduler.sync.shared_resource_manager import shared_resource_mgr
 from scheduler.sync.workspace_manager import workspace_mgr
 from scheduler.threads.base_thread import BaseSchedulerThread
 from scheduler.vault.manager import secrets_mgr
+from scheduler.worker.manager import db_worker_mgr
 
 
 THROTTLE = datetime.timedelta(seconds=10)
@@ -65,6 +66,7 @@ class SyncThread(BaseSchedulerThread):
         scheduler_mgr.sync_with_database()
         job_type_mgr.sync_with_database()
         workspace_mgr.sync_with_database()
+        shared_resource_mgr.sync_with_database()
 
         node_mgr.sync_with_database(scheduler_mgr.config)
         cleanup_mgr.update_nodes(node_mgr.get_nodes())
@@ -72,7 +74,8 @@ class SyncThread(BaseSchedulerThread):
         resource_mgr.sync_with_mesos(mesos_master.hostname, mesos_master.port)
 
         # Kill running tasks for canceled job executions
-        for task_to_kill in job_exe_mgr.sync_with_database():
+        db_worker_mgr.check_running()
+        for task_to_kill in db_worker_mgr.sync_canceled_job_exes():
             pb_task_to_kill = mesos_pb2.TaskID()
             pb_task_to_kill.value = task_to_kill.id
             logger.info('Killing task %s', task_to_kill.id)
@@ -5,6 +5,7 @@ import datetime
 
 from scheduler.task.manager import task_update_mgr
 from scheduler.threads.base_thread import BaseSchedulerThread
+from scheduler.worker.manager import db_worker_mgr
 
 
 THROTTLE = datetime.timedelta(seconds=1)
@@ -24,4 +25,4 @@ class TaskUpdateThread(BaseSchedulerThread):
         """See :meth:`scheduler.threads.base_thread.BaseSchedulerThread._execute`
         """
 
-        task_update_mgr.push_to_database()
+        db_worker_mgr.save_task_updates(task_update_mgr.take_task_updates())
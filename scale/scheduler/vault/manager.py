@@ -1,7 +1,14 @@
 """Defines the class that manages caching task secrets to memory"""
 from __future__ import unicode_literals
 
+import datetime
 import logging
+import threading
+from multiprocessing.pool import ThreadPool
+
+from django.conf import settings
+from django.utils.timezone import now
+from requests.exceptions import RequestException
 
 from vault.exceptions import InvalidSecretsAuthorization, InvalidSecretsRequest, InvalidSecretsToken, InvalidSecretsValue
 from vault.secrets_handler import SecretsHandler
@@ -17,7 +24,12 @@ class SecretsManager(object):
         """Constructor
         """
 
-        self._all_secrets = {}
+        self._all_secrets = {}  # {Job type name: (Secrets dict, When secrets were fetched)}
+        self._handler = None
+        self._handler_created = None
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._refresh_thread = None
 
     def retrieve_job_type_secrets(self, job_name):
         """Get the secret values from the cache pertaining to the provided job
@@ -28,31 +40,136 @@ class SecretsManager(object):
         :rtype: dict
         """
 
-        if job_name in self._all_secrets:
-            secret_values = self._all_secrets[job_name]
-        else:
-            secret_values = {}
-
-        return secret_values
+        with self._lock:
+            if job_name in self._all_secrets:
+                return self._all_secrets[job_name][0]
+        return {}
 
     def sync_with_backend(self):
-        """Gather all job type secrets that are stored in the secrets backend.
+        """Starts gathering all job type secrets that are stored in the secrets backend in a background thread. This
+        method returns immediately so that a slow secrets backend never blocks the caller. If a previous refresh is
+        still running, no new refresh is started.
         """
 
-        updated_secrets = {}
+        with self._refresh_lock:
+            if self._refresh_thread and self._refresh_thread.is_alive():
+                logger.debug('Previous secrets refresh is still running')
+                return
+            self._refresh_thread = threading.Thread(target=self.refresh_secrets, name='SecretsRefresh')
+            self._refresh_thread.daemon = True
+            self._refresh_thread.start()
+
+    def refresh_secrets(self, when=None):
+        """Gathers all job type secrets that are stored in the secrets backend. Only the job types that are new or
+        whose cached secrets are older than the cache TTL are fetched, using a bounded number of concurrent requests.
+
+        :param when: The current time, defaults to now
+        :type when: :class:`datetime.datetime`
+        """
+
+        if not when:
+            when = now()
+
         try:
-            sh = SecretsHandler()
-            jobs_with_secrets = sh.list_job_types()
-        except (InvalidSecretsAuthorization, InvalidSecretsRequest, InvalidSecretsToken) as e:
+            handler = self._get_handler(when)
+            jobs_with_secrets = handler.list_job_types()
+        except InvalidSecretsAuthorization as e:
+            # Force a new authentication on the next refresh in case the token has expired
+            self._handler = None
+            logger.exception('Secrets Error: %s', e.message)
+            return
+        except (InvalidSecretsRequest, InvalidSecretsToken) as e:
             logger.exception('Secrets Error: %s', e.message)
             return
+        except RequestException:
+            logger.exception('Unable to reach the secrets backend')
+            return
 
+        ttl = datetime.timedelta(seconds=settings.SECRETS_CACHE_TTL)
+        with self._lock:
+            cached_secrets = dict(self._all_secrets)
+        jobs_to_fetch = [job for job in jobs_with_secrets
+                         if job not in cached_secrets or cached_secrets[job][1] + ttl <= when]
+
+        fetched_secrets = self._fetch_job_type_secrets(handler, jobs_to_fetch)
+
+        updated_secrets = {}
+        changed_jobs = []
         for job in jobs_with_secrets:
+            if job in fetched_secrets:
+                job_secrets = fetched_secrets[job]
+                if job not in cached_secrets or cached_secrets[job][0] != job_secrets:
+                    changed_jobs.append(job)
+                updated_secrets[job] = (job_secrets, when)
+            elif job in cached_secrets:
+                # Keep using the cached secrets when they are still fresh or the fetch failed
+                updated_secrets[job] = cached_secrets[job]
+        removed_jobs = [job for job in cached_secrets if job not in updated_secrets]
+
+        with self._lock:
+            self._all_secrets = updated_secrets
+
+        if changed_jobs or removed_jobs:
+            logger.info('Secrets changed for %i job type(s) and removed for %i job type(s)', len(changed_jobs),
+                        len(removed_jobs))
+
+    def _fetch_job_type_secrets(self, handler, jobs):
+        """Fetches the secrets for the given job types from the secrets backend using a bounded number of concurrent
+        requests
+
+        :param handler: The handler for the secrets backend
+        :type handler: :class:`vault.secrets_handler.SecretsHandler`
+        :param jobs: The names of the job types to fetch
+        :type jobs: [string]
+        :returns: The secrets for each job type that was successfully fetched
+        :rtype: {string: dict}
+        """
+
+        if not jobs:
+            return {}
+
+        auth_failures = []
+
+        def fetch(job):
             try:
-                job_secrets = sh.get_job_type_secrets(job)
-                updated_secrets[job] = job_secrets
-            except (InvalidSecretsAuthorization, InvalidSecretsRequest, InvalidSecretsValue) as e:
+                return job, handler.get_job_type_secrets(job)
+            except InvalidSecretsAuthorization as e:
+                auth_failures.append(job)
                 logger.exception('Secrets Error: %s', e.message)
+            except (InvalidSecretsRequest, InvalidSecretsValue) as e:
+                logger.exception('Secrets Error: %s', e.message)
+            except RequestException:
+                logger.exception('Unable to fetch secrets for job type %s', job)
+            return job, None
+
+        pool = ThreadPool(min(len(jobs), settings.SECRETS_MAX_CONCURRENT_REQUESTS))
+        try:
+            results = pool.map(fetch, jobs)
+        finally:
+            pool.close()
+            pool.join()
+
+        if auth_failures:
+            # Force a new authentication on the next refresh in case the token has expired
+            self._handler = None
+
+        return {job: job_secrets for job, job_secrets in results if job_secrets is not None}
+
+    def _get_handler(self, when):
+        """Returns the handler for the secrets backend, re-using its authentication token until the token lifetime
+        expires
+
+        :param when: The current time
+        :type when: :class:`datetime.datetime`
+        :returns: The handler for the secrets backend
+        :rtype: :class:`vault.secrets_handler.SecretsHandler`
+        """
+
+        lifetime = datetime.timedelta(seconds=settings.SECRETS_TOKEN_LIFETIME)
+        if not self._handler or self._handler_created + lifetime <= when:
+            self._handler = SecretsHandler()
+            self._handler_created = when
+        return self._handler
 
 
 secrets_mgr = SecretsManager()
@@ -0,0 +1,242 @@
+"""Defines the class that manages the scheduler's database worker process"""
+from __future__ import unicode_literals
+
+import logging
+import multiprocessing
+import threading
+from Queue import Empty, Full
+
+from django.db import connections
+
+from job.execution.manager import job_exe_mgr
+from scheduler.task.manager import task_update_mgr
+from scheduler.worker.process import CANCELED_JOB_EXES, SCHEDULER_STATUS, TASK_UPDATES, run_database_worker
+
+
+# The maximum number of requests that may be waiting for the worker process, beyond this the work is done locally
+MAX_QUEUE_SIZE = 10000
+# The number of seconds to wait when sending a request to a full queue before doing the work locally
+SEND_TIMEOUT = 1.0
+# The number of seconds to wait for the worker process to finish its queued work when stopping
+STOP_TIMEOUT = 30.0
+
+
+logger = logging.getLogger(__name__)
+
+
+class DatabaseWorkerManager(object):
+    """This class manages the worker process that performs the scheduler's database-heavy work: saving task updates,
+    saving the scheduler status, and checking for canceled job executions. The scheduler sends requests to the worker
+    process over one queue and receives responses over another, so the ORM and JSON work does not compete with the
+    scheduling loop and the driver callbacks for the scheduler process's GIL. If the worker process is not running (or
+    its queue is full), the work is performed in the calling thread instead. The worker process is forked, so it is only
+    ever started once, before the scheduler starts its own background threads. If it dies, the scheduler performs the
+    work itself from then on rather than forking again while those threads hold locks, and the scheduler status reports
+    the dead worker. This class is thread-safe.
+    """
+
+    def __init__(self):
+        """Constructor
+        """
+
+        self._exit_code = None
+        self._has_started = False
+        self._lock = threading.Lock()
+        self._process = None
+        self._requests = None
+        self._responses = None
+
+    @property
+    def is_running(self):
+        """Indicates whether the worker process is running
+
+        :returns: True if the worker process is running, False otherwise
+        :rtype: bool
+        """
+
+        with self._lock:
+            return self._process is not None and self._process.is_alive()
+
+    def check_running(self):
+        """Checks whether the worker process has died since it was started. If it has, its work is performed in the
+        scheduler process from then on. The worker process is not restarted since forking the scheduler while its
+        background threads are running could leave the new process holding locks that are never released. The dead
+        worker is reported in the scheduler status JSON.
+        """
+
+        with self._lock:
+            if self._process is None or self._process.is_alive():
+                return
+            exit_code = self._process.exitcode
+            self._exit_code = exit_code
+            self._process = None
+            self._requests = None
+            self._responses = None
+
+        logger.error('Scheduler database worker process died with exit code %s, performing its work in the scheduler '
+                     'process from now on', exit_code)
+
+    def generate_status_json(self, status_dict):
+        """Generates the portion of the status JSON that describes the database worker process. The scheduler portion
+        of the status JSON must already have been generated.
+
+        :param status_dict: The status JSON dict
+        :type status_dict: dict
+        """
+
+        with self._lock:
+            pid = None
+            exit_code = self._exit_code
+            if self._process is not None:
+                pid = self._process.pid
+                if self._process.is_alive():
+                    state = 'RUNNING'
+                else:
+                    state = 'DEAD'
+                    exit_code = self._process.exitcode
+            elif exit_code is not None:
+                state = 'DEAD'
+            elif self._has_started:
+                state = 'STOPPED'
+            else:
+                state = 'NOT_STARTED'
+
+        status_dict['scheduler']['db_worker'] = {'state': state, 'pid': pid, 'exit_code': exit_code}
+
+    def save_scheduler_status(self, status_dict):
+        """Saves the given scheduler status JSON to the database
+
+        :param status_dict: The scheduler status JSON
+        :type status_dict: dict
+        """
+
+        if not self._send(SCHEDULER_STATUS, status_dict):
+            from scheduler.models import Scheduler
+            Scheduler.objects.all().update(status=status_dict)
+
+    def save_task_updates(self, task_updates):
+        """Saves the given task update models to the database
+
+        :param task_updates: The task update models
+        :type task_updates: [:class:`job.models.TaskUpdate`]
+        """
+
+        if task_updates and not self._send(TASK_UPDATES, task_updates):
+            task_update_mgr.save_task_updates(task_updates)
+
+    def start(self):
+        """Starts the worker process. Only the first call starts the worker process, and it must be made before the
+        scheduler starts its background threads.
+
+        The worker process is forked from the calling thread. This is normally the Mesos driver thread running the
+        registered() callback, so the native threads of libmesos are already running and may hold locks when the fork
+        happens. Forking is only safe because the worker process never calls into libmesos or the driver, only uses
+        the Django ORM through its own new database connections, and talks to the scheduler only through the
+        multiprocessing queues created here. The scheduler's background threads have not started yet and its main
+        thread is blocked in the driver, so no other Python thread can be holding a lock, such as a logging handler
+        lock, that the worker process needs.
+        """
+
+        with self._lock:
+            if self._has_started:
+                logger.warning('Scheduler database worker process was already started, not starting it again')
+                return
+            self._has_started = True
+            self._requests = multiprocessing.Queue(maxsize=MAX_QUEUE_SIZE)
+            self._responses = multiprocessing.Queue()
+            # The forked process must not share the scheduler's database connections. Mesos driver threads are running
+            # but never use the database, and the scheduler's background threads have not started yet, so the
+            # connections of the calling thread are the only open connections.
+            connections.close_all()
+            self._process = multiprocessing.Process(target=run_database_worker, args=(self._requests, self._responses),
+                                                    name='Scheduler database worker')
+            self._process.daemon = True
+            self._process.start()
+        logger.info('Started scheduler database worker process (PID %i)', self._process.pid)
+
+    def stop(self):
+        """Stops the worker process after it finishes its queued work
+        """
+
+        with self._lock:
+            process = self._process
+            requests = self._requests
+            self._process = None
+            self._requests = None
+            self._responses = None
+
+        if process is None:
+            return
+        try:
+            requests.put(None, timeout=SEND_TIMEOUT)
+        except Full:
+            logger.error('Scheduler database worker queue is full, terminating the worker')
+            process.terminate()
+        process.join(STOP_TIMEOUT)
+        logger.info('Stopped scheduler database worker process')
+
+    def sync_canceled_job_exes(self):
+        """Handles the running job executions that have been canceled in the database and returns their current tasks
+        so they may be killed. When the worker process is running, this handles the canceled job executions found by
+        the worker since the last call and asks the worker to check the current running job executions, so a
+        cancellation is handled on the call after the one that requested its check.
+
+        :returns: A list of the canceled tasks to kill
+        :rtype: [:class:`job.tasks.base_task.Task`]
+        """
+
+        with self._lock:
+            responses = self._responses
+        if responses is None:
+            return job_exe_mgr.sync_with_database()
+
+        canceled_job_exe_ids = self._receive_canceled_job_exe_ids(responses)
+        if not self._send(CANCELED_JOB_EXES, job_exe_mgr.get_running_job_exe_ids()):
+            return job_exe_mgr.sync_with_database()
+        return job_exe_mgr.cancel_job_exes(canceled_job_exe_ids)
+
+    def _receive_canceled_job_exe_ids(self, responses):
+        """Takes all of the canceled job execution IDs that the worker process has sent back
+
+        :param responses: The queue of responses from the worker process
+        :type responses: :class:`multiprocessing.Queue`
+        :returns: The IDs of the canceled job executions
+        :rtype: [int]
+        """
+
+        canceled_job_exe_ids = []
+        while True:
+            try:
+                response_type, result = responses.get_nowait()
+            except Empty:
+                break
+            if response_type == CANCELED_JOB_EXES:
+                canceled_job_exe_ids.extend(result)
+        return canceled_job_exe_ids
+
+    def _send(self, request_type, payload):
+        """Sends the given request to the worker process
+
+        :param request_type: The type of the request
+        :type request_type: string
+        :param payload: The payload of the request
+        :type payload: object
+        :returns: True if the request was sent, False if the worker process is not running or its queue is full
+        :rtype: bool
+        """
+
+        with self._lock:
+            requests = self._requests
+            is_alive = self._process is not None and self._process.is_alive()
+        if requests is None or not is_alive:
+            return False
+
+        try:
+            requests.put((request_type, payload), timeout=SEND_TIMEOUT)
+        except Full:
+            logger.warning('Scheduler database worker queue is full, performing %s request locally', request_type)
+            return False
+        return True
+
+
+db_worker_mgr = DatabaseWorkerManager()
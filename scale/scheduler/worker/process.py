@@ -0,0 +1,115 @@
+"""Defines the main loop of the scheduler's database worker process"""
+from __future__ import unicode_literals
+
+import logging
+from Queue import Empty
+
+from django.db import connection
+
+from job.models import JobExecution
+from scheduler.models import Scheduler
+from scheduler.task.manager import task_update_mgr
+from util.retry import retry_database_query
+
+
+# The types of the requests that the scheduler sends to the worker process
+CANCELED_JOB_EXES = 'canceled_job_exes'
+SCHEDULER_STATUS = 'scheduler_status'
+TASK_UPDATES = 'task_updates'
+
+# The maximum number of queued requests that are combined and handled together
+MAX_REQUEST_BATCH = 1000
+
+
+logger = logging.getLogger(__name__)
+
+
+def run_database_worker(requests, responses):
+    """Runs the main loop of the database worker process. Each loop takes all of the queued requests, combines them
+    (task updates are saved together and only the most recent scheduler status and canceled job execution check are
+    performed), and handles them. The loop stops when a None request is received.
+
+    :param requests: The queue of (request type, payload) tuples sent by the scheduler
+    :type requests: :class:`multiprocessing.Queue`
+    :param responses: The queue of (request type, result) tuples sent back to the scheduler
+    :type responses: :class:`multiprocessing.Queue`
+    """
+
+    logger.info('Scheduler database worker process started')
+
+    running = True
+    while running:
+        try:
+            batch = [requests.get()]
+        except (EOFError, IOError):
+            break  # Scheduler process has gone away
+        while len(batch) < MAX_REQUEST_BATCH:
+            try:
+                batch.append(requests.get_nowait())
+            except Empty:
+                break
+
+        if None in batch:
+            running = False
+        try:
+            _handle_requests([request for request in batch if request is not None], responses)
+        except Exception:
+            logger.exception('Scheduler database worker had a critical error')
+            # Drop the connection so that the next loop starts with a fresh one
+            connection.close()
+
+    logger.info('Scheduler database worker process stopped')
+
+
+def _handle_requests(batch, responses):
+    """Handles the given batch of requests
+
+    :param batch: The list of (request type, payload) tuples
+    :type batch: [tuple]
+    :param responses: The queue of (request type, result) tuples sent back to the scheduler
+    :type responses: :class:`multiprocessing.Queue`
+    """
+
+    task_updates = []
+    status_dict = None
+    job_exe_ids = None
+    for request_type, payload in batch:
+        if request_type == TASK_UPDATES:
+            task_updates.extend(payload)
+        elif request_type == SCHEDULER_STATUS:
+            status_dict = payload
+        elif request_type == CANCELED_JOB_EXES:
+            job_exe_ids = payload
+        else:
+            logger.error('Scheduler database worker received unknown request type %s', request_type)
+
+    if task_updates:
+        task_update_mgr.save_task_updates(task_updates)
+    if status_dict is not None:
+        _save_scheduler_status(status_dict)
+    if job_exe_ids is not None:
+        responses.put((CANCELED_JOB_EXES, _get_canceled_job_exe_ids(job_exe_ids)))
+
+
+@retry_database_query
+def _get_canceled_job_exe_ids(job_exe_ids):
+    """Returns the IDs of the given job executions that have been canceled
+
+    :param job_exe_ids: The job execution IDs
+    :type job_exe_ids: [int]
+    :returns: The IDs of the canceled job executions
+    :rtype: [int]
+    """
+
+    return list(JobExecution.objects.filter(id__in=job_exe_ids, status='CANCELED').values_list('id', flat=True))
+
+
+@retry_database_query
+def _save_scheduler_status(status_dict):
+    """Saves the given scheduler status JSON
+
+    :param status_dict: The scheduler status JSON
+    :type status_dict: dict
+    """
+
+    Scheduler.objects.all().update(status=status_dict)
@@ -0,0 +1,8 @@
+"""Defines the exceptions related to shared resources"""
+from __future__ import unicode_literals
+
+
+class InvalidSharedResource(Exception):
+    """Exception indicating that the provided shared resource definition was invalid"""
+
+    pass
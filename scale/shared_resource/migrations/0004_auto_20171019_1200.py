@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('job', '0030_auto_20171019_1200'),
+        ('storage', '0009_auto_20171019_1200'),
+        ('shared_resource', '0003_auto_20170426_0952'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SharedResource',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(db_index=True, max_length=50, unique=True)),
+                ('title', models.CharField(blank=True, max_length=50, null=True)),
+                ('description', models.CharField(blank=True, max_length=500, null=True)),
+                ('limit', models.IntegerField()),
+                ('created', models.DateTimeField(auto_now_add=True)),
+                ('last_modified', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'db_table': 'shared_resource',
+            },
+        ),
+        migrations.CreateModel(
+            name='SharedResourceRequirement',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('usage', models.IntegerField(default=1)),
+                ('created', models.DateTimeField(auto_now_add=True)),
+                ('job_type', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE,
+                                               to='job.JobType')),
+                ('shared_resource', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE,
+                                                      to='shared_resource.SharedResource')),
+                ('workspace', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE,
+                                                to='storage.Workspace')),
+            ],
+            options={
+                'db_table': 'shared_resource_requirement',
+            },
+        ),
+    ]
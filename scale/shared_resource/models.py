@@ -0,0 +1,263 @@
+"""Defines the database models for shared resources"""
+from __future__ import unicode_literals
+
+from django.db import models, transaction
+
+from job.models import JobType
+from shared_resource.exceptions import InvalidSharedResource
+from storage.models import Workspace
+
+
+class SharedResourceManager(models.Manager):
+    """Provides additional methods for handling shared resources"""
+
+    @transaction.atomic
+    def create_shared_resource(self, name, title, description, limit, requirements):
+        """Creates a new shared resource with the given requirements and returns the new shared resource model. All
+        database changes occur in an atomic transaction.
+
+        :param name: The identifying name of the shared resource
+        :type name: string
+        :param title: The human-readable name of the shared resource
+        :type title: string
+        :param description: A description of the shared resource
+        :type description: string
+        :param limit: The number of units of the shared resource that may be in use at once
+        :type limit: int
+        :param requirements: The requirements, each a dict with a job_type_id or a workspace_id and an optional usage
+        :type requirements: [dict]
+        :returns: The new shared resource
+        :rtype: :class:`shared_resource.models.SharedResource`
+
+        :raises :class:`shared_resource.exceptions.InvalidSharedResource`: If the shared resource is invalid
+        """
+
+        if SharedResource.objects.filter(name=name).exists():
+            raise InvalidSharedResource('Shared resource %s already exists' % name)
+        self._validate_limit(limit)
+        requirement_models = self._create_requirements(requirements)
+
+        shared_resource = SharedResource()
+        shared_resource.name = name
+        shared_resource.title = title
+        shared_resource.description = description
+        shared_resource.limit = limit
+        shared_resource.save()
+
+        for requirement in requirement_models:
+            requirement.shared_resource = shared_resource
+        SharedResourceRequirement.objects.bulk_create(requirement_models)
+        return shared_resource
+
+    @transaction.atomic
+    def edit_shared_resource(self, shared_resource_id, title=None, description=None, limit=None, requirements=None):
+        """Edits the given shared resource and saves the changes in the database. All database changes occur in an
+        atomic transaction. An argument of None for a field indicates that the field should not change. Any given
+        requirements replace all of the existing requirements of the shared resource.
+
+        :param shared_resource_id: The unique identifier of the shared resource to edit
+        :type shared_resource_id: int
+        :param title: The human-readable name of the shared resource
+        :type title: string
+        :param description: A description of the shared resource
+        :type description: string
+        :param limit: The number of units of the shared resource that may be in use at once
+        :type limit: int
+        :param requirements: The requirements, each a dict with a job_type_id or a workspace_id and an optional usage
+        :type requirements: [dict]
+
+        :raises :class:`shared_resource.exceptions.InvalidSharedResource`: If the shared resource is invalid
+        """
+
+        shared_resource = SharedResource.objects.select_for_update().get(pk=shared_resource_id)
+
+        if title:
+            shared_resource.title = title
+        if description:
+            shared_resource.description = description
+        if limit is not None:
+            self._validate_limit(limit)
+            shared_resource.limit = limit
+        shared_resource.save()
+
+        if requirements is not None:
+            requirement_models = self._create_requirements(requirements)
+            SharedResourceRequirement.objects.filter(shared_resource_id=shared_resource.id).delete()
+            for requirement in requirement_models:
+                requirement.shared_resource = shared_resource
+            SharedResourceRequirement.objects.bulk_create(requirement_models)
+
+    def get_details(self, shared_resource_id):
+        """Returns the shared resource for the given ID with all detail fields included.
+
+        The additional fields include: requirements.
+
+        :param shared_resource_id: The unique identifier of the shared resource.
+        :type shared_resource_id: int
+        :returns: The shared resource with all detail fields included.
+        :rtype: :class:`shared_resource.models.SharedResource`
+        """
+
+        # Attempt to get the shared resource
+        shared_resource = SharedResource.objects.get(pk=shared_resource_id)
+
+        # Add the requirements along with their job types and workspaces
+        requirements = SharedResourceRequirement.objects.select_related('job_type', 'workspace')
+        shared_resource.requirements = requirements.filter(shared_resource_id=shared_resource.id).order_by('id')
+        return shared_resource
+
+    def get_shared_resources(self, started=None, ended=None, names=None, order=None):
+        """Returns a list of shared resources within the given time range.
+
+        :param started: Query shared resources updated after this amount of time.
+        :type started: :class:`datetime.datetime`
+        :param ended: Query shared resources updated before this amount of time.
+        :type ended: :class:`datetime.datetime`
+        :param names: Query shared resources with the given name.
+        :type names: [string]
+        :param order: A list of fields to control the sort order.
+        :type order: [string]
+        :returns: The list of shared resources that match the time range.
+        :rtype: [:class:`shared_resource.models.SharedResource`]
+        """
+
+        # Fetch a list of shared resources
+        shared_resources = SharedResource.objects.all()
+
+        # Apply time range filtering
+        if started:
+            shared_resources = shared_resources.filter(last_modified__gte=started)
+        if ended:
+            shared_resources = shared_resources.filter(last_modified__lte=ended)
+
+        # Apply additional filters
+        if names:
+            shared_resources = shared_resources.filter(name__in=names)
+
+        # Apply sorting
+        if order:
+            shared_resources = shared_resources.order_by(*order)
+        else:
+            shared_resources = shared_resources.order_by('last_modified')
+        return shared_resources
+
+    def _create_requirements(self, requirements):
+        """Validates the given requirements and returns the unsaved requirement models for them
+
+        :param requirements: The requirements, each a dict with a job_type_id or a workspace_id and an optional usage
+        :type requirements: [dict]
+        :returns: The unsaved requirement models
+        :rtype: [:class:`shared_resource.models.SharedResourceRequirement`]
+
+        :raises :class:`shared_resource.exceptions.InvalidSharedResource`: If a requirement is invalid
+        """
+
+        job_type_ids = set()
+        workspace_ids = set()
+        requirement_models = []
+        for requirement in requirements:
+            if not isinstance(requirement, dict):
+                raise InvalidSharedResource('Each requirement must be a JSON object')
+            job_type_id = requirement.get('job_type_id')
+            workspace_id = requirement.get('workspace_id')
+            usage = requirement.get('usage', 1)
+            if (job_type_id is None) == (workspace_id is None):
+                raise InvalidSharedResource('Each requirement must have exactly one of job_type_id and workspace_id')
+            if not isinstance(usage, int) or isinstance(usage, bool) or usage < 1:
+                raise InvalidSharedResource('Requirement usage must be a positive integer')
+            if job_type_id is not None:
+                job_type_ids.add(job_type_id)
+            else:
+                workspace_ids.add(workspace_id)
+
+            requirement_model = SharedResourceRequirement()
+            requirement_model.job_type_id = job_type_id
+            requirement_model.workspace_id = workspace_id
+            requirement_model.usage = usage
+            requirement_models.append(requirement_model)
+
+        missing_job_type_ids = job_type_ids - set(JobType.objects.filter(id__in=job_type_ids).values_list('id',
+                                                                                                         flat=True))
+        if missing_job_type_ids:
+            raise InvalidSharedResource('Unknown job type ID(s): %s' % ', '.join(map(str, missing_job_type_ids)))
+        missing_workspace_ids = workspace_ids - set(Workspace.objects.filter(id__in=workspace_ids).values_list('id',
+                                                                                                              flat=True))
+        if missing_workspace_ids:
+            raise InvalidSharedResource('Unknown workspace ID(s): %s' % ', '.join(map(str, missing_workspace_ids)))
+
+        return requirement_models
+
+    def _validate_limit(self, limit):
+        """Validates the given shared resource limit
+
+        :param limit: The number of units of the shared resource that may be in use at once
+        :type limit: int
+
+        :raises :class:`shared_resource.exceptions.InvalidSharedResource`: If the limit is invalid
+        """
+
+        if not isinstance(limit, int) or isinstance(limit, bool) or limit < 1:
+            raise InvalidSharedResource('Shared resource limit must be a positive integer')
+
+
+class SharedResource(models.Model):
+    """Represents a resource that is shared across the cluster, such as the bandwidth of a workspace or the connections
+    to an external service, and limits how many units of it the running job executions may use at once
+
+    :keyword name: The identifying name of the shared resource used by clients for queries
+    :type name: :class:`django.db.models.CharField`
+    :keyword title: The human-readable name of the shared resource
+    :type title: :class:`django.db.models.CharField`
+    :keyword description: An optional description of the shared resource
+    :type description: :class:`django.db.models.CharField`
+    :keyword limit: The number of units of the shared resource that may be in use at once
+    :type limit: :class:`django.db.models.IntegerField`
+
+    :keyword created: When the shared resource was created
+    :type created: :class:`django.db.models.DateTimeField`
+    :keyword last_modified: When the shared resource was last modified
+    :type last_modified: :class:`django.db.models.DateTimeField`
+    """
+
+    name = models.CharField(db_index=True, max_length=50, unique=True)
+    title = models.CharField(blank=True, max_length=50, null=True)
+    description = models.CharField(blank=True, max_length=500, null=True)
+    limit = models.IntegerField()
+
+    created = models.DateTimeField(auto_now_add=True)
+    last_modified = models.DateTimeField(auto_now=True)
+
+    objects = SharedResourceManager()
+
+    class Meta(object):
+        """meta information for the db"""
+        db_table = 'shared_resource'
+
+
+class SharedResourceRequirement(models.Model):
+    """Represents the units of a shared resource used by every running job execution of a job type or by every running
+    job execution that uses a workspace
+
+    :keyword shared_resource: The shared resource that is required
+    :type shared_resource: :class:`django.db.models.ForeignKey`
+    :keyword job_type: The job type whose job executions use the shared resource, possibly None
+    :type job_type: :class:`django.db.models.ForeignKey`
+    :keyword workspace: The workspace whose job executions use the shared resource, possibly None
+    :type workspace: :class:`django.db.models.ForeignKey`
+    :keyword usage: The number of units of the shared resource used by each job execution
+    :type usage: :class:`django.db.models.IntegerField`
+
+    :keyword created: When the requirement was created
+    :type created: :class:`django.db.models.DateTimeField`
+    """
+
+    shared_resource = models.ForeignKey('shared_resource.SharedResource', on_delete=models.CASCADE)
+    job_type = models.ForeignKey('job.JobType', blank=True, null=True, on_delete=models.CASCADE)
+    workspace = models.ForeignKey('storage.Workspace', blank=True, null=True, on_delete=models.CASCADE)
+    usage = models.IntegerField(default=1)
+
+    created = models.DateTimeField(auto_now_add=True)
+
+    class Meta(object):
+        """meta information for the db"""
+        db_table = 'shared_resource_requirement'
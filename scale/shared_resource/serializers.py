@@ -0,0 +1,35 @@
+"""Defines the serializers for shared resources"""
+from __future__ import unicode_literals
+
+import rest_framework.serializers as serializers
+
+from job.serializers import JobTypeBaseSerializer
+from storage.serializers import WorkspaceBaseSerializer
+from util.rest import ModelIdSerializer
+
+
+class SharedResourceBaseSerializer(ModelIdSerializer):
+    """Converts shared resource model fields to REST output"""
+    name = serializers.CharField()
+
+
+class SharedResourceSerializer(SharedResourceBaseSerializer):
+    """Converts shared resource model fields to REST output"""
+    title = serializers.CharField()
+    description = serializers.CharField()
+    limit = serializers.IntegerField()
+
+    created = serializers.DateTimeField()
+    last_modified = serializers.DateTimeField()
+
+
+class SharedResourceRequirementSerializer(ModelIdSerializer):
+    """Converts shared resource requirement model fields to REST output"""
+    job_type = JobTypeBaseSerializer()
+    workspace = WorkspaceBaseSerializer()
+    usage = serializers.IntegerField()
+
+
+class SharedResourceDetailsSerializer(SharedResourceSerializer):
+    """Converts shared resource model fields to REST output"""
+    requirements = SharedResourceRequirementSerializer(many=True)
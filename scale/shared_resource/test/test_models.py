@@ -0,0 +1,73 @@
+from __future__ import unicode_literals
+
+import django
+from django.test import TestCase
+
+import job.test.utils as job_test_utils
+import storage.test.utils as storage_test_utils
+from shared_resource.exceptions import InvalidSharedResource
+from shared_resource.models import SharedResource, SharedResourceRequirement
+
+
+class TestSharedResourceManager(TestCase):
+
+    def setUp(self):
+        django.setup()
+
+        self.job_type = job_test_utils.create_job_type()
+        self.workspace = storage_test_utils.create_workspace()
+
+    def test_create_shared_resource(self):
+        """Tests creating a shared resource with job type and workspace requirements"""
+
+        requirements = [{'job_type_id': self.job_type.id}, {'workspace_id': self.workspace.id, 'usage': 2}]
+        shared_resource = SharedResource.objects.create_shared_resource('bandwidth', 'Bandwidth', None, 10,
+                                                                        requirements)
+
+        shared_resource = SharedResource.objects.get_details(shared_resource.id)
+        self.assertEqual(shared_resource.limit, 10)
+        self.assertEqual(len(shared_resource.requirements), 2)
+        self.assertEqual(shared_resource.requirements[0].job_type_id, self.job_type.id)
+        self.assertEqual(shared_resource.requirements[0].usage, 1)
+        self.assertEqual(shared_resource.requirements[1].workspace_id, self.workspace.id)
+        self.assertEqual(shared_resource.requirements[1].usage, 2)
+
+    def test_create_invalid_requirements(self):
+        """Tests creating a shared resource with invalid limits and requirements"""
+
+        self.assertRaises(InvalidSharedResource, SharedResource.objects.create_shared_resource, 'bandwidth', None,
+                          None, 0, [])
+        self.assertRaises(InvalidSharedResource, SharedResource.objects.create_shared_resource, 'bandwidth', None,
+                          None, 10, [{'usage': 1}])
+        self.assertRaises(InvalidSharedResource, SharedResource.objects.create_shared_resource, 'bandwidth', None,
+                          None, 10, [{'job_type_id': self.job_type.id, 'workspace_id': self.workspace.id}])
+        self.assertRaises(InvalidSharedResource, SharedResource.objects.create_shared_resource, 'bandwidth', None,
+                          None, 10, [{'job_type_id': self.job_type.id, 'usage': 0}])
+        self.assertRaises(InvalidSharedResource, SharedResource.objects.create_shared_resource, 'bandwidth', None,
+                          None, 10, [{'job_type_id': 9999}])
+        self.assertEqual(SharedResource.objects.count(), 0)
+
+    def test_create_duplicate_name(self):
+        """Tests creating a shared resource with the name of an existing shared resource"""
+
+        SharedResource.objects.create_shared_resource('bandwidth', None, None, 10, [])
+
+        self.assertRaises(InvalidSharedResource, SharedResource.objects.create_shared_resource, 'bandwidth', None,
+                          None, 5, [])
+        self.assertEqual(SharedResource.objects.count(), 1)
+
+    def test_edit_shared_resource(self):
+        """Tests that editing the requirements of a shared resource replaces them"""
+
+        shared_resource = SharedResource.objects.create_shared_resource('bandwidth', None, None, 10,
+                                                                        [{'job_type_id': self.job_type.id}])
+
+        SharedResource.objects.edit_shared_resource(shared_resource.id, limit=5)
+        self.assertEqual(SharedResourceRequirement.objects.filter(job_type_id=self.job_type.id).count(), 1)
+
+        SharedResource.objects.edit_shared_resource(shared_resource.id, requirements=[{'workspace_id':
+                                                                                       self.workspace.id}])
+        shared_resource = SharedResource.objects.get_details(shared_resource.id)
+        self.assertEqual(shared_resource.limit, 5)
+        self.assertEqual(len(shared_resource.requirements), 1)
+        self.assertEqual(shared_resource.requirements[0].workspace_id, self.workspace.id)
@@ -0,0 +1,98 @@
+from __future__ import unicode_literals
+
+import json
+
+import django
+from django.test import TestCase
+from rest_framework import status
+
+import job.test.utils as job_test_utils
+import util.rest as rest_util
+from shared_resource.models import SharedResource
+
+
+class TestSharedResourcesView(TestCase):
+
+    def setUp(self):
+        django.setup()
+
+        self.job_type = job_test_utils.create_job_type()
+        self.shared_resource = SharedResource.objects.create_shared_resource('db-connections', None, None, 10, [])
+
+    def test_successful(self):
+        """Tests successfully calling the get all shared resources view."""
+
+        url = rest_util.get_url('/shared-resources/')
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.content)
+
+        result = json.loads(response.content)
+        self.assertEqual(len(result['results']), 1)
+        self.assertEqual(result['results'][0]['name'], 'db-connections')
+        self.assertEqual(result['results'][0]['limit'], 10)
+
+    def test_create(self):
+        """Tests successfully creating a shared resource."""
+
+        json_data = {
+            'name': 'bandwidth',
+            'limit': 4,
+            'requirements': [{'job_type_id': self.job_type.id, 'usage': 2}],
+        }
+
+        url = rest_util.get_url('/shared-resources/')
+        response = self.client.generic('POST', url, json.dumps(json_data), 'application/json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.content)
+
+        result = json.loads(response.content)
+        self.assertEqual(result['name'], 'bandwidth')
+        self.assertEqual(len(result['requirements']), 1)
+        self.assertEqual(result['requirements'][0]['job_type']['id'], self.job_type.id)
+        self.assertIsNone(result['requirements'][0]['workspace'])
+        self.assertEqual(result['requirements'][0]['usage'], 2)
+
+    def test_create_invalid(self):
+        """Tests creating a shared resource with an invalid requirement."""
+
+        json_data = {
+            'name': 'bandwidth',
+            'limit': 4,
+            'requirements': [{'usage': 2}],
+        }
+
+        url = rest_util.get_url('/shared-resources/')
+        response = self.client.generic('POST', url, json.dumps(json_data), 'application/json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, response.content)
+
+
+class TestSharedResourceDetailsView(TestCase):
+
+    def setUp(self):
+        django.setup()
+
+        self.job_type = job_test_utils.create_job_type()
+        self.shared_resource = SharedResource.objects.create_shared_resource('db-connections', None, None, 10, [])
+
+    def test_not_found(self):
+        """Tests calling the get shared resource details view with an ID that does not exist."""
+
+        url = rest_util.get_url('/shared-resources/100/')
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND, response.content)
+
+    def test_edit(self):
+        """Tests editing the limit and requirements of a shared resource."""
+
+        json_data = {
+            'limit': 20,
+            'requirements': [{'job_type_id': self.job_type.id}],
+        }
+
+        url = rest_util.get_url('/shared-resources/%d/' % self.shared_resource.id)
+        response = self.client.generic('PATCH', url, json.dumps(json_data), 'application/json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.content)
+
+        result = json.loads(response.content)
+        self.assertEqual(result['limit'], 20)
+        self.assertEqual(len(result['requirements']), 1)
+        self.assertEqual(result['requirements'][0]['usage'], 1)
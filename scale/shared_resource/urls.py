@@ -0,0 +1,9 @@
+"""Defines the URLs for the RESTful shared resource services"""
+from django.conf.urls import url
+
+import shared_resource.views as views
+
+urlpatterns = [
+    url(r'^shared-resources/$', views.SharedResourcesView.as_view(), name='shared_resources_view'),
+    url(r'^shared-resources/(\d+)/$', views.SharedResourceDetailsView.as_view(), name='shared_resource_details_view'),
+]
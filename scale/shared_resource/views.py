@@ -0,0 +1,133 @@
+"""Defines the views for the RESTful shared resource services"""
+from __future__ import unicode_literals
+
+import logging
+
+import rest_framework.status as status
+from django.http.response import Http404
+from rest_framework.generics import GenericAPIView, ListCreateAPIView
+from rest_framework.response import Response
+from rest_framework.reverse import reverse
+
+import util.rest as rest_util
+from shared_resource.exceptions import InvalidSharedResource
+from shared_resource.models import SharedResource
+from shared_resource.serializers import SharedResourceDetailsSerializer, SharedResourceSerializer
+from util.rest import BadParameter
+
+logger = logging.getLogger(__name__)
+
+
+class SharedResourcesView(ListCreateAPIView):
+    """This view is the endpoint for retrieving the list of all shared resources."""
+    queryset = SharedResource.objects.all()
+    serializer_class = SharedResourceSerializer
+
+    def list(self, request):
+        """Retrieves the list of all shared resources and returns it in JSON form
+
+        :param request: the HTTP GET request
+        :type request: :class:`rest_framework.request.Request`
+        :rtype: :class:`rest_framework.response.Response`
+        :returns: the HTTP response to send back to the user
+        """
+
+        started = rest_util.parse_timestamp(request, 'started', required=False)
+        ended = rest_util.parse_timestamp(request, 'ended', required=False)
+        rest_util.check_time_range(started, ended)
+
+        names = rest_util.parse_string_list(request, 'name', required=False)
+        order = rest_util.parse_string_list(request, 'order', ['name'])
+
+        shared_resources = SharedResource.objects.get_shared_resources(started, ended, names, order)
+
+        page = self.paginate_queryset(shared_resources)
+        serializer = self.get_serializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
+
+    def create(self, request):
+        """Creates a new shared resource and returns it in JSON form
+
+        :param request: the HTTP POST request
+        :type request: :class:`rest_framework.request.Request`
+        :rtype: :class:`rest_framework.response.Response`
+        :returns: the HTTP response to send back to the user
+        """
+
+        name = rest_util.parse_string(request, 'name')
+        title = rest_util.parse_string(request, 'title', required=False)
+        description = rest_util.parse_string(request, 'description', required=False)
+        limit = rest_util.parse_int(request, 'limit')
+        requirements = rest_util.parse_dict_list(request, 'requirements', required=False)
+
+        try:
+            shared_resource = SharedResource.objects.create_shared_resource(name, title, description, limit,
+                                                                            requirements)
+        except InvalidSharedResource as ex:
+            logger.exception('Unable to create new shared resource: %s', name)
+            raise BadParameter(unicode(ex))
+
+        # Fetch the full shared resource with details
+        try:
+            shared_resource = SharedResource.objects.get_details(shared_resource.id)
+        except SharedResource.DoesNotExist:
+            raise Http404
+
+        serializer = SharedResourceDetailsSerializer(shared_resource)
+        shared_resource_url = reverse('shared_resource_details_view', args=[shared_resource.id], request=request)
+        return Response(serializer.data, status=status.HTTP_201_CREATED, headers=dict(location=shared_resource_url))
+
+
+class SharedResourceDetailsView(GenericAPIView):
+    """This view is the endpoint for retrieving/updating details of a shared resource."""
+    queryset = SharedResource.objects.all()
+    serializer_class = SharedResourceDetailsSerializer
+
+    def get(self, request, shared_resource_id):
+        """Retrieves the details for a shared resource and return them in JSON form
+
+        :param request: the HTTP GET request
+        :type request: :class:`rest_framework.request.Request`
+        :param shared_resource_id: The id of the shared resource
+        :type shared_resource_id: int encoded as a str
+        :rtype: :class:`rest_framework.response.Response`
+        :returns: the HTTP response to send back to the user
+        """
+        try:
+            shared_resource = SharedResource.objects.get_details(shared_resource_id)
+        except SharedResource.DoesNotExist:
+            raise Http404
+
+        serializer = self.get_serializer(shared_resource)
+        return Response(serializer.data)
+
+    def patch(self, request, shared_resource_id):
+        """Edits an existing shared resource and returns the updated details
+
+        :param request: the HTTP PATCH request
+        :type request: :class:`rest_framework.request.Request`
+        :param shared_resource_id: The id of the shared resource
+        :type shared_resource_id: int encoded as a str
+        :rtype: :class:`rest_framework.response.Response`
+        :returns: the HTTP response to send back to the user
+        """
+
+        title = rest_util.parse_string(request, 'title', required=False)
+        description = rest_util.parse_string(request, 'description', required=False)
+        limit = rest_util.parse_int(request, 'limit', required=False)
+        requirements = None
+        if rest_util.has_params(request, 'requirements'):
+            requirements = rest_util.parse_dict_list(request, 'requirements', required=False)
+
+        try:
+            SharedResource.objects.edit_shared_resource(shared_resource_id, title, description, limit, requirements)
+
+            shared_resource = SharedResource.objects.get_details(shared_resource_id)
+        except SharedResource.DoesNotExist:
+            raise Http404
+        except InvalidSharedResource as ex:
+            logger.exception('Unable to edit shared resource: %s', shared_resource_id)
+            raise BadParameter(unicode(ex))
+
+        serializer = self.get_serializer(shared_resource)
+        return Response(serializer.data)
@@ -21,7 +21,8 @@ class SourceFileManager(models.GeoManager):
     """Provides additional methods for handling source files
     """
 
-    def filter_sources(self, started=None, ended=None, time_field=None, is_parsed=None, file_name=None, order=None):
+    def filter_sources(self, started=None, ended=None, time_field=None, is_parsed=None, file_name=None, geometry=None,
+                       countries=None, data_started=None, data_ended=None, order=None):
         """Returns a query for source models that filters on the given fields. The returned query includes the related
         workspace, job_type, and job fields, except for the workspace.json_config field. The related countries are set
         to be pre-fetched as part of the query.
@@ -36,6 +37,14 @@ class SourceFileManager(models.GeoManager):
         :type is_parsed: bool
         :param file_name: Query source files with the given file name.
         :type file_name: str
+        :param geometry: Query source files whose geometry intersects this geometry.
+        :type geometry: :class:`django.contrib.gis.geos.GEOSGeometry`
+        :param countries: Query source files within any of the countries with these ISO 3166 alpha-2 or alpha-3 codes.
+        :type countries: list[str]
+        :param data_started: Query source files whose data ends at or after this time.
+        :type data_started: :class:`datetime.datetime`
+        :param data_ended: Query source files whose data starts at or before this time.
+        :type data_ended: :class:`datetime.datetime`
         :param order: A list of fields to control the sort order.
         :type order: list[str]
         :returns: The list of source files that match the time range.
@@ -63,6 +72,8 @@ class SourceFileManager(models.GeoManager):
             sources = sources.filter(is_parsed=is_parsed)
         if file_name:
             sources = sources.filter(file_name=file_name)
+        sources = ScaleFile.objects.filter_coverage(sources, geometry=geometry, countries=countries,
+                                                    data_started=data_started, data_ended=data_ended)
 
         # Apply sorting
         if order:
@@ -72,7 +83,8 @@ class SourceFileManager(models.GeoManager):
 
         return sources
 
-    def get_sources(self, started=None, ended=None, time_field=None, is_parsed=None, file_name=None, order=None):
+    def get_sources(self, started=None, ended=None, time_field=None, is_parsed=None, file_name=None, geometry=None,
+                    countries=None, data_started=None, data_ended=None, order=None):
         """Returns a list of source files within the given time range.
 
         :param started: Query source files updated after this amount of time.
@@ -85,6 +97,14 @@ class SourceFileManager(models.GeoManager):
         :type is_parsed: bool
         :param file_name: Query source files with the given file name.
         :type file_name: str
+        :param geometry: Query source files whose geometry intersects this geometry.
+        :type geometry: :class:`django.contrib.gis.geos.GEOSGeometry`
+        :param countries: Query source files within any of the countries with these ISO 3166 alpha-2 or alpha-3 codes.
+        :type countries: list[str]
+        :param data_started: Query source files whose data ends at or after this time.
+        :type data_started: :class:`datetime.datetime`
+        :param data_ended: Query source files whose data starts at or before this time.
+        :type data_ended: :class:`datetime.datetime`
         :param order: A list of fields to control the sort order.
         :type order: list[str]
         :returns: The list of source files that match the time range.
@@ -92,7 +112,8 @@ class SourceFileManager(models.GeoManager):
         """
 
         return self.filter_sources(started=started, ended=ended, time_field=time_field, is_parsed=is_parsed,
-                                   file_name=file_name, order=order)
+                                   file_name=file_name, geometry=geometry, countries=countries,
+                                   data_started=data_started, data_ended=data_ended, order=order)
 
     def get_source_file_by_name(self, file_name):
         """Returns the source file with the given file name
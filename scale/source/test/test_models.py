@@ -4,6 +4,7 @@ import datetime
 import os
 
 import django
+import django.contrib.gis.geos as geos
 from django.test import TestCase
 from django.utils.timezone import now
 from mock import patch
@@ -109,6 +110,23 @@ class TestSourceFileManager(TestCase):
         sources = SourceFile.objects.get_sources(ended='2016-01-15T00:00:00Z', time_field='data')
         self.assertEqual(len(sources), 3)
 
+    def test_get_sources_coverage(self):
+        """Tests calling get_sources() filtered by geometry and country"""
+
+        country = storage_utils.create_country(iso2='TT', iso3='TST')
+        source_1 = source_test_utils.create_source(countries=[country])
+        source_1.geometry = geos.Polygon.from_bbox((0.0, 0.0, 1.0, 1.0))
+        source_1.save()
+        source_2 = source_test_utils.create_source()
+        source_2.geometry = geos.Polygon.from_bbox((10.0, 10.0, 11.0, 11.0))
+        source_2.save()
+
+        sources = SourceFile.objects.get_sources(geometry=geos.Polygon.from_bbox((0.5, 0.5, 2.0, 2.0)))
+        self.assertListEqual([source.id for source in sources], [source_1.id])
+
+        sources = SourceFile.objects.get_sources(countries=['tst'])
+        self.assertListEqual([source.id for source in sources], [source_1.id])
+
 
 class TestSourceFileManagerSaveParseResults(TestCase):
 
@@ -115,6 +115,44 @@ class TestSourcesView(TestCase):
         result = json.loads(response.content)
         self.assertEqual(len(result['results']), 2)
 
+    def test_data_time_overlap(self):
+        """Tests successfully calling the source files view filtered by data time overlap."""
+
+        url = rest_util.get_url('/sources/?data_started=2016-06-01T00:00:00Z&data_ended=2017-06-01T00:00:00Z')
+        response = self.client.generic('GET', url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.content)
+
+        result = json.loads(response.content)
+        self.assertEqual(len(result['results']), 1)
+        self.assertEqual(result['results'][0]['id'], self.source2.id)
+
+    def test_invalid_bbox(self):
+        """Tests calling the source files view when the bbox parameter is invalid."""
+
+        url = rest_util.get_url('/sources/?bbox=1,2,3')
+        response = self.client.generic('GET', url)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, response.content)
+
+    def test_cursor(self):
+        """Tests successfully paging through the source files view with a cursor."""
+
+        url = rest_util.get_url('/sources/?cursor=&page_size=1')
+        response = self.client.generic('GET', url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.content)
+
+        result = json.loads(response.content)
+        self.assertEqual(len(result['results']), 1)
+        self.assertFalse('count' in result)
+        self.assertIsNotNone(result['next'])
+
+        response = self.client.generic('GET', result['next'])
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.content)
+
+        result = json.loads(response.content)
+        self.assertEqual(len(result['results']), 1)
+        self.assertIsNone(result['next'])
+
 
 class TestSourceDetailsView(TestCase):
 
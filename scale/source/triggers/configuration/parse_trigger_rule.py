@@ -3,7 +3,6 @@ from __future__ import unicode_literals
 
 import logging
 
-from jsonschema import validate
 from jsonschema.exceptions import ValidationError
 
 from job.configuration.data.job_connection import JobConnection
@@ -13,6 +12,7 @@ from source.triggers.configuration import parse_trigger_rule_1_0 as previous_par
 from source.triggers.parse_trigger_condition import ParseTriggerCondition
 from storage.models import Workspace
 from trigger.configuration.exceptions import InvalidTriggerRule
+from util.validation import validate
 
 
 logger = logging.getLogger(__name__)
@@ -22,7 +22,7 @@ from storage.models import ScaleFile
 logger = logging.getLogger(__name__)
 
 
-class SourcesView(ListAPIView):
+class SourcesView(rest_util.CursorPaginationMixin, ListAPIView):
     """This view is the endpoint for retrieving source files."""
     queryset = ScaleFile.objects.all()
     serializer_class = SourceFileSerializer
@@ -43,10 +43,22 @@ class SourcesView(ListAPIView):
 
         is_parsed = rest_util.parse_bool(request, 'is_parsed', required=False)
         file_name = rest_util.parse_string(request, 'file_name', required=False)
+        geometry = rest_util.parse_geometry(request, 'intersects', required=False)
+        bbox = rest_util.parse_bbox(request, 'bbox', required=False)
+        if geometry and bbox:
+            raise rest_util.BadParameter('Only one of "intersects" and "bbox" may be given')
+        geometry = geometry or bbox
+        countries = rest_util.parse_string_list(request, 'country', required=False)
+        data_started = rest_util.parse_timestamp(request, 'data_started', required=False)
+        data_ended = rest_util.parse_timestamp(request, 'data_ended', required=False)
+        rest_util.check_time_range(data_started, data_ended)
 
         order = rest_util.parse_string_list(request, 'order', required=False)
 
-        sources = SourceFile.objects.get_sources(started, ended, time_field, is_parsed, file_name, order)
+        sources = SourceFile.objects.get_sources(started=started, ended=ended, time_field=time_field,
+                                                 is_parsed=is_parsed, file_name=file_name, geometry=geometry,
+                                                 countries=countries, data_started=data_started,
+                                                 data_ended=data_ended, order=order)
 
         page = self.paginate_queryset(sources)
         serializer = self.get_serializer(page, many=True)
@@ -287,7 +299,7 @@ class SourceUpdatesView(ListAPIView):
 
         order = rest_util.parse_string_list(request, 'order', required=False)
 
-        sources = SourceFile.objects.get_sources(started, ended, time_field, is_parsed, file_name, order)
+        sources = SourceFile.objects.get_sources(started, ended, time_field, is_parsed, file_name, order=order)
 
         page = self.paginate_queryset(sources)
         serializer = self.get_serializer(page, many=True)
@@ -192,9 +192,9 @@ class Broker(object):
         local container path where the file currently exists. The broker is free to alter the ScaleFile fields of the
         uploaded files, including the final file_path (the given file_path is a recommendation by Scale that guarantees
         path uniqueness). The ScaleFile models may not have been saved to the database yet and so may not have their id
-        field populated. The broker should perform a model save/update to the database for any files that are
-        successfully uploaded. The directories in the remote file_path may not exist, so it is the responsibility of the
-        broker to create them if necessary.
+        field populated. The broker should not save the models to the database, the caller saves them after the upload
+        so that the file transfers can be performed outside of a database transaction. The directories in the remote
+        file_path may not exist, so it is the responsibility of the broker to create them if necessary.
 
         :param volume_path: Absolute path to the local container location onto which the volume file system was mounted,
             None if this broker does not use a container volume
@@ -141,9 +141,6 @@ class HostBroker(Broker):
             logger.info('Setting file permissions for %s', path_to_upload)
             os.chmod(path_to_upload, 0644)
 
-            # Create new model
-            file_upload.file.save()
-
     def validate_configuration(self, config):
         """See :meth:`storage.brokers.broker.Broker.validate_configuration`
         """
@@ -64,6 +64,9 @@ class S3Broker(Broker):
                     execute_command_line(['ln', '-s', path_to_download, file_download.local_path])
                 # Fall-back to default S3 file download
                 else:
+                    if file_download.partial:
+                        logger.info('No host_path mount for bucket %s, downloading entire partial file %s',
+                                    self._bucket_name, file_download.file.file_path)
                     try:
                         s3_object = client.get_object(self._bucket_name, file_download.file.file_path)
                     except FileDoesNotExist:
@@ -119,9 +122,6 @@ class S3Broker(Broker):
 
                 self._upload_file(s3_object, file_upload.file, file_upload.local_path)
 
-                # Create new model
-                file_upload.file.save()
-
     def validate_configuration(self, config):
         """See :meth:`storage.brokers.broker.Broker.validate_configuration`"""
 
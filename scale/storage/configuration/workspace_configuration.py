@@ -1,11 +1,11 @@
 """Defines the configuration for a storage Workspace"""
 from __future__ import unicode_literals
 
-from jsonschema import validate
 from jsonschema.exceptions import ValidationError
 
 import storage.brokers.factory as broker_factory
 from storage.configuration.exceptions import InvalidWorkspaceConfiguration
+from util.validation import validate
 
 DEFAULT_VERSION = '1.0'
 
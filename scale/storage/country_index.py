@@ -0,0 +1,203 @@
+"""Defines the in-process spatial index of country borders used to tag files with countries"""
+from __future__ import unicode_literals
+
+import logging
+import math
+import threading
+
+from django.db.models import Count, Max
+
+
+logger = logging.getLogger(__name__)
+
+# The maximum number of children of each node within the spatial index tree
+NODE_CAPACITY = 10
+
+# The spatial reference system used by country borders
+COUNTRY_SRID = 4326
+
+
+class CountryIndex(object):
+    """This class maintains an in-process spatial index of all country borders. Borders are stored as prepared GEOS
+    geometries within a Sort-Tile-Recursive packed R-tree so that finding the countries of a geometry is a local lookup.
+    The index is rebuilt whenever the country data in the database changes. This class is thread-safe.
+    """
+
+    def __init__(self):
+        """Constructor
+        """
+
+        self._lock = threading.Lock()
+        self._tree = None
+        self._version = None
+
+    def get_intersects(self, geom, target_date):
+        """Get the countries whose borders intersect the specified geometry and whose effective date is before the
+        target. When a country has multiple intersecting borders, the most recently effective one is used.
+
+        :param geom: The geometry (point, poly, etc.) to search.
+        :type geom: :class:`django.contrib.gis.geos.geometry.GEOSGeometry`
+        :param target_date: The target date
+        :type target_date: :class:`datetime.datetime`
+        :returns: A dict of intersected country names mapped to country models
+        :rtype: {string: :class:`storage.models.CountryData`}
+        """
+
+        return self.get_intersects_batch([(geom, target_date)])[0]
+
+    def get_intersects_batch(self, queries):
+        """Get the intersecting countries for many geometries at once. The country data version is only checked once
+        for the whole batch.
+
+        :param queries: A list of tuples containing a geometry and target date to search
+        :type queries: [(:class:`django.contrib.gis.geos.geometry.GEOSGeometry`, :class:`datetime.datetime`)]
+        :returns: A list of dicts of intersected country names mapped to country models, one for each query
+        :rtype: [{string: :class:`storage.models.CountryData`}]
+        """
+
+        results = []
+        with self._lock:
+            tree = self._get_tree()
+            for geom, target_date in queries:
+                rval = {}
+                if geom is not None:
+                    if geom.srid and geom.srid != COUNTRY_SRID:
+                        geom = geom.transform(COUNTRY_SRID, clone=True)
+                    for prepared_border, country in tree.query(geom.extent):
+                        if country.effective > target_date:
+                            continue
+                        if country.name in rval and country.effective <= rval[country.name].effective:
+                            continue
+                        if prepared_border.intersects(geom):
+                            rval[country.name] = country
+                results.append(rval)
+        return results
+
+    def clear(self):
+        """Clears the index so that it is rebuilt from the database on next use
+        """
+
+        with self._lock:
+            self._tree = None
+            self._version = None
+
+    def _get_tree(self):
+        """Returns the spatial index tree, rebuilding it if the country data has changed. Caller must have obtained the
+        index lock.
+
+        :returns: The spatial index tree
+        :rtype: :class:`storage.country_index.STRtree`
+        """
+
+        from storage.models import CountryData
+
+        version = CountryData.objects.aggregate(count=Count('id'), last_modified=Max('last_modified'))
+        version = (version['count'], version['last_modified'])
+        if self._tree is None or version != self._version:
+            entries = []
+            for country in CountryData.objects.all().iterator():
+                if country.border is None or country.border.empty:
+                    continue
+                entries.append((country.border.extent, (country.border.prepared, country)))
+            self._tree = STRtree(entries)
+            self._version = version
+            logger.debug('Rebuilt country index with %i borders', len(entries))
+        return self._tree
+
+
+class STRtree(object):
+    """A read-only R-tree of bounding boxes that is bulk loaded with the Sort-Tile-Recursive algorithm
+    """
+
+    def __init__(self, entries, node_capacity=NODE_CAPACITY):
+        """Constructor
+
+        :param entries: A list of tuples containing a bounding box (xmin, ymin, xmax, ymax) and an item
+        :type entries: [((float, float, float, float), object)]
+        :param node_capacity: The maximum number of children of each node
+        :type node_capacity: int
+        """
+
+        nodes = [_Node(extent, item=item) for extent, item in entries]
+        while len(nodes) > node_capacity:
+            nodes = _pack(nodes, node_capacity)
+        self._root = _Node(_union_extents([node.extent for node in nodes]), children=nodes) if nodes else None
+
+    def query(self, extent):
+        """Returns the items whose bounding boxes intersect the given bounding box
+
+        :param extent: The bounding box (xmin, ymin, xmax, ymax) to search
+        :type extent: (float, float, float, float)
+        :returns: The matching items
+        :rtype: [object]
+        """
+
+        results = []
+        if not self._root:
+            return results
+
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            if not _intersects(node.extent, extent):
+                continue
+            if node.children is None:
+                results.append(node.item)
+            else:
+                stack.extend(node.children)
+        return results
+
+
+class _Node(object):
+    """A node within an STR-tree, which is either a leaf with an item or a branch with children"""
+
+    __slots__ = ('extent', 'children', 'item')
+
+    def __init__(self, extent, children=None, item=None):
+        self.extent = extent
+        self.children = children
+        self.item = item
+
+
+def _intersects(extent1, extent2):
+    """Indicates whether two bounding boxes intersect
+
+    :rtype: bool
+    """
+
+    return extent1[0] <= extent2[2] and extent2[0] <= extent1[2] and extent1[1] <= extent2[3] and \
+        extent2[1] <= extent1[3]
+
+
+def _pack(nodes, node_capacity):
+    """Packs one level of STR-tree nodes into parent nodes by sorting them into vertical slices by x and then into
+    groups by y
+
+    :returns: The parent nodes
+    :rtype: [:class:`storage.country_index._Node`]
+    """
+
+    parent_count = int(math.ceil(len(nodes) / float(node_capacity)))
+    slice_size = int(math.ceil(math.sqrt(parent_count))) * node_capacity
+
+    parents = []
+    nodes = sorted(nodes, key=lambda node: node.extent[0] + node.extent[2])
+    for i in xrange(0, len(nodes), slice_size):
+        vertical_slice = sorted(nodes[i:i + slice_size], key=lambda node: node.extent[1] + node.extent[3])
+        for j in xrange(0, len(vertical_slice), node_capacity):
+            children = vertical_slice[j:j + node_capacity]
+            parents.append(_Node(_union_extents([child.extent for child in children]), children=children))
+    return parents
+
+
+def _union_extents(extents):
+    """Returns the bounding box that contains all of the given bounding boxes
+
+    :rtype: (float, float, float, float)
+    """
+
+    return (min(e[0] for e in extents), min(e[1] for e in extents), max(e[2] for e in extents),
+            max(e[3] for e in extents))
+
+
+country_index = CountryIndex()
@@ -0,0 +1,18 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('storage', '0008_auto_20170609_1443'),
+    ]
+
+    operations = [
+        migrations.AlterIndexTogether(
+            name='scalefile',
+            index_together=set([('file_type', 'data_started', 'data_ended'), ('file_type', 'last_modified', 'id')]),
+        ),
+    ]
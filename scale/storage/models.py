@@ -11,11 +11,13 @@ import django.contrib.gis.geos as geos
 import django.utils.timezone as timezone
 import django.contrib.postgres.fields
 from django.db import transaction
+from django.db.models import Q
 
 import storage.geospatial_utils as geospatial_utils
 from storage.brokers.factory import get_broker
 from storage.configuration.workspace_configuration import ValidationWarning, WorkspaceConfiguration
 from storage.container import get_workspace_volume_path
+from storage.country_index import country_index
 from storage.exceptions import ArchivedWorkspace, DeletedFile, InvalidDataTypeTag, MissingVolumeMount
 from storage.media_type import get_media_type
 
@@ -217,6 +219,43 @@ class ScaleFileManager(models.Manager):
             wp_file_downloads = wp_dict[wp_id][1]
             workspace.download_files(wp_file_downloads)
 
+    def filter_coverage(self, scale_files, geometry=None, countries=None, data_started=None, data_ended=None):
+        """Filters the given file query to the files that cover the given area and data time range. The geometry filter
+        uses the spatial index on the file geometry and the time filter uses the composite index on the file type and
+        data times, so the files are found in a single indexed query.
+
+        :param scale_files: The file query to filter
+        :type scale_files: :class:`django.db.models.QuerySet`
+        :param geometry: Query files whose geometry intersects this geometry.
+        :type geometry: :class:`django.contrib.gis.geos.GEOSGeometry`
+        :param countries: Query files within any of the countries with these ISO 3166 alpha-2 or alpha-3 codes.
+        :type countries: list[str]
+        :param data_started: Query files whose data ends at or after this time.
+        :type data_started: :class:`datetime.datetime`
+        :param data_ended: Query files whose data starts at or before this time.
+        :type data_ended: :class:`datetime.datetime`
+        :returns: The filtered file query
+        :rtype: :class:`django.db.models.QuerySet`
+        """
+
+        if geometry:
+            scale_files = scale_files.filter(geometry__intersects=geometry)
+        if countries:
+            # Filter on the relation table in a sub-query so that files in several countries are not duplicated
+            codes = [code.upper() for code in countries]
+            country_files = ScaleFile.countries.through.objects.filter(Q(countrydata__iso2__in=codes) |
+                                                                      Q(countrydata__iso3__in=codes))
+            scale_files = scale_files.filter(id__in=country_files.values('scalefile_id'))
+
+        # Files that only have a data start time are treated as an instant in time
+        if data_started:
+            scale_files = scale_files.filter(Q(data_ended__gte=data_started) |
+                                             Q(data_ended__isnull=True, data_started__gte=data_started))
+        if data_ended:
+            scale_files = scale_files.filter(data_started__lte=data_ended)
+
+        return scale_files
+
     def get_files(self, file_ids):
         """Returns the files with the given IDs. The files will have their related workspace field populated.
 
@@ -262,17 +301,34 @@ class ScaleFileManager(models.Manager):
             wp_file_moves = wp_dict[wp_id][1]
             workspace.move_files(wp_file_moves)
 
-    def upload_files(self, workspace, file_uploads):
-        """Uploads the given files from the given local file system paths into the given workspace. Each ScaleFile model
-        should have its file_path field populated with the relative location where the file should be stored within the
-        workspace. This method will update the workspace and other fields (including possibly changing file_path) in
-        each ScaleFile model and will save the models to the database.
+    def save_files(self, scale_files):
+        """Saves the given file models in the database and populates their countries. This is the second phase of a
+        staged upload that started with transfer_files() and should be called within a transaction so that the metadata
+        of all of the uploaded files is committed together.
+
+        :param scale_files: List of file models that have been transferred to their workspace
+        :type scale_files: [:class:`storage.models.ScaleFile`]
+        """
+
+        for scale_file in scale_files:
+            scale_file.save()
+
+        # Populate the country list for all files that were saved
+        self.set_countries(scale_files)
+
+    def transfer_files(self, workspace, file_uploads):
+        """Transfers the given files from the given local file system paths into the given workspace without saving
+        the ScaleFile models. This is the first phase of a staged upload: it performs no database writes, so the (slow)
+        transfers can happen outside of any database transaction, and save_files() is then called to save the models.
+        Each ScaleFile model should have its file_path field populated with the relative location where the file should
+        be stored within the workspace. This method will update the workspace and other fields (including possibly
+        changing file_path) in each ScaleFile model.
 
         :param workspace: The workspace to upload files into
         :type workspace: :class:`storage.models.Workspace`
         :param file_uploads: List of files to upload
         :type file_uploads: [:class:`storage.brokers.broker.FileUpload`]
-        :returns: The list of saved file models
+        :returns: The list of transferred (unsaved) file models
         :rtype: [:class:`storage.models.ScaleFile`]
 
         :raises :class:`storage.exceptions.ArchivedWorkspace`: If one of the files has a workspace that is archived
@@ -293,15 +349,55 @@ class ScaleFileManager(models.Manager):
         # Store files in workspace
         workspace.upload_files(file_uploads)
 
-        # Populate the country list for all files that were saved
-        for file_upload in file_uploads:
-            scale_file = file_upload.file
-            if scale_file.pk:
-                scale_file.set_countries()
-                scale_file.save()
+        return file_list
+
+    def upload_files(self, workspace, file_uploads):
+        """Uploads the given files from the given local file system paths into the given workspace. Each ScaleFile model
+        should have its file_path field populated with the relative location where the file should be stored within the
+        workspace. This method will update the workspace and other fields (including possibly changing file_path) in
+        each ScaleFile model and will save the models to the database.
+
+        :param workspace: The workspace to upload files into
+        :type workspace: :class:`storage.models.Workspace`
+        :param file_uploads: List of files to upload
+        :type file_uploads: [:class:`storage.brokers.broker.FileUpload`]
+        :returns: The list of saved file models
+        :rtype: [:class:`storage.models.ScaleFile`]
+
+        :raises :class:`storage.exceptions.ArchivedWorkspace`: If one of the files has a workspace that is archived
+        :raises :class:`storage.exceptions.MissingRemoteMount`: If a required mount location is missing
+        """
 
+        file_list = self.transfer_files(workspace, file_uploads)
+        self.save_files(file_list)
         return file_list
 
+    def set_countries(self, scale_files):
+        """Clears the countries lists of the given saved files and then recreates them using the in-process country
+        border index. Each file's countries are based on its geometry and the country border effective date will use
+        (in order of preference) data_started, data_ended, or created. The country relations for all of the files are
+        replaced with a single delete and a single bulk insert.
+
+        :param scale_files: List of saved files
+        :type scale_files: [:class:`storage.models.ScaleFile`]
+        """
+
+        if not scale_files:
+            return
+
+        queries = [(scale_file.geometry, scale_file.get_country_target_date()) for scale_file in scale_files]
+        intersects_list = country_index.get_intersects_batch(queries)
+
+        through_model = ScaleFile.countries.through
+        new_relations = []
+        for scale_file, intersects in zip(scale_files, intersects_list):
+            for country in intersects.values():
+                new_relations.append(through_model(scalefile_id=scale_file.id, countrydata_id=country.id))
+
+        with transaction.atomic():
+            through_model.objects.filter(scalefile_id__in=[scale_file.id for scale_file in scale_files]).delete()
+            through_model.objects.bulk_create(new_relations)
+
 
 class ScaleFile(models.Model):
     """Represents a file that is stored within a Scale workspace
@@ -518,20 +614,27 @@ class ScaleFile(models.Model):
             for tag in data_type:
                 self.add_data_type_tag(tag)
 
+    def get_country_target_date(self):
+        """Returns the date used to select the effective country borders for this file, which is (in order of
+        preference) data_started, data_ended, or created.
+
+        :returns: The target date for the country borders
+        :rtype: :class:`datetime.datetime`
+        """
+
+        if self.data_started is not None:
+            return self.data_started
+        elif self.data_ended is not None:
+            return self.data_ended
+        return self.created
+
     def set_countries(self):
-        """Clears the countries list then recreates it from the CountryData table.
+        """Clears the countries list then recreates it from the in-process index of the CountryData table.
         If no geometry is available, this will remain empty.
         The country border effective date will use (in order or preference) data_started, data_ended, or created.
         """
-        self.countries.clear()
-        if self.geometry is None:
-            return
-        target_date = self.created
-        if self.data_started is not None:
-            target_date = self.data_started
-        elif self.data_ended is not None:
-            target_date = self.data_ended
-        apply(self.countries.add, CountryData.objects.get_intersects(self.geometry, target_date).values())
+
+        ScaleFile.objects.set_countries([self])
 
     def set_deleted(self):
         """Marks the current file as deleted and updates the corresponding fields."""
@@ -575,6 +678,7 @@ class ScaleFile(models.Model):
     class Meta(object):
         """meta information for the db"""
         db_table = 'scale_file'
+        index_together = (('file_type', 'data_started', 'data_ended'), ('file_type', 'last_modified', 'id'))
 
 
 class WorkspaceManager(models.Manager):
@@ -916,9 +1020,9 @@ class Workspace(models.Model):
         self.get_broker().move_files(volume_path, file_moves)
 
     def upload_files(self, file_uploads):
-        """Uploads the given files from the given local file system paths and saves the ScaleFile models in the
-        database. If this workspace's broker uses a container volume, the workspace expects this volume file system to
-        already be mounted at workspace_volume_path or an exception will be raised.
+        """Uploads the given files from the given local file system paths. The ScaleFile models are not saved in the
+        database, that is left to the caller. If this workspace's broker uses a container volume, the workspace expects
+        this volume file system to already be mounted at workspace_volume_path or an exception will be raised.
 
         :param file_uploads: List of files to upload
         :type file_uploads: [:class:`storage.brokers.broker.FileUpload`]
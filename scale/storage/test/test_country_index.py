@@ -0,0 +1,35 @@
+from __future__ import unicode_literals
+
+from django.test import TestCase
+
+from storage.country_index import STRtree
+
+
+class TestSTRtree(TestCase):
+
+    def test_query(self):
+        """Tests querying a tree with many levels of nodes."""
+
+        entries = []
+        for x in range(50):
+            for y in range(50):
+                entries.append(((x, y, x + 0.5, y + 0.5), (x, y)))
+        tree = STRtree(entries, node_capacity=4)
+
+        results = tree.query((10.2, 20.2, 12.1, 21.1))
+        self.assertSetEqual(set(results), {(10, 21), (11, 21), (12, 21), (11, 20), (12, 20), (10, 20)})
+
+    def test_query_miss(self):
+        """Tests querying a tree with a bounding box that does not intersect any entries."""
+
+        tree = STRtree([((0, 0, 1, 1), 'a'), ((2, 2, 3, 3), 'b')])
+
+        self.assertListEqual(tree.query((1.5, 1.5, 1.7, 1.7)), [])
+        self.assertListEqual(tree.query((2.5, 2.5, 4, 4)), ['b'])
+
+    def test_empty(self):
+        """Tests querying an empty tree."""
+
+        tree = STRtree([])
+
+        self.assertListEqual(tree.query((0, 0, 1, 1)), [])
@@ -415,6 +415,58 @@ class TestScaleFileManagerUploadFiles(TestCase):
         self.assertRaises(Exception, ScaleFile.objects.upload_files, upload_dir, work_dir, workspace, files)
 
 
+class TestScaleFileManagerSetCountries(TestCase):
+
+    def setUp(self):
+        django.setup()
+
+        self.old_effective = datetime.datetime(2000, 1, 1, tzinfo=utc)
+        self.new_effective = datetime.datetime(2010, 1, 1, tzinfo=utc)
+        CountryData.objects.create(name='Test Country', fips='TC', gmi='TCY', iso2='TC', iso3='TCY', iso_num=42,
+                                   border=geos.Polygon(((0, 0), (0, 10), (10, 10), (10, 0), (0, 0))),
+                                   effective=self.old_effective)
+        CountryData.objects.create(name='Test Country', fips='TC', gmi='TCY', iso2='TC', iso3='TCY', iso_num=42,
+                                   border=geos.Polygon(((0, 0), (0, 20), (20, 20), (20, 0), (0, 0))),
+                                   effective=self.new_effective)
+        CountryData.objects.create(name='Test Country 2', fips='TT', gmi='TCT', iso2='TT', iso3='TCT', iso_num=43,
+                                   border=geos.Polygon(((30, 0), (30, 10), (40, 10), (40, 0), (30, 0))),
+                                   effective=self.old_effective)
+
+    def test_batch(self):
+        """Tests setting the countries of many files at once."""
+
+        file_1 = storage_test_utils.create_file()
+        file_1.geometry = geos.Polygon(((5, 5), (5, 35), (35, 35), (35, 5), (5, 5)))
+        file_2 = storage_test_utils.create_file()
+        file_2.geometry = geos.Point(15, 15)
+        file_2.data_started = datetime.datetime(2005, 1, 1, tzinfo=utc)
+        file_3 = storage_test_utils.create_file()
+        file_3.geometry = geos.Point(15, 15)
+        file_3.data_started = datetime.datetime(2015, 1, 1, tzinfo=utc)
+        file_4 = storage_test_utils.create_file()
+
+        ScaleFile.objects.set_countries([file_1, file_2, file_3, file_4])
+
+        self.assertSetEqual({c.iso2 for c in file_1.countries.all()}, {'TC', 'TT'})
+        self.assertEqual(file_2.countries.count(), 0)
+        self.assertListEqual([c.effective for c in file_3.countries.all()], [self.new_effective])
+        self.assertEqual(file_4.countries.count(), 0)
+
+    def test_country_data_changed(self):
+        """Tests that new country borders are used once they are added."""
+
+        scale_file = storage_test_utils.create_file()
+        scale_file.geometry = geos.Point(50, 50)
+        scale_file.set_countries()
+        self.assertEqual(scale_file.countries.count(), 0)
+
+        CountryData.objects.update_border('Test Country 2',
+                                          geos.Polygon(((30, 0), (30, 60), (60, 60), (60, 0), (30, 0))),
+                                          self.new_effective)
+        scale_file.set_countries()
+        self.assertListEqual([c.iso2 for c in scale_file.countries.all()], ['TT'])
+
+
 class TestScaleFile(TestCase):
 
     def setUp(self):
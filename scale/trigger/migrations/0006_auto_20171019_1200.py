@@ -0,0 +1,18 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('trigger', '0005_auto_20170412_1225'),
+    ]
+
+    operations = [
+        migrations.AlterIndexTogether(
+            name='triggerevent',
+            index_together=set([('rule', 'occurred')]),
+        ),
+    ]
@@ -67,6 +67,7 @@ class TriggerEvent(models.Model):
     class Meta(object):
         """meta information for the db"""
         db_table = 'trigger_event'
+        index_together = ['rule', 'occurred']
 
 
 class TriggerRuleManager(models.Manager):
@@ -0,0 +1,146 @@
+"""Defines a thread-safe cache for objects parsed from immutable JSON revisions"""
+from __future__ import unicode_literals
+
+import copy
+import threading
+from collections import OrderedDict
+
+
+class ParsedObjectCache(object):
+    """This class memoizes objects (such as job interfaces and recipe definitions) that are parsed from JSON stored in
+    immutable database rows, keyed by the row ID. The number of cached objects is bounded and the least recently used
+    objects are evicted first. Cached objects are shared between callers, so they should be built on read-only JSON (see
+    :func:`parse_read_only`). This class is thread-safe.
+    """
+
+    def __init__(self, max_size=1000):
+        """Constructor
+
+        :param max_size: The maximum number of objects to cache
+        :type max_size: int
+        """
+
+        self._lock = threading.Lock()
+        self._max_size = max_size
+        self._objects = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def clear(self):
+        """Removes all objects from the cache
+        """
+
+        with self._lock:
+            self._objects.clear()
+
+    def get(self, key, parse):
+        """Returns the cached object for the given key, parsing and caching it if it is not cached. A key of None is
+        never cached (such as the ID of an unsaved model).
+
+        :param key: The key of the object
+        :type key: int
+        :param parse: Function that takes no arguments and returns the parsed object
+        :type parse: function
+        :returns: The parsed object
+        :rtype: object
+        """
+
+        if key is None:
+            return parse()
+
+        with self._lock:
+            if key in self._objects:
+                # Mark object as most recently used
+                parsed = self._objects.pop(key)
+                self._objects[key] = parsed
+                self.hits += 1
+                return parsed
+            self.misses += 1
+
+        # Parse outside the lock, a rare duplicate parse of the same key is harmless
+        parsed = parse()
+
+        with self._lock:
+            self._objects[key] = parsed
+            while len(self._objects) > self._max_size:
+                self._objects.popitem(last=False)
+        return parsed
+
+
+class ReadOnlyDict(dict):
+    """A JSON object that raises a TypeError if it is modified. Copies of it are regular, modifiable dicts.
+    """
+
+    def _read_only(self, *args, **kwargs):
+        """Raises a TypeError for any modification
+        """
+
+        raise TypeError('Shared parsed JSON is read-only, copy it before modifying it')
+
+    __setitem__ = __delitem__ = clear = pop = popitem = setdefault = update = _read_only
+
+    def __copy__(self):
+        return dict(self)
+
+    def __deepcopy__(self, memo):
+        return {copy.deepcopy(key, memo): copy.deepcopy(value, memo) for key, value in self.items()}
+
+    def __reduce__(self):
+        return dict, (dict(self),)
+
+
+class ReadOnlyList(list):
+    """A JSON array that raises a TypeError if it is modified. Copies of it are regular, modifiable lists.
+    """
+
+    def _read_only(self, *args, **kwargs):
+        """Raises a TypeError for any modification
+        """
+
+        raise TypeError('Shared parsed JSON is read-only, copy it before modifying it')
+
+    __setitem__ = __delitem__ = __setslice__ = __delslice__ = __iadd__ = __imul__ = _read_only
+    append = extend = insert = pop = remove = reverse = sort = _read_only
+
+    def __copy__(self):
+        return list(self)
+
+    def __deepcopy__(self, memo):
+        return [copy.deepcopy(value, memo) for value in self]
+
+    def __reduce__(self):
+        return list, (list(self),)
+
+
+def make_read_only(value):
+    """Returns a read-only copy of the given JSON value, where every object and array is read-only
+
+    :param value: The JSON value
+    :type value: object
+    :returns: The read-only copy of the JSON value
+    :rtype: object
+    """
+
+    if isinstance(value, dict):
+        return ReadOnlyDict((key, make_read_only(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return ReadOnlyList(make_read_only(item) for item in value)
+    return value
+
+
+def parse_read_only(parser_class, definition):
+    """Parses the given JSON definition and returns a parsed object that is built on a read-only copy of the definition,
+    so the object can be safely cached and shared. The parser class must take the definition as its only constructor
+    argument, fill in the definition's default values, and return the populated definition from get_dict(). Parsing a
+    populated definition must not modify it.
+
+    :param parser_class: The class that parses the definition, such as a job interface or a recipe definition
+    :type parser_class: type
+    :param definition: The JSON definition
+    :type definition: dict
+    :returns: The parsed object
+    :rtype: object
+    """
+
+    populated_definition = parser_class(definition).get_dict()
+    return parser_class(make_read_only(populated_definition))
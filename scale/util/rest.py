@@ -4,6 +4,7 @@ from __future__ import unicode_literals
 import datetime
 
 import django.utils.timezone as timezone
+from django.contrib.gis.geos import GEOSException, GEOSGeometry, Polygon
 import rest_framework.pagination as pagination
 import rest_framework.renderers as renderers
 import rest_framework.serializers as serializers
@@ -23,6 +24,35 @@ class DefaultPagination(pagination.PageNumberPagination):
     max_page_size = 1000
 
 
+class CursorPagination(pagination.CursorPagination):
+    """Configuration class for paging through large result sets with an opaque cursor. Each page is fetched with a range
+    query on the indexed ordering fields instead of an offset, and no total count is calculated."""
+    page_size = 100
+    page_size_query_param = 'page_size'
+    max_page_size = 1000
+    ordering = ('last_modified', 'id')
+
+
+class CursorPaginationMixin(object):
+    """Mixin for list views that use cursor pagination instead of the default page numbers when the request includes
+    the cursor parameter. An empty cursor parameter requests the first page."""
+
+    @property
+    def paginator(self):
+        """The paginator instance for the current request
+
+        :returns: The paginator
+        :rtype: :class:`rest_framework.pagination.BasePagination`
+        """
+
+        if not hasattr(self, '_paginator'):
+            if CursorPagination.cursor_query_param in self.request.query_params:
+                self._paginator = CursorPagination()
+            else:
+                self._paginator = self.pagination_class()
+        return self._paginator
+
+
 class ModelIdSerializer(serializers.Serializer):
     """Converts a model to a lightweight place holder object with only an identifier to REST output"""
     id = serializers.IntegerField()
@@ -367,6 +397,71 @@ def parse_float(request, name, default_value=None, required=True, accepted_value
         raise BadParameter('Parameter must be a valid float: "%s"' % name)
 
 
+def parse_bbox(request, name, default_value=None, required=True):
+    """Parses a bounding box parameter from the given request. The bounding box is given as a comma-separated list of
+    the minimum longitude, minimum latitude, maximum longitude, and maximum latitude.
+
+    :param request: The context of an active HTTP request.
+    :type request: :class:`rest_framework.request.Request`
+    :param name: The name of the parameter to parse.
+    :type name: string
+    :param default_value: The name of the parameter to parse.
+    :type default_value: :class:`django.contrib.gis.geos.Polygon`
+    :param required: Indicates whether or not the parameter is required. An exception will be raised if the parameter
+        does not exist, there is no default value, and required is True.
+    :type required: bool
+    :returns: The value of the named parameter as a polygon or the default value if provided.
+    :rtype: :class:`django.contrib.gis.geos.Polygon`
+
+    :raises :class:`util.rest.BadParameter`: If the value cannot be parsed.
+    """
+    value = _get_param(request, name, default_value, required)
+    if not isinstance(value, basestring):
+        return value
+
+    try:
+        bbox = [float(coord) for coord in value.split(',')]
+    except (TypeError, ValueError):
+        raise BadParameter('Parameter must be a valid bounding box: "%s"' % name)
+    if len(bbox) != 4 or bbox[0] > bbox[2] or bbox[1] > bbox[3]:
+        raise BadParameter('Bounding box must be min_x,min_y,max_x,max_y: "%s"' % name)
+
+    result = Polygon.from_bbox(bbox)
+    result.srid = 4326
+    return result
+
+
+def parse_geometry(request, name, default_value=None, required=True):
+    """Parses a geometry parameter in WKT format from the given request. Geometries without an SRID are assumed to be
+    WGS84 (EPSG:4326).
+
+    :param request: The context of an active HTTP request.
+    :type request: :class:`rest_framework.request.Request`
+    :param name: The name of the parameter to parse.
+    :type name: string
+    :param default_value: The name of the parameter to parse.
+    :type default_value: :class:`django.contrib.gis.geos.GEOSGeometry`
+    :param required: Indicates whether or not the parameter is required. An exception will be raised if the parameter
+        does not exist, there is no default value, and required is True.
+    :type required: bool
+    :returns: The value of the named parameter or the default value if provided.
+    :rtype: :class:`django.contrib.gis.geos.GEOSGeometry`
+
+    :raises :class:`util.rest.BadParameter`: If the value cannot be parsed.
+    """
+    value = _get_param(request, name, default_value, required)
+    if not isinstance(value, basestring):
+        return value
+
+    try:
+        result = GEOSGeometry(value)
+    except (GEOSException, TypeError, ValueError):
+        raise BadParameter('Parameter must be a valid WKT geometry: "%s"' % name)
+    if not result.srid:
+        result.srid = 4326
+    return result
+
+
 def parse_timestamp(request, name, default_value=None, required=True):
     """Parses any valid ISO datetime, duration, or timestamp parameter from the given request.
 
@@ -480,6 +575,31 @@ def parse_dict(request, name, default_value=None, required=True):
     return value or {}
 
 
+def parse_dict_list(request, name, default_value=None, required=True):
+    """Parses a list of dictionary parameters from the given request.
+
+    :param request: The context of an active HTTP request.
+    :type request: :class:`rest_framework.request.Request`
+    :param name: The name of the parameter to parse.
+    :type name: string
+    :param default_value: The name of the parameter to parse.
+    :type default_value: [dict]
+    :param required: Indicates whether or not the parameter is required. An exception will be raised if the parameter
+        does not exist, there is no default value, and required is True.
+    :type required: bool
+    :returns: The value of the named parameter or the default value if provided.
+    :rtype: [dict]
+
+    :raises :class:`util.rest.BadParameter`: If the value cannot be parsed.
+    """
+    value = _get_param(request, name, default_value, required)
+    if value is None:
+        return []
+    if not isinstance(value, list) or not all(isinstance(item, dict) for item in value):
+        raise BadParameter('Parameter must be a valid JSON array of objects: "%s"' % name)
+    return value
+
+
 def _get_param(request, name, default_value=None, required=True):
     """Gets a parameter from the given request that works for either read or write operations.
 
@@ -0,0 +1,77 @@
+from __future__ import unicode_literals
+
+import copy
+import json
+
+import django
+from django.test import TestCase
+
+from util.memoize import ParsedObjectCache, make_read_only
+
+
+class TestParsedObjectCache(TestCase):
+    def setUp(self):
+        django.setup()
+
+    def test_get(self):
+        """Tests that an object is only parsed the first time it is requested."""
+        cache = ParsedObjectCache()
+        parsed = []
+
+        def parse():
+            parsed.append(1)
+            return object()
+
+        obj = cache.get(1, parse)
+
+        self.assertIs(cache.get(1, parse), obj)
+        self.assertEqual(len(parsed), 1)
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(cache.misses, 1)
+
+    def test_get_none_key(self):
+        """Tests that objects with a key of None are never cached."""
+        cache = ParsedObjectCache()
+
+        self.assertIsNot(cache.get(None, object), cache.get(None, object))
+
+    def test_eviction(self):
+        """Tests that the least recently used objects are evicted."""
+        cache = ParsedObjectCache(max_size=2)
+
+        obj_1 = cache.get(1, object)
+        obj_2 = cache.get(2, object)
+        cache.get(1, object)
+        cache.get(3, object)
+
+        self.assertIs(cache.get(1, object), obj_1)
+        self.assertIsNot(cache.get(2, object), obj_2)
+
+
+class TestMakeReadOnly(TestCase):
+    def setUp(self):
+        django.setup()
+
+    def test_modify(self):
+        """Tests that every object and array of a read-only JSON value raises an error when modified."""
+        definition = make_read_only({'version': '1.0', 'env_vars': [{'name': 'VAR', 'value': ''}]})
+
+        self.assertRaises(TypeError, definition.__setitem__, 'version', '2.0')
+        self.assertRaises(TypeError, definition.pop, 'version')
+        self.assertRaises(TypeError, definition.update, {'command': 'cmd'})
+        self.assertRaises(TypeError, definition['env_vars'].append, {'name': 'OTHER'})
+        self.assertRaises(TypeError, definition['env_vars'][0].__setitem__, 'value', 'secret')
+        self.assertEqual(json.loads(json.dumps(definition)),
+                         {'version': '1.0', 'env_vars': [{'name': 'VAR', 'value': ''}]})
+
+    def test_copy(self):
+        """Tests that copies of a read-only JSON value can be modified."""
+        definition = make_read_only({'env_vars': [{'name': 'VAR', 'value': ''}]})
+
+        env_vars = copy.deepcopy(definition['env_vars'])
+        env_vars[0]['value'] = 'secret'
+        env_vars.append({'name': 'OTHER'})
+        shallow = copy.copy(definition)
+        shallow['command'] = 'cmd'
+
+        self.assertEqual(definition, {'env_vars': [{'name': 'VAR', 'value': ''}]})
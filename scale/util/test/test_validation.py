@@ -0,0 +1,34 @@
+from __future__ import unicode_literals
+
+import django
+from django.test import TestCase
+from jsonschema.exceptions import ValidationError
+
+from util.validation import get_validator, validate
+
+
+SCHEMA = {
+    'type': 'object',
+    'required': ['name'],
+    'properties': {
+        'name': {'type': 'string'},
+    },
+}
+
+
+class TestValidation(TestCase):
+    def setUp(self):
+        django.setup()
+
+    def test_get_validator_reused(self):
+        """Tests that the compiled validator for a schema is re-used."""
+        self.assertIs(get_validator(SCHEMA), get_validator(SCHEMA))
+
+    def test_validate(self):
+        """Tests validating a valid instance."""
+        validate({'name': 'my_name'}, SCHEMA)
+
+    def test_validate_invalid(self):
+        """Tests validating an invalid instance."""
+        self.assertRaises(ValidationError, validate, {'name': 1}, SCHEMA)
+        self.assertRaises(ValidationError, validate, {}, SCHEMA)
@@ -0,0 +1,50 @@
+"""Defines utility functions for validating JSON against pre-compiled JSON schemas"""
+from __future__ import unicode_literals
+
+import threading
+
+from jsonschema.validators import validator_for
+
+
+_VALIDATORS = {}  # {Schema ID: (Schema, Validator)}
+_VALIDATORS_LOCK = threading.Lock()
+
+
+def get_validator(schema):
+    """Returns the compiled validator for the given JSON schema. The schema is checked and its validator is created the
+    first time the schema is seen, and the validator is re-used for every following call. Schemas are expected to be
+    module level constants that are never modified.
+
+    :param schema: The JSON schema
+    :type schema: dict
+    :returns: The validator for the schema
+    :rtype: :class:`jsonschema.validators.Validator`
+
+    :raises :class:`jsonschema.exceptions.SchemaError`: If the schema itself is invalid
+    """
+
+    schema_id = id(schema)
+    entry = _VALIDATORS.get(schema_id)
+    if entry is None or entry[0] is not schema:
+        with _VALIDATORS_LOCK:
+            cls = validator_for(schema)
+            cls.check_schema(schema)
+            # Keep a reference to the schema so its ID can never be re-used by another object
+            entry = (schema, cls(schema))
+            _VALIDATORS[schema_id] = entry
+    return entry[1]
+
+
+def validate(instance, schema):
+    """Validates the given JSON instance against the given JSON schema using a pre-compiled validator. This is a drop-in
+    replacement for :func:`jsonschema.validate`.
+
+    :param instance: The JSON instance to validate
+    :type instance: dict
+    :param schema: The JSON schema
+    :type schema: dict
+
+    :raises :class:`jsonschema.exceptions.ValidationError`: If the instance is invalid
+    """
+
+    get_validator(schema).validate(instance)
@@ -4,6 +4,7 @@ import ast
 import jwt
 import json
 import requests
+from requests.adapters import HTTPAdapter
 from requests.packages.urllib3.exceptions import InsecureRequestWarning
 
 from django.conf import settings
@@ -40,6 +41,12 @@ class SecretsHandler(object):
         if not self.raise_ssl_warnings:
             requests.packages.urllib3.disable_warnings(InsecureRequestWarning)
 
+        # Re-use pooled connections for every request made by this handler, including concurrent requests
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=settings.SECRETS_MAX_CONCURRENT_REQUESTS)
+        self._session.mount('http://', adapter)
+        self._session.mount('https://', adapter)
+
         if not self.secrets_url:
             raise InvalidSecretsConfiguration('A secrets backend is not properly configured with Scale.')
         elif self.service_account:
@@ -252,7 +259,7 @@ class SecretsHandler(object):
         if not data:
             data = {}
 
-        r = requests.request(method=method, url=url, headers=headers, data=data, verify=self.raise_ssl_warnings)
+        r = self._session.request(method=method, url=url, headers=headers, data=data, verify=self.raise_ssl_warnings)
 
         if r.status_code in self.secrets_error_codes:
             if r.status_code == 403: